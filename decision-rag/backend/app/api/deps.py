@@ -12,12 +12,15 @@ from app.services import (
     CompositeVectorStore,
     DecisionAPIClient,
     DecisionDataFetcher,
+    DecisionSummaryIndex,
     ElasticsearchVectorStore,
     IngestionPipeline,
+    LocalVectorStore,
     ParagraphChunker,
     PgvectorVectorStore,
     SchedulerService,
     job_manager,
+    search_cache,
 )
 from app.services.attachment_downloader import AttachmentDownloader
 from app.services.blob_storage import AzureBlobRawResponseSaver
@@ -93,10 +96,14 @@ def get_api_client(blob_saver: Optional[AzureBlobRawResponseSaver] = None) -> De
     return DecisionAPIClient(raw_response_saver=raw_response_saver)
 
 
-def _build_vector_store() -> BaseVectorStore:
+def _build_vector_store(suffix: str = "") -> BaseVectorStore:
     """
     Build the appropriate vector store based on VECTOR_STORE_BACKENDS setting.
 
+    Args:
+        suffix: Appended to each backend's index, table or directory name; used
+            for the decision summary index
+
     Returns:
         BaseVectorStore instance (single backend or CompositeVectorStore).
     """
@@ -106,9 +113,23 @@ def _build_vector_store() -> BaseVectorStore:
 
     instances: list[BaseVectorStore] = []
     if "elasticsearch" in backends_config:
-        instances.append(ElasticsearchVectorStore())
+        instances.append(
+            ElasticsearchVectorStore(index_name=settings.ELASTICSEARCH_INDEX + suffix)
+            if suffix
+            else ElasticsearchVectorStore()
+        )
     if "pgvector" in backends_config:
-        instances.append(PgvectorVectorStore())
+        instances.append(
+            PgvectorVectorStore(table=settings.PGVECTOR_TABLE + suffix)
+            if suffix
+            else PgvectorVectorStore()
+        )
+    if "local" in backends_config:
+        instances.append(
+            LocalVectorStore(directory=settings.LOCAL_VECTOR_STORE_DIR + suffix)
+            if suffix
+            else LocalVectorStore()
+        )
 
     if not instances:
         raise ValueError(
@@ -118,7 +139,11 @@ def _build_vector_store() -> BaseVectorStore:
     if len(instances) == 1:
         return instances[0]
 
-    return CompositeVectorStore(instances)
+    return CompositeVectorStore(
+        instances,
+        read_mode=settings.VECTOR_STORE_READ_MODE,
+        rrf_k=settings.VECTOR_STORE_RRF_K,
+    )
 
 
 def get_vector_store() -> Generator[BaseVectorStore, None, None]:
@@ -132,8 +157,30 @@ def get_vector_store() -> Generator[BaseVectorStore, None, None]:
     try:
         yield store
     finally:
-        for s in store.backends if isinstance(store, CompositeVectorStore) else [store]:
-            s.close()
+        # CompositeVectorStore.close() closes its backends and its fan-out pool
+        store.close()
+
+
+def _build_decision_index() -> Optional[DecisionSummaryIndex]:
+    """Build the decision summary index, or return None when DECISION_INDEX_ENABLED is off."""
+    if not settings.DECISION_INDEX_ENABLED:
+        return None
+    return DecisionSummaryIndex(_build_vector_store(settings.DECISION_INDEX_SUFFIX))
+
+
+def get_decision_index() -> Generator[Optional[DecisionSummaryIndex], None, None]:
+    """
+    Get the decision summary index used for two-stage search.
+
+    Yields:
+        DecisionSummaryIndex instance, or None when it is disabled
+    """
+    decision_index = _build_decision_index()
+    try:
+        yield decision_index
+    finally:
+        if decision_index is not None:
+            decision_index.close()
 
 
 def get_elasticsearch_store() -> Generator[ElasticsearchVectorStore, None, None]:
@@ -205,6 +252,8 @@ def get_ingestion_pipeline() -> IngestionPipeline:
         chunker=chunker,
         attachment_downloader=attachment_downloader,
         parquet_saver=parquet_saver,
+        decision_index=_build_decision_index(),
+        search_cache=search_cache,
     )
 
 
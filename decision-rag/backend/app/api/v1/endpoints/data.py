@@ -2,23 +2,36 @@
 
 import math
 from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 
-from app.api.deps import get_embedder, get_repository, get_vector_store, verify_api_key
-from app.api.v1.models.requests import SearchRequest
+from app.api.deps import (
+    get_decision_index,
+    get_embedder,
+    get_repository,
+    get_vector_store,
+    verify_api_key,
+)
+from app.api.v1.models.requests import BatchSearchRequest, ContextRequest, SearchRequest
 from app.api.v1.models.responses import (
+    BatchSearchResponse,
+    ContextResponse,
+    ContextSource,
     DocumentDetailResponse,
     DocumentListResponse,
     DocumentSummary,
     RepositoryStatsResponse,
+    SearchCacheStatsResponse,
     SearchResult,
     SearchResultResponse,
     VectorStoreStatsResponse,
 )
 from app.core import get_logger
 from app.repositories import DecisionRepository
-from app.services import AzureEmbedder
+from app.services import AzureEmbedder, DecisionSummaryIndex, search_cache
+from app.services.context_builder import ContextBuilder
+from app.services.search_filters import SearchFilter
 from app.services.vector_store import BaseVectorStore
 from app.utils import raise_error_with_id
 
@@ -167,6 +180,7 @@ async def search_documents(
     request: SearchRequest,
     embedder: AzureEmbedder = Depends(get_embedder),
     vector_store: BaseVectorStore = Depends(get_vector_store),
+    decision_index: Optional[DecisionSummaryIndex] = Depends(get_decision_index),
     _: None = Depends(verify_api_key),
 ):
     """
@@ -181,53 +195,24 @@ async def search_documents(
     Returns:
         Ranked search results
     """
-    try:
-        # Generate embedding for query
-        query_embedding = embedder.create_embedding(request.query)
+    search_filter = _validated_search_filter(request, decision_index)
 
-        # Build filter conditions if provided
-        filter_conditions = None
-        if request.start_date or request.end_date or request.organization:
-            filter_conditions = {}
-            if request.start_date:
-                filter_conditions["metadata.decision_date"] = {"gte": request.start_date}
-            if request.end_date:
-                if "metadata.decision_date" in filter_conditions:
-                    filter_conditions["metadata.decision_date"]["lte"] = request.end_date
-                else:
-                    filter_conditions["metadata.decision_date"] = {"lte": request.end_date}
-            if request.organization:
-                filter_conditions["metadata.organization"] = request.organization
-
-        # Perform search
-        start_time = datetime.now()
-        search_results = vector_store.search(
-            query_vector=query_embedding,
-            top_k=request.limit,
-            filter_conditions=filter_conditions,
+    try:
+        search_results, timings, took_ms, cached = _execute_search(
+            request, search_filter, embedder, vector_store, decision_index
         )
-        took_ms = int((datetime.now() - start_time).total_seconds() * 1000)
 
         # Convert to response format
-        results = []
-        for hit in search_results:
-            metadata = hit.get("metadata", {})
-            results.append(
-                SearchResult(
-                    native_id=hit.get("native_id", ""),
-                    title=metadata.get("title", "Untitled"),
-                    content=hit.get("text", "")[:500],  # Truncate content
-                    score=hit.get("score", 0.0),
-                    decision_date=metadata.get("decision_date"),
-                    organization=metadata.get("organization"),
-                )
-            )
+        results = _to_search_results(search_results)
 
         return SearchResultResponse(
             query=request.query,
             results=results,
             total=len(results),
             took_ms=took_ms,
+            mode="hybrid" if request.hybrid else "vector",
+            timings=timings,
+            cached=cached,
         )
 
     except Exception as e:
@@ -240,6 +225,306 @@ async def search_documents(
         )
 
 
+@router.post("/context", response_model=ContextResponse)
+async def assemble_context(
+    request: ContextRequest,
+    embedder: AzureEmbedder = Depends(get_embedder),
+    vector_store: BaseVectorStore = Depends(get_vector_store),
+    decision_index: Optional[DecisionSummaryIndex] = Depends(get_decision_index),
+    _: None = Depends(verify_api_key),
+):
+    """
+    Search and return the full text of the hits as one prompt-ready context block.
+
+    Chunks of the same decision or attachment share a single metadata header,
+    adjacent chunks are merged without their overlap, and hits are added in
+    score order for as long as the block fits in max_tokens.
+
+    Args:
+        request: Search request with the token budget
+
+    Returns:
+        Context block, its token count and the documents it draws on
+    """
+    search_filter = _validated_search_filter(request, decision_index)
+
+    try:
+        search_results, timings, took_ms, cached = _execute_search(
+            request, search_filter, embedder, vector_store, decision_index
+        )
+
+        assembly_start = datetime.now()
+        assembled = ContextBuilder().build(search_results, request.max_tokens)
+        timings["assembly_ms"] = (datetime.now() - assembly_start).total_seconds() * 1000
+
+        sources = [
+            ContextSource(
+                native_id=document.native_id,
+                title=document.metadata.get("title", "Untitled"),
+                score=document.score,
+                chunk_ids=[document.chunk_ids[i] for i in sorted(document.chunk_ids)],
+                decision_date=document.metadata.get("date_decision"),
+                organization=document.metadata.get("organization_name"),
+            )
+            for document in assembled["documents"]
+        ]
+
+        return ContextResponse(
+            query=request.query,
+            context=assembled["context"],
+            token_count=assembled["token_count"],
+            max_tokens=request.max_tokens,
+            sources=sources,
+            skipped=assembled["skipped"],
+            took_ms=took_ms,
+            timings=timings,
+            cached=cached,
+        )
+
+    except Exception as e:
+        raise_error_with_id(
+            logger,
+            e,
+            status_code=500,
+            message="Context assembly failed",
+            context={"operation": "assemble_context", "query": request.query},
+        )
+
+
+def _validated_search_filter(
+    request: SearchRequest, decision_index: Optional[DecisionSummaryIndex]
+) -> SearchFilter:
+    """Return the request's SearchFilter, raising 422/400 for invalid requests."""
+    # Typed filters are compiled natively by each vector store backend
+    try:
+        search_filter = request.to_search_filter()
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=f"Invalid search filter: {e}")
+    if request.two_stage and decision_index is None:
+        raise HTTPException(
+            status_code=400, detail="Two-stage search requires DECISION_INDEX_ENABLED"
+        )
+    return search_filter
+
+
+def _execute_search(
+    request: SearchRequest,
+    search_filter: SearchFilter,
+    embedder: AzureEmbedder,
+    vector_store: BaseVectorStore,
+    decision_index: Optional[DecisionSummaryIndex],
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any], int, bool]:
+    """
+    Embed the query and run the search, using the embedding and result caches.
+
+    Returns:
+        (hits, timings including embedding_ms, search time in ms, served from cache)
+    """
+    filter_conditions = None if search_filter.is_empty() else search_filter
+
+    # Generate embedding for query, reusing it for repeated questions
+    embedding_start = datetime.now()
+    query_embedding = search_cache.get_embedding(request.query)
+    if query_embedding is None:
+        query_embedding = embedder.create_embedding(request.query)
+        search_cache.put_embedding(request.query, query_embedding)
+    embedding_ms = (datetime.now() - embedding_start).total_seconds() * 1000
+
+    # Perform search
+    start_time = datetime.now()
+    search_kwargs = _search_kwargs(request)
+    # Keyed by the current index epoch, so ingestion invalidates cached results
+    cache_key = search_cache.result_key(
+        query_embedding,
+        filters=search_filter.model_dump(mode="json"),
+        top_k=request.limit,
+        two_stage=request.two_stage,
+        **search_kwargs,
+    )
+    cached = search_cache.get_results(cache_key)
+    if cached is not None:
+        search_results, search_timings = cached
+    elif request.two_stage:
+        # Shortlist decisions from the summary index, then search their chunks
+        search_results = decision_index.two_stage_search(
+            vector_store, query_embedding, request.limit, filter_conditions, **search_kwargs
+        )
+        search_timings = decision_index.last_search_timings
+    else:
+        search_results = vector_store.search(
+            query_vector=query_embedding,
+            top_k=request.limit,
+            filter_conditions=filter_conditions,
+            **search_kwargs,
+        )
+        search_timings = vector_store.last_search_timings
+    if cached is None:
+        search_cache.put_results(cache_key, search_results, search_timings)
+    took_ms = int((datetime.now() - start_time).total_seconds() * 1000)
+    timings = {"embedding_ms": embedding_ms, **search_timings}
+    return search_results, timings, took_ms, cached is not None
+
+
+@router.post("/search/batch", response_model=BatchSearchResponse)
+async def search_documents_batch(
+    request: BatchSearchRequest,
+    embedder: AzureEmbedder = Depends(get_embedder),
+    vector_store: BaseVectorStore = Depends(get_vector_store),
+    decision_index: Optional[DecisionSummaryIndex] = Depends(get_decision_index),
+    _: None = Depends(verify_api_key),
+):
+    """
+    Perform several semantic searches in one call.
+
+    Queries missing from the embedding cache are embedded in a single Azure
+    OpenAI request, and the searches are sent to the vector store together
+    (one Elasticsearch msearch, or one pgvector statement for plain vector
+    searches sharing a filter). Two-stage searches run one by one.
+
+    Args:
+        request: Batch of search requests
+
+    Returns:
+        One search response per request, in request order
+    """
+    searches = request.searches
+    try:
+        search_filters = [search.to_search_filter() for search in searches]
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=f"Invalid search filter: {e}")
+    if decision_index is None and any(search.two_stage for search in searches):
+        raise HTTPException(
+            status_code=400, detail="Two-stage search requires DECISION_INDEX_ENABLED"
+        )
+
+    try:
+        batch_start = datetime.now()
+        embeddings = [search_cache.get_embedding(search.query) for search in searches]
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if missing:
+            created = embedder.create_query_embeddings([searches[i].query for i in missing])
+            for i, embedding in zip(missing, created):
+                embeddings[i] = embedding
+                search_cache.put_embedding(searches[i].query, embedding)
+        embedding_ms = (datetime.now() - batch_start).total_seconds() * 1000
+
+        search_start = datetime.now()
+        outcomes: List[Any] = [None] * len(searches)
+        cache_keys = []
+        batch_indices, batch_queries = [], []
+        for i, (search, search_filter) in enumerate(zip(searches, search_filters)):
+            filter_conditions = None if search_filter.is_empty() else search_filter
+            search_kwargs = _search_kwargs(search)
+            cache_key = search_cache.result_key(
+                embeddings[i],
+                filters=search_filter.model_dump(mode="json"),
+                top_k=search.limit,
+                two_stage=search.two_stage,
+                **search_kwargs,
+            )
+            cache_keys.append(cache_key)
+            cached = search_cache.get_results(cache_key)
+            if cached is not None:
+                outcomes[i] = (*cached, True)
+            elif search.two_stage:
+                results = decision_index.two_stage_search(
+                    vector_store, embeddings[i], search.limit, filter_conditions, **search_kwargs
+                )
+                outcomes[i] = (results, dict(decision_index.last_search_timings), False)
+            else:
+                batch_indices.append(i)
+                batch_queries.append(
+                    {
+                        "query_vector": embeddings[i],
+                        "top_k": search.limit,
+                        "filter_conditions": filter_conditions,
+                        **search_kwargs,
+                    }
+                )
+
+        if batch_queries:
+            batch_results = vector_store.search_batch(batch_queries)
+            for i, results, timings in zip(
+                batch_indices, batch_results, vector_store.last_batch_timings
+            ):
+                outcomes[i] = (results, dict(timings), False)
+
+        responses = []
+        for search, cache_key, (results, timings, cached) in zip(searches, cache_keys, outcomes):
+            if not cached:
+                search_cache.put_results(cache_key, results, timings)
+            responses.append(
+                SearchResultResponse(
+                    query=search.query,
+                    results=_to_search_results(results),
+                    total=len(results),
+                    took_ms=None,
+                    mode="hybrid" if search.hybrid else "vector",
+                    timings=timings,
+                    cached=cached,
+                )
+            )
+
+        return BatchSearchResponse(
+            responses=responses,
+            took_ms=int((datetime.now() - batch_start).total_seconds() * 1000),
+            timings={
+                "embedding_ms": embedding_ms,
+                "search_ms": (datetime.now() - search_start).total_seconds() * 1000,
+            },
+        )
+
+    except Exception as e:
+        raise_error_with_id(
+            logger,
+            e,
+            status_code=500,
+            message="Batch search operation failed",
+            context={"operation": "search_documents_batch", "queries": len(searches)},
+        )
+
+
+def _search_kwargs(request: SearchRequest) -> Dict[str, Any]:
+    """Return the vector store search() options selected by a search request."""
+    return {
+        "query_text": request.query if request.hybrid else None,
+        "collapse": request.collapse,
+        "neighbours": request.neighbours,
+    }
+
+
+def _to_search_results(hits: List[Dict[str, Any]]) -> List[SearchResult]:
+    """Convert vector store hits to the API response format."""
+    results = []
+    for hit in hits:
+        metadata = hit.get("metadata", {})
+        results.append(
+            SearchResult(
+                native_id=hit.get("native_id", ""),
+                title=metadata.get("title", "Untitled"),
+                content=hit.get("text", "")[:500],  # Truncate content
+                score=hit.get("score", 0.0),
+                decision_date=metadata.get("date_decision"),
+                organization=metadata.get("organization_name"),
+                context=hit.get("context"),
+            )
+        )
+    return results
+
+
+@router.get("/search/cache", response_model=SearchCacheStatsResponse)
+async def get_search_cache_stats(_: None = Depends(verify_api_key)):
+    """
+    Get /search cache hit rates.
+
+    Counters are per API process and reset on restart.
+
+    Returns:
+        Query embedding and result cache statistics with the current index epoch
+    """
+    return SearchCacheStatsResponse(**search_cache.stats())
+
+
 @router.get("/stats", response_model=RepositoryStatsResponse)
 async def get_repository_stats(
     repository: DecisionRepository = Depends(get_repository),
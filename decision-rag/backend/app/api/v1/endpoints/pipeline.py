@@ -13,10 +13,10 @@ from app.api.deps import (
     verify_api_key,
 )
 from app.api.v1.models.requests import FetchRequest, FullPipelineRequest, IngestRequest
-from app.api.v1.models.responses import JobStatusResponse
+from app.api.v1.models.responses import JobStatusResponse, RateLimitStatsResponse
 from app.core import get_logger, settings
-from app.repositories import DecisionRepository
-from app.services import DecisionDataFetcher, IngestionPipeline, JobManager
+from app.repositories import DecisionRepository, DecisionWriteBehind
+from app.services import DecisionDataFetcher, IngestionPipeline, JobManager, rate_limiter
 from app.services.vector_store import MaxRetriesExceededError
 from app.utils.checkpoint_manager import FetchCheckpoint, FullPipelineCheckpoint, IngestCheckpoint
 from app.utils.date_utils import parse_date
@@ -404,6 +404,7 @@ def run_full_pipeline_job(
         pipeline: Ingestion pipeline instance
         request: Pipeline request parameters
     """
+    write_behind = None
     try:
         job_manager.start_job(job_id)
         job_manager.update_progress(job_id, 0, "Starting full pipeline...")
@@ -443,13 +444,14 @@ def run_full_pipeline_job(
             "total_chunks": 0,
             "total_attachments": 0,
             "total_attachment_chunks": 0,
-            "total_deleted": 0,
             "batches_processed": 0,
         }
 
-        # Batch accumulator
+        # Batch accumulator; documents go to ingestion in memory and are only
+        # written to disk, behind the pipeline, when files are kept
         batch_buffer = []
-        batch_native_ids = []
+        if request.keep_files:
+            write_behind = DecisionWriteBehind(pipeline.repository)
 
         job_manager.update_progress(job_id, 5, "Fetching documents...")
 
@@ -485,7 +487,6 @@ def run_full_pipeline_job(
                     stats["total_chunks"],
                     stats["total_attachments"],
                     stats["total_attachment_chunks"],
-                    stats["total_deleted"],
                     stats["batches_processed"],
                 )
                 checkpoint_mgr.save()
@@ -498,10 +499,9 @@ def run_full_pipeline_job(
 
             stats["total_fetched"] += 1
 
-            # Save document temporarily
-            if pipeline.repository.save_decision(document):
-                batch_buffer.append(document)
-                batch_native_ids.append(document.NativeId)
+            batch_buffer.append(document)
+            if write_behind is not None:
+                write_behind.submit(document)
 
             # Process batch when size reached
             if len(batch_buffer) >= request.batch_size:
@@ -513,7 +513,7 @@ def run_full_pipeline_job(
                 )
 
                 # Process the batch
-                batch_stats = pipeline.process_batch(batch_native_ids, reindex=not request.skip_existing, batch_start=batch_start, batch_end=batch_end)
+                batch_stats = pipeline.process_decisions(batch_buffer, reindex=not request.skip_existing, batch_start=batch_start, batch_end=batch_end)
 
                 stats["total_processed"] += batch_stats["processed"]
                 stats["total_successful"] += batch_stats["successful"]
@@ -524,15 +524,6 @@ def run_full_pipeline_job(
                 stats["total_attachment_chunks"] += batch_stats.get("total_attachment_chunks", 0)
                 stats["batches_processed"] += 1
 
-                # Delete processed files if not keeping them
-                if not request.keep_files:
-                    for native_id in batch_native_ids:
-                        try:
-                            pipeline.repository.delete_decision(native_id)
-                            stats["total_deleted"] += 1
-                        except Exception as e:
-                            logger.warning(f"Failed to delete {native_id}: {e}")
-
                 # Save checkpoint periodically
                 if checkpoint_mgr.should_save(
                     stats["batches_processed"],
@@ -555,21 +546,19 @@ def run_full_pipeline_job(
                         stats["total_chunks"],
                         stats["total_attachments"],
                         stats["total_attachment_chunks"],
-                        stats["total_deleted"],
                         stats["batches_processed"],
                     )
                     checkpoint_mgr.save()
 
                 # Clear batch
                 batch_buffer = []
-                batch_native_ids = []
 
         # Process remaining documents in final batch
         if batch_buffer:
             logger.info(f"Processing final batch of {len(batch_buffer)} documents")
             job_manager.update_progress(job_id, 95, "Processing final batch...")
 
-            batch_stats = pipeline.process_batch(batch_native_ids, reindex=not request.skip_existing, batch_start=batch_start, batch_end=batch_end)
+            batch_stats = pipeline.process_decisions(batch_buffer, reindex=not request.skip_existing, batch_start=batch_start, batch_end=batch_end)
 
             stats["total_processed"] += batch_stats["processed"]
             stats["total_successful"] += batch_stats["successful"]
@@ -580,15 +569,6 @@ def run_full_pipeline_job(
             stats["total_attachment_chunks"] += batch_stats.get("total_attachment_chunks", 0)
             stats["batches_processed"] += 1
 
-            # Delete processed files
-            if not request.keep_files:
-                for native_id in batch_native_ids:
-                    try:
-                        pipeline.repository.delete_decision(native_id)
-                        stats["total_deleted"] += 1
-                    except Exception as e:
-                        logger.warning(f"Failed to delete {native_id}: {e}")
-
         # Mark checkpoint as completed
         fetcher_stats = fetcher.stats
         checkpoint_mgr.mark_completed(
@@ -607,7 +587,6 @@ def run_full_pipeline_job(
             total_chunks=stats["total_chunks"],
             total_attachments=stats["total_attachments"],
             total_attachment_chunks=stats["total_attachment_chunks"],
-            files_deleted=stats["total_deleted"],
             batches_processed=stats["batches_processed"],
         )
 
@@ -629,7 +608,6 @@ def run_full_pipeline_job(
             "total_chunks": stats["total_chunks"],
             "attachments_processed": stats["total_attachments"],
             "attachment_chunks": stats["total_attachment_chunks"],
-            "files_deleted": stats["total_deleted"],
             "batches_processed": stats["batches_processed"],
         }
 
@@ -652,6 +630,9 @@ def run_full_pipeline_job(
     except Exception as e:
         logger.error(f"Full pipeline job {job_id} failed: {e}")
         job_manager.fail_job(job_id, str(e))
+    finally:
+        if write_behind is not None:
+            write_behind.close()
 
 
 @router.post("/fetch", response_model=JobStatusResponse, status_code=202)
@@ -924,6 +905,20 @@ async def cancel_job(
     )
 
 
+@router.get("/rate-limits", response_model=RateLimitStatsResponse)
+async def get_rate_limits(_: None = Depends(verify_api_key)):
+    """
+    Get the outgoing request rate limiter state.
+
+    Shows how fetch and attachment download jobs in this process are paced per
+    host, including slow-downs after 429/503 responses. Counters reset on restart.
+
+    Returns:
+        Rate and wait-time metrics per host
+    """
+    return RateLimitStatsResponse(hosts=rate_limiter.stats())
+
+
 @router.post("/shutdown")
 async def request_shutdown(
     job_manager: JobManager = Depends(get_job_manager),
@@ -1,6 +1,8 @@
 """API v1 models package initialization."""
 
 from .requests import (
+    BatchSearchRequest,
+    ContextRequest,
     DataQueryRequest,
     FetchRequest,
     FullPipelineRequest,
@@ -8,6 +10,8 @@ from .requests import (
     SearchRequest,
 )
 from .responses import (
+    BatchSearchResponse,
+    ContextResponse,
     DocumentDetailResponse,
     DocumentListResponse,
     ErrorResponse,
@@ -26,6 +30,8 @@ __all__ = [
     "FullPipelineRequest",
     "DataQueryRequest",
     "SearchRequest",
+    "BatchSearchRequest",
+    "ContextRequest",
     # Responses
     "JobStatusResponse",
     "PipelineStatsResponse",
@@ -36,4 +42,6 @@ __all__ = [
     "DocumentListResponse",
     "DocumentDetailResponse",
     "SearchResultResponse",
+    "BatchSearchResponse",
+    "ContextResponse",
 ]
@@ -1,9 +1,11 @@
 """Request models for API endpoints."""
 
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
+from app.services.search_filters import SearchFilter
+
 
 class FetchRequest(BaseModel):
     """Request model for document fetching."""
@@ -93,7 +95,7 @@ class FullPipelineRequest(BaseModel):
     )
     keep_files: bool = Field(
         False,
-        description="Keep downloaded files after ingestion",
+        description="Also save fetched documents as JSON files, written in the background",
     )
 
 
@@ -153,5 +155,66 @@ class SearchRequest(BaseModel):
     )
     organization: Optional[str] = Field(
         None,
-        description="Filter by organization ID",
+        description="Filter by organization name",
+    )
+    filters: Optional[SearchFilter] = Field(
+        None,
+        description="Typed metadata filters; start_date, end_date and organization are merged in",
+    )
+    hybrid: bool = Field(
+        False,
+        description="Fuse full-text (BM25) and vector results; helps exact terms such as diary numbers",
+    )
+    collapse: bool = Field(
+        False,
+        description="Return at most one chunk per decision or attachment",
+    )
+    neighbours: int = Field(
+        0,
+        description="Include this many preceding and following chunks of each hit as context",
+        ge=0,
+        le=5,
+    )
+    two_stage: bool = Field(
+        False,
+        description="Shortlist decisions from the decision summary index, then search their chunks",
+    )
+
+    def to_search_filter(self) -> SearchFilter:
+        """Combine the typed filters with the flat date and organization fields."""
+        merged = self.filters.model_dump() if self.filters else {}
+        if self.start_date:
+            merged["date_from"] = self.start_date
+        if self.end_date:
+            merged["date_to"] = self.end_date
+        if self.organization:
+            merged["organizations"] = [self.organization]
+        return SearchFilter(**merged)
+
+
+class ContextRequest(SearchRequest):
+    """Request model for a token-budgeted context block."""
+
+    limit: int = Field(
+        20,
+        description="Search hits considered for the context",
+        ge=1,
+        le=100,
+    )
+    max_tokens: int = Field(
+        4000,
+        description="Token budget of the assembled context (cl100k_base tokens)",
+        ge=100,
+        le=100000,
+    )
+
+
+class BatchSearchRequest(BaseModel):
+    """Request model for several searches answered in one call."""
+
+    searches: List[SearchRequest] = Field(
+        ...,
+        description="Searches to run; their queries are embedded in one request",
+        min_length=1,
+        max_length=50,
     )
@@ -148,6 +148,9 @@ class SearchResult(BaseModel):
     score: float = Field(..., description="Relevance score")
     decision_date: Optional[str] = Field(None, description="Decision date")
     organization: Optional[str] = Field(None, description="Organization name")
+    context: Optional[str] = Field(
+        None, description="Hit chunk with its neighbouring chunks, when neighbours > 0"
+    )
 
 
 class SearchResultResponse(BaseModel):
@@ -157,3 +160,71 @@ class SearchResultResponse(BaseModel):
     results: List[SearchResult] = Field(..., description="Search results")
     total: int = Field(..., description="Total number of matching results")
     took_ms: Optional[int] = Field(None, description="Query execution time in milliseconds")
+    mode: str = Field("vector", description="Retrieval mode: vector or hybrid")
+    timings: Optional[Dict[str, Optional[float]]] = Field(
+        None, description="Milliseconds per stage (embedding, decision shortlist, lexical and vector legs, fusion)"
+    )
+    cached: bool = Field(False, description="Results were served from the result cache")
+
+
+class ContextSource(BaseModel):
+    """Decision or attachment included in an assembled context."""
+
+    native_id: str = Field(..., description="Document native ID")
+    title: str = Field(..., description="Document title")
+    score: float = Field(..., description="Best relevance score among its chunks")
+    chunk_ids: List[str] = Field(..., description="Included chunks in document order")
+    decision_date: Optional[str] = Field(None, description="Decision date")
+    organization: Optional[str] = Field(None, description="Organization name")
+
+
+class ContextResponse(BaseModel):
+    """Response model for an assembled context block."""
+
+    query: str = Field(..., description="Original search query")
+    context: str = Field(..., description="Context block: one header per document, merged chunks")
+    token_count: int = Field(..., description="Tokens in the context block")
+    max_tokens: int = Field(..., description="Requested token budget")
+    sources: List[ContextSource] = Field(..., description="Documents in the order they appear")
+    skipped: int = Field(0, description="Hits left out because they did not fit the budget")
+    took_ms: Optional[int] = Field(None, description="Query execution time in milliseconds")
+    timings: Optional[Dict[str, Optional[float]]] = Field(
+        None, description="Milliseconds per stage, including context assembly"
+    )
+    cached: bool = Field(False, description="Search results were served from the result cache")
+
+
+class BatchSearchResponse(BaseModel):
+    """Response model for batch search results."""
+
+    responses: List[SearchResultResponse] = Field(
+        ..., description="One search response per request, in request order"
+    )
+    took_ms: Optional[int] = Field(None, description="Execution time of the whole batch in milliseconds")
+    timings: Optional[Dict[str, Optional[float]]] = Field(
+        None, description="Milliseconds spent embedding all queries and running all searches"
+    )
+
+
+class SearchCacheStatsResponse(BaseModel):
+    """Response model for /search cache statistics."""
+
+    embeddings: Dict[str, Any] = Field(
+        ..., description="Query embedding cache size, hits, misses and hit_rate"
+    )
+    results: Dict[str, Any] = Field(
+        ..., description="Search result cache size, hits, misses and hit_rate"
+    )
+    index_epoch: int = Field(..., description="Index change counter bumped by ingestion")
+
+
+class RateLimitStatsResponse(BaseModel):
+    """Response model for outgoing request rate limiter statistics."""
+
+    hosts: Dict[str, Dict[str, Any]] = Field(
+        ...,
+        description=(
+            "Per host: current and configured rate, burst, tokens, Retry-After pause, "
+            "requests, throttled responses and wait times"
+        ),
+    )
@@ -25,6 +25,13 @@ class Settings(BaseSettings):
     # Rate limiting
     REQUESTS_PER_SECOND: float = 1.0
     REQUEST_TIMEOUT: int = 30  # seconds
+    RATE_LIMIT_BURST: int = 3  # Requests a host may receive back to back
+    RATE_LIMIT_MIN_RPS: float = 0.1  # Floor of the rate after 429/503 slow-downs
+
+    # Async document fetching
+    API_ASYNC_FETCH: bool = False  # Fetch documents with asyncio instead of worker threads
+    API_HTTP2: bool = True  # Negotiate HTTP/2 in async mode (requires the h2 package)
+    API_MAX_CONNECTIONS: int = 10  # Connection pool size of the async client
 
     # Retry configuration
     MAX_RETRY_ATTEMPTS: int = 3
@@ -38,7 +45,7 @@ class Settings(BaseSettings):
     DOCUMENT_FETCH_RETRY_MIN_WAIT: float = 5.0  # Minimum wait time between retries (seconds)
     DOCUMENT_FETCH_RETRY_MAX_WAIT: float = 300.0  # Maximum wait time between retries (seconds)
     DOCUMENT_FETCH_RETRY_BACKOFF_MULTIPLIER: float = 3.0  # Exponential backoff multiplier
-    DOCUMENT_FETCH_RETRY_STAGGER_DELAY: float = 2.0  # Delay between initiating retries for different documents
+    DOCUMENT_FETCH_RETRY_STAGGER_DELAY: float = 2.0  # Delay between documents in inline (single-batch) retries
 
     # API outage batch-level retry configuration
     API_OUTAGE_MAX_RETRIES: int = 5  # Maximum number of batch retry attempts
@@ -63,6 +70,9 @@ class Settings(BaseSettings):
         return end.strftime("%Y-%m-%dT%H:%M:%S")
 
     BATCH_SIZE_DAYS: int = 1  # Daily batches
+    ADAPTIVE_BATCH_WINDOWS: bool = False  # Resize batch windows from decision ID counts
+    BATCH_MIN_HOURS: int = 6  # Smallest adaptive batch window
+    BATCH_MAX_DAYS: int = 31  # Largest adaptive batch window
 
     # Storage configuration
     DATA_DIR: str = "data"
@@ -91,6 +101,13 @@ class Settings(BaseSettings):
     PROCESS_ATTACHMENTS: bool = True
     MAX_ATTACHMENT_SIZE_MB: int = 50
     ATTACHMENT_TIMEOUT: int = 60
+    ATTACHMENT_DOWNLOAD_CHUNK_KB: int = 64  # Read buffer when streaming attachments to disk
+    ATTACHMENT_DEDUP_MAX_CHUNKS: int = 10000  # Attachment chunks kept for reuse across decisions, 0 disables
+
+    # On-disk HTTP cache for decision documents and attachments
+    HTTP_CACHE_ENABLED: bool = False  # Revalidate cached responses with ETag/Last-Modified
+    HTTP_CACHE_DIR: str = "data/http_cache"
+    HTTP_CACHE_MAX_SIZE_MB: int = 2048  # Least recently used entries are evicted beyond this
 
     # Logging configuration
     LOG_LEVEL: str = "INFO"
@@ -107,11 +124,14 @@ class Settings(BaseSettings):
 
     # Processing configuration
     MAX_CONCURRENT_REQUESTS: int = 2
+    FETCH_PREFETCH_DOCUMENTS: int = 200  # Fetched documents buffered ahead of the consumer
 
     # Concurrency configuration
     MAX_WORKERS_INGESTION: int = 1  # Parallel document ingestion
     MAX_WORKERS_ATTACHMENTS: int = 5  # Parallel attachment downloads
     MAX_WORKERS_ATTACHMENT_PROCESSING: int = 2  # Parallel attachment processing
+    ATTACHMENT_MAX_DOWNLOADS_PER_HOST: int = 3  # Concurrent attachment downloads per host
+    ATTACHMENT_PREFETCH_FILES: int = 20  # Downloaded attachments allowed to wait for processing
     EMBEDDING_BATCH_SIZE: int = 100  # Increased from 16 for better throughput
 
     # Azure OpenAI configuration
@@ -127,9 +147,45 @@ class Settings(BaseSettings):
     ELASTICSEARCH_CERT: str = ""  # Path to SSL certificate if needed
     ELASTICSEARCH_USER: str = ""
     ELASTICSEARCH_PASSWORD: str = ""
+    ELASTICSEARCH_BULK_LOAD_STATE_FILE: str = "data/es_bulk_load_state.json"  # Original settings while bulk loading
+    ELASTICSEARCH_BULK_LOAD_STALE_SECONDS: int = 900  # Bulk load without heartbeat for this long is treated as crashed
+    ELASTICSEARCH_INDEXING_STATS_FILE: str = "data/es_indexing_stats.json"  # Bulk indexing throughput totals
+    ELASTICSEARCH_SHORTLIST_DIMS: int = 0  # e.g. 256: Matryoshka prefix field for the kNN shortlist, 0 disables
+    ELASTICSEARCH_SHORTLIST_OVERSAMPLING: int = 5  # Shortlist hits per result rescored on the full vector
+    ELASTICSEARCH_SHORTLIST_INDEX_TYPE: str = "int8_hnsw"  # index_options type of the shortlist field
+    ELASTICSEARCH_INDEX_FULL_VECTOR: bool = True  # False: new indices keep the full vector for rescoring only
+    ELASTICSEARCH_TEXT_ANALYZER: str = "finnish"  # Analyzer of the text field in newly created indices
 
     # Vector store backend selection
     VECTOR_STORE_BACKENDS: list[str] = ["elasticsearch"]
+    VECTOR_STORE_READ_MODE: str = "primary"  # primary | rrf | first, used with multiple backends
+    VECTOR_STORE_RRF_K: int = 60  # Rank constant for reciprocal rank fusion in "rrf" read mode
+
+    # Hybrid (full-text + kNN) search
+    HYBRID_SEARCH_WINDOW: int = 50  # Results taken from each leg before fusion
+    HYBRID_SEARCH_RRF_K: int = 60  # Rank constant for fusing the lexical and vector legs
+    SEARCH_COLLAPSE_OVERSAMPLING: int = 5  # Candidates per result when collapsing to one chunk per decision
+
+    # Decision-level summary index for two-stage search
+    DECISION_INDEX_ENABLED: bool = False  # Maintain one summary vector per decision during ingestion
+    DECISION_INDEX_SUFFIX: str = "_decisions"  # Appended to ELASTICSEARCH_INDEX, PGVECTOR_TABLE and LOCAL_VECTOR_STORE_DIR
+    DECISION_INDEX_TITLE_WEIGHT: float = 0.5  # Title/metadata embedding weight against the mean chunk embedding
+    DECISION_SHORTLIST_SIZE: int = 50  # Decisions shortlisted before the chunk search
+
+    # /search caches (per API process)
+    QUERY_EMBEDDING_CACHE_SIZE: int = 1024  # Cached query embeddings, 0 disables
+    QUERY_EMBEDDING_CACHE_TTL_SECONDS: int = 86400
+    SEARCH_RESULT_CACHE_SIZE: int = 0  # Cached result lists, 0 disables
+    SEARCH_RESULT_CACHE_TTL_SECONDS: int = 300
+    INDEX_EPOCH_FILE: str = "data/index_epoch.json"  # Bumped by ingestion to invalidate cached results
+
+    # Approximate kNN candidate tuning (python pipeline.py knn-tune)
+    KNN_TUNING_FILE: str = "data/knn_tuning.json"  # num_candidates / ef_search per top_k read by search()
+    KNN_TARGET_RECALL: float = 0.95  # Recall@k against exact search the tuned values must reach
+
+    # Local memory-mapped vector store ("local" in VECTOR_STORE_BACKENDS)
+    LOCAL_VECTOR_STORE_DIR: str = "data/local_vector_store"
+    LOCAL_VECTOR_STORE_DTYPE: str = "float16"  # float16 halves memory; float32 for exact scores
 
     # pgvector configuration
     PGVECTOR_HOST: str = "localhost"
@@ -138,6 +194,19 @@ class Settings(BaseSettings):
     PGVECTOR_USER: str = ""
     PGVECTOR_PASSWORD: str = ""
     PGVECTOR_TABLE: str = "document_chunk"
+    PGVECTOR_HNSW_M: int = 16  # Used when the table has no HNSW index to copy during a bulk load
+    PGVECTOR_HNSW_EF_CONSTRUCTION: int = 64
+    PGVECTOR_BULK_LOAD_MAINTENANCE_WORK_MEM: str = "2GB"  # Session setting for the deferred HNSW build
+    PGVECTOR_BULK_LOAD_PARALLEL_WORKERS: int = 4  # max_parallel_maintenance_workers for the build
+    PGVECTOR_INDEX_BUILD_PROGRESS_SECONDS: int = 30  # Index build progress log interval, 0 disables
+    PGVECTOR_BINARY_QUANTIZATION: bool = False  # Search via binary_quantize() Hamming index + halfvec re-rank
+    PGVECTOR_BQ_OVERSAMPLING: int = 4  # Hamming candidates per requested result
+    PGVECTOR_CREATE_SCHEMA: bool = False  # Create the extension, table and indexes on startup
+    PGVECTOR_PROMOTED_COLUMNS: bool = False  # Write/filter typed metadata columns (see pgvector-migrate-schema)
+    PGVECTOR_PARTITION_BY_DATE: bool = False  # Table is range-partitioned by decision year (implies promoted columns)
+    PGVECTOR_ITERATIVE_SCAN: str = "off"  # off | strict_order | relaxed_order (pgvector 0.8+)
+    PGVECTOR_MAX_SCAN_TUPLES: int = 20000  # Upper bound on tuples visited by an iterative scan
+    PGVECTOR_TEXT_SEARCH_CONFIG: str = "finnish"  # Text search configuration of the hybrid full-text leg
 
     # Chunking configuration
     EMBED_METADATA_IN_CHUNKS: bool = True  # Feature flag for metadata embedding
@@ -1,5 +1,6 @@
 """Repositories package initialization."""
 
 from .decision_repository import DecisionRepository
+from .write_behind import DecisionWriteBehind
 
-__all__ = ["DecisionRepository"]
+__all__ = ["DecisionRepository", "DecisionWriteBehind"]
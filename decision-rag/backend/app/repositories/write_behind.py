@@ -0,0 +1,88 @@
+"""
+Write-behind persistence of decision documents.
+
+The full pipeline hands fetched documents to ingestion in memory. When the JSON
+files are to be kept, DecisionWriteBehind saves them with
+DecisionRepository.save_decision on a background thread, so file I/O does not
+hold up fetching or ingestion.
+"""
+
+import logging
+import queue
+import threading
+from typing import Dict
+
+from ..schemas.decision import DecisionDocument
+from .decision_repository import DecisionRepository
+
+logger = logging.getLogger(__name__)
+
+# Tells the writer thread that no more documents follow
+_CLOSE = object()
+
+
+class DecisionWriteBehind:
+    """Saves decision documents to a repository on a background thread."""
+
+    def __init__(self, repository: DecisionRepository, max_pending: int = 100):
+        """
+        Start the writer thread.
+
+        Args:
+            repository: Repository the documents are saved to
+            max_pending: Documents allowed to wait for saving before submit() blocks
+        """
+        self.repository = repository
+        self.stats = {"saved": 0, "failed": 0}
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max(1, max_pending))
+        self._closed = False
+        self._writer = threading.Thread(
+            target=self._write, name="decision-write-behind", daemon=True
+        )
+        self._writer.start()
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
+    def submit(self, decision: DecisionDocument) -> None:
+        """
+        Queue *decision* to be saved.
+
+        A copy is queued, so the document is saved as it was when submitted even
+        if ingestion changes it in the meantime (e.g. assigning attachment IDs).
+        """
+        self._queue.put(decision.model_copy(deep=True))
+
+    def close(self) -> Dict[str, int]:
+        """
+        Save the queued documents and stop the writer thread.
+
+        Returns:
+            Dictionary with saved and failed counts
+        """
+        if not self._closed:
+            self._closed = True
+            self._queue.put(_CLOSE)
+            self._writer.join()
+            logger.info(
+                f"Write-behind complete: {self.stats['saved']} decisions saved, "
+                f"{self.stats['failed']} failed"
+            )
+        return dict(self.stats)
+
+    def _write(self) -> None:
+        while True:
+            decision = self._queue.get()
+            if decision is _CLOSE:
+                return
+            try:
+                saved = self.repository.save_decision(decision)
+            except Exception as e:
+                logger.error(f"Error saving decision {decision.NativeId}: {e}")
+                saved = False
+            self.stats["saved" if saved else "failed"] += 1
@@ -2,6 +2,8 @@
 
 from .api_client import DecisionAPIClient
 from .attachment_downloader import AttachmentDownloader
+from .attachment_registry import AttachmentRegistry
+from .attachment_scheduler import AttachmentScheduler
 from .chunker import DocumentChunk, ParagraphChunker
 from .content_converter import (
     HTMLSanitizer,
@@ -9,34 +11,64 @@ from .content_converter import (
     convert_attachment_content,
     convert_decision_content,
 )
+from .context_builder import ContextBuilder
 from .data_fetcher import DecisionDataFetcher
+from .decision_index import DecisionSummaryIndex
 from .elasticsearch_store import ElasticsearchVectorStore
 from .embedder import AzureEmbedder, EmbeddingResult
+from .http_cache import HTTPCache, get_http_cache
 from .ingestion_pipeline import IngestionPipeline
 from .job_manager import Job, JobManager, job_manager
+from .knn_tuning import KnnTuning
+from .local_vector_store import LocalVectorStore
 from .parquet_embedding_saver import ParquetEmbeddingSaver
 from .pgvector_store import PgvectorVectorStore
+from .rate_limiter import RateLimiter, rate_limiter
+from .retry_queue import DelayedRetryQueue
 from .scheduler import SchedulerService
+from .search_cache import SearchCache, search_cache
+from .search_filters import FilterCondition, SearchFilter
 from .scheduler_state import ExecutionRecord, SchedulerState, SchedulerStateManager
-from .vector_store import BaseVectorStore, CompositeVectorStore, MaxRetriesExceededError
+from .vector_store import (
+    BaseVectorStore,
+    CompositeVectorStore,
+    MaxRetriesExceededError,
+    supported_options,
+)
 
 __all__ = [
     "DecisionAPIClient",
     "DecisionDataFetcher",
     "AttachmentDownloader",
+    "AttachmentRegistry",
+    "AttachmentScheduler",
     "convert_decision_content",
     "convert_attachment_content",
     "MarkdownConverter",
     "HTMLSanitizer",
+    "ContextBuilder",
     "ParagraphChunker",
     "DocumentChunk",
     "AzureEmbedder",
     "EmbeddingResult",
+    "HTTPCache",
+    "get_http_cache",
     "BaseVectorStore",
     "ElasticsearchVectorStore",
     "PgvectorVectorStore",
+    "RateLimiter",
+    "rate_limiter",
+    "DelayedRetryQueue",
     "CompositeVectorStore",
+    "DecisionSummaryIndex",
+    "KnnTuning",
+    "LocalVectorStore",
     "MaxRetriesExceededError",
+    "supported_options",
+    "SearchCache",
+    "search_cache",
+    "SearchFilter",
+    "FilterCondition",
     "IngestionPipeline",
     "Job",
     "JobManager",
@@ -2,16 +2,24 @@
 API client for fetching decision ids and singular decisions from City of Helsinki decisions API.
 
 The DecisionAPIClient class provides methods for fetching decision IDs based on date ranges and retrieving individual decision documents by their NativeId. The client implements robust error handling and retry logic to ensure reliable communication with the API, while respecting rate limits.
+
+Documents can also be fetched with asyncio over one pooled httpx.AsyncClient (HTTP/2 when the h2 package is installed), where the rate limiter alone bounds concurrency.
+
+With HTTP_CACHE_ENABLED, fetched documents are kept in the on-disk HTTP cache and revalidated with conditional requests, so re-fetching an unchanged document costs a 304 response.
 """
 
+import asyncio
+import importlib.util
+import json
 import logging
-import threading
-import time
-from typing import Any, Callable, Dict, Optional
+import math
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Union
 
 import httpx
 from tenacity import (
     retry,
+    retry_if_exception,
     retry_if_exception_type,
     stop_after_attempt,
     wait_exponential,
@@ -23,10 +31,28 @@ from ..schemas.decision import (
     DecisionDocumentResponse,
     DecisionIdResponse,
 )
+from .http_cache import CacheEntry, HTTPCache, get_http_cache
+from .rate_limiter import RateLimiter, is_throttle_error, rate_limiter
 
 logger = logging.getLogger(__name__)
 api_logger = logging.getLogger("api")
 
+# Query parameters masked in request logs
+_SENSITIVE_PARAM_KEYS = {"api-key", "apikey", "api_key", "key", "token", "secret"}
+
+_RETRY_POLICY = dict(
+    stop=stop_after_attempt(settings.MAX_RETRY_ATTEMPTS),
+    wait=wait_exponential(
+        multiplier=settings.RETRY_BACKOFF_FACTOR,
+        min=settings.RETRY_MIN_WAIT,
+        max=settings.RETRY_MAX_WAIT,
+    ),
+    retry=(
+        retry_if_exception_type((httpx.TimeoutException, httpx.NetworkError))
+        | retry_if_exception(is_throttle_error)
+    ),
+)
+
 
 class APIOutageError(Exception):
     """Exception raised when API-wide outage is detected (404 on decision IDs endpoint)."""
@@ -39,16 +65,31 @@ class DecisionAPIClient:
     def __init__(
         self,
         raw_response_saver: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+        limiter: Optional[RateLimiter] = None,
+        http_cache: Optional[HTTPCache] = None,
     ):
-        """Initialize the API client."""
+        """
+        Initialize the API client.
+
+        Args:
+            raw_response_saver: Called with (native_id, raw JSON) for every fetched document
+            limiter: Rate limiter (defaults to the process-wide one shared with
+                AttachmentDownloader)
+            http_cache: Cache for decision documents (defaults to the process-wide
+                one when HTTP_CACHE_ENABLED is set)
+        """
         self.base_url = settings.API_BASE_URL
         self.timeout = settings.REQUEST_TIMEOUT
         self.client = httpx.Client(timeout=self.timeout)
         if settings.REQUESTS_PER_SECOND <= 0:
             raise ValueError("REQUESTS_PER_SECOND must be greater than 0")
-        self.rate_limit_delay = 1.0 / settings.REQUESTS_PER_SECOND
-        self.last_request_time = 0
+        self.rate_limiter = limiter or rate_limiter
         self.raw_response_saver = raw_response_saver
+        self.http_cache = http_cache if http_cache is not None else get_http_cache()
+
+        self.http2 = settings.API_HTTP2 and importlib.util.find_spec("h2") is not None
+        if settings.API_HTTP2 and not self.http2 and settings.API_ASYNC_FETCH:
+            logger.warning("API_HTTP2 is set but the h2 package is not installed; using HTTP/1.1")
 
     def __enter__(self):
         """Context manager entry."""
@@ -63,59 +104,44 @@ class DecisionAPIClient:
         if self.client:
             self.client.close()
 
-    def _rate_limit(self) -> None:
-        """Apply rate limiting between requests.
+    @staticmethod
+    def _safe_params(params: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Return params with secrets masked, for logging."""
+        if not params:
+            return params
+        return {k: ("***" if k.lower() in _SENSITIVE_PARAM_KEYS else v) for k, v in params.items()}
 
-        Uses a lock to ensure thread-safe rate limiting across concurrent requests.
-        """
-        if not hasattr(self, '_rate_limit_lock'):
-            self._rate_limit_lock = threading.Lock()
-
-        with self._rate_limit_lock:
-            current_time = time.time()
-            time_since_last = current_time - self.last_request_time
-            if time_since_last < self.rate_limit_delay:
-                sleep_time = self.rate_limit_delay - time_since_last
-                time.sleep(sleep_time)
-            self.last_request_time = time.time()
-
-    @retry(
-        stop=stop_after_attempt(settings.MAX_RETRY_ATTEMPTS),
-        wait=wait_exponential(
-            multiplier=settings.RETRY_BACKOFF_FACTOR,
-            min=settings.RETRY_MIN_WAIT,
-            max=settings.RETRY_MAX_WAIT,
-        ),
-        retry=retry_if_exception_type((httpx.TimeoutException, httpx.NetworkError)),
-    )
-    def _make_request(self, url: str, params: Optional[Dict[str, Any]] = None) -> httpx.Response:
+    @retry(**_RETRY_POLICY)
+    def _make_request(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> httpx.Response:
         """
         Make HTTP request with retry logic.
 
         Args:
             url: Request URL
             params: Query parameters
+            headers: Extra request headers, e.g. cache validators
 
         Returns:
-            HTTP response
+            HTTP response (304 Not Modified counts as success)
         """
-        self._rate_limit()
+        self.rate_limiter.acquire(url)
 
         # Sanitize params before logging — never expose the API key.
-        _SENSITIVE_PARAM_KEYS = {"api-key", "apikey", "api_key", "key", "token", "secret"}
-        safe_params = (
-            {
-                k: ("***" if k.lower() in _SENSITIVE_PARAM_KEYS else v)
-                for k, v in params.items()
-            }
-            if params
-            else params
-        )
-        api_logger.debug(f"Making request to {url} with params: {safe_params}")
+        api_logger.debug(f"Making request to {url} with params: {self._safe_params(params)}")
 
         try:
-            response = self.client.get(url, params=params)
-            response.raise_for_status()
+            if headers:
+                response = self.client.get(url, params=params, headers=headers)
+            else:
+                response = self.client.get(url, params=params)
+            self.rate_limiter.record_response(url, response.status_code, response.headers)
+            if response.status_code != 304:
+                response.raise_for_status()
             api_logger.debug(f"Request successful: {url}")
             return response
         except httpx.HTTPStatusError as e:
@@ -131,6 +157,60 @@ class DecisionAPIClient:
             api_logger.error(f"Unexpected error for {url}: {e}")
             raise
 
+    @retry(**_RETRY_POLICY)
+    async def _make_request_async(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> httpx.Response:
+        """
+        Make an HTTP request on the async client with the same retry policy as _make_request.
+
+        Args:
+            client: Pooled async client
+            url: Request URL
+            params: Query parameters
+            headers: Extra request headers, e.g. cache validators
+
+        Returns:
+            HTTP response (304 Not Modified counts as success)
+        """
+        await self.rate_limiter.acquire_async(url)
+        api_logger.debug(f"Making async request to {url} with params: {self._safe_params(params)}")
+
+        try:
+            response = await client.get(url, params=params, headers=headers)
+            self.rate_limiter.record_response(url, response.status_code, response.headers)
+            if response.status_code != 304:
+                response.raise_for_status()
+            api_logger.debug(f"Request successful: {url} ({response.http_version})")
+            return response
+        except httpx.HTTPStatusError as e:
+            api_logger.error(f"HTTP error for {url}: {e.response.status_code} - {e.response.text}")
+            raise
+        except httpx.TimeoutException:
+            api_logger.error(f"Timeout for {url}")
+            raise
+        except httpx.NetworkError as e:
+            api_logger.error(f"Network error for {url}: {e}")
+            raise
+        except Exception as e:
+            api_logger.error(f"Unexpected error for {url}: {e}")
+            raise
+
+    def _async_client(self) -> httpx.AsyncClient:
+        """Create the pooled async client used by one fetch_decision_documents() call."""
+        return httpx.AsyncClient(
+            timeout=self.timeout,
+            http2=self.http2,
+            limits=httpx.Limits(
+                max_connections=settings.API_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.API_MAX_CONNECTIONS,
+            ),
+        )
+
     def fetch_decision_ids(
         self,
         api_key: str,
@@ -139,16 +219,113 @@ class DecisionAPIClient:
         size: int = None,
     ) -> DecisionIdResponse:
         """
-        Fetch decision IDs for a date range.
+        Fetch all decision IDs for a date range, following pagination.
+
+        The first page reports the total count; the remaining pages are then
+        fetched in parallel (paced by the rate limiter). Pages are followed one by
+        one after that until the count is reached, in case the API returned
+        shorter pages than asked for. When the API reports no count, pages are
+        followed one by one while nextCount is set. Paging always stops at an
+        empty page or one without new IDs.
+
+        Args:
+            api_key: API key for authentication
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format
+            size: Number of results per page
+
+        Returns:
+            DecisionIdResponse containing the decision IDs of every page, with
+            count set to the total reported by the API
+        """
+        if size is None:
+            size = settings.API_PAGE_SIZE
+
+        first = self.fetch_decision_ids_page(api_key, start_date, end_date, size)
+        page_size = first.size or size
+        first_page = first.page or 0
+        pages = [first]
+
+        # IDs can shift between pages while the listing changes; keep the first occurrence
+        seen = set()
+        decisions = []
+
+        def collect(response: DecisionIdResponse) -> int:
+            added = 0
+            for decision in response.decisions:
+                if decision.NativeId not in seen:
+                    seen.add(decision.NativeId)
+                    decisions.append(decision)
+                    added += 1
+            return added
+
+        collect(first)
+        if first.count is not None:
+            total_pages = max(1, math.ceil(first.count / page_size))
+            if total_pages > 1 and first.decisions:
+                remaining = range(first_page + 1, first_page + total_pages)
+                with ThreadPoolExecutor(
+                    max_workers=max(1, min(settings.MAX_CONCURRENT_REQUESTS, len(remaining)))
+                ) as executor:
+                    pages.extend(
+                        executor.map(
+                            lambda page: self.fetch_decision_ids_page(
+                                api_key, start_date, end_date, size, page
+                            ),
+                            remaining,
+                        )
+                    )
+                for response in pages[1:]:
+                    collect(response)
+
+        page = first_page + len(pages) - 1
+        added = len(decisions)
+        while (
+            added
+            and pages[-1].decisions
+            and (
+                len(decisions) < first.count
+                if first.count is not None
+                else pages[-1].nextCount
+            )
+        ):
+            page += 1
+            pages.append(self.fetch_decision_ids_page(api_key, start_date, end_date, size, page))
+            added = collect(pages[-1])
+
+        if len(pages) == 1:
+            return first
+
+        if first.count is not None and len(decisions) < first.count:
+            logger.warning(
+                f"Paged listing from {start_date} to {end_date} returned {len(decisions)} "
+                f"of {first.count} decision IDs"
+            )
+        logger.info(f"Retrieved {len(decisions)} decision IDs from {len(pages)} pages")
+        return DecisionIdResponse(
+            decisions=decisions, page=first.page, count=first.count, size=page_size
+        )
+
+    def fetch_decision_ids_page(
+        self,
+        api_key: str,
+        start_date: str,
+        end_date: str,
+        size: int = None,
+        page: Optional[int] = None,
+    ) -> DecisionIdResponse:
+        """
+        Fetch one page of decision IDs for a date range.
 
         Args:
             api_key: API key for authentication
             start_date: Start date in YYYY-MM-DD format
             end_date: End date in YYYY-MM-DD format
-            size: Number of results
+            size: Number of results per page
+            page: Page to fetch; None requests the first page without a page parameter
 
         Returns:
-            DecisionIdResponse containing list of decision IDs
+            DecisionIdResponse containing one page of decision IDs
         """
         if size is None:
             size = settings.API_PAGE_SIZE
@@ -160,8 +337,13 @@ class DecisionAPIClient:
             "handledbefore": end_date,
             "size": size,
         }
+        if page is not None:
+            params["page"] = page
 
-        logger.info(f"Fetching decision IDs from {start_date} to {end_date}")
+        logger.info(
+            f"Fetching decision IDs from {start_date} to {end_date}"
+            + (f" (page {page})" if page is not None else "")
+        )
 
         try:
             response = self._make_request(url, params)
@@ -213,37 +395,100 @@ class DecisionAPIClient:
         logger.debug(f"Fetching decision document: {native_id}")
 
         try:
-            response = self._make_request(url, params)
-            data = response.json()
+            cached = self.http_cache.lookup(url) if self.http_cache else None
+            response = self._make_request(url, params, HTTPCache.conditional_headers(cached))
+            return self._parse_decision_document(
+                native_id, self._decode_document_response(url, response, cached)
+            )
 
-            # Save full raw response if a saver is configured
-            if self.raw_response_saver is not None:
-                try:
-                    self.raw_response_saver(native_id, data)
-                except Exception as e:
-                    logger.error(f"Failed to save raw response for {native_id}: {e}")
-
-            # The endpoint returns a single decision, not a list
-            # Compatible with v1 of the API
-            if isinstance(data, dict):
-                # Try to parse as single decision
-                if "NativeId" in data:
-                    decision = DecisionDocument(**data)
-                    logger.debug(f"Successfully fetched decision: {native_id}")
-                    return decision
-                # Or as a response with decisions list
-                elif "decisions" in data:
-                    response_obj = DecisionDocumentResponse(**data)
-                    if response_obj.decisions:
-                        return response_obj.decisions[0]
-            # Compatible with v2 of the API
-            elif isinstance(data, list) and len(data) > 0:
-                response_obj = DecisionDocumentResponse(decisions=[DecisionDocument(**item) for item in data])
-                if response_obj.decisions:
-                    return response_obj.decisions[0]
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                logger.warning(f"Decision not found: {native_id}")
+                return None
+            logger.error(f"HTTP error fetching decision {native_id}: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Error fetching decision {native_id}: {e}")
+            raise
+
+    def fetch_decision_documents(
+        self,
+        native_ids: List[str],
+        api_key: str,
+        on_document: Optional[Callable[[DecisionDocument], None]] = None,
+    ) -> Dict[str, Union[Optional[DecisionDocument], Exception]]:
+        """
+        Fetch several decision documents concurrently with asyncio.
+
+        Runs fetch_decision_documents_async() in a new event loop, so it must be
+        called from a thread without a running loop (CLI, background job threads).
+
+        Args:
+            native_ids: NativeIds to fetch
+            api_key: API key for authentication
+            on_document: Called with each document as soon as it is fetched
+
+        Returns:
+            Dict of native_id to its DecisionDocument, None if not found, or the
+            exception that made the fetch fail after retries
+        """
+        return asyncio.run(self.fetch_decision_documents_async(native_ids, api_key, on_document))
+
+    async def fetch_decision_documents_async(
+        self,
+        native_ids: List[str],
+        api_key: str,
+        on_document: Optional[Callable[[DecisionDocument], None]] = None,
+    ) -> Dict[str, Union[Optional[DecisionDocument], Exception]]:
+        """
+        Fetch several decision documents over one pooled async client.
+
+        Every fetch starts at once and waits for its rate limiter slot, so
+        REQUESTS_PER_SECOND rather than a worker count bounds the request rate;
+        API_MAX_CONNECTIONS caps the open connections.
+
+        Args:
+            native_ids: NativeIds to fetch
+            api_key: API key for authentication
+            on_document: Called with each document as soon as it is fetched, on a
+                single handoff thread so it may block to apply backpressure
+                without stalling the event loop
 
-            logger.warning(f"No decision found for NativeId: {native_id}")
-            return None
+        Returns:
+            Dict of native_id to its DecisionDocument, None if not found, or the
+            exception that made the fetch fail after retries
+        """
+
+        loop = asyncio.get_running_loop()
+
+        async def fetch(client: httpx.AsyncClient, native_id: str) -> Optional[DecisionDocument]:
+            document = await self._fetch_decision_document_async(client, native_id, api_key)
+            if document and on_document is not None:
+                await loop.run_in_executor(handoff, on_document, document)
+            return document
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="document-handoff") as handoff:
+            async with self._async_client() as client:
+                results = await asyncio.gather(
+                    *(fetch(client, native_id) for native_id in native_ids),
+                    return_exceptions=True,
+                )
+        return dict(zip(native_ids, results))
+
+    async def _fetch_decision_document_async(
+        self, client: httpx.AsyncClient, native_id: str, api_key: str
+    ) -> Optional[DecisionDocument]:
+        url = f"{self.base_url}{settings.DECISION_DOCUMENT_ENDPOINT.format(native_id=native_id)}"
+        logger.debug(f"Fetching decision document: {native_id}")
+
+        try:
+            cached = self.http_cache.lookup(url) if self.http_cache else None
+            response = await self._make_request_async(
+                client, url, {"api-key": api_key}, HTTPCache.conditional_headers(cached)
+            )
+            return self._parse_decision_document(
+                native_id, self._decode_document_response(url, response, cached)
+            )
 
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
@@ -254,3 +499,65 @@ class DecisionAPIClient:
         except Exception as e:
             logger.error(f"Error fetching decision {native_id}: {e}")
             raise
+
+    def _decode_document_response(
+        self, url: str, response: httpx.Response, cached: Optional[CacheEntry]
+    ) -> Any:
+        """
+        Decode a document response, serving 304 from the HTTP cache and caching fresh bodies.
+
+        Args:
+            url: Request URL, the cache key (the API key is sent as a parameter)
+            response: Response to a request made with the validators of *cached*
+            cached: Cache entry the request was conditional on, if any
+
+        Returns:
+            Decoded JSON body
+        """
+        if self.http_cache is None:
+            return response.json()
+        if response.status_code == 304 and cached is not None:
+            self.http_cache.mark_revalidated(cached)
+            return json.loads(self.http_cache.read(cached))
+        self.http_cache.store(url, response.content, response.headers)
+        return response.json()
+
+    def _parse_decision_document(self, native_id: str, data: Any) -> Optional[DecisionDocument]:
+        """
+        Save the raw response if configured and parse the decision from it.
+
+        Args:
+            native_id: The NativeId that was requested
+            data: Decoded JSON response
+
+        Returns:
+            DecisionDocument object or None if the response holds no decision
+        """
+        # Save full raw response if a saver is configured
+        if self.raw_response_saver is not None:
+            try:
+                self.raw_response_saver(native_id, data)
+            except Exception as e:
+                logger.error(f"Failed to save raw response for {native_id}: {e}")
+
+        # The endpoint returns a single decision, not a list
+        # Compatible with v1 of the API
+        if isinstance(data, dict):
+            # Try to parse as single decision
+            if "NativeId" in data:
+                decision = DecisionDocument(**data)
+                logger.debug(f"Successfully fetched decision: {native_id}")
+                return decision
+            # Or as a response with decisions list
+            elif "decisions" in data:
+                response_obj = DecisionDocumentResponse(**data)
+                if response_obj.decisions:
+                    return response_obj.decisions[0]
+        # Compatible with v2 of the API
+        elif isinstance(data, list) and len(data) > 0:
+            response_obj = DecisionDocumentResponse(decisions=[DecisionDocument(**item) for item in data])
+            if response_obj.decisions:
+                return response_obj.decisions[0]
+
+        logger.warning(f"No decision found for NativeId: {native_id}")
+        return None
@@ -2,17 +2,22 @@
 Attachment downloader service for fetching decision attachments.
 
 Attachments are downloaded from public URLs provided in the decision documents, with filtering based on publicity and personal data criteria. The service includes rate limiting, retry logic, and optional parallelization for efficient downloading of multiple attachments.
+
+Downloads are streamed to disk in ATTACHMENT_DOWNLOAD_CHUNK_KB chunks and hashed on the way, so memory use per download stays at one chunk; oversized files are rejected from Content-Length or as soon as the running byte count passes MAX_ATTACHMENT_SIZE_MB.
+
+With HTTP_CACHE_ENABLED, downloads go through the on-disk HTTP cache: unchanged files are revalidated with conditional requests instead of downloaded again, and files are stored by content hash so identical attachments are kept once. Attachments of a decision with identical content are processed once.
 """
 
-import threading
-import time
+import hashlib
+import os
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import httpx
 from tenacity import (
     retry,
+    retry_if_exception,
     retry_if_exception_type,
     stop_after_attempt,
     wait_exponential,
@@ -20,6 +25,8 @@ from tenacity import (
 
 from app.core import get_logger, settings
 from app.schemas.decision import Attachment
+from app.services.http_cache import HTTPCache, get_http_cache
+from app.services.rate_limiter import RateLimiter, is_throttle_error, rate_limiter
 
 logger = get_logger(__name__)
 
@@ -31,28 +38,39 @@ class AttachmentDownloader:
         self,
         timeout: int = None,
         rate_limit: float = None,
+        limiter: Optional[RateLimiter] = None,
+        http_cache: Optional[HTTPCache] = None,
     ):
         """
         Initialize attachment downloader.
 
         Args:
             timeout: HTTP request timeout in seconds
-            rate_limit: Requests per second limit
+            rate_limit: Requests per second limit per host; gives this downloader
+                its own limiter instead of the process-wide one
+            limiter: Rate limiter to use (defaults to the process-wide one shared
+                with DecisionAPIClient)
+            http_cache: Cache for downloaded files (defaults to the process-wide one
+                when HTTP_CACHE_ENABLED is set)
         """
         self.timeout = timeout or getattr(settings, "ATTACHMENT_TIMEOUT", 60)
         if rate_limit is not None and rate_limit <= 0:
             raise ValueError("Rate limit must be a positive number")
         if getattr(settings, "REQUESTS_PER_SECOND", 5.0) <= 0:
             raise ValueError("REQUESTS_PER_SECOND must be greater than 0")
-        self.rate_limit_delay = 1.0 / (rate_limit or getattr(settings, "REQUESTS_PER_SECOND", 5.0))
-        self.last_request_time = 0
-        self._rate_limit_lock = threading.Lock()  # Thread-safe rate limiting
+        if limiter is None:
+            limiter = RateLimiter(rate=rate_limit) if rate_limit else rate_limiter
+        self.rate_limiter = limiter
+        self.http_cache = http_cache if http_cache is not None else get_http_cache()
+        # Digests of downloaded files, computed while streaming them to disk
+        self._file_digests: Dict[Path, str] = {}
 
         self.client = httpx.Client(timeout=self.timeout, follow_redirects=True)
 
         logger.info(
             f"Initialized AttachmentDownloader with timeout={self.timeout}s, "
-            f"rate_limit={1.0/self.rate_limit_delay:.1f} req/s"
+            f"rate_limit={self.rate_limiter.rate:.1f} req/s per host, "
+            f"burst={self.rate_limiter.burst}"
         )
 
     def __enter__(self):
@@ -68,16 +86,6 @@ class AttachmentDownloader:
         if self.client:
             self.client.close()
 
-    def _rate_limit(self):
-        """Apply rate limiting between requests. Thread-safe."""
-        with self._rate_limit_lock:
-            current_time = time.time()
-            time_since_last = current_time - self.last_request_time
-            if time_since_last < self.rate_limit_delay:
-                sleep_time = self.rate_limit_delay - time_since_last
-                time.sleep(sleep_time)
-            self.last_request_time = time.time()
-
     def should_fetch_attachment(self, attachment: Attachment) -> bool:
         """
         Determine if an attachment should be fetched.
@@ -116,7 +124,10 @@ class AttachmentDownloader:
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=2.0, min=1.0, max=60.0),
-        retry=retry_if_exception_type((httpx.TimeoutException, httpx.NetworkError)),
+        retry=(
+            retry_if_exception_type((httpx.TimeoutException, httpx.NetworkError))
+            | retry_if_exception(is_throttle_error)
+        ),
     )
     def download_attachment(
         self, file_uri: str, target_path: Path, attachment_title: str = ""
@@ -133,40 +144,69 @@ class AttachmentDownloader:
             Path to downloaded file on success, None on failure
         """
         try:
-            self._rate_limit()
+            self.rate_limiter.acquire(file_uri)
 
             logger.debug(f"Downloading attachment '{attachment_title}' from {file_uri}")
 
-            # Make request
-            response = self.client.get(file_uri)
-            response.raise_for_status()
+            # Stream the response, conditional on the cached copy if there is one
+            cached = self.http_cache.lookup(file_uri) if self.http_cache else None
+            with self.client.stream(
+                "GET", file_uri, headers=HTTPCache.conditional_headers(cached)
+            ) as response:
+                self.rate_limiter.record_response(
+                    file_uri, response.status_code, response.headers
+                )
+
+                if response.status_code == 304 and cached is not None:
+                    self.http_cache.mark_revalidated(cached)
+                    self.http_cache.copy_to(cached, target_path)
+                    self._file_digests[target_path] = cached.sha256
+                    logger.info(
+                        f"Attachment '{attachment_title}' unchanged, "
+                        f"copied {cached.size} bytes from cache to {target_path}"
+                    )
+                    return target_path
+                response.raise_for_status()
 
-            # Check file size
-            content_length = response.headers.get("content-length")
-            if content_length:
-                size_mb = int(content_length) / (1024 * 1024)
+                # Reject by declared size before reading any of the body
                 max_size = getattr(settings, "MAX_ATTACHMENT_SIZE_MB", 50)
-                if size_mb > max_size:
+                max_bytes = max_size * 1024 * 1024
+                content_length = response.headers.get("content-length")
+                if content_length and int(content_length) > max_bytes:
                     logger.warning(
                         f"Attachment '{attachment_title}' exceeds max size: "
-                        f"{size_mb:.1f}MB > {max_size}MB"
+                        f"{int(content_length) / (1024 * 1024):.1f}MB > {max_size}MB"
                     )
                     return None
 
-            # Ensure target directory exists
-            target_path.parent.mkdir(parents=True, exist_ok=True)
+                # Ensure target directory exists
+                target_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Write to file
-            with open(target_path, "wb") as f:
-                f.write(response.content)
+                written = self._stream_to_file(response, target_path, max_bytes)
+                if written is None:
+                    logger.warning(
+                        f"Attachment '{attachment_title}' exceeds max size: "
+                        f"download stopped after {max_size}MB"
+                    )
+                    return None
+                digest, size = written
+
+            self._file_digests[target_path] = digest
+            if self.http_cache is not None:
+                self.http_cache.store_file(file_uri, target_path, digest, response.headers)
 
             logger.info(
-                f"Downloaded attachment '{attachment_title}' "
-                f"({len(response.content)} bytes) to {target_path}"
+                f"Downloaded attachment '{attachment_title}' ({size} bytes) to {target_path}"
             )
             return target_path
 
         except httpx.HTTPStatusError as e:
+            if is_throttle_error(e):
+                logger.warning(
+                    f"Throttled downloading '{attachment_title}' from {file_uri}: "
+                    f"{e.response.status_code}"
+                )
+                raise  # Let retry handle it once the limiter allows
             logger.error(
                 f"HTTP error downloading '{attachment_title}' from {file_uri}: "
                 f"{e.response.status_code}"
@@ -185,6 +225,41 @@ class AttachmentDownloader:
             )
             return None
 
+    @staticmethod
+    def _stream_to_file(
+        response: httpx.Response, target_path: Path, max_bytes: int
+    ) -> Optional[Tuple[str, int]]:
+        """
+        Write a streamed response body to *target_path* in fixed-size chunks.
+
+        The body goes to a ".part" file that is renamed into place once complete,
+        so an aborted download never leaves a truncated attachment behind.
+
+        Args:
+            response: Open streaming response
+            target_path: Path to save the file
+            max_bytes: Size limit; the download stops as soon as it is exceeded
+
+        Returns:
+            Tuple of (hex SHA-256, size in bytes), or None if the body exceeded max_bytes
+        """
+        chunk_size = getattr(settings, "ATTACHMENT_DOWNLOAD_CHUNK_KB", 64) * 1024
+        part_path = target_path.with_name(target_path.name + ".part")
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            with open(part_path, "wb") as f:
+                for chunk in response.iter_bytes(chunk_size=chunk_size):
+                    size += len(chunk)
+                    if size > max_bytes:
+                        return None
+                    digest.update(chunk)
+                    f.write(chunk)
+            os.replace(part_path, target_path)
+        finally:
+            part_path.unlink(missing_ok=True)
+        return digest.hexdigest(), size
+
     def download_attachments(
         self, attachments: List[Attachment], temp_dir: Path, decision_native_id: str = ""
     ) -> Dict[str, Path]:
@@ -236,9 +311,7 @@ class AttachmentDownloader:
                         continue
 
                     native_id = attachment.NativeId
-                    ext = self._get_extension_from_uri(attachment.FileURI)
-                    filename = f"{decision_native_id}_{native_id}{ext}"
-                    target_path = temp_dir / filename
+                    target_path = self.attachment_path(temp_dir, decision_native_id, attachment)
 
                     future = executor.submit(
                         self.download_attachment,
@@ -276,9 +349,7 @@ class AttachmentDownloader:
                     )
                     continue
                 native_id = attachment.NativeId
-                ext = self._get_extension_from_uri(attachment.FileURI)
-                filename = f"{decision_native_id}_{native_id}{ext}"
-                target_path = temp_dir / filename
+                target_path = self.attachment_path(temp_dir, decision_native_id, attachment)
 
                 # Download
                 result = self.download_attachment(
@@ -298,7 +369,73 @@ class AttachmentDownloader:
             f"for decision {decision_native_id}"
         )
 
-        return downloaded
+        return self._drop_duplicate_files(downloaded, decision_native_id)
+
+    def _drop_duplicate_files(
+        self, downloaded: Dict[str, Path], decision_native_id: str = ""
+    ) -> Dict[str, Path]:
+        """
+        Keep one attachment of each distinct file content.
+
+        Args:
+            downloaded: Dictionary mapping attachment NativeId to file path
+            decision_native_id: Native ID of parent decision (for logging)
+
+        Returns:
+            Dictionary without attachments whose file repeats an earlier one
+        """
+        unique: Dict[str, Path] = {}
+        seen: Dict[str, str] = {}
+        for native_id, path in sorted(downloaded.items()):
+            digest = self.file_digest(path)
+            if digest in seen:
+                logger.info(
+                    f"Attachment {native_id} of decision {decision_native_id} is identical "
+                    f"to {seen[digest]}; processing it once"
+                )
+                continue
+            seen[digest] = native_id
+            unique[native_id] = path
+        return unique
+
+    def attachment_path(
+        self, temp_dir: Path, decision_native_id: str, attachment: Attachment
+    ) -> Path:
+        """
+        Return the download path of an attachment.
+
+        Args:
+            temp_dir: Download directory of the decision
+            decision_native_id: Native ID of parent decision
+            attachment: Attachment with a NativeId
+
+        Returns:
+            Path named {decision_native_id}_{attachment NativeId}{extension}
+        """
+        ext = self._get_extension_from_uri(attachment.FileURI)
+        return temp_dir / f"{decision_native_id}_{attachment.NativeId}{ext}"
+
+    def file_digest(self, path: Path) -> str:
+        """
+        Return the hex SHA-256 of a downloaded file.
+
+        Uses the digest computed while the file was streamed to disk when there
+        is one, and hashes the file in chunks otherwise.
+
+        Args:
+            path: Path returned by download_attachment
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        digest = self._file_digests.pop(path, None)
+        if digest:
+            return digest
+        sha256 = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                sha256.update(chunk)
+        return sha256.hexdigest()
 
     def _get_extension_from_uri(self, file_uri: str) -> str:
         """
@@ -0,0 +1,210 @@
+"""
+Registry of processed attachments for reuse across decisions.
+
+Decisions of the same case often carry the same attachment: the same NativeId,
+the same FileURI, or identical bytes behind another URI. IngestionPipeline
+registers the chunks and embeddings of each attachment it processes under all
+three keys, and a later decision with a matching attachment reuses them: only
+the decision-specific metadata header, metadata and chunk IDs are regenerated,
+so the file is not converted or embedded again, and with a NativeId or FileURI
+match not even downloaded. Chunk bodies are kept without their metadata header
+and embeddings as float32 arrays, in an LRU bounded by the number of chunks.
+"""
+
+import threading
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from app.core import get_logger, settings
+from app.services.context_builder import split_header
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class RegisteredChunk:
+    """One chunk of a processed attachment, without its decision-specific header."""
+
+    chunk_index: int
+    body: str
+    token_count: int
+    embedding: array
+
+    @property
+    def embedding_list(self) -> List[float]:
+        return self.embedding.tolist()
+
+
+@dataclass
+class ProcessedAttachment:
+    """Chunks and embeddings of an attachment as first processed."""
+
+    decision_native_id: str
+    attachment_native_id: str
+    model: str
+    chunks: List[RegisteredChunk]
+    keys: List[Tuple[str, str]] = field(default_factory=list)
+    seq: int = 0
+
+
+class AttachmentRegistry:
+    """Thread-safe LRU of processed attachments keyed by NativeId, FileURI and SHA-256."""
+
+    def __init__(self, max_chunks: Optional[int] = None):
+        """
+        Initialize the registry.
+
+        Args:
+            max_chunks: Chunks kept across all entries (falls back to
+                ATTACHMENT_DEDUP_MAX_CHUNKS setting); 0 disables the registry
+        """
+        if max_chunks is None:
+            max_chunks = settings.ATTACHMENT_DEDUP_MAX_CHUNKS
+        self.max_chunks = max_chunks
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[int, ProcessedAttachment]" = OrderedDict()
+        self._keys: Dict[Tuple[str, str], int] = {}
+        self._seq = 0
+        self._chunk_count = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_chunks > 0
+
+    @staticmethod
+    def _key_list(
+        native_id: Optional[str], file_uri: Optional[str], sha256: Optional[str]
+    ) -> List[Tuple[str, str]]:
+        keys = [("native_id", native_id), ("file_uri", file_uri), ("sha256", sha256)]
+        return [(kind, value) for kind, value in keys if value]
+
+    def lookup(
+        self,
+        native_id: Optional[str] = None,
+        file_uri: Optional[str] = None,
+        sha256: Optional[str] = None,
+    ) -> Optional[ProcessedAttachment]:
+        """
+        Return the processed attachment matching any of the given keys.
+
+        Args:
+            native_id: Attachment NativeId as published by the API
+            file_uri: Attachment FileURI
+            sha256: Hex SHA-256 of the downloaded file
+
+        Returns:
+            The registered attachment, or None if none matches
+        """
+        keys = self._key_list(native_id, file_uri, sha256)
+        if not self.enabled or not keys:
+            return None
+        with self._lock:
+            for key in keys:
+                seq = self._keys.get(key)
+                if seq is not None:
+                    self._entries.move_to_end(seq)
+                    self.hits += 1
+                    return self._entries[seq]
+            self.misses += 1
+            return None
+
+    def register(
+        self,
+        decision_native_id: str,
+        attachment_native_id: str,
+        model: str,
+        chunks: Sequence[Dict[str, Any]],
+        native_id: Optional[str] = None,
+        file_uri: Optional[str] = None,
+        sha256: Optional[str] = None,
+    ) -> Optional[ProcessedAttachment]:
+        """
+        Register the indexed chunks of a freshly processed attachment.
+
+        Args:
+            decision_native_id: Decision the attachment was processed for
+            attachment_native_id: Attachment NativeId used in its chunk IDs
+            model: Embedding model of the chunks
+            chunks: Indexed chunk dicts with chunk_index, text, token_count and embedding
+            native_id: Attachment NativeId key (None when it was generated locally)
+            file_uri: Attachment FileURI key
+            sha256: Hex SHA-256 key of the downloaded file
+
+        Returns:
+            The registered attachment, or None if the registry is disabled, no key
+            was given or the attachment alone exceeds max_chunks
+        """
+        keys = self._key_list(native_id, file_uri, sha256)
+        if not self.enabled or not keys or not chunks or len(chunks) > self.max_chunks:
+            return None
+
+        processed = ProcessedAttachment(
+            decision_native_id=decision_native_id,
+            attachment_native_id=attachment_native_id,
+            model=model,
+            chunks=[
+                RegisteredChunk(
+                    chunk_index=chunk["chunk_index"],
+                    body=split_header(chunk["text"])[1],
+                    token_count=chunk["token_count"],
+                    embedding=array("f", chunk["embedding"]),
+                )
+                for chunk in chunks
+            ],
+        )
+        with self._lock:
+            self._seq += 1
+            processed.seq = self._seq
+            self._entries[processed.seq] = processed
+            self._chunk_count += len(processed.chunks)
+            self._add_keys(processed, keys)
+            self._evict()
+        return processed
+
+    def add_keys(
+        self,
+        processed: ProcessedAttachment,
+        native_id: Optional[str] = None,
+        file_uri: Optional[str] = None,
+        sha256: Optional[str] = None,
+    ) -> None:
+        """Make *processed* also reachable under the given keys, e.g. after a content match."""
+        keys = self._key_list(native_id, file_uri, sha256)
+        with self._lock:
+            if self._entries.get(processed.seq) is processed:
+                self._add_keys(processed, keys)
+
+    def _add_keys(self, processed: ProcessedAttachment, keys: List[Tuple[str, str]]) -> None:
+        for key in keys:
+            if self._keys.get(key) != processed.seq:
+                self._keys[key] = processed.seq
+                processed.keys.append(key)
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the registry fits max_chunks."""
+        while self._chunk_count > self.max_chunks and self._entries:
+            _, oldest = self._entries.popitem(last=False)
+            self._chunk_count -= len(oldest.chunks)
+            self.evictions += 1
+            for key in oldest.keys:
+                if self._keys.get(key) == oldest.seq:
+                    del self._keys[key]
+
+    def stats(self) -> Dict[str, Any]:
+        """Return entry and chunk counts, hits, misses and evictions."""
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "chunks": self._chunk_count,
+                "max_chunks": self.max_chunks,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
@@ -0,0 +1,366 @@
+"""
+Batch-wide scheduler for attachment downloads and processing.
+
+One scheduler serves every decision of an ingestion batch. Attachments are
+downloaded on a shared pool of MAX_WORKERS_ATTACHMENTS threads, at most
+ATTACHMENT_MAX_DOWNLOADS_PER_HOST at a time per host, and each finished file is
+queued straight away for conversion, chunking, embedding and indexing on a shared
+pool of MAX_WORKERS_ATTACHMENT_PROCESSING threads. Downloads for later decisions
+therefore run while earlier attachments are still converting; at most
+ATTACHMENT_PREFETCH_FILES downloaded files wait for processing at once. An
+optional reuse callback is asked first, so attachments already processed for an
+earlier decision are not downloaded again. With reuse, an attachment that is
+still being downloaded or processed for another decision of the batch (same
+NativeId, FileURI or file content) is waited for and then reused instead of
+being processed twice.
+"""
+
+import shutil
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.core import get_logger, settings
+from app.schemas.decision import Attachment, DecisionDocument
+from app.services.attachment_downloader import AttachmentDownloader
+from app.services.rate_limiter import RateLimiter
+
+logger = get_logger(__name__)
+
+# (key kind, value) under which an attachment is in flight, e.g. ("file_uri", uri)
+_Key = Tuple[str, str]
+# In-flight future of an attachment and the keys it was registered under
+_Claim = Tuple[Future, List[_Key]]
+
+
+def default_reuse_keys(attachment: Attachment, sha256: Optional[str]) -> Dict[str, Optional[str]]:
+    """Return the NativeId, FileURI and content digest keys of *attachment*."""
+    return {"native_id": attachment.NativeId, "file_uri": attachment.FileURI, "sha256": sha256}
+
+
+class _DecisionAttachments:
+    """Progress of one decision's attachments through the scheduler."""
+
+    def __init__(self, decision: DecisionDocument, temp_dir: Path, pending: int):
+        self.decision = decision
+        self.temp_dir = temp_dir
+        self.pending = pending
+        self.digests: Dict[str, str] = {}
+        self.stats = {
+            "attachments_processed": 0,
+            "chunks_created": 0,
+            "chunks_indexed": 0,
+            "failed": 0,
+        }
+        self.future: "Future[Dict[str, Any]]" = Future()
+        self.lock = threading.Lock()
+
+
+class AttachmentScheduler:
+    """Shared download and processing pools for the attachments of a batch of decisions."""
+
+    def __init__(
+        self,
+        downloader: AttachmentDownloader,
+        process: Callable[[DecisionDocument, Attachment, Path, Optional[str]], Dict[str, Any]],
+        download_workers: Optional[int] = None,
+        processing_workers: Optional[int] = None,
+        per_host: Optional[int] = None,
+        prefetch_files: Optional[int] = None,
+        reuse: Optional[
+            Callable[[DecisionDocument, Attachment], Optional[Dict[str, Any]]]
+        ] = None,
+        reuse_keys: Optional[
+            Callable[[Attachment, Optional[str]], Dict[str, Optional[str]]]
+        ] = None,
+    ):
+        """
+        Initialize the scheduler and its pools.
+
+        Args:
+            downloader: Attachment downloader used for filtering and downloads
+            process: Called with (decision, attachment, file_path, sha256) for each
+                downloaded file, sha256 being its hex digest or None; returns stats
+                with success, chunks_created and chunks_indexed
+            download_workers: Download threads (falls back to MAX_WORKERS_ATTACHMENTS)
+            processing_workers: Processing threads (falls back to
+                MAX_WORKERS_ATTACHMENT_PROCESSING)
+            per_host: Concurrent downloads per host (falls back to
+                ATTACHMENT_MAX_DOWNLOADS_PER_HOST)
+            prefetch_files: Downloaded files allowed to wait for processing (falls
+                back to ATTACHMENT_PREFETCH_FILES)
+            reuse: Called with (decision, attachment) before downloading; returns
+                stats like *process* when the attachment was served from earlier
+                results, or None to download and process it
+            reuse_keys: Called with (attachment, sha256) for the keys an in-flight
+                attachment is known by; None values are left out (defaults to
+                NativeId, FileURI and digest)
+        """
+        self.downloader = downloader
+        self.process = process
+        self.reuse = reuse
+        self.reuse_keys = reuse_keys or default_reuse_keys
+        self.per_host = max(1, per_host or settings.ATTACHMENT_MAX_DOWNLOADS_PER_HOST)
+        self._download_pool = ThreadPoolExecutor(
+            max_workers=max(1, download_workers or settings.MAX_WORKERS_ATTACHMENTS),
+            thread_name_prefix="attachment-download",
+        )
+        self._processing_pool = ThreadPoolExecutor(
+            max_workers=max(1, processing_workers or settings.MAX_WORKERS_ATTACHMENT_PROCESSING),
+            thread_name_prefix="attachment-process",
+        )
+        self._prefetch_slots = threading.BoundedSemaphore(
+            max(1, prefetch_files or settings.ATTACHMENT_PREFETCH_FILES)
+        )
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+        self._decisions: Dict[str, _DecisionAttachments] = {}
+        # Attachments being downloaded or processed, resolved once they are done
+        self._in_flight: Dict[_Key, Future] = {}
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
+    def submit(self, decision: DecisionDocument) -> "Future[Dict[str, Any]]":
+        """
+        Queue downloads for every fetchable attachment of *decision*.
+
+        Args:
+            decision: Decision whose attachments all have a NativeId
+
+        Returns:
+            Future resolving to the decision's attachment stats once all its
+            attachments are processed and its download directory is removed
+        """
+        attachments = [
+            attachment
+            for attachment in decision.Attachments or []
+            if attachment.NativeId and self.downloader.should_fetch_attachment(attachment)
+        ]
+        temp_dir = Path(settings.ATTACHMENT_DOWNLOAD_DIR) / decision.NativeId
+        work = _DecisionAttachments(decision, temp_dir, len(attachments))
+        with self._lock:
+            self._decisions[decision.NativeId] = work
+
+        if not attachments:
+            logger.info(f"No public attachments to download for decision {decision.NativeId}")
+            work.future.set_result(work.stats)
+            return work.future
+
+        logger.info(
+            f"Scheduling {len(attachments)} attachment downloads for decision {decision.NativeId}"
+        )
+        temp_dir.mkdir(parents=True, exist_ok=True)
+        for attachment in attachments:
+            self._download_pool.submit(self._download, work, attachment)
+        return work.future
+
+    def join(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Wait until every submitted decision's attachments are done.
+
+        Returns:
+            Dictionary mapping decision NativeId to its attachment stats
+        """
+        with self._lock:
+            decisions = dict(self._decisions)
+        return {native_id: work.future.result() for native_id, work in decisions.items()}
+
+    def close(self) -> None:
+        """Shut down both pools after the queued work has finished."""
+        self._download_pool.shutdown(wait=True)
+        self._processing_pool.shutdown(wait=True)
+
+    def _host_slot(self, file_uri: str) -> threading.BoundedSemaphore:
+        host = RateLimiter.host_of(file_uri)
+        with self._lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.BoundedSemaphore(self.per_host)
+            return self._host_slots[host]
+
+    def _keys(self, attachment: Attachment, sha256: Optional[str] = None) -> List[_Key]:
+        keys = self.reuse_keys(attachment, sha256)
+        return [(kind, value) for kind, value in keys.items() if value]
+
+    def _claim(self, keys: List[_Key]) -> Tuple[Optional[Future], Optional[_Claim]]:
+        """
+        Mark *keys* as in flight for the caller unless another attachment holds one.
+
+        Returns:
+            (future of the attachment holding one of the keys, None), or
+            (None, claim to pass to _release() once the caller is done)
+        """
+        with self._lock:
+            for key in keys:
+                if key in self._in_flight:
+                    return self._in_flight[key], None
+            own: Future = Future()
+            for key in keys:
+                self._in_flight[key] = own
+            return None, (own, keys)
+
+    def _release(self, claims: List[_Claim]) -> None:
+        """Remove the caller's in-flight keys and wake the attachments waiting on them."""
+        with self._lock:
+            for own, keys in claims:
+                for key in keys:
+                    if self._in_flight.get(key) is own:
+                        del self._in_flight[key]
+        for own, _ in claims:
+            own.set_result(None)
+
+    def _try_reuse(self, work: _DecisionAttachments, attachment: Attachment) -> bool:
+        """Serve *attachment* from earlier results if possible, recording its stats."""
+        try:
+            att_stats = self.reuse(work.decision, attachment)
+        except Exception as e:
+            logger.error(f"Exception reusing attachment {attachment.NativeId}: {e}", exc_info=True)
+            return False
+        if att_stats is None:
+            return False
+        self._record(work, att_stats)
+        return True
+
+    def _download(self, work: _DecisionAttachments, attachment: Attachment) -> None:
+        decision_id = work.decision.NativeId
+        claims: List[_Claim] = []
+        if self.reuse is not None:
+            while True:
+                if self._try_reuse(work, attachment):
+                    return
+                in_flight, claim = self._claim(self._keys(attachment))
+                if claim is not None:
+                    claims.append(claim)
+                    break
+                # Another decision is fetching the same attachment; reuse its result,
+                # or take over if it failed
+                logger.info(
+                    f"Attachment {attachment.NativeId} of decision {decision_id} is already "
+                    "in progress; waiting for it"
+                )
+                in_flight.result()
+
+        try:
+            self._download_claimed(work, attachment, claims)
+        except BaseException:
+            self._release(claims)
+            raise
+
+    def _download_claimed(
+        self,
+        work: _DecisionAttachments,
+        attachment: Attachment,
+        claims: List[_Claim],
+    ) -> None:
+        decision_id = work.decision.NativeId
+        target_path = self.downloader.attachment_path(work.temp_dir, decision_id, attachment)
+
+        # Hold a prefetch slot from download until processing finishes
+        self._prefetch_slots.acquire()
+        file_path = None
+        try:
+            with self._host_slot(attachment.FileURI):
+                file_path = self.downloader.download_attachment(
+                    attachment.FileURI, target_path, attachment.Title or attachment.NativeId
+                )
+        except Exception as e:
+            logger.error(
+                f"Exception downloading attachment '{attachment.Title}' "
+                f"({attachment.NativeId}): {e}",
+                exc_info=True,
+            )
+
+        if not file_path:
+            logger.warning(
+                f"Failed to download attachment '{attachment.Title}' "
+                f"({attachment.NativeId}) for decision {decision_id}"
+            )
+            self._prefetch_slots.release()
+            self._release(claims)
+            self._finish(work)
+            return
+
+        try:
+            digest = self.downloader.file_digest(file_path)
+        except OSError as e:
+            logger.warning(f"Could not hash attachment {attachment.NativeId}: {e}")
+            digest = None
+        with work.lock:
+            duplicate_of = work.digests.setdefault(digest, attachment.NativeId) if digest else None
+        if duplicate_of not in (None, attachment.NativeId):
+            logger.info(
+                f"Attachment {attachment.NativeId} of decision {decision_id} is identical "
+                f"to {duplicate_of}; processing it once"
+            )
+            self._prefetch_slots.release()
+            self._release(claims)
+            self._finish(work)
+            return
+
+        if self.reuse is not None and digest:
+            in_flight, claim = self._claim([("sha256", digest)])
+            if claim is not None:
+                claims.append(claim)
+            else:
+                # Same content is being processed for another decision; process()
+                # then finds it registered under the digest
+                in_flight.result()
+
+        self._processing_pool.submit(self._process, work, attachment, file_path, digest, claims)
+
+    def _process(
+        self,
+        work: _DecisionAttachments,
+        attachment: Attachment,
+        file_path: Path,
+        digest: Optional[str],
+        claims: List[_Claim],
+    ) -> None:
+        try:
+            att_stats = self.process(work.decision, attachment, file_path, digest)
+        except Exception as e:
+            logger.error(
+                f"Exception processing attachment {attachment.NativeId}: {e}", exc_info=True
+            )
+            att_stats = {"success": False}
+        finally:
+            self._prefetch_slots.release()
+            self._release(claims)
+        self._record(work, att_stats)
+
+    def _record(self, work: _DecisionAttachments, att_stats: Dict[str, Any]) -> None:
+        """Add one attachment's stats to *work* and count the attachment as done."""
+        with work.lock:
+            work.stats["chunks_created"] += att_stats.get("chunks_created", 0)
+            work.stats["chunks_indexed"] += att_stats.get("chunks_indexed", 0)
+            if att_stats.get("success"):
+                work.stats["attachments_processed"] += 1
+            else:
+                work.stats["failed"] += 1
+        self._finish(work)
+
+    def _finish(self, work: _DecisionAttachments) -> None:
+        """Count one attachment of *work* as done, completing the decision after the last."""
+        with work.lock:
+            work.pending -= 1
+            if work.pending > 0:
+                return
+
+        try:
+            if work.temp_dir.exists():
+                shutil.rmtree(work.temp_dir)
+                logger.info(f"Cleaned up temporary directory: {work.temp_dir}")
+        except Exception as e:
+            logger.warning(f"Failed to clean up temporary directory {work.temp_dir}: {e}")
+
+        logger.info(
+            f"Attachment processing complete for decision {work.decision.NativeId}: "
+            f"{work.stats['attachments_processed']} processed, {work.stats['failed']} failed"
+        )
+        work.future.set_result(work.stats)
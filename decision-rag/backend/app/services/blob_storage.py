@@ -3,6 +3,8 @@ Azure Blob Storage sink for raw decision API responses.
 
 Accumulates per-document raw responses in memory during a date-batch fetch,
 then gzip-compresses and uploads the entire batch as a single NDJSON blob.
+Responses buffered between batches (e.g. from scheduled retries) are carried
+over into the next batch.
 """
 
 import gzip
@@ -40,17 +42,30 @@ class AzureBlobRawResponseSaver:
         self._lock = threading.Lock()
         self._batch_start: Optional[datetime] = None
         self._batch_end: Optional[datetime] = None
+        self._batch_label: Optional[str] = None
+        self._batch_open: bool = False
         self._flush_failures: int = 0
 
         # Lazy-initialised service client
         self._blob_service_client: Optional[BlobServiceClient] = None
 
-    def start_batch(self, batch_start: datetime, batch_end: datetime) -> None:
-        """Reset the buffer and record the current batch key."""
+    def start_batch(
+        self, batch_start: datetime, batch_end: datetime, label: Optional[str] = None
+    ) -> None:
+        """Record the current batch key, discarding the buffer of an unflushed batch.
+
+        Args:
+            batch_start: Batch start date
+            batch_end: Batch end date
+            label: Optional blob name suffix, e.g. "retries"
+        """
         with self._lock:
-            self._buffer = []
+            if self._batch_open:
+                self._buffer = []
             self._batch_start = batch_start
             self._batch_end = batch_end
+            self._batch_label = label
+            self._batch_open = True
         logger.debug(
             f"Blob saver: started batch {batch_start.date()} to {batch_end.date()}"
         )
@@ -74,8 +89,10 @@ class AzureBlobRawResponseSaver:
         with self._lock:
             entries = list(self._buffer)
             self._buffer = []
+            self._batch_open = False
             batch_start = self._batch_start
             batch_end = self._batch_end
+            batch_label = self._batch_label
 
         if not entries:
             logger.debug("Blob saver: empty batch, skipping upload")
@@ -85,7 +102,7 @@ class AzureBlobRawResponseSaver:
             logger.error("Blob saver: flush_batch called before start_batch")
             return False
 
-        blob_name = self._build_blob_name(batch_start, batch_end)
+        blob_name = self._build_blob_name(batch_start, batch_end, batch_label)
 
         try:
             ndjson_bytes = "\n".join(json.dumps(e, ensure_ascii=False) for e in entries).encode("utf-8")
@@ -120,11 +137,14 @@ class AzureBlobRawResponseSaver:
             )
             return False
 
-    def _build_blob_name(self, batch_start: datetime, batch_end: datetime) -> str:
-        """Format blob path: {prefix}/{YYYY-MM-DD}_{YYYY-MM-DD}.ndjson.gz"""
+    def _build_blob_name(
+        self, batch_start: datetime, batch_end: datetime, label: Optional[str] = None
+    ) -> str:
+        """Format blob path: {prefix}/{YYYY-MM-DD}_{YYYY-MM-DD}[_{label}].ndjson.gz"""
         start_str = batch_start.strftime("%Y-%m-%d")
         end_str = batch_end.strftime("%Y-%m-%d")
-        return f"{self._blob_prefix}/{start_str}_{end_str}.ndjson.gz"
+        suffix = f"_{label}" if label else ""
+        return f"{self._blob_prefix}/{start_str}_{end_str}{suffix}.ndjson.gz"
 
     def _get_blob_service_client(self) -> BlobServiceClient:
         """Return a lazily-created BlobServiceClient (connection string or DefaultAzureCredential)."""
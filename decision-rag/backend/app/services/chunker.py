@@ -13,6 +13,10 @@ from app.core import get_logger
 
 logger = get_logger(__name__)
 
+# First and last line of the metadata header prepended to chunk text
+METADATA_HEADER_START = "--- Dokumentin konteksti ---"
+METADATA_HEADER_END = "---"
+
 
 @dataclass
 class DocumentChunk:
@@ -510,7 +514,7 @@ class ParagraphChunker:
         if not self.embed_metadata:
             return ""
 
-        header_lines = ["--- Dokumentin konteksti ---"]
+        header_lines = [METADATA_HEADER_START]
 
         # Decision title and ID (always include)
         title = metadata.get("title", "")
@@ -574,7 +578,7 @@ class ParagraphChunker:
         if section:
             header_lines.append(f"Pykälä: {section}")
 
-        header_lines.append("---")
+        header_lines.append(METADATA_HEADER_END)
 
         header_text = "\n".join(header_lines)
 
@@ -587,6 +591,29 @@ class ParagraphChunker:
 
         return header_text
 
+    def rebuild_chunk(
+        self,
+        body: str,
+        native_id: str,
+        chunk_index: int,
+        token_count: int,
+        metadata: Dict[str, Any],
+    ) -> DocumentChunk:
+        """
+        Rebuild a chunk for another document from its body, with that document's header.
+
+        Args:
+            body: Chunk text without a metadata header
+            native_id: Native ID of the document the chunk is rebuilt for
+            chunk_index: Index of the chunk in the document
+            token_count: Token count of the original chunk, recounted when a header is added
+            metadata: Metadata of the document the chunk is rebuilt for
+
+        Returns:
+            DocumentChunk object
+        """
+        return self._create_chunk(body, native_id, chunk_index, token_count, metadata)
+
     def _create_chunk(
         self,
         text: str,
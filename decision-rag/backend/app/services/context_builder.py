@@ -0,0 +1,224 @@
+"""
+Token-budgeted context assembly for RAG prompts.
+
+Every chunk starts with the metadata header from
+ParagraphChunker._generate_metadata_header(), and consecutive chunks of a
+document overlap by ParagraphChunker.overlap_tokens. ContextBuilder turns search
+hits into one prompt-ready block: chunks are grouped per document under a single
+header, adjacent chunks are merged with their overlap removed, documents are
+ordered by their best score, and hits are added in score order while the block
+stays within a token budget.
+"""
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import tiktoken
+
+from app.core import get_logger
+from app.services.chunker import METADATA_HEADER_END, METADATA_HEADER_START
+
+logger = get_logger(__name__)
+
+# Placed between non-adjacent chunks of the same document
+GAP_MARKER = "[...]"
+
+# Longest chunk overlap looked for when merging adjacent chunks, in characters
+_MAX_OVERLAP_CHARS = 4000
+
+# Shortest repeat treated as chunk overlap; the chunker repeats about 100 tokens, so
+# shorter matches are coincidences such as a shared last word
+MIN_OVERLAP_CHARS = 40
+
+# Placed between documents in the context
+_DOCUMENT_SEPARATOR = "\n\n"
+
+
+@lru_cache(maxsize=1)
+def _encoding() -> tiktoken.Encoding:
+    return tiktoken.get_encoding("cl100k_base")
+
+
+def count_tokens(text: str) -> int:
+    """Count tokens with the encoding ParagraphChunker uses (cl100k_base)."""
+    return len(_encoding().encode(text)) if text else 0
+
+
+def split_header(text: str) -> Tuple[str, str]:
+    """
+    Split chunk text into its metadata header and body.
+
+    Returns:
+        (header, body); the header is empty for chunks indexed without one
+    """
+    if not text.startswith(METADATA_HEADER_START):
+        return "", text
+    end = text.find(f"\n{METADATA_HEADER_END}\n\n")
+    if end < 0:
+        return "", text
+    header_end = end + len(METADATA_HEADER_END) + 1
+    return text[:header_end], text[header_end + 2 :]
+
+
+def merge_overlapping(first: str, second: str, min_overlap: int = MIN_OVERLAP_CHARS) -> str:
+    """
+    Join two consecutive chunk bodies, dropping the start of *second* repeated from *first*.
+
+    Args:
+        first: Body of the earlier chunk
+        second: Body of the following chunk
+        min_overlap: Shortest repeat, in characters, removed as overlap; bodies with
+            a shorter or no repeat are joined with a blank line
+
+    Returns:
+        The joined text
+    """
+    window_start = max(0, len(first) - _MAX_OVERLAP_CHARS)
+    for start in range(window_start, len(first) - max(min_overlap, 1) + 1):
+        if second.startswith(first[start:]):
+            return first + second[len(first) - start :]
+    return first + "\n\n" + second
+
+
+@dataclass
+class ContextDocument:
+    """Chunks of one document (decision or attachment) selected for the context."""
+
+    native_id: str
+    header: str
+    score: float
+    metadata: Dict[str, Any]
+    bodies: Dict[int, str] = field(default_factory=dict)
+    chunk_ids: Dict[int, str] = field(default_factory=dict)
+
+    def render(self, min_overlap: int = MIN_OVERLAP_CHARS) -> str:
+        """Return the header followed by the chunks in order, adjacent ones merged."""
+        parts: List[str] = []
+        previous_index: Optional[int] = None
+        for chunk_index in sorted(self.bodies):
+            body = self.bodies[chunk_index]
+            if previous_index is not None and chunk_index == previous_index + 1:
+                parts[-1] = merge_overlapping(parts[-1], body, min_overlap)
+            else:
+                parts.append(body)
+            previous_index = chunk_index
+        text = f"\n\n{GAP_MARKER}\n\n".join(parts)
+        return f"{self.header}\n\n{text}" if self.header else text
+
+
+class ContextBuilder:
+    """Pack search hits into a single context block within a token budget."""
+
+    def __init__(
+        self,
+        token_counter: Optional[Callable[[str], int]] = None,
+        min_overlap: int = MIN_OVERLAP_CHARS,
+    ):
+        """
+        Initialize the builder.
+
+        Args:
+            token_counter: Function counting the tokens of a text (defaults to
+                the chunker's tiktoken encoding)
+            min_overlap: Shortest repeat, in characters, merged away between
+                adjacent chunks
+        """
+        self.count_tokens = token_counter or count_tokens
+        self.min_overlap = min_overlap
+
+    def build(self, hits: List[Dict[str, Any]], max_tokens: int) -> Dict[str, Any]:
+        """
+        Assemble the context block from search hits.
+
+        Hits are considered in descending score order; a hit whose chunks would
+        push the block over max_tokens is skipped, so a smaller lower-ranked hit
+        can still fill the remaining budget. Neighbour chunks attached by
+        search(neighbours=...) are added together with their hit. Tokens are
+        counted per document, so each hit only re-renders and re-counts the
+        document it adds to.
+
+        Args:
+            hits: Results of BaseVectorStore.search()
+            max_tokens: Token budget of the returned context
+
+        Returns:
+            Dict with "context", "token_count", "documents" (one ContextDocument
+            per included document, in context order) and "skipped" (hits that
+            did not fit)
+        """
+        documents: Dict[str, ContextDocument] = {}
+        document_tokens: Dict[str, int] = {}
+        separator_tokens = self.count_tokens(_DOCUMENT_SEPARATOR)
+        token_count, skipped = 0, 0
+
+        for hit in sorted(hits, key=lambda h: h.get("score", 0.0), reverse=True):
+            native_id = hit.get("native_id", "")
+            chunks = hit.get("context_chunks") or [
+                {
+                    "chunk_id": hit.get("chunk_id"),
+                    "chunk_index": hit.get("metadata", {}).get("chunk_index"),
+                    "text": hit.get("text", ""),
+                }
+            ]
+            document = documents.get(native_id)
+            added_document = document is None
+            if added_document:
+                header, _ = split_header(chunks[0].get("text") or "")
+                document = documents[native_id] = ContextDocument(
+                    native_id=native_id,
+                    header=header,
+                    score=hit.get("score", 0.0),
+                    metadata=hit.get("metadata", {}),
+                )
+
+            added = []
+            for position, chunk in enumerate(chunks):
+                # Chunks indexed without chunk_index sort after the known ones
+                chunk_index = chunk.get("chunk_index")
+                if chunk_index is None:
+                    chunk_index = 1_000_000 + len(document.bodies) + position
+                if chunk_index in document.bodies:
+                    continue
+                document.bodies[chunk_index] = split_header(chunk.get("text") or "")[1]
+                document.chunk_ids[chunk_index] = chunk.get("chunk_id")
+                added.append(chunk_index)
+            if not added:
+                continue
+
+            tokens = self.count_tokens(document.render(self.min_overlap))
+            candidate_tokens = token_count + tokens - document_tokens.get(native_id, 0)
+            if added_document and len(documents) > 1:
+                candidate_tokens += separator_tokens
+            if candidate_tokens <= max_tokens:
+                document_tokens[native_id] = tokens
+                token_count = candidate_tokens
+                continue
+
+            skipped += 1
+            if added_document:
+                del documents[native_id]
+            else:
+                for chunk_index in added:
+                    del document.bodies[chunk_index]
+                    del document.chunk_ids[chunk_index]
+
+        logger.debug(
+            f"Assembled context: {token_count} tokens from {len(documents)} documents, "
+            f"{skipped} hits skipped"
+        )
+        return {
+            "context": self._render(documents),
+            "token_count": token_count,
+            "documents": self._ordered(documents),
+            "skipped": skipped,
+        }
+
+    @staticmethod
+    def _ordered(documents: Dict[str, ContextDocument]) -> List[ContextDocument]:
+        return sorted(documents.values(), key=lambda d: d.score, reverse=True)
+
+    def _render(self, documents: Dict[str, ContextDocument]) -> str:
+        return _DOCUMENT_SEPARATOR.join(
+            document.render(self.min_overlap) for document in self._ordered(documents)
+        )
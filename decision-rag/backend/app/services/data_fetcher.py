@@ -1,23 +1,36 @@
 """
 Data fetcher service for orchestrating decision data retrieval.
 
-There are capabilities for fetching decision IDs in batches, filtering IDs to avoid fetching existing documents, and robust retry logic for failed document fetches with exponential backoff and staggered delays.
+There are capabilities for fetching decision IDs in batches, filtering IDs to avoid fetching existing documents, and robust retry logic for failed document fetches with per-document exponential backoff that runs alongside the remaining batches.
 """
 
 import logging
+import queue
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from datetime import datetime
-from typing import Generator, List, Optional
+from datetime import datetime, timedelta
+from typing import Callable, Generator, Iterable, List, Optional, Tuple
 
 from ..core.config import settings
 from ..schemas.decision import DecisionDocument
-from ..utils.date_utils import format_date_for_api, generate_date_range, weeks_between
+from ..utils.date_utils import (
+    AdaptiveDateWindows,
+    format_date_for_api,
+    generate_date_range,
+    weeks_between,
+)
 from .api_client import APIOutageError, DecisionAPIClient
 from .blob_storage import AzureBlobRawResponseSaver
+from .http_cache import HTTPCache
+from .rate_limiter import RateLimiter
+from .retry_queue import DelayedRetryQueue
 
 logger = logging.getLogger(__name__)
 
+# Marks the end of the producer's output in fetch_all_decisions()
+_END_OF_FETCH = object()
+
 
 class DecisionDataFetcher:
     """Service for fetching decision data in batches."""
@@ -66,6 +79,10 @@ class DecisionDataFetcher:
         This method can optionally filter IDs before fetching to avoid fetching
         documents that already exist in the vector store.
 
+        Documents are yielded as soon as each one is fetched. A background thread
+        lists and fetches the following windows while the caller processes
+        earlier documents, staying at most FETCH_PREFETCH_DOCUMENTS ahead.
+
         Args:
             api_key: API key for authentication
             start_date: Start date
@@ -74,7 +91,7 @@ class DecisionDataFetcher:
                       the document should be fetched. If None, all documents are fetched.
 
         Yields:
-            DecisionDocument objects
+            Tuples of (DecisionDocument, batch_start, batch_end)
         """
         # Reset stats for this fetch operation
         self.stats = {
@@ -95,40 +112,181 @@ class DecisionDataFetcher:
         }
 
         # Generate date batches
-        date_batches = generate_date_range(start_date, end_date, settings.BATCH_SIZE_DAYS, backwards=start_date > end_date)
-        self.stats["total_batches"] = len(date_batches)
+        adaptive_windows = None
+        if settings.ADAPTIVE_BATCH_WINDOWS:
+            adaptive_windows = AdaptiveDateWindows(
+                start_date,
+                end_date,
+                initial=timedelta(days=settings.BATCH_SIZE_DAYS),
+                minimum=timedelta(hours=settings.BATCH_MIN_HOURS),
+                maximum=timedelta(days=settings.BATCH_MAX_DAYS),
+                page_size=settings.API_PAGE_SIZE,
+            )
+            date_batches = adaptive_windows
+            self.stats["total_batches"] = adaptive_windows.remaining()
+        else:
+            date_batches = generate_date_range(start_date, end_date, settings.BATCH_SIZE_DAYS, backwards=start_date > end_date)
+            self.stats["total_batches"] = len(date_batches)
 
         total_weeks = weeks_between(start_date, end_date, backwards=start_date > end_date)
         filter_msg = " with ID filtering" if id_filter else ""
         logger.info(f"Starting data fetch{filter_msg} from {start_date.date()} to {end_date.date()}")
-        logger.info(f"Total batches: {len(date_batches)} ({total_weeks} weeks)")
+        logger.info(
+            f"Total batches: {self.stats['total_batches']}"
+            f"{' (estimated, adaptive windows)' if adaptive_windows else ''} ({total_weeks} weeks)"
+        )
 
-        # Process each batch
-        for batch_start, batch_end in date_batches:
-            logger.info(f"\nProcessing batch: {batch_start.date()} to {batch_end.date()}")
+        # Windows are fetched on a background thread that runs ahead of the
+        # consumer by at most FETCH_PREFETCH_DOCUMENTS documents, so listing and
+        # fetching the next window overlaps with processing the current one.
+        buffer: "queue.Queue" = queue.Queue(maxsize=max(1, settings.FETCH_PREFETCH_DOCUMENTS))
+        stop = threading.Event()
+        producer = threading.Thread(
+            target=self._produce_documents,
+            args=(date_batches, adaptive_windows, api_key, id_filter, buffer, stop),
+            name="decision-fetch-prefetch",
+            daemon=True,
+        )
+        producer.start()
 
-            try:
-                # Fetch documents for this batch
-                documents = self._fetch_batch(batch_start, batch_end, api_key, id_filter)
+        try:
+            while True:
+                item = buffer.get()
+                if item is _END_OF_FETCH:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                self.stats["documents_fetched"] += 1
+                yield item
+        finally:
+            # Stops the producer at its next check if the consumer quit early
+            stop.set()
+
+        producer.join()
 
-                # Yield each document and their batch info
-                for doc in documents:
-                    self.stats["documents_fetched"] += 1
-                    yield doc, batch_start, batch_end
+        # Log final summary
+        self._log_summary()
 
-                self.stats["batches_completed"] += 1
+    def _produce_documents(
+        self,
+        date_batches: Iterable[Tuple[datetime, datetime]],
+        adaptive_windows: Optional[AdaptiveDateWindows],
+        api_key: str,
+        id_filter: Optional[callable],
+        buffer: "queue.Queue",
+        stop: threading.Event,
+    ) -> None:
+        """
+        Fetch every batch and put (document, batch_start, batch_end) on *buffer* as fetched.
 
-                # Log progress
-                self._log_progress()
+        Documents that fail their first fetch are handed to a DelayedRetryQueue, so
+        their backoff waits overlap with the following batches instead of holding
+        them up. Recovered documents keep the batch window they were listed in.
+        """
 
-            except Exception as e:
-                logger.error(
-                    f"Error processing batch {batch_start.date()} to {batch_end.date()}: {e}"
-                )
-                self.stats["errors"] += 1
+        def put(item) -> bool:
+            # Wait for buffer space unless the consumer has gone away
+            while not stop.is_set():
+                try:
+                    buffer.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
 
-        # Log final summary
-        self._log_summary()
+        stats_lock = threading.Lock()
+
+        def retry_fetch(native_id: str) -> Optional[DecisionDocument]:
+            with stats_lock:
+                self.stats["retry_attempts"] += 1
+            return self.api_client.fetch_decision_document(native_id, api_key)
+
+        def recovered(native_id: str, document: DecisionDocument, window) -> None:
+            with stats_lock:
+                self.stats["documents_recovered"] += 1
+            put((document, *window))
+
+        def gave_up(native_id: str, window) -> None:
+            with stats_lock:
+                self.stats["permanently_failed"] += 1
+
+        retry_queue = DelayedRetryQueue(
+            fetch=retry_fetch,
+            on_success=recovered,
+            on_give_up=gave_up,
+            max_attempts=settings.DOCUMENT_FETCH_MAX_RETRIES,
+            min_wait=settings.DOCUMENT_FETCH_RETRY_MIN_WAIT,
+            max_wait=settings.DOCUMENT_FETCH_RETRY_MAX_WAIT,
+            multiplier=settings.DOCUMENT_FETCH_RETRY_BACKOFF_MULTIPLIER,
+            workers=settings.MAX_CONCURRENT_REQUESTS,
+        )
+        run_start = run_end = None
+
+        try:
+            for batch_number, (batch_start, batch_end) in enumerate(date_batches, start=1):
+                if stop.is_set():
+                    return
+                run_start = run_start or batch_start
+                run_end = batch_end
+                logger.info(f"\nProcessing batch: {batch_start.date()} to {batch_end.date()}")
+
+                try:
+                    # Documents are handed over as soon as each one is fetched
+                    ids_before = self.stats["ids_fetched"]
+                    self._fetch_batch(
+                        batch_start,
+                        batch_end,
+                        api_key,
+                        id_filter,
+                        on_document=lambda doc, s=batch_start, e=batch_end: put((doc, s, e)),
+                        retry_queue=retry_queue,
+                    )
+
+                    if adaptive_windows:
+                        self._resize_window(
+                            adaptive_windows, self.stats["ids_fetched"] - ids_before, batch_number
+                        )
+
+                    self.stats["batches_completed"] += 1
+
+                    # Log progress
+                    self._log_progress()
+
+                except Exception as e:
+                    logger.error(
+                        f"Error processing batch {batch_start.date()} to {batch_end.date()}: {e}"
+                    )
+                    self.stats["errors"] += 1
+
+            if retry_queue.pending():
+                logger.info(f"Waiting for {retry_queue.pending()} scheduled document retries...")
+            while retry_queue.pending() and not stop.wait(0.1):
+                pass
+            if stop.is_set():
+                return
+
+            # Raw responses of retries that finished after the last batch was flushed
+            if self.blob_saver and run_start is not None:
+                self.blob_saver.start_batch(run_start, run_end, label="retries")
+                self.blob_saver.flush_batch()
+        except Exception as e:
+            put(e)
+        finally:
+            retry_queue.close(cancel=True)
+            put(_END_OF_FETCH)
+
+    def _resize_window(
+        self, windows: AdaptiveDateWindows, id_count: int, batches_processed: int
+    ) -> None:
+        """Size the next adaptive window from the last batch's ID count and re-estimate batches."""
+        previous = windows.window
+        window = windows.record(id_count)
+        if window != previous:
+            logger.info(
+                f"Batch listed {id_count} IDs (page size {settings.API_PAGE_SIZE}); "
+                f"next window {'shrinks' if window < previous else 'grows'} to {window}"
+            )
+        self.stats["total_batches"] = batches_processed + windows.remaining()
 
     def _fetch_batch(
         self,
@@ -136,6 +294,8 @@ class DecisionDataFetcher:
         end_date: datetime,
         api_key: str,
         id_filter: Optional[callable] = None,
+        on_document: Optional[Callable[[DecisionDocument], None]] = None,
+        retry_queue: Optional[DelayedRetryQueue] = None,
     ) -> List[DecisionDocument]:
         """
         Fetch all decisions for a single date batch.
@@ -146,9 +306,13 @@ class DecisionDataFetcher:
             api_key: API key for authentication
             id_filter: Optional callable that takes a native_id and returns True if
                       the document should be fetched. If None, all documents are fetched.
+            on_document: Optional callable receiving each document as soon as it
+                      is fetched, including documents recovered by retries
+            retry_queue: Optional queue that takes over failed documents, tagged with
+                      this batch's window, instead of retrying them before returning
 
         Returns:
-            List of DecisionDocument objects
+            List of DecisionDocument objects (without documents left to retry_queue)
         """
         # Format dates for API
         start_str = format_date_for_api(start_date)
@@ -220,15 +384,19 @@ class DecisionDataFetcher:
             self.blob_saver.start_batch(start_date, end_date)
 
         # Fetch documents for filtered IDs
-        documents, failed_ids = self._fetch_documents_for_ids(native_ids, api_key)
+        documents, failed_ids = self._fetch_documents_for_ids(native_ids, api_key, on_document)
 
         # Retry failed documents if any
-        if failed_ids:
+        if failed_ids and retry_queue is not None:
+            logger.info(f"Scheduled {len(failed_ids)} failed documents for retry")
+            for native_id in failed_ids:
+                retry_queue.add(native_id, (start_date, end_date))
+        elif failed_ids:
             logger.info(f"Retrying {len(failed_ids)} failed documents...")
-            retry_documents = self._retry_failed_documents(failed_ids, api_key)
+            retry_documents = self._retry_failed_documents(failed_ids, api_key, on_document)
             documents.extend(retry_documents)
 
-        # Flush blob batch once all documents (including retries) are done
+        # Flush blob batch once all documents (including inline retries) are done
         if self.blob_saver:
             self.blob_saver.flush_batch()
 
@@ -312,22 +480,15 @@ class DecisionDataFetcher:
 
         return False, None
 
-    def _fetch_documents_for_ids(
-        self, native_ids: List[str], api_key: str
-    ) -> tuple[List[DecisionDocument], List[str]]:
-        """
-        Fetch decision documents for a list of NativeIds.
-
-        Args:
-            native_ids: List of NativeId strings
-            api_key: API key for authentication
-
-        Returns:
-            Tuple of (List of DecisionDocument objects, List of failed native_ids)
-        """
-        documents = []
-        failed_ids = []
-
+    def _fetch_documents_threaded(
+        self,
+        native_ids: List[str],
+        api_key: str,
+        documents: List[DecisionDocument],
+        failed_ids: List[str],
+        on_document: Optional[Callable[[DecisionDocument], None]] = None,
+    ) -> None:
+        """Fetch documents on MAX_CONCURRENT_REQUESTS threads into the given lists."""
         # Use ThreadPoolExecutor for parallel fetching
         with ThreadPoolExecutor(max_workers=settings.MAX_CONCURRENT_REQUESTS) as executor:
             # Submit all fetch tasks with thread_safe=True for parallel execution
@@ -345,6 +506,8 @@ class DecisionDataFetcher:
                     document = future.result()
                     if document:
                         documents.append(document)
+                        if on_document:
+                            on_document(document)
                     else:
                         logger.warning(f"No document returned for {native_id}")
                         failed_ids.append(native_id)
@@ -354,6 +517,53 @@ class DecisionDataFetcher:
                     failed_ids.append(native_id)
                     self.stats["errors"] += 1
 
+    def _fetch_documents_for_ids(
+        self,
+        native_ids: List[str],
+        api_key: str,
+        on_document: Optional[Callable[[DecisionDocument], None]] = None,
+    ) -> tuple[List[DecisionDocument], List[str]]:
+        """
+        Fetch decision documents for a list of NativeIds.
+
+        Args:
+            native_ids: List of NativeId strings
+            api_key: API key for authentication
+            on_document: Optional callable receiving each document as it completes
+
+        Returns:
+            Tuple of (List of DecisionDocument objects, List of failed native_ids)
+        """
+        documents = []
+        failed_ids = []
+
+        if not settings.API_ASYNC_FETCH:
+            self._fetch_documents_threaded(native_ids, api_key, documents, failed_ids, on_document)
+        else:
+            # One event loop and pooled client; the rate limiter bounds concurrency
+            handed_over = set()
+
+            def hand_over(document: DecisionDocument) -> None:
+                handed_over.add(document.NativeId)
+                on_document(document)
+
+            results = self.api_client.fetch_decision_documents(
+                native_ids, api_key, on_document=hand_over if on_document else None
+            )
+            for native_id, result in results.items():
+                if isinstance(result, Exception):
+                    logger.error(f"Error fetching document {native_id}: {result}", exc_info=result)
+                    failed_ids.append(native_id)
+                    self.stats["errors"] += 1
+                elif result:
+                    documents.append(result)
+                    if on_document and result.NativeId not in handed_over:
+                        on_document(result)
+                else:
+                    logger.warning(f"No document returned for {native_id}")
+                    failed_ids.append(native_id)
+                    self.stats["errors"] += 1
+
         if failed_ids:
             logger.warning(f"Failed to fetch {len(failed_ids)} documents: {failed_ids[:5]}{'...' if len(failed_ids) > 5 else ''}")
 
@@ -361,7 +571,10 @@ class DecisionDataFetcher:
         return documents, failed_ids
 
     def _retry_failed_documents(
-        self, failed_ids: List[str], api_key: str
+        self,
+        failed_ids: List[str],
+        api_key: str,
+        on_document: Optional[Callable[[DecisionDocument], None]] = None,
     ) -> List[DecisionDocument]:
         """
         Retry fetching failed documents with exponential backoff and staggered delays.
@@ -369,6 +582,7 @@ class DecisionDataFetcher:
         Args:
             failed_ids: List of native IDs that failed initial fetch
             api_key: API key for authentication
+            on_document: Optional callable receiving each recovered document
 
         Returns:
             List of successfully fetched DecisionDocument objects from retries
@@ -418,6 +632,8 @@ class DecisionDataFetcher:
                     if document:
                         recovered_documents.append(document)
                         self.stats["documents_recovered"] += 1
+                        if on_document:
+                            on_document(document)
                         logger.info(
                             f"Successfully recovered document {native_id} "
                             f"on retry attempt {retry_attempt}"
@@ -523,6 +739,25 @@ class DecisionDataFetcher:
                 )
                 logger.info(f"Batch recovery rate: {batch_recovery_rate:.1f}%")
 
+        # Rate limiter statistics of the API host
+        limiter = getattr(self.api_client, "rate_limiter", None)
+        if isinstance(limiter, RateLimiter):
+            host_stats = limiter.stats().get(RateLimiter.host_of(self.api_client.base_url))
+            if host_stats:
+                logger.info(
+                    f"API rate: {host_stats['rate']}/{host_stats['configured_rate']} req/s, "
+                    f"throttled responses: {host_stats['throttled']}, "
+                    f"avg wait: {host_stats['avg_wait_ms']} ms"
+                )
+
+        http_cache = getattr(self.api_client, "http_cache", None)
+        if isinstance(http_cache, HTTPCache):
+            cache_stats = http_cache.stats()
+            logger.info(
+                f"HTTP cache: {cache_stats['revalidated']} unchanged (304), "
+                f"{cache_stats['misses']} downloaded, {cache_stats['size_mb']} MB stored"
+            )
+
         logger.info(f"\nTotal time: {elapsed/60:.1f} minutes")
         if self.stats["batches_completed"] > 0:
             logger.info(
@@ -0,0 +1,287 @@
+"""
+Decision-level summary index for two-stage retrieval.
+
+Each decision gets one vector in a separate vector store: its title and key
+metadata embedded together, blended with the mean of its decision chunk
+embeddings. Search first shortlists decisions from this compact index and then
+runs the chunk search restricted to the shortlisted decisions and their
+attachments, instead of scanning every attachment chunk in the corpus.
+"""
+
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from app.core import get_logger, settings
+from app.services.knn_tuning import summarize_runs
+from app.services.search_filters import SearchFilter
+from app.services.vector_store import BaseVectorStore
+
+logger = get_logger(__name__)
+
+# Metadata keys copied to the summary entry, so SearchFilters apply to both stages
+SUMMARY_METADATA_KEYS = (
+    "native_id",
+    "title",
+    "case_id",
+    "section",
+    "classification_code",
+    "classification_title",
+    "date_decision",
+    "organization_name",
+)
+
+
+class DecisionSummaryIndex:
+    """One summary vector per decision, stored in its own vector store."""
+
+    def __init__(self, store: BaseVectorStore, title_weight: Optional[float] = None):
+        """
+        Initialize the summary index.
+
+        Args:
+            store: Vector store holding the summary entries (e.g. a second
+                Elasticsearch index or pgvector table)
+            title_weight: Weight of the title/metadata embedding against the mean
+                chunk embedding (falls back to DECISION_INDEX_TITLE_WEIGHT)
+        """
+        self.store = store
+        self.title_weight = (
+            title_weight
+            if title_weight is not None
+            else getattr(settings, "DECISION_INDEX_TITLE_WEIGHT", 0.5)
+        )
+        if not 0.0 <= self.title_weight <= 1.0:
+            raise ValueError(f"title_weight must be between 0 and 1, got {self.title_weight}")
+        self.last_search_timings: Dict[str, float] = {}
+
+    @staticmethod
+    def summary_text(metadata: Dict[str, Any]) -> str:
+        """Return the text embedded for a decision: title and descriptive metadata."""
+        parts = [
+            metadata.get("title"),
+            metadata.get("organization_name"),
+            metadata.get("classification_title"),
+            metadata.get("section"),
+            (metadata.get("date_decision") or "")[:10],
+        ]
+        return "\n".join(part for part in parts if part)
+
+    def summary_vector(
+        self, title_embedding: Sequence[float], chunk_embeddings: Sequence[Sequence[float]]
+    ) -> List[float]:
+        """
+        Blend the title embedding with the mean chunk embedding and L2-normalise.
+
+        Either input may be empty (e.g. a failed title embedding), in which case
+        the other is used alone.
+
+        Args:
+            title_embedding: Embedding of summary_text()
+            chunk_embeddings: Embeddings of the decision's chunks
+
+        Returns:
+            Unit-length summary vector
+        """
+        if len(title_embedding) == 0 and len(chunk_embeddings) == 0:
+            raise ValueError("A summary vector needs a title or chunk embedding")
+        title = _normalise(np.asarray(title_embedding, dtype=np.float32))
+        if len(chunk_embeddings) == 0:
+            return title.tolist()
+        chunks = _normalise(np.asarray(chunk_embeddings, dtype=np.float32).mean(axis=0))
+        if len(title_embedding) == 0:
+            return chunks.tolist()
+        return _normalise(self.title_weight * title + (1.0 - self.title_weight) * chunks).tolist()
+
+    def index_decision(
+        self,
+        native_id: str,
+        metadata: Dict[str, Any],
+        title_embedding: Sequence[float],
+        chunk_embeddings: Sequence[Sequence[float]],
+    ) -> bool:
+        """
+        Insert or replace the summary entry of one decision.
+
+        Args:
+            native_id: Native ID of the decision
+            metadata: Decision metadata as attached to its chunks
+            title_embedding: Embedding of summary_text(metadata)
+            chunk_embeddings: Embeddings of the decision's chunks
+
+        Returns:
+            True if the entry was indexed
+        """
+        summary_metadata = {
+            key: metadata[key] for key in SUMMARY_METADATA_KEYS if metadata.get(key) is not None
+        }
+        summary_metadata.update({"is_attachment": False, "chunk_count": len(chunk_embeddings)})
+        return self.store.index_chunk(
+            {
+                "chunk_id": f"{native_id}_decision",
+                "native_id": native_id,
+                "chunk_index": 0,
+                "text": self.summary_text(metadata),
+                "embedding": self.summary_vector(title_embedding, chunk_embeddings),
+                "metadata": summary_metadata,
+            }
+        )
+
+    def delete_decision(self, native_id: str) -> int:
+        """Remove the summary entry of a decision; returns the number deleted."""
+        return self.store.delete_document(native_id)
+
+    def shortlist(
+        self,
+        query_vector: List[float],
+        size: int,
+        search_filter: Optional[SearchFilter] = None,
+    ) -> List[str]:
+        """
+        Return the native IDs of the decisions closest to the query.
+
+        is_attachment is dropped from the filter: it constrains chunks, while every
+        summary entry describes a whole decision.
+        """
+        if search_filter is not None:
+            search_filter = search_filter.model_copy(update={"is_attachment": None})
+            if search_filter.is_empty():
+                search_filter = None
+        hits = self.store.search(query_vector, size, search_filter)
+        return [hit["native_id"] for hit in hits]
+
+    def two_stage_search(
+        self,
+        chunk_store: BaseVectorStore,
+        query_vector: List[float],
+        top_k: int = 10,
+        search_filter: Optional[SearchFilter] = None,
+        shortlist_size: Optional[int] = None,
+        **search_kwargs: Any,
+    ) -> List[Dict[str, Any]]:
+        """
+        Shortlist decisions, then search chunks of the shortlisted decisions only.
+
+        Args:
+            chunk_store: The chunk vector store searched in the second stage
+            query_vector: Query embedding vector
+            top_k: Number of chunk results to return
+            search_filter: Optional SearchFilter applied in both stages
+            shortlist_size: Decisions kept from the first stage (falls back to
+                DECISION_SHORTLIST_SIZE)
+            **search_kwargs: Passed to chunk_store.search() (query_text, collapse,
+                neighbours)
+
+        Returns:
+            Chunk results in the shape returned by chunk_store.search(); timings of
+            both stages are kept in last_search_timings
+        """
+        shortlist_size = shortlist_size or getattr(settings, "DECISION_SHORTLIST_SIZE", 50)
+        started = time.perf_counter()
+        native_ids = self.shortlist(query_vector, shortlist_size, search_filter)
+        decision_ms = (time.perf_counter() - started) * 1000
+
+        results: List[Dict[str, Any]] = []
+        timings = {"decision_ms": decision_ms, "chunk_ms": 0.0}
+        if native_ids:
+            chunk_filter = (search_filter or SearchFilter()).model_copy(
+                update={"native_ids": native_ids}
+            )
+            chunk_started = time.perf_counter()
+            results = chunk_store.search(query_vector, top_k, chunk_filter, **search_kwargs)
+            timings["chunk_ms"] = (time.perf_counter() - chunk_started) * 1000
+            # Per-leg timings of a hybrid chunk search (lexical_ms, vector_ms, ...)
+            timings.update(
+                (name, value)
+                for name, value in chunk_store.last_search_timings.items()
+                if name != "total_ms"
+            )
+        timings["total_ms"] = (time.perf_counter() - started) * 1000
+        self.last_search_timings = timings
+        logger.debug(
+            f"Two-stage search: {len(native_ids)} decisions shortlisted, {len(results)} chunks"
+        )
+        return results
+
+    def sample_titles(self, sample_size: int, dimension: int) -> List[str]:
+        """
+        Return the titles of up to *sample_size* indexed decisions.
+
+        Vector stores have no random sampling, so the decisions closest to a
+        random direction are taken; good enough for benchmark queries.
+
+        Args:
+            sample_size: Number of decisions to sample
+            dimension: Dimension of the summary vectors
+
+        Returns:
+            Decision titles, possibly fewer than sample_size
+        """
+        probe = _normalise(np.random.default_rng().standard_normal(dimension).astype(np.float32))
+        hits = self.store.search(probe.tolist(), sample_size)
+        titles = ((hit.get("metadata") or {}).get("title") for hit in hits)
+        return [title for title in titles if title]
+
+    def benchmark(
+        self,
+        chunk_store: BaseVectorStore,
+        query_vectors: List[List[float]],
+        top_k: int = 10,
+        shortlist_sizes: Optional[List[int]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Compare recall and latency of single-stage and two-stage chunk search.
+
+        Ground truth is the single-stage chunk search, so recall measures how many
+        of its results survive the decision shortlist.
+
+        Args:
+            chunk_store: The chunk vector store
+            query_vectors: Query embeddings
+            top_k: Results per query
+            shortlist_sizes: Shortlist sizes to try (defaults to 10, 50, 200)
+
+        Returns:
+            Dict keyed by "single_stage" and "two_stage_{size}" with recall,
+            p50_ms and p95_ms
+        """
+        if not query_vectors:
+            return {}
+        shortlist_sizes = shortlist_sizes or [10, 50, 200]
+
+        variants = [("single_stage", lambda v: chunk_store.search(v, top_k))]
+        for size in shortlist_sizes:
+            variants.append(
+                (
+                    f"two_stage_{size}",
+                    lambda v, size=size: self.two_stage_search(
+                        chunk_store, v, top_k, shortlist_size=size
+                    ),
+                )
+            )
+
+        report: Dict[str, Any] = {"queries": len(query_vectors), "top_k": top_k}
+        truth: List[set] = []
+        for variant, run in variants:
+            latencies, recalls = [], []
+            for i, vector in enumerate(query_vectors):
+                started = time.perf_counter()
+                found = {hit["chunk_id"] for hit in run(vector)}
+                latencies.append((time.perf_counter() - started) * 1000)
+                if variant == "single_stage":
+                    truth.append(found)
+                recalls.append(len(found & truth[i]) / max(len(truth[i]), 1))
+            report[variant] = summarize_runs(latencies, recalls)
+
+        logger.info(f"Two-stage search benchmark: {report}")
+        return report
+
+    def close(self) -> None:
+        """Close the underlying vector store."""
+        self.store.close()
+
+
+def _normalise(vector: np.ndarray) -> np.ndarray:
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm > 0 else vector
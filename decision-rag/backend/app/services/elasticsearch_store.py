@@ -2,17 +2,39 @@
 Elasticsearch vector store implementation.
 """
 
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import json
+import math
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 from elasticsearch import Elasticsearch, helpers
 from elasticsearch.exceptions import ConnectionError, ConnectionTimeout, TransportError
 
 from app.core import get_logger, settings
-from app.services.vector_store import BaseVectorStore, MaxRetriesExceededError
+from app.services.knn_tuning import KnnTuning, summarize_runs, tune_candidates
+from app.services.search_filters import SearchFilter
+from app.services.vector_store import (
+    BaseVectorStore,
+    MaxRetriesExceededError,
+    collapse_by_native_id,
+    join_context,
+    reciprocal_rank_fusion,
+)
 
 logger = get_logger(__name__)
 
+# Search responses leave out the embeddings, which callers do not need
+_SEARCH_SOURCE = {"excludes": ["vector", "vector_short"]}
+
+# Elasticsearch rejects kNN searches with num_candidates above this
+_MAX_NUM_CANDIDATES = 10000
+
 
 class ElasticsearchVectorStore(BaseVectorStore):
     """
@@ -42,6 +64,39 @@ class ElasticsearchVectorStore(BaseVectorStore):
         self.vector_dims = vector_dims
         self.cert = getattr(settings, "ELASTICSEARCH_CERT", None)
 
+        # Optional low-dimensional Matryoshka prefix of the embedding used for the
+        # kNN shortlist; results are rescored exactly on the full vector.
+        self.shortlist_dims = getattr(settings, "ELASTICSEARCH_SHORTLIST_DIMS", 0)
+        self.shortlist_oversampling = getattr(settings, "ELASTICSEARCH_SHORTLIST_OVERSAMPLING", 5)
+        self.index_full_vector = getattr(settings, "ELASTICSEARCH_INDEX_FULL_VECTOR", True)
+        # num_candidates per top_k chosen by benchmark_num_candidates()
+        self.knn_tuning = KnnTuning()
+        if self.shortlist_dims >= self.vector_dims:
+            raise ValueError(
+                f"ELASTICSEARCH_SHORTLIST_DIMS ({self.shortlist_dims}) must be smaller "
+                f"than the embedding dimension ({self.vector_dims})"
+            )
+
+        # Writes go to write_index; it only differs from index_name while a bulk load
+        # builds a fresh index behind the alias that live search keeps using.
+        self.write_index = self.index_name
+        self._bulk_load_state: Optional[Dict[str, Any]] = None
+        self._bulk_load_state_file = Path(
+            getattr(settings, "ELASTICSEARCH_BULK_LOAD_STATE_FILE", "data/es_bulk_load_state.json")
+        )
+        # Guards the state file, which the heartbeat thread rewrites during a bulk load
+        self._bulk_load_lock = threading.Lock()
+        self._heartbeat_stop: Optional[threading.Event] = None
+        self._heartbeat_thread: Optional[threading.Thread] = None
+        self._indexing_stats_file = Path(
+            getattr(settings, "ELASTICSEARCH_INDEXING_STATS_FILE", "data/es_indexing_stats.json")
+        )
+        self._indexing_stats: Dict[str, Dict[str, float]] = {
+            "normal": {"chunks": 0, "seconds": 0.0},
+            "bulk_load": {"chunks": 0, "seconds": 0.0},
+        }
+        self._stats_lock = threading.Lock()
+
         # Initialize Elasticsearch client
         try:
             if self.cert:
@@ -69,6 +124,11 @@ class ElasticsearchVectorStore(BaseVectorStore):
 
             # Create index if it doesn't exist
             self._create_index_if_not_exists()
+            if self.shortlist_dims:
+                self._ensure_shortlist_mapping()
+
+            # Undo index settings left behind by a bulk load that crashed
+            self._recover_stale_bulk_load()
 
         except Exception as e:
             logger.error(f"Error initializing Elasticsearch client: {e}")
@@ -80,8 +140,19 @@ class ElasticsearchVectorStore(BaseVectorStore):
             logger.info(f"Index '{self.index_name}' already exists")
             return
 
+        try:
+            self.client.indices.create(index=self.index_name, body=self._build_index_body())
+            logger.info(
+                f"Created index '{self.index_name}' with vector dimensions {self.vector_dims}"
+            )
+        except Exception as e:
+            logger.error(f"Error creating index: {e}")
+            raise
+
+    def _build_index_body(self) -> Dict[str, Any]:
+        """Return the index mappings and settings used for new decision indices."""
         # Define index mappings compatible with Open WebUI structure
-        mappings = {
+        return {
             "mappings": {
                 "dynamic_templates": [
                     {"strings": {"match_mapping_type": "string", "mapping": {"type": "keyword"}}}
@@ -89,14 +160,16 @@ class ElasticsearchVectorStore(BaseVectorStore):
                 "properties": {
                     "collection": {"type": "keyword"},
                     "id": {"type": "keyword"},
-                    "text": {"type": "text"},
-                    "vector": {
-                        "type": "dense_vector",
-                        "dims": self.vector_dims,
-                        "index": True,
-                        "similarity": "cosine",
-                        "index_options": {"type": "bbq_hnsw", "m": 16, "ef_construction": 100},
+                    "text": {
+                        "type": "text",
+                        "analyzer": getattr(settings, "ELASTICSEARCH_TEXT_ANALYZER", "finnish"),
                     },
+                    "vector": self._full_vector_mapping(),
+                    **(
+                        {"vector_short": self._shortlist_vector_mapping()}
+                        if self.shortlist_dims
+                        else {}
+                    ),
                     "metadata": {
                         "properties": {
                             # Open WebUI standard metadata
@@ -136,14 +209,54 @@ class ElasticsearchVectorStore(BaseVectorStore):
             "settings": {"number_of_shards": 1, "number_of_replicas": 1},
         }
 
-        try:
-            self.client.indices.create(index=self.index_name, body=mappings)
-            logger.info(
-                f"Created index '{self.index_name}' with vector dimensions {self.vector_dims}"
-            )
-        except Exception as e:
-            logger.error(f"Error creating index: {e}")
-            raise
+    def _full_vector_mapping(self) -> Dict[str, Any]:
+        """Mapping for the full embedding; not HNSW-indexed when only used for rescoring."""
+        if self.shortlist_dims and not self.index_full_vector:
+            return {"type": "dense_vector", "dims": self.vector_dims, "index": False}
+        return {
+            "type": "dense_vector",
+            "dims": self.vector_dims,
+            "index": True,
+            "similarity": "cosine",
+            "index_options": {"type": "bbq_hnsw", "m": 16, "ef_construction": 100},
+        }
+
+    def _shortlist_vector_mapping(self) -> Dict[str, Any]:
+        """Mapping for the truncated, renormalised shortlist vector."""
+        return {
+            "type": "dense_vector",
+            "dims": self.shortlist_dims,
+            "index": True,
+            "similarity": "dot_product",
+            "index_options": {
+                "type": getattr(settings, "ELASTICSEARCH_SHORTLIST_INDEX_TYPE", "int8_hnsw"),
+                "m": 16,
+                "ef_construction": 100,
+            },
+        }
+
+    def _ensure_shortlist_mapping(self) -> None:
+        """Add the shortlist field to an index created before it was enabled."""
+        mapping = self.client.indices.get_mapping(index=self.index_name)
+        if all(
+            "vector_short" in body["mappings"].get("properties", {})
+            for body in mapping.values()
+        ):
+            return
+        self.client.indices.put_mapping(
+            index=self.index_name,
+            body={"properties": {"vector_short": self._shortlist_vector_mapping()}},
+        )
+        logger.warning(
+            f"Added 'vector_short' to '{self.index_name}'; existing chunks are not found by "
+            "shortlist search until `python pipeline.py es-shortlist-backfill` has run"
+        )
+
+    def _shortlist_vector(self, vector: List[float]) -> List[float]:
+        """Truncate *vector* to the shortlist dimensions and renormalise it to unit length."""
+        prefix = vector[: self.shortlist_dims]
+        norm = math.sqrt(sum(v * v for v in prefix))
+        return [v / norm for v in prefix] if norm else list(prefix)
 
     def bulk_index_chunks(
         self, chunks_with_embeddings: List[Dict[str, Any]], batch_size: int = 100
@@ -162,7 +275,7 @@ class ElasticsearchVectorStore(BaseVectorStore):
             logger.warning("No chunks provided for indexing")
             return {"success": 0, "failed": 0, "errors": []}
 
-        logger.info(f"Bulk indexing {len(chunks_with_embeddings)} chunks to '{self.index_name}'")
+        logger.info(f"Bulk indexing {len(chunks_with_embeddings)} chunks to '{self.write_index}'")
 
         # Prepare documents for bulk indexing with Open WebUI structure
         actions = []
@@ -181,7 +294,7 @@ class ElasticsearchVectorStore(BaseVectorStore):
             )
 
             doc = {
-                "_index": self.index_name,
+                "_index": self.write_index,
                 "_id": chunk_data["chunk_id"],
                 "_source": {
                     "collection": getattr(settings, "COLLECTION_NAME", "decisions"),
@@ -191,6 +304,8 @@ class ElasticsearchVectorStore(BaseVectorStore):
                     "metadata": metadata,
                 },
             }
+            if self.shortlist_dims:
+                doc["_source"]["vector_short"] = self._shortlist_vector(chunk_data["embedding"])
             actions.append(doc)
 
         # Perform bulk indexing
@@ -199,6 +314,7 @@ class ElasticsearchVectorStore(BaseVectorStore):
         errors = []
 
         try:
+            started = time.perf_counter()
             success, failed = helpers.bulk(
                 self.client,
                 actions,
@@ -209,6 +325,7 @@ class ElasticsearchVectorStore(BaseVectorStore):
             )
 
             success_count = success
+            self._record_indexing_throughput(success_count, time.perf_counter() - started)
 
             # Reset retry count on successful operation
             self._reset_retry_count()
@@ -273,8 +390,10 @@ class ElasticsearchVectorStore(BaseVectorStore):
                 "vector": chunk_data["embedding"],
                 "metadata": metadata,
             }
+            if self.shortlist_dims:
+                doc["vector_short"] = self._shortlist_vector(chunk_data["embedding"])
 
-            self.client.index(index=self.index_name, id=chunk_data["chunk_id"], document=doc)
+            self.client.index(index=self.write_index, id=chunk_data["chunk_id"], document=doc)
 
             self._reset_retry_count()
 
@@ -297,48 +416,63 @@ class ElasticsearchVectorStore(BaseVectorStore):
         self,
         query_vector: List[float],
         top_k: int = 10,
-        filter_conditions: Optional[Dict[str, Any]] = None,
+        filter_conditions: Optional[Union[SearchFilter, Dict[str, Any]]] = None,
+        query_text: Optional[str] = None,
+        collapse: bool = False,
+        neighbours: int = 0,
     ) -> List[Dict[str, Any]]:
         """
         Search for similar documents using vector similarity.
 
+        With ELASTICSEARCH_SHORTLIST_DIMS set, the kNN shortlist of
+        top_k * ELASTICSEARCH_SHORTLIST_OVERSAMPLING hits comes from the low-dimensional
+        field and is rescored by exact cosine similarity on the full vector.
+
+        With query_text, a BM25 match on ``text`` and the kNN query are sent in one
+        msearch request and fused by reciprocal rank fusion; each leg's server-side
+        ``took`` is kept in last_search_timings.
+
+        collapse uses field collapsing on ``metadata.native_id`` over
+        top_k * SEARCH_COLLAPSE_OVERSAMPLING kNN candidates. Elasticsearch does not
+        allow collapse together with rescore, so shortlist searches collapse the
+        rescored candidates here instead. Neighbour chunks are fetched with one
+        additional request covering all hits.
+
         Args:
             query_vector: Query embedding vector
             top_k: Number of results to return
-            filter_conditions: Optional filters to apply
+            filter_conditions: Optional SearchFilter, or a raw Elasticsearch query
+                clause; either is applied as a kNN pre-filter
+            query_text: Query text for hybrid BM25 + kNN retrieval
+            collapse: Return at most one chunk per native_id
+            neighbours: Attach the chunks within ±neighbours of each hit's chunk_index
 
         Returns:
             List of matching documents with scores
         """
+        started = time.perf_counter()
         try:
-            query = {
-                "knn": {
-                    "field": "vector",
-                    "query_vector": query_vector,
-                    "k": top_k,
-                    "num_candidates": top_k * 10,
-                }
-            }
-
-            if filter_conditions:
-                query["filter"] = filter_conditions
+            if query_text:
+                results = self._hybrid_search(
+                    query_text, query_vector, top_k, filter_conditions, collapse
+                )
+            else:
+                query, size = self._vector_search_body(
+                    query_vector, top_k, filter_conditions, collapse
+                )
+                response = self.client.search(index=self.index_name, body=query, size=size)
+                results = self._vector_results(response, top_k, collapse)
+                self.last_search_timings = {"vector_ms": response.get("took")}
 
-            response = self.client.search(index=self.index_name, body=query, size=top_k)
+            if neighbours and results:
+                neighbours_started = time.perf_counter()
+                self._attach_neighbours(results, neighbours)
+                self.last_search_timings["neighbours_ms"] = (
+                    time.perf_counter() - neighbours_started
+                ) * 1000
 
             self._reset_retry_count()
-
-            results = []
-            for hit in response["hits"]["hits"]:
-                source = hit["_source"]
-                metadata = source.get("metadata", {})
-                result = {
-                    "chunk_id": source.get("id", metadata.get("chunk_id", "")),
-                    "native_id": metadata.get("native_id", ""),
-                    "text": source.get("text", ""),
-                    "score": hit["_score"],
-                    "metadata": metadata,
-                }
-                results.append(result)
+            self.last_search_timings["total_ms"] = (time.perf_counter() - started) * 1000
 
             logger.info(f"Search completed: {len(results)} results")
             return results
@@ -353,6 +487,572 @@ class ElasticsearchVectorStore(BaseVectorStore):
             logger.error(f"Error searching: {e}")
             return []
 
+    def search_batch(self, queries: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """
+        Run several searches with one msearch request, plus one for neighbours.
+
+        Every query contributes its kNN body, or its BM25 and kNN bodies when it
+        has query_text, to a single msearch. The neighbour windows of all queries
+        that ask for them go into a second msearch. Per-query timings (each leg's
+        server-side ``took``) are kept in last_batch_timings.
+
+        Args:
+            queries: search() keyword arguments, one dict per query
+
+        Returns:
+            One result list per query, in input order
+        """
+        started = time.perf_counter()
+        try:
+            searches: List[Dict[str, Any]] = []
+            for query in queries:
+                top_k = query.get("top_k", 10)
+                if query.get("query_text"):
+                    lexical, vector = self._hybrid_search_bodies(
+                        query["query_text"],
+                        query["query_vector"],
+                        top_k,
+                        query.get("filter_conditions"),
+                        query.get("collapse", False),
+                    )
+                    searches += [{}, lexical, {}, vector]
+                else:
+                    body, size = self._vector_search_body(
+                        query["query_vector"],
+                        top_k,
+                        query.get("filter_conditions"),
+                        query.get("collapse", False),
+                    )
+                    searches += [{}, {**body, "size": size}]
+
+            responses = iter(
+                self.client.msearch(index=self.index_name, searches=searches)["responses"]
+            )
+            batch_results, batch_timings = [], []
+            for query in queries:
+                top_k = query.get("top_k", 10)
+                if query.get("query_text"):
+                    legs = [next(responses), next(responses)]
+                    results, timings = self._fuse_hybrid_legs(
+                        legs, top_k, query.get("collapse", False)
+                    )
+                else:
+                    response = next(responses)
+                    if "error" in response:
+                        raise RuntimeError(f"Batch search failed: {response['error']}")
+                    results = self._vector_results(response, top_k, query.get("collapse", False))
+                    timings = {"vector_ms": response.get("took")}
+                batch_results.append(results)
+                batch_timings.append(timings)
+
+            self._attach_batch_neighbours(queries, batch_results, batch_timings)
+
+            self._reset_retry_count()
+            self.last_batch_timings = batch_timings
+            self.last_search_timings = {"total_ms": (time.perf_counter() - started) * 1000}
+            logger.info(f"Batch search completed: {len(queries)} queries")
+            return batch_results
+
+        except (ConnectionTimeout, TransportError) as e:
+            self._increment_retry_count()
+            logger.error(f"Connection/timeout error during batch search: {e}")
+            raise
+        except MaxRetriesExceededError:
+            raise
+        except Exception as e:
+            logger.error(f"Error in batch search: {e}")
+            self.last_batch_timings = [{} for _ in queries]
+            return [[] for _ in queries]
+
+    def _attach_batch_neighbours(
+        self,
+        queries: List[Dict[str, Any]],
+        batch_results: List[List[Dict[str, Any]]],
+        batch_timings: List[Dict[str, Any]],
+    ) -> None:
+        """Fetch the neighbour windows of every query in the batch with one msearch."""
+        pending, searches = [], []
+        for query, results in zip(queries, batch_results):
+            neighbours = query.get("neighbours", 0)
+            request = self._neighbours_body(results, neighbours) if neighbours else None
+            if request is not None:
+                body, size = request
+                pending.append((results, neighbours))
+                searches += [{}, {**body, "size": size}]
+        if not searches:
+            return
+
+        neighbours_started = time.perf_counter()
+        responses = self.client.msearch(index=self.index_name, searches=searches)["responses"]
+        for (results, neighbours), response in zip(pending, responses):
+            if "error" in response:
+                raise RuntimeError(f"Batch neighbour search failed: {response['error']}")
+            self._apply_neighbours(results, response, neighbours)
+        neighbours_ms = (time.perf_counter() - neighbours_started) * 1000
+        for query, timings in zip(queries, batch_timings):
+            if query.get("neighbours"):
+                timings["neighbours_ms"] = neighbours_ms
+
+    def _vector_search_body(
+        self,
+        query_vector: List[float],
+        top_k: int,
+        filter_conditions: Optional[Union[SearchFilter, Dict[str, Any]]] = None,
+        collapse: bool = False,
+    ) -> Tuple[Dict[str, Any], int]:
+        """Return the kNN search body and result size for one (optionally collapsed) search."""
+        shortlist = bool(self.shortlist_dims)
+        candidates = top_k * self._collapse_oversampling() if collapse else top_k
+        query = self._build_search_body(
+            query_vector, candidates, filter_conditions, shortlist=shortlist
+        )
+        query["_source"] = _SEARCH_SOURCE
+        if collapse and not shortlist:
+            query["collapse"] = {"field": "metadata.native_id"}
+        return query, candidates if collapse and shortlist else top_k
+
+    def _vector_results(
+        self, response: Dict[str, Any], top_k: int, collapse: bool = False
+    ) -> List[Dict[str, Any]]:
+        results = [self._hit_to_result(hit) for hit in response["hits"]["hits"]]
+        if collapse:
+            results = collapse_by_native_id(results, top_k)
+        return results
+
+    def _hybrid_search(
+        self,
+        query_text: str,
+        query_vector: List[float],
+        top_k: int,
+        filter_conditions: Optional[Union[SearchFilter, Dict[str, Any]]] = None,
+        collapse: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Run the BM25 and kNN legs in one msearch and fuse them by reciprocal rank."""
+        lexical, vector = self._hybrid_search_bodies(
+            query_text, query_vector, top_k, filter_conditions, collapse
+        )
+        response = self.client.msearch(
+            index=self.index_name, searches=[{}, lexical, {}, vector]
+        )
+        results, self.last_search_timings = self._fuse_hybrid_legs(
+            response["responses"], top_k, collapse
+        )
+        return results
+
+    def _hybrid_search_bodies(
+        self,
+        query_text: str,
+        query_vector: List[float],
+        top_k: int,
+        filter_conditions: Optional[Union[SearchFilter, Dict[str, Any]]] = None,
+        collapse: bool = False,
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Return the msearch bodies of the BM25 and kNN legs of one hybrid search."""
+        window = max(top_k, getattr(settings, "HYBRID_SEARCH_WINDOW", 50))
+        shortlist = bool(self.shortlist_dims)
+        es_filter = (
+            filter_conditions.to_elasticsearch()
+            if isinstance(filter_conditions, SearchFilter)
+            else filter_conditions
+        )
+
+        lexical_query: Dict[str, Any] = {"match": {"text": {"query": query_text}}}
+        if es_filter:
+            lexical_query = {"bool": {"must": [lexical_query], "filter": [es_filter]}}
+        lexical = {"query": lexical_query, "size": window, "_source": _SEARCH_SOURCE}
+        vector = {
+            **self._build_search_body(query_vector, window, es_filter, shortlist=shortlist),
+            "size": window,
+            "_source": _SEARCH_SOURCE,
+        }
+        if collapse:
+            lexical["collapse"] = {"field": "metadata.native_id"}
+            if not shortlist:
+                vector["collapse"] = {"field": "metadata.native_id"}
+        return lexical, vector
+
+    def _fuse_hybrid_legs(
+        self, legs: List[Dict[str, Any]], top_k: int, collapse: bool = False
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Optional[float]]]:
+        """Fuse the BM25 and kNN msearch responses; returns (results, timings)."""
+        window = max(top_k, getattr(settings, "HYBRID_SEARCH_WINDOW", 50))
+        for name, leg in zip(("lexical", "vector"), legs):
+            if "error" in leg:
+                raise RuntimeError(f"Hybrid search {name} leg failed: {leg['error']}")
+
+        fusion_started = time.perf_counter()
+        results = reciprocal_rank_fusion(
+            [[self._hit_to_result(hit) for hit in leg["hits"]["hits"]] for leg in legs],
+            2 * window if collapse else top_k,
+            getattr(settings, "HYBRID_SEARCH_RRF_K", 60),
+            leg_names=["lexical", "vector"],
+        )
+        if collapse:
+            # The legs may have kept different chunks of the same decision
+            results = collapse_by_native_id(results, top_k)
+        timings = {
+            "lexical_ms": legs[0].get("took"),
+            "vector_ms": legs[1].get("took"),
+            "fusion_ms": (time.perf_counter() - fusion_started) * 1000,
+        }
+        return results, timings
+
+    @staticmethod
+    def _collapse_oversampling() -> int:
+        return max(1, getattr(settings, "SEARCH_COLLAPSE_OVERSAMPLING", 5))
+
+    def _attach_neighbours(self, results: List[Dict[str, Any]], neighbours: int) -> None:
+        """Fetch the ±neighbours chunks of every result in one request and attach them."""
+        request = self._neighbours_body(results, neighbours)
+        if request is None:
+            return
+        body, size = request
+        response = self.client.search(index=self.index_name, body=body, size=size)
+        self._apply_neighbours(results, response, neighbours)
+
+    def _neighbours_body(
+        self, results: List[Dict[str, Any]], neighbours: int
+    ) -> Optional[Tuple[Dict[str, Any], int]]:
+        """Return the search body and size fetching every result's window, or None."""
+        windows = []
+        for result in results:
+            chunk_index = result["metadata"].get("chunk_index")
+            if chunk_index is None:
+                continue
+            windows.append(
+                {
+                    "bool": {
+                        "filter": [
+                            {"term": {"metadata.native_id": result["native_id"]}},
+                            {
+                                "range": {
+                                    "metadata.chunk_index": {
+                                        "gte": chunk_index - neighbours,
+                                        "lte": chunk_index + neighbours,
+                                    }
+                                }
+                            },
+                        ]
+                    }
+                }
+            )
+        if not windows:
+            return None
+        body = {
+            "query": {"bool": {"should": windows, "minimum_should_match": 1}},
+            "_source": _SEARCH_SOURCE,
+            "sort": [{"metadata.chunk_index": "asc"}],
+        }
+        return body, len(windows) * (2 * neighbours + 1)
+
+    def _apply_neighbours(
+        self, results: List[Dict[str, Any]], response: Dict[str, Any], neighbours: int
+    ) -> None:
+        by_document: Dict[str, List[Dict[str, Any]]] = {}
+        for hit in response["hits"]["hits"]:
+            chunk = self._hit_to_result(hit)
+            by_document.setdefault(chunk["native_id"], []).append(
+                {
+                    "chunk_id": chunk["chunk_id"],
+                    "chunk_index": chunk["metadata"].get("chunk_index"),
+                    "text": chunk["text"],
+                }
+            )
+
+        for result in results:
+            chunk_index = result["metadata"].get("chunk_index")
+            if chunk_index is None:
+                continue
+            context = [
+                chunk
+                for chunk in by_document.get(result["native_id"], [])
+                if abs(chunk["chunk_index"] - chunk_index) <= neighbours
+            ]
+            result["context_chunks"] = context
+            result["context"] = join_context(context)
+
+    @staticmethod
+    def _hit_to_result(hit: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a search hit to the result shape shared by all vector stores."""
+        source = hit["_source"]
+        metadata = source.get("metadata", {})
+        return {
+            "chunk_id": source.get("id", metadata.get("chunk_id", "")),
+            "native_id": metadata.get("native_id", ""),
+            "text": source.get("text", ""),
+            "score": hit["_score"],
+            "metadata": metadata,
+        }
+
+    def _build_search_body(
+        self,
+        query_vector: List[float],
+        top_k: int,
+        filter_conditions: Optional[Union[SearchFilter, Dict[str, Any]]] = None,
+        shortlist: bool = False,
+        oversampling: Optional[int] = None,
+        num_candidates: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Build the kNN search body, either on the full vector or shortlist + rescore.
+
+        Full-vector searches use num_candidates, else the value tuned for top_k by
+        benchmark_num_candidates(), else top_k * 10.
+        """
+        if isinstance(filter_conditions, SearchFilter):
+            filter_conditions = filter_conditions.to_elasticsearch()
+
+        if not shortlist:
+            knn: Dict[str, Any] = {
+                "field": "vector",
+                "query_vector": query_vector,
+                "k": top_k,
+                "num_candidates": num_candidates or self._num_candidates(top_k),
+            }
+            if filter_conditions:
+                knn["filter"] = filter_conditions
+            return {"knn": knn}
+
+        window = top_k * (oversampling or self.shortlist_oversampling)
+        knn = {
+            "field": "vector_short",
+            "query_vector": self._shortlist_vector(query_vector),
+            "k": window,
+            "num_candidates": max(window, top_k * 10),
+        }
+        if filter_conditions:
+            knn["filter"] = filter_conditions
+        return {
+            "knn": knn,
+            "rescore": {
+                "window_size": window,
+                "query": {
+                    "rescore_query": {
+                        "script_score": {
+                            "query": {"match_all": {}},
+                            "script": {
+                                # Same scale as kNN cosine scores: (1 + cos) / 2
+                                "source": "(cosineSimilarity(params.query_vector, 'vector') + 1.0) / 2.0",
+                                "params": {"query_vector": query_vector},
+                            },
+                        }
+                    },
+                    "query_weight": 0.0,
+                    "rescore_query_weight": 1.0,
+                },
+            },
+        }
+
+    @property
+    def _tuning_key(self) -> str:
+        return f"elasticsearch:{self.index_name}"
+
+    def _num_candidates(self, top_k: int) -> int:
+        tuned = self.knn_tuning.candidates(self._tuning_key, top_k)
+        return min(max(tuned or top_k * 10, top_k), _MAX_NUM_CANDIDATES)
+
+    def benchmark_num_candidates(
+        self,
+        sample_size: int = 50,
+        top_k_values: Optional[List[int]] = None,
+        factors: Optional[List[int]] = None,
+        target_recall: Optional[float] = None,
+        persist: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Find the smallest kNN num_candidates reaching a target recall for each top_k.
+
+        Query vectors are sampled from the index. Ground truth is an exact
+        script_score scan over all chunks. The chosen values are persisted with
+        KnnTuning and used by search() from then on; the shortlist field keeps
+        its own oversampling and is not tuned here.
+
+        Args:
+            sample_size: Number of query vectors to sample
+            top_k_values: Result sizes to tune (defaults to 5, 10, 20, 50)
+            factors: num_candidates to try as multiples of top_k (defaults to
+                1, 2, 5, 10, 20)
+            target_recall: Recall to reach (falls back to KNN_TARGET_RECALL)
+            persist: Save the chosen values
+
+        Returns:
+            Report from tune_candidates(), keyed by "top_k_{k}" with recall and
+            latency per factor, and the chosen values under "chosen"
+        """
+        if not self.index_full_vector:
+            raise ValueError("ELASTICSEARCH_INDEX_FULL_VECTOR is off; there is no kNN to tune")
+        top_k_values = top_k_values or [5, 10, 20, 50]
+        factors = factors or [1, 2, 5, 10, 20]
+        if target_recall is None:
+            target_recall = getattr(settings, "KNN_TARGET_RECALL", 0.95)
+
+        sample = self.client.search(
+            index=self.index_name,
+            body={
+                "query": {"function_score": {"random_score": {}}},
+                "_source": ["vector"],
+            },
+            size=sample_size,
+        )
+        queries = [hit["_source"]["vector"] for hit in sample["hits"]["hits"]]
+
+        def exact(vector: List[float], k: int) -> List[str]:
+            body = {
+                "query": {
+                    "script_score": {
+                        "query": {"match_all": {}},
+                        "script": {
+                            "source": "cosineSimilarity(params.query_vector, 'vector') + 1.0",
+                            "params": {"query_vector": vector},
+                        },
+                    }
+                },
+                "_source": False,
+            }
+            response = self.client.search(index=self.index_name, body=body, size=k)
+            return [hit["_id"] for hit in response["hits"]["hits"]]
+
+        def approximate(vector: List[float], k: int, candidates: int) -> List[str]:
+            body = {
+                **self._build_search_body(vector, k, num_candidates=candidates),
+                "_source": False,
+            }
+            response = self.client.search(index=self.index_name, body=body, size=k)
+            return [hit["_id"] for hit in response["hits"]["hits"]]
+
+        report = tune_candidates(
+            queries,
+            exact,
+            approximate,
+            top_k_values,
+            factors,
+            target_recall,
+            _MAX_NUM_CANDIDATES,
+        )
+        if persist and report.get("chosen"):
+            self.knn_tuning.save(self._tuning_key, report["chosen"], target_recall)
+        logger.info(f"num_candidates benchmark on '{self.index_name}': {report}")
+        return report
+
+    def backfill_shortlist_vectors(self, batch_size: int = 500) -> int:
+        """
+        Compute ``vector_short`` for chunks indexed before the shortlist field existed.
+
+        Runs an update-by-query that truncates and renormalises the stored vector.
+
+        Returns:
+            Number of chunks updated
+        """
+        if not self.shortlist_dims:
+            raise ValueError("ELASTICSEARCH_SHORTLIST_DIMS is not set")
+
+        response = self.client.update_by_query(
+            index=self.index_name,
+            body={
+                "query": {"bool": {"must_not": {"exists": {"field": "vector_short"}}}},
+                "script": {
+                    "lang": "painless",
+                    "source": (
+                        "def v = ctx._source.vector; double norm = 0; "
+                        "List s = new ArrayList(); "
+                        "for (int i = 0; i < params.dims; i++) { s.add(v[i]); norm += v[i] * v[i]; } "
+                        "norm = Math.sqrt(norm); "
+                        "if (norm > 0) { for (int i = 0; i < s.size(); i++) { s[i] = s[i] / norm; } } "
+                        "ctx._source.vector_short = s;"
+                    ),
+                    "params": {"dims": self.shortlist_dims},
+                },
+            },
+            scroll_size=batch_size,
+            conflicts="proceed",
+            wait_for_completion=True,
+            request_timeout=3600,
+        )
+        updated = response.get("updated", 0)
+        logger.info(f"Backfilled shortlist vectors for {updated} chunks in '{self.index_name}'")
+        return updated
+
+    def benchmark_shortlist(
+        self,
+        sample_size: int = 50,
+        top_k: int = 10,
+        oversampling_factors: Optional[List[int]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Compare recall and latency of full-vector kNN and shortlist + rescore search.
+
+        Query vectors are sampled from the index. Ground truth is an exact
+        script_score scan over all chunks.
+
+        Args:
+            sample_size: Number of query vectors to sample
+            top_k: Results per query
+            oversampling_factors: Shortlist oversampling factors to try (defaults to 2, 5, 10)
+
+        Returns:
+            Dict keyed by "exact", "full_knn" and "shortlist_x{factor}" with recall,
+            p50_ms and p95_ms
+        """
+        if not self.shortlist_dims:
+            raise ValueError("ELASTICSEARCH_SHORTLIST_DIMS is not set")
+        oversampling_factors = oversampling_factors or [2, 5, 10]
+
+        sample = self.client.search(
+            index=self.index_name,
+            body={
+                "query": {"function_score": {"random_score": {}}},
+                "_source": ["vector"],
+            },
+            size=sample_size,
+        )
+        queries = [hit["_source"]["vector"] for hit in sample["hits"]["hits"]]
+        if not queries:
+            return {}
+
+        def exact_body(vector: List[float]) -> Dict[str, Any]:
+            return {
+                "query": {
+                    "script_score": {
+                        "query": {"match_all": {}},
+                        "script": {
+                            "source": "cosineSimilarity(params.query_vector, 'vector') + 1.0",
+                            "params": {"query_vector": vector},
+                        },
+                    }
+                }
+            }
+
+        variants = [("exact", exact_body)]
+        if self.index_full_vector:
+            variants.append(("full_knn", lambda v: self._build_search_body(v, top_k)))
+        for factor in oversampling_factors:
+            variants.append(
+                (
+                    f"shortlist_x{factor}",
+                    lambda v, factor=factor: self._build_search_body(
+                        v, top_k, shortlist=True, oversampling=factor
+                    ),
+                )
+            )
+
+        report: Dict[str, Any] = {"queries": len(queries), "top_k": top_k}
+        truth: List[set] = []
+        for variant, build in variants:
+            latencies, recalls = [], []
+            for i, vector in enumerate(queries):
+                body = {**build(vector), "_source": False}
+                started = time.perf_counter()
+                response = self.client.search(index=self.index_name, body=body, size=top_k)
+                latencies.append((time.perf_counter() - started) * 1000)
+                found = {hit["_id"] for hit in response["hits"]["hits"]}
+                if variant == "exact":
+                    truth.append(found)
+                recalls.append(len(found & truth[i]) / max(len(truth[i]), 1))
+            report[variant] = summarize_runs(latencies, recalls)
+
+        logger.info(f"Shortlist benchmark on '{self.index_name}': {report}")
+        return report
+
     def delete_document(self, native_id: str) -> int:
         """
         Delete all chunks for a document (including attachments).
@@ -365,7 +1065,7 @@ class ElasticsearchVectorStore(BaseVectorStore):
         """
         try:
             response = self.client.delete_by_query(
-                index=self.index_name,
+                index=self.write_index,
                 body={
                     "query": {
                         "bool": {
@@ -406,7 +1106,7 @@ class ElasticsearchVectorStore(BaseVectorStore):
         """
         try:
             response = self.client.delete_by_query(
-                index=self.index_name,
+                index=self.write_index,
                 body={
                     "query": {
                         "bool": {
@@ -451,7 +1151,7 @@ class ElasticsearchVectorStore(BaseVectorStore):
         """
         try:
             response = self.client.count(
-                index=self.index_name,
+                index=self.write_index,
                 body={"query": {"term": {"metadata.native_id": native_id}}},
             )
 
@@ -502,13 +1202,15 @@ class ElasticsearchVectorStore(BaseVectorStore):
                 for nid in native_id_values:
                     unique_native_ids.add(nid)
 
+            # "_all" also works when index_name is an alias over a versioned index
+            size_bytes = stats["_all"]["total"]["store"]["size_in_bytes"]
+
             return {
                 "instance": "elasticsearch",
                 "index_name": self.index_name,
                 "total_chunks": count_response.get("count", 0),
-                "size_bytes": stats["indices"][self.index_name]["total"]["store"]["size_in_bytes"],
-                "size_mb": stats["indices"][self.index_name]["total"]["store"]["size_in_bytes"]
-                / (1024 * 1024),
+                "size_bytes": size_bytes,
+                "size_mb": size_bytes / (1024 * 1024),
                 "total_decisions": len(unique_native_ids),
             }
 
@@ -522,8 +1224,426 @@ class ElasticsearchVectorStore(BaseVectorStore):
             logger.error(f"Error getting statistics: {e}")
             return {"instance": "elasticsearch", "index_name": self.index_name, "error": str(e)}
 
+    # ------------------------------------------------------------------
+    # Bulk-load (backfill) mode
+    # ------------------------------------------------------------------
+
+    @property
+    def bulk_load_active(self) -> bool:
+        """Whether bulk-load mode is currently active on this instance."""
+        return self._bulk_load_state is not None
+
+    @contextmanager
+    def bulk_load_mode(
+        self, force_merge: bool = False, new_index: bool = False, copy_existing: bool = True
+    ) -> Iterator["ElasticsearchVectorStore"]:
+        """
+        Context manager wrapping begin_bulk_load() / end_bulk_load().
+
+        Settings are restored even when the wrapped block raises. The alias is only
+        switched to a freshly built index when the block completes without errors.
+
+        Args:
+            force_merge: Force-merge the loaded index down to one segment at the end
+            new_index: Build a new versioned index behind the alias (see begin_bulk_load)
+            copy_existing: Seed a new index with the documents of the current one
+        """
+        self.begin_bulk_load(new_index=new_index, copy_existing=copy_existing)
+        completed = False
+        try:
+            yield self
+            completed = True
+        finally:
+            self.end_bulk_load(force_merge=force_merge and completed, promote=completed)
+
+    def begin_bulk_load(self, new_index: bool = False, copy_existing: bool = True) -> str:
+        """
+        Put the write index into bulk-load mode.
+
+        Disables refresh and replicas so segments and HNSW graphs are not rebuilt for
+        every bulk request. The original settings are persisted to
+        ELASTICSEARCH_BULK_LOAD_STATE_FILE before they are changed, so they can be
+        restored by a later run if this process dies.
+
+        With new_index=True and an alias as index_name, a fresh versioned index is
+        created and loaded while live search keeps using the old index through the
+        alias; end_bulk_load() then swaps the alias atomically. The new index is
+        first seeded with the documents of the old one, so a run over part of the
+        date range does not drop the rest from search.
+
+        Args:
+            new_index: Load into a new index behind the alias instead of in place
+            copy_existing: Seed a new index with the documents of the current one
+
+        Returns:
+            Name of the concrete index receiving writes
+        """
+        if self._bulk_load_state is not None:
+            raise RuntimeError(f"Bulk-load mode is already active on '{self.write_index}'")
+
+        # Restore what a crashed load left behind, but never take over a live one
+        self._recover_stale_bulk_load()
+        live = self._read_bulk_load_state()
+        if live is not None and live.get("index_name") == self.index_name:
+            raise RuntimeError(
+                f"Bulk load on '{live.get('target_index')}' is in progress in another process "
+                f"(pid {live.get('pid')}, last heartbeat "
+                f"{time.time() - live.get('heartbeat', 0):.0f}s ago)"
+            )
+
+        target = self.index_name
+        previous_indices: List[str] = []
+        if new_index:
+            if self.client.indices.exists_alias(name=self.index_name):
+                previous_indices = list(self.client.indices.get_alias(name=self.index_name).keys())
+                target = f"{self.index_name}_{datetime.now(timezone.utc):%Y%m%d%H%M%S}"
+                self.client.indices.create(index=target, body=self._build_index_body())
+                logger.info(f"Created index '{target}' for bulk load behind alias '{self.index_name}'")
+            else:
+                logger.warning(
+                    f"'{self.index_name}' is a concrete index, not an alias; bulk loading in place"
+                )
+
+        current = self.client.indices.get_settings(index=target, flat_settings=True)
+        original_settings = {
+            index: {
+                "index.refresh_interval": body["settings"].get("index.refresh_interval"),
+                "index.number_of_replicas": body["settings"].get("index.number_of_replicas"),
+            }
+            for index, body in current.items()
+        }
+
+        self._bulk_load_state = {
+            "index_name": self.index_name,
+            "target_index": target,
+            "previous_indices": previous_indices,
+            "original_settings": original_settings,
+            "started_at": datetime.now(timezone.utc).isoformat(),
+            "heartbeat": time.time(),
+            "pid": os.getpid(),
+        }
+        self._write_bulk_load_state()
+        self._start_heartbeat()
+
+        self.client.indices.put_settings(
+            index=target,
+            body={"index": {"refresh_interval": "-1", "number_of_replicas": 0}},
+        )
+        if previous_indices and copy_existing:
+            try:
+                self._copy_documents(previous_indices, target)
+            except Exception:
+                self.end_bulk_load(promote=False)
+                raise
+        self.write_index = target
+
+        logger.info(
+            f"Bulk-load mode enabled on '{target}' "
+            f"(refresh disabled, replicas 0; original settings: {original_settings})"
+        )
+        return target
+
+    def end_bulk_load(self, force_merge: bool = False, promote: bool = True) -> Dict[str, Any]:
+        """
+        Leave bulk-load mode and restore the original index settings.
+
+        The index is refreshed and optionally force-merged before replicas are
+        re-enabled, so replicas copy the merged segments instead of merging again.
+
+        Args:
+            force_merge: Force-merge the loaded index to a single segment
+            promote: Swap the alias to a newly built index (ignored for in-place loads)
+
+        Returns:
+            Indexing throughput report (see get_indexing_report)
+        """
+        state = self._bulk_load_state
+        if state is None:
+            logger.warning("end_bulk_load called but bulk-load mode is not active")
+            return self.get_indexing_report()
+
+        target = state["target_index"]
+        try:
+            self.client.indices.refresh(index=target)
+            if force_merge:
+                started = time.perf_counter()
+                logger.info(f"Force-merging '{target}' to a single segment...")
+                self.client.indices.forcemerge(
+                    index=target, max_num_segments=1, request_timeout=3600
+                )
+                logger.info(f"Force merge of '{target}' took {time.perf_counter() - started:.1f}s")
+        finally:
+            self._restore_index_settings(state)
+
+        if target != self.index_name and promote:
+            actions = [
+                {"remove": {"index": index, "alias": self.index_name}}
+                for index in state["previous_indices"]
+            ]
+            actions.append({"add": {"index": target, "alias": self.index_name}})
+            self.client.indices.update_aliases(body={"actions": actions})
+            logger.info(
+                f"Alias '{self.index_name}' now points to '{target}' "
+                f"(was {state['previous_indices']})"
+            )
+        elif target != self.index_name:
+            logger.warning(
+                f"Bulk load into '{target}' did not complete; alias '{self.index_name}' "
+                "was left unchanged"
+            )
+
+        self._clear_bulk_load_state()
+        self.write_index = self.index_name
+        self._save_indexing_stats()
+
+        report = self.get_indexing_report()
+        logger.info(f"Bulk-load mode disabled on '{target}'. Indexing throughput: {report}")
+        return report
+
+    def _copy_documents(self, sources: List[str], target: str) -> None:
+        """Copy every document of *sources* into *target* with the reindex API."""
+        started = time.perf_counter()
+        response = self.client.reindex(
+            body={"source": {"index": ",".join(sources)}, "dest": {"index": target}},
+            wait_for_completion=True,
+            request_timeout=3600,
+        )
+        if response.get("failures"):
+            raise RuntimeError(
+                f"Copying {sources} to '{target}' failed: {response['failures'][:3]}"
+            )
+        logger.info(
+            f"Copied {response.get('created', 0)} existing documents from {sources} to "
+            f"'{target}' in {time.perf_counter() - started:.1f}s"
+        )
+
+    def restore_bulk_load_settings(self) -> bool:
+        """
+        Restore index settings recorded by an interrupted bulk load.
+
+        Returns:
+            True if a recorded state was found and restored
+        """
+        return self._recover_stale_bulk_load(force=True)
+
+    def get_indexing_report(self) -> Dict[str, Any]:
+        """
+        Compare bulk indexing throughput with and without bulk-load mode.
+
+        Combines the persisted totals from earlier runs with this instance's counters.
+
+        Returns:
+            Dict with chunks, seconds and chunks_per_second per mode, plus the speedup
+            of bulk-load mode over normal indexing when both have been measured
+        """
+        totals = self._load_indexing_stats()
+        with self._stats_lock:
+            for mode, counters in self._indexing_stats.items():
+                totals.setdefault(mode, {"chunks": 0, "seconds": 0.0})
+                totals[mode]["chunks"] += counters["chunks"]
+                totals[mode]["seconds"] += counters["seconds"]
+
+        report: Dict[str, Any] = {}
+        for mode, counters in totals.items():
+            seconds = counters["seconds"]
+            report[mode] = {
+                "chunks": int(counters["chunks"]),
+                "seconds": round(seconds, 3),
+                "chunks_per_second": round(counters["chunks"] / seconds, 1) if seconds else None,
+            }
+
+        normal_rate = report.get("normal", {}).get("chunks_per_second")
+        bulk_rate = report.get("bulk_load", {}).get("chunks_per_second")
+        report["speedup"] = round(bulk_rate / normal_rate, 2) if normal_rate and bulk_rate else None
+        return report
+
+    def _record_indexing_throughput(self, chunks: int, seconds: float) -> None:
+        """Accumulate bulk request timings under the current indexing mode."""
+        mode = "bulk_load" if self._bulk_load_state is not None else "normal"
+        with self._stats_lock:
+            self._indexing_stats[mode]["chunks"] += chunks
+            self._indexing_stats[mode]["seconds"] += seconds
+
+    def _start_heartbeat(self) -> None:
+        """
+        Refresh the bulk-load heartbeat from a timer thread until the load ends.
+
+        The heartbeat lets other processes tell a live bulk load from a crashed one,
+        also while no bulk requests are sent (force merge, outage backoff).
+        """
+        stale_after = getattr(settings, "ELASTICSEARCH_BULK_LOAD_STALE_SECONDS", 900)
+        interval = max(1.0, stale_after / 3)
+        stop = threading.Event()
+
+        def beat() -> None:
+            while not stop.wait(interval):
+                try:
+                    with self._bulk_load_lock:
+                        if self._bulk_load_state is None:
+                            return
+                        self._bulk_load_state["heartbeat"] = time.time()
+                    self._write_bulk_load_state()
+                except Exception as e:
+                    logger.warning(f"Could not write bulk-load heartbeat: {e}")
+
+        self._heartbeat_stop = stop
+        self._heartbeat_thread = threading.Thread(
+            target=beat, name="es-bulk-load-heartbeat", daemon=True
+        )
+        self._heartbeat_thread.start()
+
+    def _stop_heartbeat(self) -> None:
+        if self._heartbeat_stop is not None:
+            self._heartbeat_stop.set()
+            self._heartbeat_thread.join()
+            self._heartbeat_stop = None
+            self._heartbeat_thread = None
+
+    def _restore_index_settings(self, state: Dict[str, Any]) -> None:
+        """Put back the refresh interval and replica count recorded in *state*."""
+        for index, original in state["original_settings"].items():
+            if not self.client.indices.exists(index=index):
+                logger.warning(f"Index '{index}' no longer exists, cannot restore its settings")
+                continue
+            # None resets a setting to the Elasticsearch default
+            self.client.indices.put_settings(
+                index=index,
+                body={
+                    "index": {
+                        "refresh_interval": original.get("index.refresh_interval"),
+                        "number_of_replicas": original.get("index.number_of_replicas"),
+                    }
+                },
+            )
+            logger.info(f"Restored settings on '{index}': {original}")
+
+    def _recover_stale_bulk_load(self, force: bool = False) -> bool:
+        """
+        Restore settings left behind by a bulk load that did not finish.
+
+        Without force, only state whose heartbeat is older than
+        ELASTICSEARCH_BULK_LOAD_STALE_SECONDS is recovered, so a bulk load running in
+        another process is not disturbed.
+
+        Args:
+            force: Recover regardless of the heartbeat age
+
+        Returns:
+            True if settings were restored
+        """
+        state = self._read_bulk_load_state()
+        if state is None or state.get("index_name") != self.index_name:
+            return False
+
+        stale_after = getattr(settings, "ELASTICSEARCH_BULK_LOAD_STALE_SECONDS", 900)
+        age = time.time() - state.get("heartbeat", 0)
+        if not force and age < stale_after:
+            logger.info(
+                f"Bulk load on '{state.get('target_index')}' is in progress elsewhere "
+                f"(last heartbeat {age:.0f}s ago)"
+            )
+            return False
+
+        logger.warning(
+            f"Recovering from interrupted bulk load on '{state.get('target_index')}' "
+            f"started at {state.get('started_at')}"
+        )
+        try:
+            self._restore_index_settings(state)
+        except Exception as e:
+            logger.error(f"Failed to restore index settings after interrupted bulk load: {e}")
+            return False
+
+        if state.get("target_index") != self.index_name:
+            logger.warning(
+                f"Partially loaded index '{state.get('target_index')}' was not promoted to "
+                f"alias '{self.index_name}'; delete it or rerun the backfill"
+            )
+
+        self._clear_bulk_load_state()
+        return True
+
+    def _read_bulk_load_state(self) -> Optional[Dict[str, Any]]:
+        """Return the bulk-load state recorded on disk, or None if there is none."""
+        if not self._bulk_load_state_file.exists():
+            return None
+        try:
+            with open(self._bulk_load_state_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            logger.error(f"Could not read bulk-load state {self._bulk_load_state_file}: {e}")
+            return None
+
+    def _write_bulk_load_state(self) -> None:
+        """Persist the active bulk-load state atomically."""
+        with self._bulk_load_lock:
+            if self._bulk_load_state is None:
+                return
+            self._bulk_load_state_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(
+                dir=self._bulk_load_state_file.parent,
+                prefix=f".{self._bulk_load_state_file.name}.",
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(self._bulk_load_state, f, indent=2)
+                os.replace(tmp, self._bulk_load_state_file)
+            except BaseException:
+                Path(tmp).unlink(missing_ok=True)
+                raise
+
+    def _clear_bulk_load_state(self) -> None:
+        """Forget the active bulk-load state in memory and on disk."""
+        self._stop_heartbeat()
+        with self._bulk_load_lock:
+            self._bulk_load_state = None
+        try:
+            self._bulk_load_state_file.unlink(missing_ok=True)
+        except Exception as e:
+            logger.warning(f"Could not remove bulk-load state {self._bulk_load_state_file}: {e}")
+
+    def _load_indexing_stats(self) -> Dict[str, Dict[str, float]]:
+        """Load persisted throughput totals from earlier runs."""
+        if not self._indexing_stats_file.exists():
+            return {}
+        try:
+            with open(self._indexing_stats_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"Could not read indexing stats {self._indexing_stats_file}: {e}")
+            return {}
+
+    def _save_indexing_stats(self) -> None:
+        """Fold this instance's throughput counters into the persisted totals."""
+        with self._stats_lock:
+            if not any(c["chunks"] for c in self._indexing_stats.values()):
+                return
+        try:
+            totals = self.get_indexing_report()
+            persisted = {
+                mode: {"chunks": values["chunks"], "seconds": values["seconds"]}
+                for mode, values in totals.items()
+                if isinstance(values, dict)
+            }
+            self._indexing_stats_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self._indexing_stats_file, "w", encoding="utf-8") as f:
+                json.dump(persisted, f, indent=2)
+            with self._stats_lock:
+                for counters in self._indexing_stats.values():
+                    counters["chunks"] = 0
+                    counters["seconds"] = 0.0
+        except Exception as e:
+            logger.warning(f"Could not save indexing stats {self._indexing_stats_file}: {e}")
+
     def close(self) -> None:
         """Close the Elasticsearch client connection."""
+        if self._bulk_load_state is not None:
+            logger.warning("Closing store with bulk-load mode still active; restoring settings")
+            try:
+                self.end_bulk_load(promote=False)
+            except Exception as e:
+                logger.error(f"Error leaving bulk-load mode on close: {e}")
+        self._save_indexing_stats()
         try:
             self.client.close()
             logger.info("Elasticsearch connection closed")
@@ -211,3 +211,27 @@ class AzureEmbedder:
             logger.error(f"Error generating single embedding: {e}")
             return []
 
+    def create_query_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """
+        Generate embeddings for several query texts in as few requests as possible.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            One embedding per text, in input order; empty for blank texts and for
+            texts whose batch failed
+        """
+        embeddings: List[List[float]] = [[] for _ in texts]
+        pending = [i for i, text in enumerate(texts) if text and text.strip()]
+        for start in range(0, len(pending), self.batch_size):
+            batch = pending[start : start + self.batch_size]
+            try:
+                batch_embeddings = self._create_embeddings_batch([texts[i] for i in batch])
+            except Exception as e:
+                logger.error(f"Error generating query embeddings: {e}")
+                continue
+            for i, embedding in zip(batch, batch_embeddings):
+                embeddings[i] = embedding
+        return embeddings
+
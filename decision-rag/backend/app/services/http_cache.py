@@ -0,0 +1,295 @@
+"""
+Persistent HTTP response cache with conditional revalidation.
+
+Responses of decision document and attachment requests are kept on disk so that
+re-runs over overlapping date ranges do not download them again. Each URL has a
+small JSON entry holding its ETag and Last-Modified validators, which are sent
+back as If-None-Match / If-Modified-Since; a 304 answer is then served from the
+cache. Bodies are stored content-addressed by their SHA-256, so identical files
+behind different URLs are kept once. When the bodies outgrow the size cap the
+least recently used entries are evicted.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional
+
+from app.core import get_logger, settings
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class CacheEntry:
+    """Validators and body reference cached for one URL."""
+
+    url: str
+    sha256: str
+    size: int
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    stored_at: float = 0.0
+    used_at: float = 0.0
+
+
+class HTTPCache:
+    """Thread-safe on-disk cache of response bodies keyed by URL, with a size cap."""
+
+    def __init__(self, directory: Optional[str] = None, max_size_mb: Optional[float] = None):
+        """
+        Initialize the cache, loading the entries already on disk.
+
+        Args:
+            directory: Cache directory (falls back to HTTP_CACHE_DIR setting)
+            max_size_mb: Cap on stored bodies in MB (falls back to HTTP_CACHE_MAX_SIZE_MB setting)
+        """
+        self.directory = Path(directory or settings.HTTP_CACHE_DIR)
+        size_mb = max_size_mb if max_size_mb is not None else settings.HTTP_CACHE_MAX_SIZE_MB
+        self.max_bytes = int(size_mb * 1024 * 1024)
+        self._entries_dir = self.directory / "entries"
+        self._objects_dir = self.directory / "objects"
+        self._entries_dir.mkdir(parents=True, exist_ok=True)
+        self._objects_dir.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._entries: Dict[str, CacheEntry] = {}
+        # Entries referencing each body and the bytes of all bodies, kept current so
+        # writes do not scan every entry
+        self._refs: Dict[str, int] = {}
+        self._total_bytes = 0
+        self._load()
+
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _key(url: str) -> str:
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def object_path(self, sha256: str) -> Path:
+        """Return the path of the body with the given digest."""
+        return self._objects_dir / sha256[:2] / sha256
+
+    def lookup(self, url: str) -> Optional[CacheEntry]:
+        """Return the entry cached for *url*, or None if absent or its body is gone."""
+        with self._lock:
+            entry = self._entries.get(self._key(url))
+        if entry is None:
+            return None
+        if not self.object_path(entry.sha256).exists():
+            self._remove(url)
+            return None
+        return entry
+
+    @staticmethod
+    def conditional_headers(entry: Optional[CacheEntry]) -> Dict[str, str]:
+        """Return the If-None-Match / If-Modified-Since headers to revalidate *entry*."""
+        headers = {}
+        if entry is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def read(self, entry: CacheEntry) -> bytes:
+        """Return the cached body of *entry*."""
+        return self.object_path(entry.sha256).read_bytes()
+
+    def copy_to(self, entry: CacheEntry, target_path: Path) -> Path:
+        """Copy the cached body of *entry* to *target_path*."""
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(self.object_path(entry.sha256), target_path)
+        return target_path
+
+    def mark_revalidated(self, entry: CacheEntry) -> None:
+        """Record that the server confirmed *entry* is current (304 response)."""
+        with self._lock:
+            self.hits += 1
+            self.revalidated += 1
+            entry.used_at = time.time()
+        self._write_entry(entry)
+
+    def store(self, url: str, content: bytes, headers: Mapping[str, str]) -> CacheEntry:
+        """
+        Cache a fresh response body for *url*.
+
+        Args:
+            url: Request URL (without credentials)
+            content: Response body
+            headers: Response headers, read for ETag and Last-Modified
+
+        Returns:
+            The new cache entry
+        """
+        sha256 = hashlib.sha256(content).hexdigest()
+        object_path = self.object_path(sha256)
+        if not object_path.exists():
+            self._write_atomic(object_path, content)
+        return self._add_entry(url, sha256, len(content), headers)
+
+    def store_file(
+        self, url: str, source_path: Path, sha256: str, headers: Mapping[str, str]
+    ) -> CacheEntry:
+        """
+        Cache a response body already written to *source_path* without reading it into memory.
+
+        Args:
+            url: Request URL (without credentials)
+            source_path: File holding the response body
+            sha256: Hex SHA-256 of the file, computed while it was written
+            headers: Response headers, read for ETag and Last-Modified
+
+        Returns:
+            The new cache entry
+        """
+        object_path = self.object_path(sha256)
+        if not object_path.exists():
+            object_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=object_path.parent, prefix=".tmp-")
+            os.close(fd)
+            try:
+                shutil.copyfile(source_path, tmp)
+                os.replace(tmp, object_path)
+            except BaseException:
+                Path(tmp).unlink(missing_ok=True)
+                raise
+        return self._add_entry(url, sha256, source_path.stat().st_size, headers)
+
+    def _add_entry(
+        self, url: str, sha256: str, size: int, headers: Mapping[str, str]
+    ) -> CacheEntry:
+        now = time.time()
+        entry = CacheEntry(
+            url=url,
+            sha256=sha256,
+            size=size,
+            etag=headers.get("etag"),
+            last_modified=headers.get("last-modified"),
+            stored_at=now,
+            used_at=now,
+        )
+        with self._lock:
+            self.misses += 1
+            previous = self._entries.get(self._key(url))
+            self._entries[self._key(url)] = entry
+            self._track(entry)
+            unused = previous is not None and self._untrack(previous)
+        self._write_entry(entry)
+        if unused:
+            self.object_path(previous.sha256).unlink(missing_ok=True)
+        self._enforce_size_cap()
+        return entry
+
+    def stats(self) -> Dict[str, Any]:
+        """Return entry, size and hit counts."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "objects": len(self._refs),
+                "size_mb": round(self._total_bytes / (1024 * 1024), 2),
+                "max_size_mb": round(self.max_bytes / (1024 * 1024), 2),
+                "hits": self.hits,
+                "revalidated": self.revalidated,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def _load(self) -> None:
+        for path in self._entries_dir.glob("*.json"):
+            try:
+                entry = CacheEntry(**json.loads(path.read_text(encoding="utf-8")))
+            except Exception as e:
+                logger.warning(f"Discarding unreadable HTTP cache entry {path.name}: {e}")
+                path.unlink(missing_ok=True)
+                continue
+            self._entries[path.stem] = entry
+            self._track(entry)
+        if self._entries:
+            logger.info(f"HTTP cache: loaded {len(self._entries)} entries from {self.directory}")
+
+    def _write_entry(self, entry: CacheEntry) -> None:
+        path = self._entries_dir / f"{self._key(entry.url)}.json"
+        self._write_atomic(path, json.dumps(asdict(entry)).encode("utf-8"))
+
+    @staticmethod
+    def _write_atomic(path: Path, content: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def _track(self, entry: CacheEntry) -> None:
+        """Count a new reference to the body of *entry*; call with the lock held."""
+        refs = self._refs.get(entry.sha256, 0)
+        if refs == 0:
+            self._total_bytes += entry.size
+        self._refs[entry.sha256] = refs + 1
+
+    def _untrack(self, entry: CacheEntry) -> bool:
+        """Drop a reference to the body of *entry*; True if it was the last one."""
+        refs = self._refs.get(entry.sha256, 0) - 1
+        if refs > 0:
+            self._refs[entry.sha256] = refs
+            return False
+        if self._refs.pop(entry.sha256, None) is not None:
+            self._total_bytes -= entry.size
+        return True
+
+    def _remove(self, url: str) -> None:
+        key = self._key(url)
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            unused = entry is not None and self._untrack(entry)
+        (self._entries_dir / f"{key}.json").unlink(missing_ok=True)
+        if unused:
+            self.object_path(entry.sha256).unlink(missing_ok=True)
+
+    def _enforce_size_cap(self) -> None:
+        """Evict least recently used entries until the stored bodies fit the cap."""
+        with self._lock:
+            if self._total_bytes <= self.max_bytes:
+                return
+            # Only sorted once the cap is exceeded
+            by_age = sorted(self._entries.values(), key=lambda e: e.used_at)
+
+        for entry in by_age:
+            with self._lock:
+                if self._total_bytes <= self.max_bytes:
+                    break
+                self.evictions += 1
+            self._remove(entry.url)
+        logger.debug(f"HTTP cache: evicted down to {self._total_bytes / (1024 * 1024):.1f} MB")
+
+
+_shared_cache: Optional[HTTPCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_http_cache() -> Optional[HTTPCache]:
+    """Return the process-wide cache shared by the API client and attachment downloader.
+
+    Returns:
+        The shared HTTPCache, or None when HTTP_CACHE_ENABLED is off
+    """
+    global _shared_cache
+    if not settings.HTTP_CACHE_ENABLED:
+        return None
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = HTTPCache()
+        return _shared_cache
@@ -1,7 +1,7 @@
 """
 Ingestion pipeline for processing decision documents.
 
-Implements the full flow from loading documents, converting content, chunking, embedding, and indexing to Elasticsearch. Also includes attachment processing with parallelization and robust error handling.
+Implements the full flow from loading documents, converting content, chunking, embedding, and indexing to Elasticsearch. Also includes attachment processing with parallelization and robust error handling; within a batch, attachments of all decisions share one AttachmentScheduler so downloads for later decisions overlap with processing earlier ones.
 """
 
 import shutil
@@ -15,14 +15,23 @@ from app.core import get_logger, settings
 from app.repositories import DecisionRepository
 from app.schemas.decision import Attachment, DecisionDocument
 from app.services.attachment_downloader import AttachmentDownloader
-from app.services.chunker import ParagraphChunker
+from app.services.attachment_registry import AttachmentRegistry, ProcessedAttachment
+from app.services.attachment_scheduler import AttachmentScheduler
+from app.services.chunker import DocumentChunk, ParagraphChunker
 from app.services.content_converter import convert_attachment_content, convert_decision_content
-from app.services.embedder import AzureEmbedder
+from app.services.decision_index import DecisionSummaryIndex
+from app.services.embedder import AzureEmbedder, EmbeddingResult
 from app.services.parquet_embedding_saver import ParquetEmbeddingSaver
+from app.services.search_cache import SearchCache
 from app.services.vector_store import BaseVectorStore
+from app.utils.validators import validate_decision_document
 
 logger = get_logger(__name__)
 
+# Prefix of NativeIds given to attachments that have none; these are not unique
+# across decisions and are never used as deduplication keys
+GENERATED_ATTACHMENT_ID_PREFIX = "att_"
+
 
 class IngestionPipeline:
     """
@@ -42,6 +51,9 @@ class IngestionPipeline:
         vector_store: BaseVectorStore,
         attachment_downloader: Optional[AttachmentDownloader] = None,
         parquet_saver: Optional[ParquetEmbeddingSaver] = None,
+        decision_index: Optional[DecisionSummaryIndex] = None,
+        search_cache: Optional[SearchCache] = None,
+        attachment_registry: Optional[AttachmentRegistry] = None,
     ):
         """
         Initialize ingestion pipeline.
@@ -53,6 +65,12 @@ class IngestionPipeline:
             vector_store: Vector store service
             attachment_downloader: Attachment download service (optional)
             parquet_saver: Parquet embedding saver (optional)
+            decision_index: Decision-level summary index kept in step with the
+                chunk index (optional)
+            search_cache: Search cache whose index epoch is bumped whenever a
+                document's chunks change (optional)
+            attachment_registry: Registry of processed attachments reused across
+                decisions (optional; created when ATTACHMENT_DEDUP_MAX_CHUNKS > 0)
         """
         self.repository = repository
         self.chunker = chunker
@@ -60,17 +78,34 @@ class IngestionPipeline:
         self.vector_store = vector_store
         self.attachment_downloader = attachment_downloader
         self.parquet_saver = parquet_saver
+        self.decision_index = decision_index
+        self.search_cache = search_cache
+        if attachment_registry is None and settings.ATTACHMENT_DEDUP_MAX_CHUNKS > 0:
+            attachment_registry = AttachmentRegistry()
+        self.attachment_registry = attachment_registry
         self._lock = threading.Lock()  # Thread safety for logging and stats
 
         logger.info("Initialized IngestionPipeline")
 
-    def process_document(self, native_id: str, reindex: bool = False) -> Dict[str, Any]:
+    def process_document(
+        self,
+        native_id: str,
+        reindex: bool = False,
+        attachment_scheduler: Optional[AttachmentScheduler] = None,
+        decision: Optional[DecisionDocument] = None,
+    ) -> Dict[str, Any]:
         """
         Process a single decision document.
 
         Args:
             native_id: Native ID of the document
             reindex: Force reindexing even if document exists
+            attachment_scheduler: Batch scheduler to hand the attachments to; they
+                are then processed in the background and not counted in the
+                returned stats. Without one, attachments are processed before
+                returning.
+            decision: The document itself, e.g. straight from the fetcher; when
+                given it is not loaded from the repository
 
         Returns:
             Dictionary with processing statistics
@@ -93,8 +128,9 @@ class IngestionPipeline:
                 stats["skipped"] = True
                 return stats
 
-            # Load decision document
-            decision = self.repository.get_decision(native_id)
+            # Load decision document unless it was handed over in memory
+            if decision is None:
+                decision = self.repository.get_decision(native_id)
             if not decision:
                 stats["error"] = "Document not found"
                 logger.warning(f"Document not found: {native_id}")
@@ -180,6 +216,8 @@ class IngestionPipeline:
             if reindex:
                 deleted_count = self.vector_store.delete_document(native_id)
                 logger.info(f"Deleted {deleted_count} existing chunks for {native_id}")
+                if deleted_count:
+                    self._invalidate_search_cache()
 
             # Index to Elasticsearch
             logger.debug(f"Indexing {len(chunks_with_embeddings)} chunks to Elasticsearch")
@@ -191,6 +229,14 @@ class IngestionPipeline:
             if index_result["failed"] > 0:
                 stats["error"] = f"{index_result['failed']} chunks failed to index"
 
+            if self.decision_index is not None and stats["success"]:
+                stats["decision_summary_indexed"] = self._index_decision_summary(
+                    native_id, metadata, chunks_with_embeddings
+                )
+
+            if stats["success"]:
+                self._invalidate_search_cache()
+
             logger.info(
                 f"Processed document {native_id}: "
                 f"{stats['chunks_created']} chunks created, "
@@ -198,7 +244,15 @@ class IngestionPipeline:
             )
 
             # Process attachments if enabled and downloader is available
-            if settings.PROCESS_ATTACHMENTS and self.attachment_downloader and decision.Attachments:
+            if (
+                settings.PROCESS_ATTACHMENTS
+                and self.attachment_downloader
+                and decision.Attachments
+                and attachment_scheduler is not None
+            ):
+                self._assign_attachment_ids(decision)
+                attachment_scheduler.submit(decision)
+            elif settings.PROCESS_ATTACHMENTS and self.attachment_downloader and decision.Attachments:
                 try:
                     attachment_stats = self.process_attachments(decision)
                     stats["attachments_processed"] = attachment_stats.get(
@@ -220,7 +274,7 @@ class IngestionPipeline:
 
     def process_batch(self, native_ids: List[str], reindex: bool = False, batch_start: datetime = None, batch_end: datetime = None) -> Dict[str, Any]:
         """
-        Process a batch of documents with optional parallelization.
+        Process a batch of documents stored in the repository with optional parallelization.
 
         Args:
             native_ids: List of native IDs to process
@@ -231,6 +285,49 @@ class IngestionPipeline:
         Returns:
             Dictionary with batch processing statistics
         """
+        return self._run_batch(native_ids, {}, reindex, batch_start, batch_end)
+
+    def process_decisions(
+        self,
+        decisions: List[DecisionDocument],
+        reindex: bool = False,
+        batch_start: datetime = None,
+        batch_end: datetime = None,
+    ) -> Dict[str, Any]:
+        """
+        Process a batch of decision documents held in memory, e.g. straight from the fetcher.
+
+        The documents are not read from or written to the repository. Documents
+        failing validation are left out, as DecisionRepository.save_decision
+        would reject them.
+
+        Args:
+            decisions: Decision documents to process
+            reindex: Force reindexing even if documents exist
+            batch_start: Optional start datetime for the batch
+            batch_end: Optional end datetime for the batch
+
+        Returns:
+            Dictionary with batch processing statistics
+        """
+        by_id = {}
+        for decision in decisions:
+            is_valid, error = validate_decision_document(decision)
+            if not is_valid:
+                logger.error(f"Invalid decision document: {error}")
+                continue
+            by_id[decision.NativeId] = decision
+        return self._run_batch(list(by_id), by_id, reindex, batch_start, batch_end)
+
+    def _run_batch(
+        self,
+        native_ids: List[str],
+        decisions: Dict[str, DecisionDocument],
+        reindex: bool,
+        batch_start: Optional[datetime],
+        batch_end: Optional[datetime],
+    ) -> Dict[str, Any]:
+        """Process *native_ids*, taking documents from *decisions* or else the repository."""
         batch_stats = {
             "total": len(native_ids),
             "processed": 0,
@@ -251,42 +348,64 @@ class IngestionPipeline:
         if self.parquet_saver is not None and batch_start is not None and batch_end is not None:
             self.parquet_saver.start_batch(batch_start, batch_end)
 
-        if max_workers > 1:
-            # Parallel processing with ThreadPoolExecutor
-            logger.info(f"Using {max_workers} workers for parallel document processing")
+        # One scheduler for the attachments of every decision in the batch
+        attachment_scheduler = self.create_attachment_scheduler()
+        try:
+            if max_workers > 1:
+                # Parallel processing with ThreadPoolExecutor
+                logger.info(f"Using {max_workers} workers for parallel document processing")
 
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                # Submit all document processing tasks
-                future_to_id = {
-                    executor.submit(self.process_document, native_id, reindex): native_id
-                    for native_id in native_ids
-                }
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    # Submit all document processing tasks
+                    future_to_id = {
+                        executor.submit(
+                            self.process_document,
+                            native_id,
+                            reindex,
+                            attachment_scheduler,
+                            decisions.get(native_id),
+                        ): native_id
+                        for native_id in native_ids
+                    }
 
-                # Collect results as they complete
-                for future in as_completed(future_to_id):
-                    native_id = future_to_id[future]
+                    # Collect results as they complete
+                    for future in as_completed(future_to_id):
+                        native_id = future_to_id[future]
+                        try:
+                            doc_stats = future.result()
+                            self._update_batch_stats(batch_stats, doc_stats, native_id)
+                        except Exception as e:
+                            logger.error(
+                                f"Exception processing document {native_id}: {e}", exc_info=True
+                            )
+                            batch_stats["processed"] += 1
+                            batch_stats["failed"] += 1
+                            batch_stats["errors"].append({"native_id": native_id, "error": str(e)})
+            else:
+                # Serial processing (original behavior)
+                logger.info("Using serial document processing (MAX_WORKERS_INGESTION=1)")
+                for native_id in native_ids:
                     try:
-                        doc_stats = future.result()
+                        doc_stats = self.process_document(
+                            native_id, reindex, attachment_scheduler, decisions.get(native_id)
+                        )
                         self._update_batch_stats(batch_stats, doc_stats, native_id)
                     except Exception as e:
-                        logger.error(
-                            f"Exception processing document {native_id}: {e}", exc_info=True
-                        )
+                        logger.error(f"Exception processing document {native_id}: {e}", exc_info=True)
                         batch_stats["processed"] += 1
                         batch_stats["failed"] += 1
                         batch_stats["errors"].append({"native_id": native_id, "error": str(e)})
-        else:
-            # Serial processing (original behavior)
-            logger.info("Using serial document processing (MAX_WORKERS_INGESTION=1)")
-            for native_id in native_ids:
-                try:
-                    doc_stats = self.process_document(native_id, reindex)
-                    self._update_batch_stats(batch_stats, doc_stats, native_id)
-                except Exception as e:
-                    logger.error(f"Exception processing document {native_id}: {e}", exc_info=True)
-                    batch_stats["processed"] += 1
-                    batch_stats["failed"] += 1
-                    batch_stats["errors"].append({"native_id": native_id, "error": str(e)})
+
+            # Attachments finish in the background; wait for them before flushing
+            if attachment_scheduler is not None:
+                for attachment_stats in attachment_scheduler.join().values():
+                    batch_stats["total_attachments"] += attachment_stats["attachments_processed"]
+                    batch_stats["total_attachment_chunks"] += attachment_stats["chunks_indexed"]
+                if self.attachment_registry is not None:
+                    logger.info(f"Attachment registry: {self.attachment_registry.stats()}")
+        finally:
+            if attachment_scheduler is not None:
+                attachment_scheduler.close()
 
         logger.info(
             f"Batch processing complete: "
@@ -337,6 +456,36 @@ class IngestionPipeline:
                         {"native_id": native_id, "error": doc_stats["error"]}
                     )
 
+    def create_attachment_scheduler(self) -> Optional[AttachmentScheduler]:
+        """
+        Create a scheduler for the attachments of a batch of decisions.
+
+        Returns:
+            AttachmentScheduler processing attachments with this pipeline, or None
+            when attachment processing is disabled or there is no downloader
+        """
+        if not settings.PROCESS_ATTACHMENTS or self.attachment_downloader is None:
+            return None
+        if self.attachment_registry is None:
+            return AttachmentScheduler(self.attachment_downloader, self._process_single_attachment)
+        return AttachmentScheduler(
+            self.attachment_downloader,
+            self._process_single_attachment,
+            reuse=self._reuse_known_attachment,
+            reuse_keys=self._attachment_keys,
+        )
+
+    def _assign_attachment_ids(self, decision: DecisionDocument) -> None:
+        """Give attachments without a NativeId one derived from their number."""
+        attachment_number = 0
+        for attachment in decision.Attachments:
+            attachment_number += 1
+            if not attachment.NativeId:
+                attachment.NativeId = (
+                    f"{GENERATED_ATTACHMENT_ID_PREFIX}"
+                    f"{attachment.AttachmentNumber or attachment_number}"
+                )
+
     def process_attachments(self, decision: DecisionDocument) -> Dict[str, Any]:
         """
         Process all attachments for a decision with optional parallelization.
@@ -363,11 +512,7 @@ class IngestionPipeline:
         temp_dir.mkdir(parents=True, exist_ok=True)
 
         # If there's attachments without NativeId, we generate one
-        attachment_number = 0
-        for attachment in decision.Attachments:
-            attachment_number += 1
-            if not attachment.NativeId:
-                attachment.NativeId = f"att_{attachment.AttachmentNumber or attachment_number}"
+        self._assign_attachment_ids(decision)
 
         try:
             # Download attachments
@@ -499,15 +644,21 @@ class IngestionPipeline:
         return stats
 
     def _process_single_attachment(
-        self, decision, attachment: Attachment, file_path: Path
+        self, decision, attachment: Attachment, file_path: Path, sha256: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Process a single attachment (convert, chunk, embed, index).
 
+        An attachment already processed for another decision (same NativeId,
+        FileURI or file content) is not converted or embedded again; its
+        registered chunks are indexed for this decision instead.
+
         Args:
             decision: Decision document object
             attachment: Attachment object
             file_path: Path to downloaded attachment file
+            sha256: Hex digest of the file if already known from the download;
+                computed from the file when needed otherwise
 
         Returns:
             Dictionary with processing statistics
@@ -524,6 +675,18 @@ class IngestionPipeline:
         native_id = attachment.NativeId
 
         try:
+            if self.attachment_registry is not None:
+                if sha256 is None:
+                    sha256 = self._attachment_digest(file_path)
+                processed = self.attachment_registry.lookup(
+                    **self._attachment_keys(attachment, sha256)
+                )
+                if processed is not None:
+                    self.attachment_registry.add_keys(
+                        processed, **self._attachment_keys(attachment, sha256)
+                    )
+                    return self._reuse_attachment(decision, attachment, processed)
+
             # Convert to markdown
             logger.info(f"Converting attachment {native_id} to Markdown")
             markdown_text = convert_attachment_content(file_path)
@@ -566,46 +729,14 @@ class IngestionPipeline:
                 logger.error(f"Failed to generate embeddings for attachment {native_id}")
                 return stats
 
-            # Buffer embeddings for Parquet export
-            if self.parquet_saver is not None:
-                try:
-                    self.parquet_saver.buffer(embedding_results, decision.NativeId)
-                except Exception as _exc:
-                    logger.warning(
-                        f"Parquet saver buffer error for attachment {native_id}: {_exc}",
-                        exc_info=True,
-                    )
-
-            # Prepare chunks with embeddings
-            chunks_with_embeddings = []
-            embedding_map = {er.chunk_id: er.embedding for er in embedding_results}
-
-            for chunk in chunks:
-                if chunk.chunk_id in embedding_map:
-                    chunks_with_embeddings.append(
-                        {
-                            "chunk_id": chunk.chunk_id,
-                            "native_id": chunk.native_id,
-                            "chunk_index": chunk.chunk_index,
-                            "text": chunk.text,
-                            "embedding": embedding_map[chunk.chunk_id],
-                            "token_count": chunk.token_count,
-                            "chunk_position": chunk.chunk_index,
-                            "metadata": chunk.metadata,
-                        }
-                    )
-
-            # Index to Elasticsearch
-            logger.info(
-                f"Indexing {len(chunks_with_embeddings)} attachment chunks to Elasticsearch"
+            chunks_with_embeddings = self._index_attachment_chunks(
+                decision, attachment, chunks, embedding_results, stats
             )
-            index_result = self.vector_store.bulk_index_chunks(chunks_with_embeddings)
 
-            stats["chunks_indexed"] = index_result["success"]
-            stats["success"] = index_result["success"] > 0
-
-            if index_result["failed"] > 0:
-                logger.warning(f"{index_result['failed']} attachment chunks failed to index")
+            if stats["success"] and self.attachment_registry is not None:
+                self._register_attachment(
+                    decision, attachment, sha256, embedding_results, chunks_with_embeddings
+                )
 
             end_time = datetime.now()
             duration = (end_time - start_time).total_seconds()
@@ -614,7 +745,7 @@ class IngestionPipeline:
 
             logger.info(
                 f"Processed attachment {native_id} for decision {decision.NativeId}: "
-                f"{len(chunks)} chunks created, {index_result['success']} chunks indexed"
+                f"{len(chunks)} chunks created, {stats['chunks_indexed']} chunks indexed"
             )
 
         except Exception as e:
@@ -623,6 +754,230 @@ class IngestionPipeline:
 
         return stats
 
+    def _index_attachment_chunks(
+        self,
+        decision,
+        attachment: Attachment,
+        chunks: List[DocumentChunk],
+        embedding_results: List[EmbeddingResult],
+        stats: Dict[str, Any],
+    ) -> List[Dict[str, Any]]:
+        """
+        Buffer attachment embeddings for Parquet export and index the chunks.
+
+        Args:
+            decision: Decision document object
+            attachment: Attachment object
+            chunks: Attachment chunks
+            embedding_results: Embeddings of the chunks
+            stats: Attachment statistics, updated with chunks_indexed and success
+
+        Returns:
+            The chunks sent to the vector store, with their embeddings
+        """
+        native_id = attachment.NativeId
+
+        # Buffer embeddings for Parquet export
+        if self.parquet_saver is not None:
+            try:
+                self.parquet_saver.buffer(embedding_results, decision.NativeId)
+            except Exception as _exc:
+                logger.warning(
+                    f"Parquet saver buffer error for attachment {native_id}: {_exc}",
+                    exc_info=True,
+                )
+
+        # Prepare chunks with embeddings
+        chunks_with_embeddings = []
+        embedding_map = {er.chunk_id: er.embedding for er in embedding_results}
+
+        for chunk in chunks:
+            if chunk.chunk_id in embedding_map:
+                chunks_with_embeddings.append(
+                    {
+                        "chunk_id": chunk.chunk_id,
+                        "native_id": chunk.native_id,
+                        "chunk_index": chunk.chunk_index,
+                        "text": chunk.text,
+                        "embedding": embedding_map[chunk.chunk_id],
+                        "token_count": chunk.token_count,
+                        "chunk_position": chunk.chunk_index,
+                        "metadata": chunk.metadata,
+                    }
+                )
+
+        # Index to Elasticsearch
+        logger.info(f"Indexing {len(chunks_with_embeddings)} attachment chunks to Elasticsearch")
+        index_result = self.vector_store.bulk_index_chunks(chunks_with_embeddings)
+
+        stats["chunks_indexed"] = index_result["success"]
+        stats["success"] = index_result["success"] > 0
+        if stats["success"]:
+            self._invalidate_search_cache()
+
+        if index_result["failed"] > 0:
+            logger.warning(f"{index_result['failed']} attachment chunks failed to index")
+
+        return chunks_with_embeddings
+
+    def _attachment_keys(
+        self, attachment: Attachment, sha256: Optional[str] = None
+    ) -> Dict[str, Optional[str]]:
+        """Return the registry keys of *attachment*, leaving out locally generated NativeIds."""
+        native_id = attachment.NativeId
+        if native_id and native_id.startswith(GENERATED_ATTACHMENT_ID_PREFIX):
+            native_id = None
+        return {"native_id": native_id, "file_uri": attachment.FileURI, "sha256": sha256}
+
+    def _attachment_digest(self, file_path: Path) -> Optional[str]:
+        """Return the SHA-256 of a downloaded attachment, or None if it cannot be read."""
+        if self.attachment_downloader is None:
+            return None
+        try:
+            return self.attachment_downloader.file_digest(file_path)
+        except OSError as e:
+            logger.warning(f"Could not hash attachment file {file_path}: {e}")
+            return None
+
+    def _register_attachment(
+        self,
+        decision,
+        attachment: Attachment,
+        sha256: Optional[str],
+        embedding_results: List[EmbeddingResult],
+        chunks_with_embeddings: List[Dict[str, Any]],
+    ) -> None:
+        """Record a processed attachment so that later decisions can reuse it."""
+        try:
+            self.attachment_registry.register(
+                decision.NativeId,
+                attachment.NativeId,
+                embedding_results[0].model,
+                chunks_with_embeddings,
+                **self._attachment_keys(attachment, sha256),
+            )
+        except Exception as e:
+            logger.warning(f"Failed to register attachment {attachment.NativeId} for reuse: {e}")
+
+    def _reuse_known_attachment(
+        self, decision: DecisionDocument, attachment: Attachment
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Index an attachment from the registry if its NativeId or FileURI is known.
+
+        Used by the AttachmentScheduler before downloading, so known attachments
+        are not downloaded at all.
+
+        Returns:
+            Attachment statistics, or None when the attachment has to be downloaded
+        """
+        if self.attachment_registry is None:
+            return None
+        processed = self.attachment_registry.lookup(**self._attachment_keys(attachment))
+        if processed is None:
+            return None
+        return self._reuse_attachment(decision, attachment, processed)
+
+    def _reuse_attachment(
+        self, decision, attachment: Attachment, processed: ProcessedAttachment
+    ) -> Dict[str, Any]:
+        """
+        Index the chunks of an attachment processed for another decision.
+
+        The chunk bodies and embeddings are reused as they are; the metadata,
+        metadata header and chunk IDs are rebuilt for *decision*.
+
+        Args:
+            decision: Decision document object
+            attachment: Attachment object
+            processed: Registered chunks of the same attachment
+
+        Returns:
+            Dictionary with processing statistics
+        """
+        stats = {
+            "success": False,
+            "chunks_created": 0,
+            "chunks_indexed": 0,
+        }
+        native_id = attachment.NativeId
+
+        try:
+            metadata = self._extract_attachment_metadata(decision, attachment)
+            chunk_native_id = f"{decision.NativeId}_att_{native_id}"
+            chunks = []
+            embedding_results = []
+            for registered in processed.chunks:
+                chunk = self.chunker.rebuild_chunk(
+                    registered.body,
+                    chunk_native_id,
+                    registered.chunk_index,
+                    registered.token_count,
+                    metadata,
+                )
+                chunks.append(chunk)
+                embedding_results.append(
+                    EmbeddingResult(
+                        chunk_id=chunk.chunk_id,
+                        embedding=registered.embedding_list,
+                        model=processed.model,
+                        tokens_used=0,
+                    )
+                )
+            stats["chunks_created"] = len(chunks)
+
+            self._index_attachment_chunks(decision, attachment, chunks, embedding_results, stats)
+
+            logger.info(
+                f"Reused attachment {processed.attachment_native_id} of decision "
+                f"{processed.decision_native_id} as {native_id} for decision "
+                f"{decision.NativeId}: {stats['chunks_indexed']} chunks indexed"
+            )
+        except Exception as e:
+            logger.error(f"Error reusing attachment {native_id}: {e}", exc_info=True)
+
+        return stats
+
+    def _invalidate_search_cache(self) -> None:
+        """Bump the index epoch so cached search results are no longer served."""
+        if self.search_cache is None:
+            return
+        try:
+            self.search_cache.invalidate()
+        except Exception as e:
+            logger.warning(f"Failed to bump the search index epoch: {e}")
+
+    def _index_decision_summary(
+        self, native_id: str, metadata: Dict[str, Any], chunks: List[Dict[str, Any]]
+    ) -> bool:
+        """
+        Write the decision's entry in the summary index.
+
+        Embeds the title/metadata text and blends it with the decision chunk
+        embeddings. Failures are logged and do not fail the document.
+
+        Args:
+            native_id: Native ID of the decision
+            metadata: Decision metadata
+            chunks: Indexed decision chunks with embeddings
+
+        Returns:
+            True if the summary entry was written
+        """
+        try:
+            title_embedding = self.embedder.create_embedding(
+                self.decision_index.summary_text(metadata)
+            )
+            return self.decision_index.index_decision(
+                native_id,
+                metadata,
+                title_embedding,
+                [chunk["embedding"] for chunk in chunks],
+            )
+        except Exception as e:
+            logger.warning(f"Failed to index decision summary for {native_id}: {e}")
+            return False
+
     def _extract_attachment_metadata(self, decision, attachment: Attachment) -> Dict[str, Any]:
         """
         Extract metadata for attachment chunks.
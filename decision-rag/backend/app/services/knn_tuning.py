@@ -0,0 +1,176 @@
+"""
+Recall-driven tuning of approximate kNN candidate counts.
+
+Elasticsearch kNN searches visit ``num_candidates`` vectors per shard and
+pgvector HNSW scans keep ``hnsw.ef_search`` candidates; both trade latency for
+recall. tune_candidates() measures recall@k against exact search for several
+candidate counts per top_k and picks the smallest one that reaches a target
+recall. KnnTuning persists the choice in a small JSON file, keyed by backend
+and index, which the vector stores read at search time.
+"""
+
+import json
+import math
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from app.core import get_logger, settings
+
+logger = get_logger(__name__)
+
+
+class KnnTuning:
+    """Candidate counts per top_k chosen by the recall benchmark, shared through a file."""
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initialize the tuning store.
+
+        Args:
+            path: Tuning file (falls back to KNN_TUNING_FILE setting)
+        """
+        self.path = Path(path or getattr(settings, "KNN_TUNING_FILE", "data/knn_tuning.json"))
+        self._lock = threading.Lock()
+        self._file_id: Optional[Tuple[int, int]] = None
+        self._data: Dict[str, Any] = {}
+
+    def candidates(self, key: str, top_k: int) -> Optional[int]:
+        """
+        Return the tuned candidate count for a search, or None if *key* is untuned.
+
+        The entry for the smallest benchmarked top_k at or above the requested one
+        is used; beyond the largest benchmarked top_k its candidates-per-result
+        ratio is scaled up.
+
+        Args:
+            key: Backend and index, e.g. "elasticsearch:decision_documents"
+            top_k: Number of results the search returns
+        """
+        tuned = self._load().get(key, {}).get("candidates")
+        if not tuned:
+            return None
+        sizes = sorted(int(size) for size in tuned)
+        for size in sizes:
+            if size >= top_k:
+                return int(tuned[str(size)])
+        largest = sizes[-1]
+        return math.ceil(int(tuned[str(largest)]) / largest * top_k)
+
+    def save(self, key: str, candidates: Dict[int, int], target_recall: float) -> None:
+        """Persist the chosen candidate counts (top_k -> candidates) for *key*."""
+        with self._lock:
+            data = self._read()
+            data[key] = {
+                "candidates": {str(size): value for size, value in sorted(candidates.items())},
+                "target_recall": target_recall,
+                "tuned_at": time.time(),
+            }
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(data, indent=2))
+            os.replace(tmp_path, self.path)
+            self._file_id = None
+        logger.info(f"Saved kNN tuning for {key} to {self.path}: {candidates}")
+
+    def _load(self) -> Dict[str, Any]:
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return {}
+        file_id = (stat.st_ino, stat.st_mtime_ns)
+        with self._lock:
+            if file_id != self._file_id:
+                self._data = self._read()
+                self._file_id = file_id
+            return self._data
+
+    def _read(self) -> Dict[str, Any]:
+        try:
+            data = json.loads(self.path.read_text())
+        except FileNotFoundError:
+            return {}
+        except ValueError as e:
+            logger.warning(f"Ignoring unreadable kNN tuning file {self.path}: {e}")
+            return {}
+        return data if isinstance(data, dict) else {}
+
+
+def summarize_runs(latencies: Sequence[float], recalls: Sequence[float]) -> Dict[str, float]:
+    """
+    Summarise the per-query results of one benchmark variant.
+
+    Args:
+        latencies: Query latencies in milliseconds
+        recalls: Recall of each query
+
+    Returns:
+        Dict with mean "recall" and "p50_ms" / "p95_ms" latency
+    """
+    ordered = sorted(latencies)
+    return {
+        "recall": round(sum(recalls) / len(recalls), 4),
+        "p50_ms": round(ordered[len(ordered) // 2], 2),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 2),
+    }
+
+
+def tune_candidates(
+    queries: Sequence[Any],
+    exact: Callable[[Any, int], List[str]],
+    approximate: Callable[[Any, int, int], List[str]],
+    top_k_values: Sequence[int],
+    factors: Sequence[int],
+    target_recall: float,
+    max_candidates: int,
+) -> Dict[str, Any]:
+    """
+    Measure recall@k and latency per candidate count and pick the cheapest.
+
+    Args:
+        queries: Query vectors in whatever form the callables take
+        exact: Returns the IDs of the exact nearest neighbours of (query, k) in order
+        approximate: Returns the IDs found by (query, k, candidates)
+        top_k_values: Result sizes to tune
+        factors: Candidate counts to try, as multiples of top_k
+        target_recall: Recall the chosen candidate count must reach
+        max_candidates: Backend limit on the candidate count
+
+    Returns:
+        Dict with "queries", "target_recall", "top_k_{k}" -> {"x{factor}": {candidates,
+        recall, p50_ms, p95_ms}} and "chosen" -> {top_k: candidates}. When no
+        factor reaches the target, the largest one tried is chosen.
+    """
+    report: Dict[str, Any] = {"queries": len(queries), "target_recall": target_recall}
+    if not queries:
+        return report
+
+    largest_k = max(top_k_values)
+    truth = [exact(query, largest_k) for query in queries]
+    chosen: Dict[int, int] = {}
+    for top_k in sorted(set(top_k_values)):
+        variants: Dict[str, Dict[str, Any]] = {}
+        for factor in sorted(set(factors)):
+            candidates = min(max(top_k * factor, top_k), max_candidates)
+            latencies, recalls = [], []
+            for query, expected in zip(queries, truth):
+                expected = set(expected[:top_k])
+                started = time.perf_counter()
+                found = set(approximate(query, top_k, candidates))
+                latencies.append((time.perf_counter() - started) * 1000)
+                recalls.append(len(found & expected) / max(len(expected), 1))
+            variants[f"x{factor}"] = {"candidates": candidates, **summarize_runs(latencies, recalls)}
+            if top_k not in chosen and variants[f"x{factor}"]["recall"] >= target_recall:
+                chosen[top_k] = candidates
+        if top_k not in chosen:
+            chosen[top_k] = max(variant["candidates"] for variant in variants.values())
+            logger.warning(
+                f"No candidate count reached recall {target_recall} at top_k={top_k}; "
+                f"using the largest tried ({chosen[top_k]})"
+            )
+        report[f"top_k_{top_k}"] = variants
+
+    report["chosen"] = chosen
+    return report
@@ -0,0 +1,686 @@
+"""
+Local vector store backed by a memory-mapped NumPy matrix.
+
+Vectors are stored L2-normalised in ``vectors.<generation>.npy`` (float16 or float32) and
+opened read-only with ``np.load(mmap_mode="r")``; rows added since the last save are held in
+memory until save(). Chunk ids, text and metadata live in a companion Parquet file. Each save
+writes a new generation of both files and switches to it by atomically replacing
+``manifest.json``, so a crash mid-save leaves the previous generation intact.
+Search is exact: one matrix-vector product over the (optionally
+pre-filtered) rows. Intended for offline evaluation, local development and as a
+standby that needs no external service.
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Union
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from app.core import get_logger, settings
+from app.services.search_filters import DECISION_FIELD, FilterCondition, SearchFilter
+from app.services.vector_store import BaseVectorStore, join_context
+
+logger = get_logger(__name__)
+
+# Un-suffixed names are what stores saved before generations were introduced use
+_VECTORS_FILE = "vectors.npy"
+_CHUNKS_FILE = "chunks.parquet"
+_MANIFEST_FILE = "manifest.json"
+
+
+def _generation_file(name: str, generation: int) -> str:
+    """Return the file name of *name* (e.g. ``vectors.npy``) for a save generation."""
+    stem, suffix = name.split(".", 1)
+    return f"{stem}.{generation}.{suffix}"
+
+# Rows scored per float32 matrix-vector product; float16 matmul in NumPy has no BLAS
+# path, so float16 stores are upcast one block at a time
+_SCORE_BLOCK_ROWS = 16384
+
+_CHUNKS_SCHEMA = pa.schema(
+    [
+        pa.field("chunk_id", pa.string()),
+        pa.field("native_id", pa.string()),
+        pa.field("text", pa.string()),
+        pa.field("metadata", pa.string()),  # JSON encoded
+    ]
+)
+
+
+def _score_rows(index: "_LocalIndex", rows: np.ndarray, query: np.ndarray) -> np.ndarray:
+    """Return float32 dot products of *query* with the given rows, in blocks."""
+    contiguous = len(rows) == index.count
+    scores = np.empty(len(rows), dtype=np.float32)
+    for start in range(0, len(rows), _SCORE_BLOCK_ROWS):
+        end = min(start + _SCORE_BLOCK_ROWS, len(rows))
+        block = index.vectors[start:end] if contiguous else index.vectors[rows[start:end]]
+        scores[start:end] = block.astype(np.float32, copy=False) @ query
+    return scores
+
+
+class _LocalIndex:
+    """
+    Shared in-process state for one store directory.
+
+    API requests build a new vector store per request, so the matrix and metadata
+    are loaded once per process and shared by every LocalVectorStore on the same
+    directory.
+    """
+
+    def __init__(self, directory: Path, vector_dims: int, dtype: str) -> None:
+        self.directory = directory
+        self.vector_dims = vector_dims
+        self.dtype = np.dtype(dtype)
+        self.lock = threading.RLock()
+        self.dirty = False
+        self.generation = 0
+        self.vectors_file = _VECTORS_FILE
+        self.chunks_file = _CHUNKS_FILE
+
+        self.count = 0
+        self.vectors: np.ndarray = np.empty((0, vector_dims), dtype=self.dtype)
+        self.live = np.zeros(0, dtype=bool)
+        self.chunk_ids: List[str] = []
+        self.native_ids: List[str] = []
+        self.texts: List[str] = []
+        self.metadata: List[Dict[str, Any]] = []
+        self.row_by_chunk_id: Dict[str, int] = {}
+        self.rows_by_document: Dict[str, Set[int]] = {}
+        # Per metadata key value arrays for vectorised pre-filtering, built lazily
+        self._columns: Dict[str, np.ndarray] = {}
+
+        self._load()
+
+    # -- persistence -------------------------------------------------------
+
+    def _load(self) -> None:
+        manifest_path = self.directory / _MANIFEST_FILE
+        if not manifest_path.exists():
+            self.directory.mkdir(parents=True, exist_ok=True)
+            return
+
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        if manifest["vector_dims"] != self.vector_dims:
+            raise ValueError(
+                f"Local vector store at {self.directory} has {manifest['vector_dims']} "
+                f"dimensions, expected {self.vector_dims}"
+            )
+        self.dtype = np.dtype(manifest["dtype"])
+        self.count = manifest["count"]
+        self.generation = manifest.get("generation", 0)
+        self.vectors_file = manifest.get("vectors_file", _VECTORS_FILE)
+        self.chunks_file = manifest.get("chunks_file", _CHUNKS_FILE)
+
+        self.vectors = np.load(self.directory / self.vectors_file, mmap_mode="r")
+        table = pq.read_table(self.directory / self.chunks_file)
+        if self.vectors.shape[0] != self.count or table.num_rows != self.count:
+            raise ValueError(
+                f"Local vector store at {self.directory} is inconsistent: manifest lists "
+                f"{self.count} chunks but {self.vectors_file} has {self.vectors.shape[0]} "
+                f"vectors and {self.chunks_file} has {table.num_rows} rows"
+            )
+        self.chunk_ids = table.column("chunk_id").to_pylist()
+        self.native_ids = table.column("native_id").to_pylist()
+        self.texts = table.column("text").to_pylist()
+        self.metadata = [json.loads(m) for m in table.column("metadata").to_pylist()]
+        self.live = np.ones(self.vectors.shape[0], dtype=bool)
+        self.live[self.count:] = False
+
+        for row, chunk_id in enumerate(self.chunk_ids):
+            self.row_by_chunk_id[chunk_id] = row
+            self._add_document_rows(row)
+
+        logger.info(
+            f"Loaded local vector store from {self.directory}: {self.count} chunks, "
+            f"{self.dtype.name} vectors"
+        )
+
+    def save(self) -> None:
+        """
+        Compact deleted rows and persist vectors, chunk data and manifest.
+
+        Vectors and chunks are written under the next generation's file names; only the
+        atomic manifest replace switches readers to them, after which the previous
+        generation's files are removed.
+        """
+        with self.lock:
+            if not self.dirty:
+                return
+            started = time.perf_counter()
+            self._compact()
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+            generation = self.generation + 1
+            vectors_file = _generation_file(_VECTORS_FILE, generation)
+            chunks_file = _generation_file(_CHUNKS_FILE, generation)
+
+            with open(self.directory / vectors_file, "wb") as f:
+                np.save(f, np.asarray(self.vectors[: self.count]))
+                f.flush()
+                os.fsync(f.fileno())
+
+            table = pa.Table.from_pydict(
+                {
+                    "chunk_id": self.chunk_ids,
+                    "native_id": self.native_ids,
+                    "text": self.texts,
+                    "metadata": [json.dumps(m, ensure_ascii=False) for m in self.metadata],
+                },
+                schema=_CHUNKS_SCHEMA,
+            )
+            with open(self.directory / chunks_file, "wb") as f:
+                pq.write_table(table, f)
+                f.flush()
+                os.fsync(f.fileno())
+
+            manifest = {
+                "count": self.count,
+                "vector_dims": self.vector_dims,
+                "dtype": self.dtype.name,
+                "generation": generation,
+                "vectors_file": vectors_file,
+                "chunks_file": chunks_file,
+                "saved_at": time.time(),
+            }
+            manifest_tmp = self.directory / f"{_MANIFEST_FILE}.tmp"
+            with open(manifest_tmp, "w", encoding="utf-8") as f:
+                json.dump(manifest, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(manifest_tmp, self.directory / _MANIFEST_FILE)
+
+            self.generation = generation
+            self.vectors_file = vectors_file
+            self.chunks_file = chunks_file
+            self._remove_stale_files()
+
+            # Continue on the freshly written file so capacity matches count again
+            self.vectors = np.load(self.directory / vectors_file, mmap_mode="r")
+            self.live = np.ones(self.count, dtype=bool)
+            self.dirty = False
+            logger.info(
+                f"Saved local vector store ({self.count} chunks) to {self.directory} "
+                f"in {time.perf_counter() - started:.2f}s"
+            )
+
+    def _remove_stale_files(self) -> None:
+        """Delete vector and chunk files of earlier or abandoned save generations."""
+        current = {self.vectors_file, self.chunks_file}
+        for pattern in ("vectors*.npy", "chunks*.parquet"):
+            for path in self.directory.glob(pattern):
+                if path.name not in current:
+                    path.unlink(missing_ok=True)
+
+    def _compact(self) -> None:
+        """Drop deleted rows so saved files only contain live chunks."""
+        keep = np.flatnonzero(self.live[: self.count])
+        if len(keep) == self.count:
+            return
+        self.vectors = np.asarray(self.vectors[keep])
+        self.chunk_ids = [self.chunk_ids[i] for i in keep]
+        self.native_ids = [self.native_ids[i] for i in keep]
+        self.texts = [self.texts[i] for i in keep]
+        self.metadata = [self.metadata[i] for i in keep]
+        self.count = len(keep)
+        self.live = np.ones(self.count, dtype=bool)
+        self.row_by_chunk_id = {chunk_id: row for row, chunk_id in enumerate(self.chunk_ids)}
+        self.rows_by_document = {}
+        for row in range(self.count):
+            self._add_document_rows(row)
+        self._columns.clear()
+
+    # -- writes ------------------------------------------------------------
+
+    def _ensure_capacity(self, needed: int) -> None:
+        capacity = self.vectors.shape[0]
+        if needed <= capacity:
+            return
+        new_capacity = max(needed, capacity * 2, 1024)
+        grown = np.zeros((new_capacity, self.vector_dims), dtype=self.dtype)
+        grown[: self.count] = self.vectors[: self.count]
+        live = np.zeros(new_capacity, dtype=bool)
+        live[: self.count] = self.live[: self.count]
+        self.vectors, self.live = grown, live
+
+    def _add_document_rows(self, row: int) -> None:
+        metadata = self.metadata[row]
+        for key in {self.native_ids[row], metadata.get("decision_native_id")}:
+            if key:
+                self.rows_by_document.setdefault(key, set()).add(row)
+
+    def upsert(
+        self,
+        chunk_id: str,
+        native_id: str,
+        text: str,
+        embedding: Iterable[float],
+        metadata: Dict[str, Any],
+    ) -> None:
+        vector = np.asarray(embedding, dtype=np.float32)
+        if vector.shape != (self.vector_dims,):
+            raise ValueError(
+                f"Embedding for {chunk_id} has shape {vector.shape}, expected ({self.vector_dims},)"
+            )
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector = vector / norm
+
+        with self.lock:
+            row = self.row_by_chunk_id.get(chunk_id)
+            if row is not None:
+                self.delete_rows([row])
+            row = self.count
+            self._ensure_capacity(row + 1)
+            self.vectors[row] = vector
+            self.live[row] = True
+            self.chunk_ids.append(chunk_id)
+            self.native_ids.append(native_id)
+            self.texts.append(text)
+            self.metadata.append(metadata)
+            self.row_by_chunk_id[chunk_id] = row
+            self._add_document_rows(row)
+            self.count += 1
+            self._columns.clear()
+            self.dirty = True
+
+    def delete_rows(self, rows: Iterable[int]) -> int:
+        deleted = 0
+        with self.lock:
+            for row in rows:
+                if not self.live[row]:
+                    continue
+                self.live[row] = False
+                self.row_by_chunk_id.pop(self.chunk_ids[row], None)
+                for key in {self.native_ids[row], self.metadata[row].get("decision_native_id")}:
+                    rows_for_document = self.rows_by_document.get(key)
+                    if rows_for_document is not None:
+                        rows_for_document.discard(row)
+                        if not rows_for_document:
+                            del self.rows_by_document[key]
+                deleted += 1
+            if deleted:
+                self.dirty = True
+        return deleted
+
+    # -- reads -------------------------------------------------------------
+
+    def document_mask(self, native_ids: Iterable[str]) -> np.ndarray:
+        """Return a row mask of the chunks of *native_ids*, including their attachments."""
+        mask = np.zeros(self.count, dtype=bool)
+        for native_id in native_ids:
+            rows = self.rows_by_document.get(native_id)
+            if rows:
+                mask[list(rows)] = True
+        return mask
+
+    def column(self, key: str) -> np.ndarray:
+        """Return metadata *key* of every row as a string array (cached until the next write)."""
+        values = self._columns.get(key)
+        if values is None or len(values) != self.count:
+            values = np.array(
+                [
+                    "" if m.get(key) is None else _filter_value(m.get(key))
+                    for m in self.metadata[: self.count]
+                ],
+                dtype=object,
+            )
+            self._columns[key] = values
+        return values
+
+
+def _filter_value(value: Any) -> str:
+    """Normalise a metadata or filter value for equality comparison."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def _condition_mask(column: np.ndarray, condition: FilterCondition) -> np.ndarray:
+    """Evaluate a SearchFilter condition against a metadata string column."""
+    if condition.op == "eq":
+        return column == _filter_value(condition.value)
+    if condition.op == "in":
+        return np.isin(column, [_filter_value(v) for v in condition.value])
+    # Ranges compare ISO strings; rows without the key ("") never match
+    present = column != ""
+    if condition.op == "gte":
+        return present & (column >= condition.value)
+    return present & (column < condition.value)
+
+
+class LocalVectorStore(BaseVectorStore):
+    """
+    Vector store keeping normalised vectors in a memory-mapped NumPy matrix.
+
+    Changes are kept in memory and written to disk by save(), which close() calls
+    when there are unsaved changes.
+    """
+
+    _indexes: Dict[str, _LocalIndex] = {}
+    _indexes_lock = threading.Lock()
+
+    def __init__(
+        self,
+        directory: Optional[Union[str, Path]] = None,
+        vector_dims: Optional[int] = None,
+        dtype: Optional[str] = None,
+    ) -> None:
+        """
+        Open (or create) the local vector store.
+
+        Args:
+            directory: Store directory (falls back to LOCAL_VECTOR_STORE_DIR setting)
+            vector_dims: Embedding dimensions (falls back to EMBEDDING_DIMENSION setting)
+            dtype: float16 or float32 for new stores (falls back to LOCAL_VECTOR_STORE_DTYPE)
+        """
+        super().__init__()
+
+        self.directory = Path(
+            directory or getattr(settings, "LOCAL_VECTOR_STORE_DIR", "data/local_vector_store")
+        )
+        self.vector_dims = vector_dims or getattr(settings, "EMBEDDING_DIMENSION", 3072)
+        dtype = dtype or getattr(settings, "LOCAL_VECTOR_STORE_DTYPE", "float16")
+        if dtype not in ("float16", "float32"):
+            raise ValueError(f"Unsupported local vector store dtype: {dtype}")
+
+        key = str(self.directory.resolve())
+        with self._indexes_lock:
+            index = self._indexes.get(key)
+            if index is None:
+                index = _LocalIndex(self.directory, self.vector_dims, dtype)
+                self._indexes[key] = index
+        self._index = index
+
+    def bulk_index_chunks(
+        self, chunks_with_embeddings: List[Dict[str, Any]], batch_size: int = 100
+    ) -> Dict[str, Any]:
+        """
+        Insert or replace chunks.
+
+        Args:
+            chunks_with_embeddings: Chunk dicts with chunk_id, native_id, chunk_index,
+                text, embedding and metadata
+            batch_size: Unused (kept for interface compatibility)
+
+        Returns:
+            Dict with success/failed/errors counts
+        """
+        if not chunks_with_embeddings:
+            logger.warning("No chunks provided for indexing")
+            return {"success": 0, "failed": 0, "errors": []}
+
+        success_count = 0
+        errors: List[str] = []
+        for chunk_data in chunks_with_embeddings:
+            if self.index_chunk(chunk_data):
+                success_count += 1
+            else:
+                errors.append(f"Failed to index chunk {chunk_data.get('chunk_id')}")
+
+        logger.info(
+            f"Local bulk indexing complete: {success_count} successful, {len(errors)} failed"
+        )
+        return {
+            "success": success_count,
+            "failed": len(errors),
+            "errors": errors[:10],
+        }
+
+    def index_chunk(self, chunk_data: Dict[str, Any]) -> bool:
+        """
+        Insert or replace a single chunk.
+
+        Args:
+            chunk_data: Chunk dict
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            metadata = dict(chunk_data.get("metadata", {}))
+            metadata.update(
+                {
+                    "chunk_id": chunk_data["chunk_id"],
+                    "native_id": chunk_data["native_id"],
+                    "chunk_index": chunk_data["chunk_index"],
+                    "token_count": chunk_data.get("token_count", 0),
+                    "chunk_position": chunk_data.get("chunk_position", 0),
+                }
+            )
+            self._index.upsert(
+                chunk_data["chunk_id"],
+                chunk_data["native_id"],
+                chunk_data["text"],
+                chunk_data["embedding"],
+                metadata,
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Error indexing chunk {chunk_data.get('chunk_id')}: {e}")
+            return False
+
+    def document_exists(self, native_id: str) -> bool:
+        """Return True if any chunk for *native_id* (decision or attachment) exists."""
+        return bool(self._index.rows_by_document.get(native_id))
+
+    def delete_document(self, native_id: str) -> int:
+        """
+        Delete all chunks for a document (decision + its attachments).
+
+        Returns:
+            Number of chunks deleted
+        """
+        rows = list(self._index.rows_by_document.get(native_id, ()))
+        deleted = self._index.delete_rows(rows)
+        logger.info(f"Deleted {deleted} chunks for document {native_id}")
+        return deleted
+
+    def delete_attachments(self, decision_native_id: str) -> int:
+        """
+        Delete attachment chunks for a decision.
+
+        Returns:
+            Number of chunks deleted
+        """
+        index = self._index
+        rows = [
+            row
+            for row in index.rows_by_document.get(decision_native_id, ())
+            if index.metadata[row].get("is_attachment")
+            and index.metadata[row].get("decision_native_id") == decision_native_id
+        ]
+        deleted = index.delete_rows(rows)
+        logger.info(f"Deleted {deleted} attachment chunks for decision {decision_native_id}")
+        return deleted
+
+    def search(
+        self,
+        query_vector: List[float],
+        top_k: int = 10,
+        filter_conditions: Optional[Union[SearchFilter, Dict[str, Any]]] = None,
+        query_text: Optional[str] = None,
+        collapse: bool = False,
+        neighbours: int = 0,
+    ) -> List[Dict[str, Any]]:
+        """
+        Exact cosine-similarity search over all live chunks.
+
+        Filters are applied before scoring, so only matching rows are multiplied.
+        Collapsing walks the full ranking, so it always returns top_k documents when
+        that many match.
+
+        Args:
+            query_vector: Query embedding vector
+            top_k: Number of results to return
+            filter_conditions: Optional SearchFilter, or a dict of exact metadata
+                key→value filters where a list value matches any of its items
+            query_text: Not used; the local store has no full-text index, so hybrid
+                searches fall back to vector-only ranking
+            collapse: Return at most one chunk per native_id
+            neighbours: Attach the chunks within ±neighbours of each hit's chunk_index
+
+        Returns:
+            List of result dicts matching the shape returned by ElasticsearchVectorStore
+        """
+        index = self._index
+        query = np.asarray(query_vector, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm > 0:
+            query = query / norm
+
+        started = time.perf_counter()
+        with index.lock:
+            mask = index.live[: index.count].copy()
+            if isinstance(filter_conditions, SearchFilter):
+                for condition in filter_conditions.conditions():
+                    if condition.field == DECISION_FIELD:
+                        mask &= index.document_mask(condition.value)
+                    else:
+                        mask &= _condition_mask(index.column(condition.field), condition)
+            else:
+                for key, value in (filter_conditions or {}).items():
+                    column = index.column(key)
+                    if isinstance(value, (list, tuple, set)):
+                        mask &= np.isin(column, [_filter_value(v) for v in value])
+                    else:
+                        mask &= column == _filter_value(value)
+
+            rows = np.flatnonzero(mask)
+            if len(rows) == 0:
+                return []
+
+            scores = _score_rows(index, rows, query)
+
+            if collapse:
+                top, seen = [], set()
+                for i in np.argsort(-scores):
+                    native_id = index.native_ids[rows[i]]
+                    if native_id not in seen:
+                        seen.add(native_id)
+                        top.append(i)
+                        if len(top) == top_k:
+                            break
+            else:
+                k = min(top_k, len(rows))
+                top = np.argpartition(-scores, k - 1)[:k]
+                top = top[np.argsort(-scores[top])]
+
+            results = [
+                {
+                    "chunk_id": index.chunk_ids[rows[i]],
+                    "native_id": index.native_ids[rows[i]],
+                    "text": index.texts[rows[i]] or "",
+                    "score": float(scores[i]),
+                    "metadata": index.metadata[rows[i]],
+                }
+                for i in top
+            ]
+            if neighbours:
+                for result in results:
+                    self._attach_neighbours(index, result, neighbours)
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.last_search_timings = {"vector_ms": elapsed_ms, "total_ms": elapsed_ms}
+        logger.debug(f"Local search over {len(rows)} chunks took {elapsed_ms:.2f} ms")
+        return results
+
+    @staticmethod
+    def _attach_neighbours(index: _LocalIndex, result: Dict[str, Any], neighbours: int) -> None:
+        chunk_index = result["metadata"].get("chunk_index")
+        if chunk_index is None:
+            return
+        context = []
+        for row in index.rows_by_document.get(result["native_id"], ()):
+            row_index = index.metadata[row].get("chunk_index")
+            if (
+                index.live[row]
+                and index.native_ids[row] == result["native_id"]
+                and row_index is not None
+                and abs(row_index - chunk_index) <= neighbours
+            ):
+                context.append(
+                    {
+                        "chunk_id": index.chunk_ids[row],
+                        "chunk_index": row_index,
+                        "text": index.texts[row] or "",
+                    }
+                )
+        context.sort(key=lambda chunk: chunk["chunk_index"])
+        result["context_chunks"] = context
+        result["context"] = join_context(context)
+
+    def load_parquet(self, paths: Iterable[Union[str, Path]]) -> int:
+        """
+        Load vectors from Parquet embedding exports (see ParquetEmbeddingSaver).
+
+        Exports carry chunk_id, native_id and embedding only, so loaded chunks have
+        empty text and minimal metadata. Directories are searched for ``*.parquet``.
+
+        Args:
+            paths: Parquet files or directories
+
+        Returns:
+            Number of chunks loaded
+        """
+        files: List[Path] = []
+        for path in map(Path, paths):
+            files.extend(sorted(path.rglob("*.parquet")) if path.is_dir() else [path])
+
+        loaded = 0
+        for file in files:
+            table = pq.read_table(file, columns=["chunk_id", "native_id", "embedding"])
+            for chunk_id, native_id, embedding in zip(
+                table.column("chunk_id").to_pylist(),
+                table.column("native_id").to_pylist(),
+                table.column("embedding").to_pylist(),
+            ):
+                metadata = {"chunk_id": chunk_id, "native_id": native_id}
+                _, _, chunk_index = chunk_id.rpartition("_chunk_")
+                if chunk_index.isdigit():
+                    metadata["chunk_index"] = int(chunk_index)
+                self._index.upsert(chunk_id, native_id, "", embedding, metadata)
+                loaded += 1
+            logger.info(f"Loaded {table.num_rows} embeddings from {file}")
+
+        self.save()
+        return loaded
+
+    def save(self) -> None:
+        """Persist unsaved changes to disk."""
+        self._index.save()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Return chunk count and on-disk size statistics.
+
+        Returns:
+            Dictionary with total_chunks, total_decisions, size_bytes, size_mb, index_name
+        """
+        index = self._index
+        size_bytes = sum(
+            f.stat().st_size
+            for f in (index.directory / name for name in (index.vectors_file, index.chunks_file))
+            if f.exists()
+        )
+        return {
+            "instance": "local",
+            "index_name": str(index.directory),
+            "total_chunks": int(index.live[: index.count].sum()),
+            "total_decisions": len(set(np.asarray(index.native_ids)[index.live[: index.count]])),
+            "dtype": index.dtype.name,
+            "size_bytes": size_bytes,
+            "size_mb": size_bytes / (1024 * 1024),
+        }
+
+    def close(self) -> None:
+        """Persist unsaved changes; the shared in-memory index stays loaded."""
+        try:
+            self.save()
+        except Exception as e:
+            logger.error(f"Error saving local vector store: {e}")
@@ -2,17 +2,36 @@
 pgvector (PostgreSQL) vector store implementation.
 """
 
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date, datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
 import psycopg2
 import psycopg2.extras
 
 from app.core import get_logger, settings
-from app.services.vector_store import BaseVectorStore, MaxRetriesExceededError
+from app.services.knn_tuning import KnnTuning, summarize_runs, tune_candidates
+from app.services.search_filters import FILTER_FIELDS, SearchFilter, pgvector_filter_expression
+from app.services.vector_store import BaseVectorStore, MaxRetriesExceededError, join_context
 
 logger = get_logger(__name__)
 
+# Metadata keys promoted from vmetadata to typed, indexed columns
+PROMOTED_COLUMNS = (
+    ("native_id", "text"),
+    ("decision_native_id", "text"),
+    ("date_decision", "date"),
+    ("organization_name", "text"),
+    ("is_attachment", "boolean NOT NULL DEFAULT false"),
+)
+
+ITERATIVE_SCAN_MODES = ("off", "strict_order", "relaxed_order")
+
+# Upper bound pgvector accepts for hnsw.ef_search
+_MAX_EF_SEARCH = 1000
+
 
 class PgvectorVectorStore(BaseVectorStore):
     """
@@ -30,6 +49,11 @@ class PgvectorVectorStore(BaseVectorStore):
         password: str = None,
         table: str = None,
         vector_dims: int = None,
+        binary_quantization: Optional[bool] = None,
+        bq_oversampling: Optional[int] = None,
+        promoted_columns: Optional[bool] = None,
+        partition_by_date: Optional[bool] = None,
+        iterative_scan: Optional[str] = None,
     ) -> None:
         """
         Connect to PostgreSQL and create the chunk table / indexes if they do not exist.
@@ -42,6 +66,16 @@ class PgvectorVectorStore(BaseVectorStore):
             password: Database password (falls back to PGVECTOR_PASSWORD setting)
             table: Table name (falls back to PGVECTOR_TABLE setting)
             vector_dims: Embedding dimensions (falls back to EMBEDDING_DIMENSION setting)
+            binary_quantization: Search through the binary-quantized index and re-rank
+                on halfvec (falls back to PGVECTOR_BINARY_QUANTIZATION setting)
+            bq_oversampling: Hamming candidates fetched per requested result
+                (falls back to PGVECTOR_BQ_OVERSAMPLING setting)
+            promoted_columns: Read and write the typed metadata columns (falls back
+                to PGVECTOR_PROMOTED_COLUMNS setting; implied by partition_by_date)
+            partition_by_date: The table is range-partitioned by decision year
+                (falls back to PGVECTOR_PARTITION_BY_DATE setting)
+            iterative_scan: hnsw.iterative_scan mode for filtered queries
+                (falls back to PGVECTOR_ITERATIVE_SCAN setting)
         """
         super().__init__()
 
@@ -52,6 +86,40 @@ class PgvectorVectorStore(BaseVectorStore):
         self.password = password if password is not None else getattr(settings, "PGVECTOR_PASSWORD", "")
         self.table = table or getattr(settings, "PGVECTOR_TABLE", "decision_chunks")
         self.vector_dims = vector_dims or getattr(settings, "EMBEDDING_DIMENSION", 3072)
+        self.binary_quantization = (
+            binary_quantization
+            if binary_quantization is not None
+            else getattr(settings, "PGVECTOR_BINARY_QUANTIZATION", False)
+        )
+        self.bq_oversampling = bq_oversampling or getattr(settings, "PGVECTOR_BQ_OVERSAMPLING", 4)
+        self.partition_by_date = (
+            partition_by_date
+            if partition_by_date is not None
+            else getattr(settings, "PGVECTOR_PARTITION_BY_DATE", False)
+        )
+        # The partition key must be a real column, so partitioning implies promotion
+        self.promoted_columns = self.partition_by_date or (
+            promoted_columns
+            if promoted_columns is not None
+            else getattr(settings, "PGVECTOR_PROMOTED_COLUMNS", False)
+        )
+        self.iterative_scan = iterative_scan or getattr(settings, "PGVECTOR_ITERATIVE_SCAN", "off")
+        if self.iterative_scan not in ITERATIVE_SCAN_MODES:
+            raise ValueError(
+                f"Unknown iterative scan mode '{self.iterative_scan}', "
+                f"expected one of {', '.join(ITERATIVE_SCAN_MODES)}"
+            )
+        self._partitions: Set[str] = set()
+        # hnsw.ef_search per top_k chosen by benchmark_ef_search()
+        self.knn_tuning = KnnTuning()
+        self.text_search_config = getattr(settings, "PGVECTOR_TEXT_SEARCH_CONFIG", "finnish")
+        if not self.text_search_config.isidentifier():
+            raise ValueError(f"Invalid text search configuration '{self.text_search_config}'")
+
+        # Writes go to write_table; during a bulk load it is an unindexed staging copy
+        # of the table, which search keeps using until the swap.
+        self.write_table = self.table
+        self._bulk_load_stats: Optional[Dict[str, Any]] = None
 
         try:
             self.conn = psycopg2.connect(
@@ -63,12 +131,18 @@ class PgvectorVectorStore(BaseVectorStore):
             )
             self.conn.autocommit = False
 
-            # Assume the table and pgvector extension are already set up
+            # By default the table and pgvector extension are managed outside the app
+            if getattr(settings, "PGVECTOR_CREATE_SCHEMA", False):
+                self._enable_pgvector()
+                self._create_table_if_not_exists()
 
             logger.info(
                 f"Connected to pgvector at {self.host}:{self.port}/{self.db}, "
                 f"table '{self.table}'"
             )
+
+            # Warn about a mirror trigger left behind by a crashed or aborted bulk load
+            self._warn_leftover_staging_mirror()
         except Exception as e:
             logger.error(f"Error initializing PgvectorVectorStore: {e}")
             raise
@@ -92,58 +166,32 @@ class PgvectorVectorStore(BaseVectorStore):
             return {"success": 0, "failed": 0, "errors": []}
 
         logger.info(
-            f"Bulk indexing {len(chunks_with_embeddings)} chunks to pgvector table '{self.table}'"
+            f"Bulk indexing {len(chunks_with_embeddings)} chunks to pgvector table '{self.write_table}'"
         )
+        started = time.perf_counter()
 
         success_count = 0
         failed_count = 0
         errors: List[str] = []
 
         try:
+            created: List[str] = []
             with self.conn.cursor() as cur:
-                for chunk_data in chunks_with_embeddings:
-                    vmetadata = dict(chunk_data.get("metadata", {}))
-                    vmetadata.update(
-                        {
-                            "chunk_id": chunk_data["chunk_id"],
-                            "native_id": chunk_data["native_id"],
-                            "chunk_index": chunk_data["chunk_index"],
-                            "token_count": chunk_data.get("token_count", 0),
-                            "chunk_position": chunk_data.get("chunk_position", 0),
-                            "indexed_at": datetime.now(timezone.utc).isoformat(),
-                        }
-                    )
-                    vector_str = "[" + ",".join(str(v) for v in chunk_data["embedding"]) + "]"
-
-                    cur.execute(
-                        f"""
-                        INSERT INTO {self.table}
-                            (id, collection_name, text, vector, vmetadata)
-                        VALUES (%s, %s, %s, %s::halfvec, %s)
-                        ON CONFLICT (id) DO UPDATE SET
-                            collection_name = EXCLUDED.collection_name,
-                            text            = EXCLUDED.text,
-                            vector          = EXCLUDED.vector,
-                            vmetadata       = EXCLUDED.vmetadata;
-                        """,
-                        (
-                            chunk_data["chunk_id"],
-                            chunk_data.get(
-                                "collection",
-                                getattr(settings, "COLLECTION_NAME", "decisions"),
-                            ),
-                            chunk_data["text"],
-                            vector_str,
-                            psycopg2.extras.Json(vmetadata),
-                        ),
+                if self.partition_by_date:
+                    created = self._ensure_partitions(
+                        cur, (self._chunk_decision_date(c) for c in chunks_with_embeddings)
                     )
+                for chunk_data in chunks_with_embeddings:
+                    self._upsert_chunk(cur, chunk_data)
                     success_count += 1
 
             self.conn.commit()
+            self._partitions.update(created)
             self._reset_retry_count()
             logger.info(
                 f"Bulk indexing complete: {success_count} successful, {failed_count} failed"
             )
+            self._record_load_progress(success_count, time.perf_counter() - started)
 
         except psycopg2.OperationalError as e:
             self.conn.rollback()
@@ -177,44 +225,14 @@ class PgvectorVectorStore(BaseVectorStore):
             True if successful, False otherwise.
         """
         try:
-            vmetadata = dict(chunk_data.get("metadata", {}))
-            vmetadata.update(
-                {
-                    "chunk_id": chunk_data["chunk_id"],
-                    "native_id": chunk_data["native_id"],
-                    "chunk_index": chunk_data["chunk_index"],
-                    "token_count": chunk_data.get("token_count", 0),
-                    "chunk_position": chunk_data.get("chunk_position", 0),
-                    "indexed_at": datetime.now(timezone.utc).isoformat(),
-                }
-            )
-            vector_str = "[" + ",".join(str(v) for v in chunk_data["embedding"]) + "]"
-
+            created: List[str] = []
             with self.conn.cursor() as cur:
-                cur.execute(
-                    f"""
-                    INSERT INTO {self.table}
-                        (id, collection_name, text, vector, vmetadata)
-                    VALUES (%s, %s, %s, %s::halfvec, %s)
-                    ON CONFLICT (id) DO UPDATE SET
-                        collection_name = EXCLUDED.collection_name,
-                        text            = EXCLUDED.text,
-                        vector          = EXCLUDED.vector,
-                        vmetadata       = EXCLUDED.vmetadata;
-                    """,
-                    (
-                        chunk_data["chunk_id"],
-                        chunk_data.get(
-                            "collection",
-                            getattr(settings, "COLLECTION_NAME", "decisions"),
-                        ),
-                        chunk_data["text"],
-                        vector_str,
-                        psycopg2.extras.Json(vmetadata),
-                    ),
-                )
+                if self.partition_by_date:
+                    created = self._ensure_partitions(cur, [self._chunk_decision_date(chunk_data)])
+                self._upsert_chunk(cur, chunk_data)
 
             self.conn.commit()
+            self._partitions.update(created)
             self._reset_retry_count()
             logger.debug(f"Indexed chunk: {chunk_data['chunk_id']}")
             return True
@@ -234,6 +252,77 @@ class PgvectorVectorStore(BaseVectorStore):
             logger.error(f"Error indexing chunk {chunk_data.get('chunk_id')}: {e}")
             return False
 
+    def _upsert_chunk(self, cur, chunk_data: Dict[str, Any]) -> None:
+        """Insert or update one chunk in write_table, filling promoted columns if enabled."""
+        vmetadata = dict(chunk_data.get("metadata", {}))
+        vmetadata.update(
+            {
+                "chunk_id": chunk_data["chunk_id"],
+                "native_id": chunk_data["native_id"],
+                "chunk_index": chunk_data["chunk_index"],
+                "token_count": chunk_data.get("token_count", 0),
+                "chunk_position": chunk_data.get("chunk_position", 0),
+                "indexed_at": datetime.now(timezone.utc).isoformat(),
+            }
+        )
+        vector_str = _vector_literal(chunk_data["embedding"])
+
+        columns = ["id", "collection_name", "text", "vector", "vmetadata"]
+        placeholders = ["%s", "%s", "%s", "%s::halfvec", "%s"]
+        params: List[Any] = [
+            chunk_data["chunk_id"],
+            chunk_data.get("collection", getattr(settings, "COLLECTION_NAME", "decisions")),
+            chunk_data["text"],
+            vector_str,
+            psycopg2.extras.Json(vmetadata),
+        ]
+        if self.promoted_columns:
+            columns.extend(name for name, _ in PROMOTED_COLUMNS)
+            placeholders.extend(["%s"] * len(PROMOTED_COLUMNS))
+            params.extend(
+                [
+                    vmetadata.get("native_id"),
+                    vmetadata.get("decision_native_id"),
+                    self._chunk_decision_date(chunk_data),
+                    vmetadata.get("organization_name"),
+                    bool(vmetadata.get("is_attachment", False)),
+                ]
+            )
+
+        # Unique keys of a partitioned table must include the partition key
+        conflict = "(id, date_decision)" if self.partition_by_date else "(id)"
+        updates = ",\n                ".join(
+            f"{column} = EXCLUDED.{column}" for column in columns if column != "id"
+        )
+        cur.execute(
+            f"""
+            INSERT INTO {self.write_table}
+                ({", ".join(columns)})
+            VALUES ({", ".join(placeholders)})
+            ON CONFLICT {conflict} DO UPDATE SET
+                {updates};
+            """,
+            params,
+        )
+
+    def _column(self, field: str) -> str:
+        """Return the SQL expression for a metadata key: its promoted column or vmetadata."""
+        columns = {name for name, _ in PROMOTED_COLUMNS} if self.promoted_columns else set()
+        return pgvector_filter_expression(field, columns)
+
+    @staticmethod
+    def _chunk_decision_date(chunk_data: Dict[str, Any]) -> Optional[date]:
+        """Parse the ISO decision date of a chunk, or None when missing or malformed."""
+        value = (chunk_data.get("metadata") or {}).get("date_decision")
+        if isinstance(value, datetime):
+            return value.date()
+        if isinstance(value, date):
+            return value
+        try:
+            return date.fromisoformat(str(value)[:10]) if value else None
+        except ValueError:
+            return None
+
     def delete_document(self, native_id: str) -> int:
         """
         Delete all chunks for a document (decision + its attachments).
@@ -248,9 +337,9 @@ class PgvectorVectorStore(BaseVectorStore):
             with self.conn.cursor() as cur:
                 cur.execute(
                     f"""
-                    DELETE FROM {self.table}
-                    WHERE vmetadata->>'native_id' = %s
-                       OR vmetadata->>'decision_native_id' = %s;
+                    DELETE FROM {self.write_table}
+                    WHERE {self._column("native_id")} = %s
+                       OR {self._column("decision_native_id")} = %s;
                     """,
                     (native_id, native_id),
                 )
@@ -288,9 +377,9 @@ class PgvectorVectorStore(BaseVectorStore):
             with self.conn.cursor() as cur:
                 cur.execute(
                     f"""
-                    DELETE FROM {self.table}
-                    WHERE vmetadata->>'decision_native_id' = %s
-                      AND (vmetadata->>'is_attachment')::boolean = true;
+                    DELETE FROM {self.write_table}
+                    WHERE {self._column("decision_native_id")} = %s
+                      AND {self._column("is_attachment")} = true;
                     """,
                     (decision_native_id,),
                 )
@@ -329,9 +418,9 @@ class PgvectorVectorStore(BaseVectorStore):
             with self.conn.cursor() as cur:
                 cur.execute(
                     f"""
-                    SELECT 1 FROM {self.table}
-                    WHERE vmetadata->>'native_id' = %s
-                       OR vmetadata->>'decision_native_id' = %s
+                    SELECT 1 FROM {self.write_table}
+                    WHERE {self._column("native_id")} = %s
+                       OR {self._column("decision_native_id")} = %s
                     LIMIT 1;
                     """,
                     (native_id, native_id),
@@ -357,59 +446,74 @@ class PgvectorVectorStore(BaseVectorStore):
         self,
         query_vector: List[float],
         top_k: int = 10,
-        filter_conditions: Optional[Dict[str, Any]] = None,
+        filter_conditions: Optional[Union[SearchFilter, Dict[str, Any]]] = None,
+        query_text: Optional[str] = None,
+        collapse: bool = False,
+        neighbours: int = 0,
     ) -> List[Dict[str, Any]]:
         """
         Cosine-similarity nearest-neighbour search using the pgvector ``<=>`` operator.
 
+        With binary quantization enabled, top_k * bq_oversampling candidates are taken
+        from the Hamming-distance index on ``binary_quantize(vector)`` and re-ranked by
+        exact cosine distance on the stored halfvec.
+
+        With query_text the search is hybrid: a full-text leg on the GIN index from
+        create_text_search_index() and the HNSW leg are fused by reciprocal rank
+        fusion in a single SQL statement.
+
+        collapse keeps the best of top_k * SEARCH_COLLAPSE_OVERSAMPLING candidates per
+        native_id with a window function, and neighbour chunks are aggregated by a
+        correlated subquery in the same statement.
+
         Args:
             query_vector: Query embedding vector.
             top_k: Number of results to return.
-            filter_conditions: Optional dict of exact metadata key→value filters.
+            filter_conditions: Optional SearchFilter, compiled to predicates on the
+                promoted columns or the expressions indexed by create_filter_indexes();
+                a plain dict is treated as exact metadata key→value filters.
+            query_text: Query text for hybrid full-text + vector retrieval.
+            collapse: Return at most one chunk per native_id.
+            neighbours: Attach the chunks within ±neighbours of each hit's chunk_index.
 
         Returns:
             List of result dicts matching the shape returned by ElasticsearchVectorStore.
         """
+        started = time.perf_counter()
         try:
-            vector_str = "[" + ",".join(str(v) for v in query_vector) + "]"
-
-            filter_params: List[Any] = []
-            where_clauses: List[str] = []
-            if filter_conditions:
-                for key, value in filter_conditions.items():
-                    where_clauses.append("vmetadata->>%s = %s")
-                    filter_params.extend([key, str(value)])
-
+            vector_str = _vector_literal(query_vector)
+            where_clauses, filter_params = self._compile_filter(filter_conditions)
             where_sql = "WHERE " + " AND ".join(where_clauses) if where_clauses else ""
 
             with self.conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
-                cur.execute(
-                    f"""
-                    SELECT id, collection_name, text, vmetadata,
-                           1 - (vector <=> %s::halfvec) AS score
-                    FROM {self.table}
-                    {where_sql}
-                    ORDER BY vector <=> %s::halfvec
-                    LIMIT %s;
-                    """,
-                    [vector_str] + filter_params + [vector_str, top_k],
-                )
-                rows = cur.fetchall()
+                if query_text:
+                    rows = self._query_hybrid(
+                        cur,
+                        vector_str,
+                        query_text,
+                        top_k,
+                        where_clauses,
+                        filter_params,
+                        collapse=collapse,
+                        neighbours=neighbours,
+                    )
+                else:
+                    rows = self._query_nearest(
+                        cur,
+                        vector_str,
+                        top_k,
+                        where_sql,
+                        filter_params,
+                        self.binary_quantization,
+                        collapse=collapse,
+                        neighbours=neighbours,
+                    )
 
             self._reset_retry_count()
+            # Both hybrid legs run inside one statement, so only the total is measured
+            self.last_search_timings = {"total_ms": (time.perf_counter() - started) * 1000}
 
-            results = []
-            for row in rows:
-                vmetadata = row["vmetadata"] or {}
-                results.append(
-                    {
-                        "chunk_id": row["id"],
-                        "native_id": vmetadata.get("native_id", ""),
-                        "text": row["text"] or "",
-                        "score": float(row["score"]),
-                        "metadata": vmetadata,
-                    }
-                )
+            results = [self._row_to_result(row, bool(query_text), neighbours) for row in rows]
 
             logger.info(f"pgvector search completed: {len(results)} results")
             return results
@@ -421,9 +525,762 @@ class PgvectorVectorStore(BaseVectorStore):
         except MaxRetriesExceededError:
             raise
         except Exception as e:
+            # Leave the aborted transaction so later queries on the connection work
+            self.conn.rollback()
             logger.error(f"Error during pgvector search: {e}")
             return []
 
+    def search_batch(self, queries: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """
+        Run several searches, in a single statement when they share a filter.
+
+        Plain vector queries (no query_text, collapse or neighbours, binary
+        quantization off) with the same filter are answered by one statement: the
+        query vectors are unnested and each drives a LATERAL HNSW scan with its own
+        LIMIT. Any other batch runs query by query on the same connection.
+
+        Args:
+            queries: search() keyword arguments, one dict per query
+
+        Returns:
+            One result list per query, in input order
+        """
+        filters = {repr(self._compile_filter(q.get("filter_conditions"))) for q in queries}
+        plain = not self.binary_quantization and all(
+            not (q.get("query_text") or q.get("collapse") or q.get("neighbours"))
+            for q in queries
+        )
+        if not queries or not plain or len(filters) > 1:
+            return super().search_batch(queries)
+
+        started = time.perf_counter()
+        try:
+            where_clauses, filter_params = self._compile_filter(queries[0].get("filter_conditions"))
+            where_sql = "WHERE " + " AND ".join(where_clauses) if where_clauses else ""
+            with self.conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+                iterative = self._set_iterative_scan(cur, bool(where_sql))
+                tuned = self._set_ef_search(cur, max(q.get("top_k", 10) for q in queries))
+                cur.execute(
+                    f"""
+                    SELECT q.ord, hits.*
+                    FROM unnest(%s::text[], %s::int[]) WITH ORDINALITY AS q(vec, k, ord)
+                    CROSS JOIN LATERAL (
+                        SELECT id, collection_name, text, vmetadata,
+                               1 - (vector <=> q.vec::halfvec) AS score
+                        FROM {self.table}
+                        {where_sql}
+                        ORDER BY vector <=> q.vec::halfvec
+                        LIMIT q.k
+                    ) hits
+                    ORDER BY q.ord, hits.score DESC;
+                    """,
+                    [
+                        [_vector_literal(q["query_vector"]) for q in queries],
+                        [q.get("top_k", 10) for q in queries],
+                    ]
+                    + filter_params,
+                )
+                rows = cur.fetchall()
+                if iterative or tuned:
+                    self.conn.commit()
+
+            self._reset_retry_count()
+            batch_results: List[List[Dict[str, Any]]] = [[] for _ in queries]
+            for row in rows:
+                batch_results[row["ord"] - 1].append(self._row_to_result(row))
+            total_ms = (time.perf_counter() - started) * 1000
+            # One statement answers every query, so only the batch total is measured
+            self.last_batch_timings = [{"total_ms": total_ms} for _ in queries]
+            self.last_search_timings = {"total_ms": total_ms}
+            logger.info(f"pgvector batch search completed: {len(queries)} queries")
+            return batch_results
+
+        except psycopg2.OperationalError as e:
+            self._increment_retry_count()
+            logger.error(f"pgvector connection error during batch search: {e}")
+            raise
+        except MaxRetriesExceededError:
+            raise
+        except Exception as e:
+            self.conn.rollback()
+            logger.error(f"Error during pgvector batch search: {e}")
+            self.last_batch_timings = [{} for _ in queries]
+            return [[] for _ in queries]
+
+    def _compile_filter(
+        self, filter_conditions: Optional[Union[SearchFilter, Dict[str, Any]]]
+    ) -> Tuple[List[str], List[Any]]:
+        """Compile search() filter_conditions to WHERE clauses and their parameters."""
+        filter_params: List[Any] = []
+        where_clauses: List[str] = []
+        if isinstance(filter_conditions, SearchFilter):
+            predicate, filter_params = filter_conditions.to_pgvector(
+                {name for name, _ in PROMOTED_COLUMNS} if self.promoted_columns else set()
+            )
+            if predicate:
+                where_clauses.append(predicate)
+        elif filter_conditions:
+            for key, value in filter_conditions.items():
+                where_clauses.append("vmetadata->>%s = %s")
+                filter_params.extend([key, str(value)])
+        return where_clauses, filter_params
+
+    @staticmethod
+    def _row_to_result(
+        row: Dict[str, Any], hybrid: bool = False, neighbours: int = 0
+    ) -> Dict[str, Any]:
+        vmetadata = row["vmetadata"] or {}
+        result = {
+            "chunk_id": row["id"],
+            "native_id": vmetadata.get("native_id", ""),
+            "text": row["text"] or "",
+            "score": float(row["score"]),
+            "metadata": vmetadata,
+        }
+        if hybrid:
+            result["lexical_rank"] = row["lexical_rank"]
+            result["vector_rank"] = row["vector_rank"]
+        if neighbours:
+            result["context_chunks"] = row.get("context_chunks") or []
+            result["context"] = join_context(result["context_chunks"])
+        return result
+
+    def _query_nearest(
+        self,
+        cur,
+        vector_str: str,
+        top_k: int,
+        where_sql: str = "",
+        filter_params: Optional[List[Any]] = None,
+        binary_quantization: bool = False,
+        oversampling: Optional[int] = None,
+        collapse: bool = False,
+        neighbours: int = 0,
+        ef_search: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Run the plain HNSW or the binary-quantized + re-rank query and fetch rows.
+
+        The plain query sets hnsw.ef_search to ef_search, else to the value tuned
+        for its LIMIT by benchmark_ef_search(), else leaves the server default.
+        """
+        filter_params = filter_params or []
+        iterative = self._set_iterative_scan(cur, bool(where_sql))
+        limit = top_k * self._collapse_oversampling() if collapse else top_k
+        tuned = False
+
+        if not binary_quantization:
+            tuned = self._set_ef_search(cur, limit, ef_search)
+            sql = f"""
+                SELECT id, collection_name, text, vmetadata,
+                       1 - (vector <=> %s::halfvec) AS score
+                FROM {self.table}
+                {where_sql}
+                ORDER BY vector <=> %s::halfvec
+                LIMIT %s
+                """
+            params = [vector_str] + filter_params + [vector_str, limit]
+        else:
+            candidates = limit * (oversampling or self.bq_oversampling)
+            # hnsw.ef_search caps how many rows an HNSW scan returns (default 40)
+            cur.execute(
+                "SET LOCAL hnsw.ef_search = %s;", (min(max(candidates, 40), _MAX_EF_SEARCH),)
+            )
+            sql = f"""
+                SELECT id, collection_name, text, vmetadata,
+                       1 - (vector <=> %s::halfvec) AS score
+                FROM (
+                    SELECT id, collection_name, text, vmetadata, vector
+                    FROM {self.table}
+                    {where_sql}
+                    ORDER BY binary_quantize(vector)::bit({self.vector_dims})
+                             <~> binary_quantize(%s::halfvec)
+                    LIMIT %s
+                ) candidates
+                ORDER BY vector <=> %s::halfvec
+                LIMIT %s
+                """
+            params = [vector_str] + filter_params + [vector_str, candidates, vector_str, limit]
+
+        sql, params = self._shape_results(sql, params, top_k, collapse, neighbours)
+        cur.execute(sql.rstrip() + ";", params)
+        rows = cur.fetchall()
+
+        if iterative or binary_quantization or tuned:
+            # End the transaction so SET LOCAL does not outlive this query
+            self.conn.commit()
+        if self.iterative_scan == "relaxed_order" and iterative:
+            rows = sorted(rows, key=lambda row: row["score"], reverse=True)
+        return rows
+
+    def _set_iterative_scan(self, cur, filtered: bool) -> bool:
+        """
+        Enable hnsw.iterative_scan for a filtered query in the current transaction.
+
+        Without iterative scans HNSW returns ef_search rows before filtering, so a
+        selective filter can leave fewer than top_k results. The caller must commit
+        so SET LOCAL does not outlive the query.
+
+        Returns:
+            True if iterative scanning was enabled
+        """
+        if not filtered or self.iterative_scan == "off":
+            return False
+        cur.execute(f"SET LOCAL hnsw.iterative_scan = {self.iterative_scan};")
+        cur.execute(
+            "SET LOCAL hnsw.max_scan_tuples = %s;",
+            (getattr(settings, "PGVECTOR_MAX_SCAN_TUPLES", 20000),),
+        )
+        return True
+
+    def _set_ef_search(self, cur, limit: int, ef_search: Optional[int] = None) -> bool:
+        """
+        Set hnsw.ef_search for an HNSW scan returning *limit* rows in this transaction.
+
+        Returns:
+            True if a value was set; the caller must commit so SET LOCAL does not
+            outlive the query
+        """
+        ef_search = ef_search or self.knn_tuning.candidates(f"pgvector:{self.table}", limit)
+        if not ef_search:
+            return False
+        cur.execute(
+            "SET LOCAL hnsw.ef_search = %s;", (min(max(ef_search, limit), _MAX_EF_SEARCH),)
+        )
+        return True
+
+    def _query_hybrid(
+        self,
+        cur,
+        vector_str: str,
+        query_text: str,
+        top_k: int,
+        where_clauses: List[str],
+        filter_params: List[Any],
+        collapse: bool = False,
+        neighbours: int = 0,
+    ) -> List[Dict[str, Any]]:
+        """Fuse the HNSW and full-text legs by reciprocal rank fusion in one statement."""
+        window = max(top_k, getattr(settings, "HYBRID_SEARCH_WINDOW", 50))
+        rrf_k = getattr(settings, "HYBRID_SEARCH_RRF_K", 60)
+        tsvector = self._text_search_vector()
+        vector_where = "WHERE " + " AND ".join(where_clauses) if where_clauses else ""
+        lexical_where = " AND ".join([f"{tsvector} @@ query"] + where_clauses)
+        iterative = self._set_iterative_scan(cur, bool(where_clauses))
+        tuned = self._set_ef_search(cur, window)
+
+        sql = f"""
+            WITH vector_leg AS MATERIALIZED (
+                SELECT id, row_number() OVER (ORDER BY vector <=> %s::halfvec) AS rank
+                FROM {self.table}
+                {vector_where}
+                ORDER BY vector <=> %s::halfvec
+                LIMIT %s
+            ),
+            lexical_leg AS MATERIALIZED (
+                SELECT id, row_number() OVER (ORDER BY ts_rank_cd({tsvector}, query) DESC) AS rank
+                FROM {self.table},
+                     websearch_to_tsquery('{self.text_search_config}', %s) query
+                WHERE {lexical_where}
+                ORDER BY ts_rank_cd({tsvector}, query) DESC
+                LIMIT %s
+            )
+            SELECT t.id, t.collection_name, t.text, t.vmetadata,
+                   COALESCE(1.0 / (%s + v.rank), 0.0)
+                   + COALESCE(1.0 / (%s + l.rank), 0.0) AS score,
+                   l.rank AS lexical_rank, v.rank AS vector_rank
+            FROM vector_leg v
+            FULL OUTER JOIN lexical_leg l ON l.id = v.id
+            JOIN {self.table} t ON t.id = COALESCE(v.id, l.id)
+            ORDER BY score DESC
+            LIMIT %s
+            """
+        params = (
+            [vector_str]
+            + filter_params
+            + [vector_str, window, query_text]
+            + filter_params
+            + [window, rrf_k, rrf_k, top_k * self._collapse_oversampling() if collapse else top_k]
+        )
+        sql, params = self._shape_results(sql, params, top_k, collapse, neighbours)
+        cur.execute(sql.rstrip() + ";", params)
+        rows = cur.fetchall()
+        if iterative or tuned:
+            self.conn.commit()
+        return rows
+
+    @staticmethod
+    def _collapse_oversampling() -> int:
+        return max(1, getattr(settings, "SEARCH_COLLAPSE_OVERSAMPLING", 5))
+
+    def _shape_results(
+        self, sql: str, params: List[Any], top_k: int, collapse: bool, neighbours: int
+    ) -> Tuple[str, List[Any]]:
+        """
+        Wrap a ranked result query to collapse by native_id and/or add neighbour chunks.
+
+        *sql* must select id, collection_name, text, vmetadata and score. Collapsing
+        keeps the best row per native_id with a window function; neighbours adds a
+        ``context_chunks`` JSON array of the chunks within ±neighbours of each hit's
+        chunk_index, read through the native_id index.
+        """
+        if collapse:
+            sql = f"""
+                SELECT * FROM (
+                    SELECT hits.*, row_number() OVER (
+                        PARTITION BY hits.vmetadata->>'native_id' ORDER BY hits.score DESC
+                    ) AS native_rank
+                    FROM ({sql}) hits
+                ) ranked
+                WHERE native_rank = 1
+                ORDER BY score DESC
+                LIMIT %s
+                """
+            params = params + [top_k]
+        if neighbours:
+            native_id = (
+                "n.native_id" if self.promoted_columns else "(n.vmetadata->>'native_id')"
+            )
+            sql = f"""
+                SELECT hits.*, (
+                    SELECT json_agg(
+                        json_build_object(
+                            'chunk_id', n.id,
+                            'chunk_index', (n.vmetadata->>'chunk_index')::int,
+                            'text', n.text
+                        )
+                        ORDER BY (n.vmetadata->>'chunk_index')::int
+                    )
+                    FROM {self.table} n
+                    WHERE {native_id} = hits.vmetadata->>'native_id'
+                      AND (n.vmetadata->>'chunk_index')::int
+                          BETWEEN (hits.vmetadata->>'chunk_index')::int - %s
+                              AND (hits.vmetadata->>'chunk_index')::int + %s
+                ) AS context_chunks
+                FROM ({sql}) hits
+                ORDER BY hits.score DESC
+                """
+            params = [neighbours, neighbours] + params
+        return sql, params
+
+    def _text_search_vector(self) -> str:
+        """Return the tsvector expression indexed by create_text_search_index()."""
+        return f"to_tsvector('{self.text_search_config}', coalesce(text, ''))"
+
+    def create_text_search_index(self) -> float:
+        """
+        Create the GIN full-text index used by the lexical leg of hybrid search.
+
+        Returns:
+            Build time in seconds
+        """
+        started = time.perf_counter()
+        try:
+            with self.conn.cursor() as cur:
+                cur.execute(
+                    f"CREATE INDEX IF NOT EXISTS {self.table}_text_tsv_idx ON {self.table} "
+                    f"USING gin (({self._text_search_vector()}));"
+                )
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
+        seconds = round(time.perf_counter() - started, 3)
+        logger.info(f"Full-text index on '{self.table}' ready in {seconds:.1f}s")
+        return seconds
+
+    def create_filter_indexes(self) -> List[str]:
+        """
+        Create B-tree indexes for the metadata keys SearchFilter can filter on.
+
+        The indexed expressions (promoted columns, or ``vmetadata->>'key'`` without
+        them) match those emitted by SearchFilter.to_pgvector(), so equality, set and
+        range predicates are answered from the index instead of a JSONB scan.
+
+        Returns:
+            Names of the indexes ensured
+        """
+        fields = list(FILTER_FIELDS)
+        if self.promoted_columns:
+            fields += [name for name, _ in PROMOTED_COLUMNS if name not in fields]
+            fields.append("collection_name")
+
+        names = []
+        try:
+            with self.conn.cursor() as cur:
+                for field in fields:
+                    name = f"{self.table}_{field}_idx"
+                    expression = field if field == "collection_name" else self._column(field)
+                    cur.execute(
+                        f"CREATE INDEX IF NOT EXISTS {name} ON {self.table} ({expression});"
+                    )
+                    names.append(name)
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
+        logger.info(f"Filter indexes on '{self.table}' ready: {', '.join(names)}")
+        return names
+
+    # ------------------------------------------------------------------
+    # Schema: promoted columns and date partitioning
+    # ------------------------------------------------------------------
+
+    def _enable_pgvector(self) -> None:
+        """Create the pgvector extension if it is not installed."""
+        with self.conn.cursor() as cur:
+            cur.execute("CREATE EXTENSION IF NOT EXISTS vector;")
+        self.conn.commit()
+
+    def _create_table_if_not_exists(self) -> None:
+        """
+        Create the chunk table with its HNSW and filter indexes if it does not exist.
+
+        With partition_by_date the table is range-partitioned on date_decision, with a
+        DEFAULT partition for undated chunks; yearly partitions are created on write.
+        """
+        columns = [
+            "id text NOT NULL",
+            "collection_name text",
+            "text text",
+            f"vector halfvec({self.vector_dims})",
+            "vmetadata jsonb",
+        ]
+        if self.promoted_columns:
+            columns.extend(f"{name} {sql_type}" for name, sql_type in PROMOTED_COLUMNS)
+        if self.partition_by_date:
+            # NULLS NOT DISTINCT keeps upserts of undated chunks unique (PostgreSQL 15+)
+            columns.append(
+                f"CONSTRAINT {self.table}_id_key UNIQUE NULLS NOT DISTINCT (id, date_decision)"
+            )
+            partitioning = " PARTITION BY RANGE (date_decision)"
+        else:
+            columns.append("PRIMARY KEY (id)")
+            partitioning = ""
+
+        m = getattr(settings, "PGVECTOR_HNSW_M", 16)
+        ef_construction = getattr(settings, "PGVECTOR_HNSW_EF_CONSTRUCTION", 64)
+        try:
+            with self.conn.cursor() as cur:
+                cur.execute(
+                    f"CREATE TABLE IF NOT EXISTS {self.table} "
+                    f"({', '.join(columns)}){partitioning};"
+                )
+                if self.partition_by_date:
+                    cur.execute(
+                        f"CREATE TABLE IF NOT EXISTS {self.table}_undated "
+                        f"PARTITION OF {self.table} DEFAULT;"
+                    )
+                cur.execute(
+                    f"""
+                    CREATE INDEX IF NOT EXISTS {self.table}_vector_idx ON {self.table}
+                    USING hnsw (vector halfvec_cosine_ops)
+                    WITH (m = {int(m)}, ef_construction = {int(ef_construction)});
+                    """
+                )
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        self.create_filter_indexes()
+        self.create_text_search_index()
+
+    def migrate_schema(self) -> Dict[str, Any]:
+        """
+        Add the promoted metadata columns to an existing table and backfill them.
+
+        Existing rows are filled from vmetadata in one UPDATE; the filter indexes are
+        created afterwards. Enable PGVECTOR_PROMOTED_COLUMNS once this has run so new
+        writes fill the columns too. Partitioning an existing table is not done here:
+        create a new partitioned table and reload it.
+
+        Returns:
+            Dict with rows_backfilled, indexes and seconds
+        """
+        started = time.perf_counter()
+        try:
+            with self.conn.cursor() as cur:
+                for name, sql_type in PROMOTED_COLUMNS:
+                    cur.execute(
+                        f"ALTER TABLE {self.table} ADD COLUMN IF NOT EXISTS {name} {sql_type};"
+                    )
+                cur.execute(
+                    f"""
+                    UPDATE {self.table} SET
+                        native_id          = vmetadata->>'native_id',
+                        decision_native_id = vmetadata->>'decision_native_id',
+                        date_decision      = CASE
+                            WHEN vmetadata->>'date_decision' ~ '^\\d{{4}}-\\d{{2}}-\\d{{2}}'
+                            THEN left(vmetadata->>'date_decision', 10)::date
+                        END,
+                        organization_name  = vmetadata->>'organization_name',
+                        is_attachment      = COALESCE((vmetadata->>'is_attachment')::boolean, false)
+                    WHERE native_id IS NULL;
+                    """
+                )
+                rows = cur.rowcount
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
+        self.promoted_columns = True
+        indexes = self.create_filter_indexes()
+        seconds = round(time.perf_counter() - started, 3)
+        logger.info(f"Promoted metadata columns on '{self.table}': {rows} rows backfilled")
+        return {"rows_backfilled": rows, "indexes": indexes, "seconds": seconds}
+
+    def _ensure_partitions(self, cur, dates: Iterable[Optional[date]]) -> List[str]:
+        """
+        Create the yearly partitions for *dates* that do not exist yet.
+
+        The CREATE runs in the caller's transaction, so the caller adds the
+        returned partitions to the known ones only after committing; after a
+        rollback they are created again by the next write.
+
+        Returns:
+            Names of the partitions created
+        """
+        created = []
+        for year in sorted({d.year for d in dates if d}):
+            partition = f"{self.table}_y{year}"
+            if partition in self._partitions:
+                continue
+            # Undated rows live in the DEFAULT partition, so no dated row has to move
+            cur.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {partition} PARTITION OF {self.table}
+                FOR VALUES FROM ('{year}-01-01') TO ('{year + 1}-01-01');
+                """
+            )
+            created.append(partition)
+        return created
+
+    def list_partitions(self) -> List[Tuple[str, str]]:
+        """
+        Return (partition name, bound expression) for each partition of the table.
+        """
+        with self.conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT child.relname, pg_get_expr(child.relpartbound, child.oid)
+                FROM pg_inherits
+                JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+                JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+                WHERE parent.relname = %s
+                ORDER BY child.relname;
+                """,
+                (self.table,),
+            )
+            return [(name, bound) for name, bound in cur.fetchall()]
+
+    def drop_partitions_before(self, cutoff: date, dry_run: bool = False) -> List[str]:
+        """
+        Drop the yearly partitions that end on or before *cutoff*.
+
+        Retention becomes a metadata-only operation instead of a large DELETE
+        followed by vacuuming the HNSW index.
+
+        Args:
+            cutoff: Partitions whose decision years all fall before this date are dropped
+            dry_run: Only return the partitions that would be dropped
+
+        Returns:
+            Names of the dropped partitions
+        """
+        if not self.partition_by_date:
+            raise RuntimeError(f"Table '{self.table}' is not partitioned by decision date")
+
+        prefix = f"{self.table}_y"
+        expired = [
+            name
+            for name, _ in self.list_partitions()
+            if name.startswith(prefix)
+            and name[len(prefix):].isdigit()
+            and date(int(name[len(prefix):]) + 1, 1, 1) <= cutoff
+        ]
+        if dry_run or not expired:
+            return expired
+
+        try:
+            with self.conn.cursor() as cur:
+                for name in expired:
+                    cur.execute(f"DROP TABLE {name};")
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
+        self._partitions.difference_update(expired)
+        logger.info(f"Dropped {len(expired)} partitions of '{self.table}': {', '.join(expired)}")
+        return expired
+
+    def create_binary_quantized_index(self) -> float:
+        """
+        Create the Hamming-distance HNSW expression index on ``binary_quantize(vector)``.
+
+        At one bit per dimension the index is 16x smaller than the halfvec HNSW index.
+        Requires pgvector 0.7 or newer.
+
+        Returns:
+            Build time in seconds
+        """
+        started = time.perf_counter()
+        try:
+            with self.conn.cursor() as cur:
+                cur.execute(
+                    "SET maintenance_work_mem = %s;",
+                    (getattr(settings, "PGVECTOR_BULK_LOAD_MAINTENANCE_WORK_MEM", "2GB"),),
+                )
+                cur.execute(
+                    f"""
+                    CREATE INDEX IF NOT EXISTS {self.table}_vector_bq_idx ON {self.table}
+                    USING hnsw ((binary_quantize(vector)::bit({self.vector_dims})) bit_hamming_ops);
+                    """
+                )
+                cur.execute("RESET maintenance_work_mem;")
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
+        seconds = round(time.perf_counter() - started, 3)
+        logger.info(f"Binary-quantized index on '{self.table}' ready in {seconds:.1f}s")
+        return seconds
+
+    def benchmark_binary_quantization(
+        self,
+        sample_size: int = 50,
+        top_k: int = 10,
+        oversampling_factors: Optional[List[int]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Compare recall and latency of plain HNSW and binary-quantized search.
+
+        Query vectors are sampled from the table. Ground truth is an exact sequential
+        scan, so recall@top_k is reported for the current HNSW query as well as for
+        each oversampling factor.
+
+        Args:
+            sample_size: Number of query vectors to sample
+            top_k: Results per query
+            oversampling_factors: Oversampling factors to try (defaults to 1, 2, 4, 8)
+
+        Returns:
+            Dict keyed by "exact", "hnsw" and "bq_x{factor}" with recall, p50_ms and p95_ms
+        """
+        oversampling_factors = oversampling_factors or [1, 2, 4, 8]
+        with self.conn.cursor() as cur:
+            cur.execute(
+                f"SELECT vector::text FROM {self.table} ORDER BY random() LIMIT %s;",
+                (sample_size,),
+            )
+            queries = [row[0] for row in cur.fetchall()]
+        self.conn.commit()
+
+        if not queries:
+            return {}
+
+        def exact(cur, vector_str):
+            # Disabling index scans forces a sequential scan with exact distances
+            cur.execute("SET LOCAL enable_indexscan = off;")
+            return self._query_nearest(cur, vector_str, top_k)
+
+        variants = [("exact", exact), ("hnsw", lambda cur, v: self._query_nearest(cur, v, top_k))]
+        for factor in oversampling_factors:
+            variants.append(
+                (
+                    f"bq_x{factor}",
+                    lambda cur, v, factor=factor: self._query_nearest(
+                        cur, v, top_k, binary_quantization=True, oversampling=factor
+                    ),
+                )
+            )
+
+        report: Dict[str, Any] = {"queries": len(queries), "top_k": top_k}
+        truth: List[set] = []
+        for variant, fn in variants:
+            latencies, recalls = [], []
+            for i, vector_str in enumerate(queries):
+                with self.conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+                    started = time.perf_counter()
+                    rows = fn(cur, vector_str)
+                    latencies.append((time.perf_counter() - started) * 1000)
+                self.conn.commit()
+                found = {row["id"] for row in rows}
+                if variant == "exact":
+                    truth.append(found)
+                recalls.append(len(found & truth[i]) / max(len(truth[i]), 1))
+            report[variant] = summarize_runs(latencies, recalls)
+
+        logger.info(f"Binary quantization benchmark on '{self.table}': {report}")
+        return report
+
+    def benchmark_ef_search(
+        self,
+        sample_size: int = 50,
+        top_k_values: Optional[List[int]] = None,
+        factors: Optional[List[int]] = None,
+        target_recall: Optional[float] = None,
+        persist: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Find the smallest hnsw.ef_search reaching a target recall for each top_k.
+
+        Query vectors are sampled from the table. Ground truth is an exact
+        sequential scan. The chosen values are persisted with KnnTuning and set
+        by search() from then on.
+
+        Args:
+            sample_size: Number of query vectors to sample
+            top_k_values: Result sizes to tune (defaults to 5, 10, 20, 50)
+            factors: ef_search values to try as multiples of top_k (defaults to
+                1, 2, 4, 8, 16)
+            target_recall: Recall to reach (falls back to KNN_TARGET_RECALL)
+            persist: Save the chosen values
+
+        Returns:
+            Report from tune_candidates(), keyed by "top_k_{k}" with recall and
+            latency per factor, and the chosen values under "chosen"
+        """
+        top_k_values = top_k_values or [5, 10, 20, 50]
+        factors = factors or [1, 2, 4, 8, 16]
+        if target_recall is None:
+            target_recall = getattr(settings, "KNN_TARGET_RECALL", 0.95)
+
+        with self.conn.cursor() as cur:
+            cur.execute(
+                f"SELECT vector::text FROM {self.table} ORDER BY random() LIMIT %s;",
+                (sample_size,),
+            )
+            queries = [row[0] for row in cur.fetchall()]
+        self.conn.commit()
+
+        def run(vector_str: str, k: int, ef_search: Optional[int] = None) -> List[str]:
+            with self.conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+                if ef_search is None:
+                    # Disabling index scans forces a sequential scan with exact distances
+                    cur.execute("SET LOCAL enable_indexscan = off;")
+                rows = self._query_nearest(cur, vector_str, k, ef_search=ef_search or k)
+            self.conn.commit()
+            return [row["id"] for row in rows]
+
+        report = tune_candidates(
+            queries,
+            run,
+            run,
+            top_k_values,
+            factors,
+            target_recall,
+            _MAX_EF_SEARCH,
+        )
+        if persist and report.get("chosen"):
+            self.knn_tuning.save(f"pgvector:{self.table}", report["chosen"], target_recall)
+        logger.info(f"ef_search benchmark on '{self.table}': {report}")
+        return report
+
     def get_statistics(self) -> Dict[str, Any]:
         """
         Return chunk count and table size statistics.
@@ -462,6 +1319,481 @@ class PgvectorVectorStore(BaseVectorStore):
             logger.error(f"Error getting pgvector statistics: {e}")
             return {"instance": "pgvector", "index_name": self.table, "error": str(e)}
 
+    # ------------------------------------------------------------------
+    # Bulk-load (backfill) mode
+    # ------------------------------------------------------------------
+
+    @property
+    def staging_table(self) -> str:
+        """Name of the unindexed table used while bulk loading."""
+        return f"{self.table}_staging"
+
+    @property
+    def bulk_load_active(self) -> bool:
+        """Whether bulk-load mode is currently active on this instance."""
+        return self._bulk_load_stats is not None
+
+    @contextmanager
+    def bulk_load_mode(
+        self, copy_existing: bool = True, resume: bool = False
+    ) -> Iterator["PgvectorVectorStore"]:
+        """
+        Context manager wrapping begin_bulk_load() / end_bulk_load().
+
+        The index is built and the staging table swapped in only when the wrapped
+        block completes; on error the staging table is kept so the load can resume.
+
+        Args:
+            copy_existing: Seed the staging table with the rows of the live table
+            resume: Continue loading into a staging table left by an earlier run
+        """
+        self.begin_bulk_load(copy_existing=copy_existing, resume=resume)
+        completed = False
+        try:
+            yield self
+            completed = True
+        finally:
+            if completed:
+                self.end_bulk_load()
+            else:
+                self.abort_bulk_load()
+
+    def begin_bulk_load(self, copy_existing: bool = True, resume: bool = False) -> str:
+        """
+        Redirect writes to an unindexed staging table.
+
+        Inserting into a table with an HNSW index updates the graph row by row, which
+        dominates backfill time. The staging table only has the primary key (needed
+        for upserts); the live table keeps serving searches until end_bulk_load()
+        builds its indexes once and swaps it in.
+
+        Other processes (the API, the scheduler) keep writing to the live table. A
+        trigger on the live table replays their inserts, updates and deletes into the
+        staging table, so the swap does not lose them. It is created in the same
+        transaction as the seeding copy, which waits for in-flight writes to the live
+        table and holds new ones until the copy is committed.
+
+        Args:
+            copy_existing: Seed the staging table with the rows of the live table so
+                the swap does not lose data that is not reloaded
+            resume: Reuse an existing staging table instead of recreating it
+
+        Returns:
+            Name of the staging table receiving writes
+        """
+        if self._bulk_load_stats is not None:
+            raise RuntimeError(f"Bulk-load mode is already active on '{self.write_table}'")
+        if self.partition_by_date:
+            # LIKE copies columns but not partitioning, so the swap would lose it
+            raise RuntimeError(
+                f"Bulk-load staging is not supported for the partitioned table '{self.table}'"
+            )
+
+        staging = self.staging_table
+        started = time.perf_counter()
+        try:
+            with self.conn.cursor() as cur:
+                cur.execute("SELECT to_regclass(%s) IS NOT NULL;", (staging,))
+                staging_exists = cur.fetchone()[0]
+
+                if staging_exists and resume:
+                    logger.info(f"Resuming bulk load into existing staging table '{staging}'")
+                    self._create_staging_mirror(cur, staging)
+                else:
+                    if staging_exists:
+                        logger.warning(f"Dropping leftover staging table '{staging}'")
+                    cur.execute(f"DROP TRIGGER IF EXISTS {self._mirror_name} ON {self.table};")
+                    cur.execute(f"DROP TABLE IF EXISTS {staging};")
+                    cur.execute(
+                        f"CREATE TABLE {staging} (LIKE {self.table} INCLUDING DEFAULTS);"
+                    )
+                    cur.execute(f"ALTER TABLE {staging} ADD PRIMARY KEY (id);")
+                    # Before the copy, so no live write falls between the two
+                    self._create_staging_mirror(cur, staging)
+                    if copy_existing:
+                        cur.execute(f"INSERT INTO {staging} SELECT * FROM {self.table};")
+                        logger.info(
+                            f"Copied {cur.rowcount} existing rows from '{self.table}' to '{staging}'"
+                        )
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
+        self.write_table = staging
+        self._bulk_load_stats = {
+            "staging_table": staging,
+            "prepare_seconds": round(time.perf_counter() - started, 3),
+            "rows_loaded": 0,
+            "load_seconds": 0.0,
+            "started_at": time.perf_counter(),
+        }
+        logger.info(f"Bulk-load mode enabled: writes go to unindexed table '{staging}'")
+        return staging
+
+    @property
+    def _mirror_name(self) -> str:
+        """Name of the trigger and function replaying live writes into the staging table."""
+        return f"{self.table}_mirror_to_staging"
+
+    def _create_staging_mirror(self, cur, staging: str) -> None:
+        """Create the trigger replaying inserts, updates and deletes on the live table."""
+        cur.execute(
+            """
+            SELECT column_name FROM information_schema.columns
+            WHERE table_name = %s AND table_schema = current_schema()
+            ORDER BY ordinal_position;
+            """,
+            (self.table,),
+        )
+        updates = ", ".join(
+            f"{row[0]} = EXCLUDED.{row[0]}" for row in cur.fetchall() if row[0] != "id"
+        )
+        cur.execute(
+            f"""
+            CREATE OR REPLACE FUNCTION {self._mirror_name}() RETURNS trigger
+            LANGUAGE plpgsql AS $$
+            BEGIN
+                IF TG_OP = 'DELETE' THEN
+                    DELETE FROM {staging} WHERE id = OLD.id;
+                    RETURN NULL;
+                END IF;
+                IF TG_OP = 'UPDATE' THEN
+                    IF OLD.id <> NEW.id THEN
+                        DELETE FROM {staging} WHERE id = OLD.id;
+                    END IF;
+                END IF;
+                INSERT INTO {staging} SELECT NEW.*
+                ON CONFLICT (id) DO UPDATE SET {updates};
+                RETURN NULL;
+            END;
+            $$;
+            """
+        )
+        cur.execute(f"DROP TRIGGER IF EXISTS {self._mirror_name} ON {self.table};")
+        cur.execute(
+            f"""
+            CREATE TRIGGER {self._mirror_name}
+            AFTER INSERT OR UPDATE OR DELETE ON {self.table}
+            FOR EACH ROW EXECUTE FUNCTION {self._mirror_name}();
+            """
+        )
+
+    def staging_mirror_exists(self) -> bool:
+        """Whether the live table has the trigger replaying its writes into the staging table."""
+        with self.conn.cursor() as cur:
+            cur.execute(
+                "SELECT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = %s "
+                "AND tgrelid = to_regclass(%s));",
+                (self._mirror_name, self.table),
+            )
+            exists = bool(cur.fetchone()[0])
+        # Do not leave the catalog read open as an idle transaction
+        self.conn.rollback()
+        return exists
+
+    def _warn_leftover_staging_mirror(self) -> None:
+        """Log a warning when a staging mirror trigger exists but no load is active here."""
+        try:
+            leftover = self.staging_mirror_exists()
+        except Exception as e:
+            self.conn.rollback()
+            logger.debug(f"Could not check for a leftover staging mirror: {e}")
+            return
+        if leftover:
+            logger.warning(
+                f"Trigger '{self._mirror_name}' copies every write on '{self.table}' into "
+                f"'{self.staging_table}', but no bulk load is active in this process. Unless "
+                f"a backfill is running elsewhere, resume it with --resume or remove the "
+                f"leftovers with 'python pipeline.py pgvector-drop-staging'."
+            )
+
+    def drop_bulk_load_staging(self) -> bool:
+        """
+        Drop the staging table and mirror trigger left by a crashed or aborted bulk load.
+
+        Returns:
+            True if a mirror trigger or staging table was found and dropped
+        """
+        if self.bulk_load_active:
+            raise RuntimeError(f"Bulk-load mode is active on '{self.staging_table}'")
+
+        staging = self.staging_table
+        try:
+            with self.conn.cursor() as cur:
+                cur.execute(
+                    "SELECT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = %s "
+                    "AND tgrelid = to_regclass(%s)), to_regclass(%s) IS NOT NULL;",
+                    (self._mirror_name, self.table, staging),
+                )
+                mirror_exists, staging_exists = cur.fetchone()
+                cur.execute(f"DROP TRIGGER IF EXISTS {self._mirror_name} ON {self.table};")
+                cur.execute(f"DROP FUNCTION IF EXISTS {self._mirror_name}();")
+                cur.execute(f"DROP TABLE IF EXISTS {staging};")
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
+        if mirror_exists or staging_exists:
+            logger.info(f"Dropped bulk-load staging table '{staging}' and its mirror trigger")
+        return bool(mirror_exists or staging_exists)
+
+    def end_bulk_load(self, promote: bool = True) -> Dict[str, Any]:
+        """
+        Build the indexes on the staging table once and swap it in for the live table.
+
+        Indexes of the live table are recreated on the staging table, B-tree indexes
+        first and HNSW last, with maintenance_work_mem and parallel maintenance workers
+        raised for the session. The swap (drop live table, rename staging table and its
+        indexes) runs in one transaction, so searches see either the old or the new
+        table.
+
+        Args:
+            promote: Swap the staging table in; with False only writes are redirected
+                back and the staging table is left for a later resume, still receiving
+                the live writes
+
+        Returns:
+            Report with rows loaded, load/index build/swap timings and rows per second
+        """
+        stats = self._bulk_load_stats
+        if stats is None:
+            logger.warning("end_bulk_load called but bulk-load mode is not active")
+            return {}
+
+        report = {
+            "staging_table": stats["staging_table"],
+            "rows_loaded": stats["rows_loaded"],
+            "load_seconds": round(stats["load_seconds"], 3),
+            "rows_per_second": (
+                round(stats["rows_loaded"] / stats["load_seconds"], 1)
+                if stats["load_seconds"]
+                else None
+            ),
+            "prepare_seconds": stats["prepare_seconds"],
+            "index_builds": [],
+            "swap_seconds": None,
+            "total_seconds": None,
+        }
+
+        if promote:
+            report["index_builds"] = self._build_staging_indexes(stats["staging_table"])
+            report["swap_seconds"] = self._swap_staging_table(
+                stats["staging_table"], [build["index"] for build in report["index_builds"]]
+            )
+
+        report["total_seconds"] = round(time.perf_counter() - stats["started_at"], 3)
+        self.write_table = self.table
+        self._bulk_load_stats = None
+
+        logger.info(f"Bulk-load mode disabled on '{self.table}': {report}")
+        return report
+
+    def abort_bulk_load(self) -> None:
+        """
+        Send writes back to the live table, keeping the staging table for a resume.
+
+        The live-write trigger stays in place so the staging table keeps up until the
+        load is resumed; begin_bulk_load() without resume drops and recreates both.
+        """
+        if self._bulk_load_stats is None:
+            return
+        logger.warning(
+            f"Bulk load into '{self.staging_table}' aborted after "
+            f"{self._bulk_load_stats['rows_loaded']} rows; staging table kept for resume"
+        )
+        self.end_bulk_load(promote=False)
+
+    def _record_load_progress(self, rows: int, seconds: float) -> None:
+        """Accumulate load progress while bulk-load mode is active."""
+        stats = self._bulk_load_stats
+        if stats is None:
+            return
+        stats["rows_loaded"] += rows
+        stats["load_seconds"] += seconds
+        logger.info(
+            f"Bulk load progress: {stats['rows_loaded']} rows into '{stats['staging_table']}' "
+            f"({stats['rows_loaded'] / stats['load_seconds']:.0f} rows/s)"
+            if stats["load_seconds"]
+            else f"Bulk load progress: {stats['rows_loaded']} rows"
+        )
+
+    def _live_index_definitions(self) -> List[Dict[str, str]]:
+        """Return name and CREATE INDEX statement of the live table's secondary indexes."""
+        with self.conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT i.indexname, i.indexdef
+                FROM pg_indexes i
+                JOIN pg_class c ON c.relname = i.indexname
+                JOIN pg_index x ON x.indexrelid = c.oid
+                WHERE i.tablename = %s AND NOT x.indisprimary;
+                """,
+                (self.table,),
+            )
+            return [{"name": row[0], "definition": row[1]} for row in cur.fetchall()]
+
+    def _build_staging_indexes(self, staging: str) -> List[Dict[str, Any]]:
+        """
+        Recreate the live table's indexes on the staging table.
+
+        Falls back to a cosine HNSW index from settings when the live table has none.
+
+        Returns:
+            One entry per index with its name and build time in seconds
+        """
+        definitions = self._live_index_definitions()
+        if not any("USING hnsw" in d["definition"] for d in definitions):
+            definitions.append(
+                {
+                    "name": f"{self.table}_vector_idx",
+                    "definition": (
+                        f"CREATE INDEX {self.table}_vector_idx ON {self.table} "
+                        f"USING hnsw (vector halfvec_cosine_ops) WITH ("
+                        f"m = {getattr(settings, 'PGVECTOR_HNSW_M', 16)}, "
+                        f"ef_construction = {getattr(settings, 'PGVECTOR_HNSW_EF_CONSTRUCTION', 64)})"
+                    ),
+                }
+            )
+        # B-tree / GIN indexes are cheap; build them before the long HNSW build
+        definitions.sort(key=lambda d: "USING hnsw" in d["definition"])
+
+        maintenance_work_mem = getattr(settings, "PGVECTOR_BULK_LOAD_MAINTENANCE_WORK_MEM", "2GB")
+        parallel_workers = getattr(settings, "PGVECTOR_BULK_LOAD_PARALLEL_WORKERS", 4)
+
+        builds = []
+        try:
+            with self.conn.cursor() as cur:
+                cur.execute("SET maintenance_work_mem = %s;", (maintenance_work_mem,))
+                cur.execute(
+                    "SET max_parallel_maintenance_workers = %s;", (int(parallel_workers),)
+                )
+                for d in definitions:
+                    staging_name = f"{d['name']}_staging"
+                    statement = self._retarget_index_definition(
+                        d["definition"], d["name"], staging_name, staging
+                    )
+                    logger.info(f"Building index '{staging_name}' on '{staging}'...")
+                    # A resumed load may have a half-built index from an earlier attempt
+                    cur.execute(f"DROP INDEX IF EXISTS {staging_name};")
+                    started = time.perf_counter()
+                    with self._index_build_progress(staging):
+                        cur.execute(statement)
+                    self.conn.commit()
+                    seconds = round(time.perf_counter() - started, 3)
+                    builds.append({"index": d["name"], "seconds": seconds})
+                    logger.info(f"Built index '{staging_name}' in {seconds:.1f}s")
+                cur.execute("RESET maintenance_work_mem;")
+                cur.execute("RESET max_parallel_maintenance_workers;")
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
+        return builds
+
+    @staticmethod
+    def _retarget_index_definition(
+        definition: str, name: str, new_name: str, new_table: str
+    ) -> str:
+        """Point a CREATE INDEX statement from pg_indexes at another name and table."""
+        head, sep, tail = definition.partition(" USING ")
+        head = head.replace(f" {name} ON ", f" {new_name} ON ", 1)
+        on_index = head.rindex(" ON ")
+        head = f"{head[:on_index]} ON {new_table}"
+        return f"{head}{sep}{tail}"
+
+    def _swap_staging_table(self, staging: str, index_names: List[str]) -> float:
+        """
+        Replace the live table with the staging table in a single transaction.
+
+        Args:
+            staging: Staging table name
+            index_names: Live index names whose ``_staging`` copies take over the name
+
+        Returns:
+            Seconds spent in the swap transaction
+        """
+        started = time.perf_counter()
+        try:
+            with self.conn.cursor() as cur:
+                cur.execute(f"LOCK TABLE {self.table} IN ACCESS EXCLUSIVE MODE;")
+                # Dropping the live table drops its mirror trigger with it
+                cur.execute(f"DROP TABLE {self.table};")
+                cur.execute(f"DROP FUNCTION IF EXISTS {self._mirror_name}();")
+                cur.execute(f"ALTER TABLE {staging} RENAME TO {self.table};")
+                cur.execute(f"ALTER INDEX IF EXISTS {staging}_pkey RENAME TO {self.table}_pkey;")
+                for name in index_names:
+                    cur.execute(f"ALTER INDEX {name}_staging RENAME TO {name};")
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
+        seconds = round(time.perf_counter() - started, 3)
+        logger.info(f"Swapped '{staging}' in as '{self.table}' in {seconds:.3f}s")
+        return seconds
+
+    @contextmanager
+    def _index_build_progress(self, table: str) -> Iterator[None]:
+        """
+        Log pg_stat_progress_create_index for *table* while an index is being built.
+
+        Polls from a separate connection since the build blocks the main one.
+        Disabled when PGVECTOR_INDEX_BUILD_PROGRESS_SECONDS is 0.
+        """
+        interval = getattr(settings, "PGVECTOR_INDEX_BUILD_PROGRESS_SECONDS", 30)
+        if not interval:
+            yield
+            return
+
+        stop = threading.Event()
+
+        def poll() -> None:
+            try:
+                conn = psycopg2.connect(
+                    host=self.host,
+                    port=self.port,
+                    dbname=self.db,
+                    user=self.user,
+                    password=self.password,
+                )
+            except Exception as e:
+                logger.warning(f"Index build progress reporting unavailable: {e}")
+                return
+            conn.autocommit = True
+            try:
+                while not stop.wait(interval):
+                    with conn.cursor() as cur:
+                        cur.execute(
+                            """
+                            SELECT phase, blocks_done, blocks_total, tuples_done, tuples_total
+                            FROM pg_stat_progress_create_index
+                            WHERE relid = to_regclass(%s);
+                            """,
+                            (table,),
+                        )
+                        row = cur.fetchone()
+                    if row:
+                        phase, blocks_done, blocks_total, tuples_done, tuples_total = row
+                        logger.info(
+                            f"Index build on '{table}': {phase} "
+                            f"(blocks {blocks_done}/{blocks_total}, tuples {tuples_done}/{tuples_total})"
+                        )
+            except Exception as e:
+                logger.warning(f"Index build progress reporting stopped: {e}")
+            finally:
+                conn.close()
+
+        thread = threading.Thread(target=poll, name="pgvector-index-progress", daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            thread.join(timeout=5)
+
     def close(self) -> None:
         """Close the PostgreSQL connection."""
         try:
@@ -469,3 +1801,8 @@ class PgvectorVectorStore(BaseVectorStore):
             logger.info("pgvector connection closed")
         except Exception as e:
             logger.error(f"Error closing pgvector connection: {e}")
+
+
+def _vector_literal(vector: Iterable[float]) -> str:
+    """Format a vector as a pgvector text literal, e.g. ``[0.1,0.2]``."""
+    return "[" + ",".join(str(v) for v in vector) + "]"
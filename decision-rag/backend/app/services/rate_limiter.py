@@ -0,0 +1,270 @@
+"""
+Token-bucket rate limiting shared by the decision API and attachment clients.
+
+Every host gets its own bucket that refills at the configured rate and holds up
+to a burst of tokens. Callers check the bucket under a short lock and sleep
+outside it, so waiting threads (or asyncio tasks) do not serialise each other;
+after each sleep they check again, so a throttle or Retry-After pause recorded
+in the meantime also holds back requests that were already waiting.
+Responses are fed back with record_response(): 429 and 503 halve the host's
+rate and a Retry-After header pauses the host, after which the rate recovers
+step by step on successful responses.
+"""
+
+import asyncio
+import email.utils
+import threading
+import time
+from typing import Any, Dict, Mapping, Optional
+
+import httpx
+
+from app.core import get_logger, settings
+
+logger = get_logger(__name__)
+
+# Status codes that signal the server wants us to slow down
+THROTTLE_STATUS_CODES = {429, 503}
+
+# Rate multiplier applied on a throttle response
+_BACKOFF_FACTOR = 0.5
+
+# Share of the configured rate restored per successful response
+_RECOVERY_STEP = 0.05
+
+# Longest Retry-After pause honoured, in seconds
+_MAX_RETRY_AFTER = 300.0
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value.
+
+    Args:
+        value: Delay in seconds or an HTTP date
+
+    Returns:
+        Seconds to wait (capped at five minutes), or None if absent or unparsable
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            retry_at = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at is None:
+            return None
+        seconds = retry_at.timestamp() - time.time()
+    return min(max(seconds, 0.0), _MAX_RETRY_AFTER)
+
+
+def is_throttle_error(exc: BaseException) -> bool:
+    """Return True for HTTP errors that ask the client to slow down (429, 503)."""
+    return (
+        isinstance(exc, httpx.HTTPStatusError)
+        and exc.response.status_code in THROTTLE_STATUS_CODES
+    )
+
+
+class TokenBucket:
+    """Thread-safe token bucket with adaptive rate for a single host."""
+
+    def __init__(self, rate: float, burst: int, min_rate: float):
+        """
+        Initialize the bucket full.
+
+        Args:
+            rate: Configured requests per second
+            burst: Maximum number of tokens, i.e. requests allowed back to back
+            min_rate: Lowest rate adaptive slow-down goes to
+        """
+        self.base_rate = rate
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.min_rate = min(min_rate, rate)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = threading.Lock()
+
+        self.requests = 0
+        self.throttled = 0
+        self.waits = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def try_acquire(self, waited: float = 0.0) -> float:
+        """
+        Take a token if one is available and the host is not paused.
+
+        Args:
+            waited: Seconds the caller has already waited, recorded with the request
+
+        Returns:
+            0.0 if a token was taken, otherwise seconds to wait before trying again
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if self.paused_until > now:
+                return self.paused_until - now
+            if self.tokens < 1:
+                return (1 - self.tokens) / self.rate
+            self.tokens -= 1
+            self.requests += 1
+            if waited > 0:
+                self.waits += 1
+                self.total_wait += waited
+                self.max_wait = max(self.max_wait, waited)
+            return 0.0
+
+    def throttle(self, retry_after: Optional[float] = None) -> None:
+        """Slow down after a throttle response, pausing for *retry_after* seconds if given."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.throttled += 1
+            self.rate = max(self.min_rate, self.rate * _BACKOFF_FACTOR)
+            self.tokens = min(self.tokens, 0.0)
+            if retry_after:
+                self.paused_until = max(self.paused_until, now + retry_after)
+
+    def recover(self) -> None:
+        """Move the rate back towards the configured one after a successful response."""
+        if self.rate >= self.base_rate:
+            return
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = min(self.base_rate, self.rate + self.base_rate * _RECOVERY_STEP)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            return {
+                "rate": round(self.rate, 3),
+                "configured_rate": self.base_rate,
+                "burst": self.capacity,
+                "tokens": round(self.tokens, 2),
+                "paused_for_s": round(max(self.paused_until - now, 0.0), 2),
+                "requests": self.requests,
+                "throttled": self.throttled,
+                "waits": self.waits,
+                "avg_wait_ms": (
+                    round(self.total_wait / self.requests * 1000, 1) if self.requests else 0.0
+                ),
+                "max_wait_ms": round(self.max_wait * 1000, 1),
+            }
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+
+class RateLimiter:
+    """Per-host token buckets with burst capacity and adaptive slow-down."""
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[int] = None,
+        min_rate: Optional[float] = None,
+    ):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            rate: Requests per second per host (falls back to REQUESTS_PER_SECOND setting)
+            burst: Bucket capacity (falls back to RATE_LIMIT_BURST setting)
+            min_rate: Floor of the adaptive rate (falls back to RATE_LIMIT_MIN_RPS setting)
+        """
+        if rate is not None and rate <= 0:
+            raise ValueError("Rate limit must be a positive number")
+        self.rate = rate if rate is not None else settings.REQUESTS_PER_SECOND
+        self.burst = burst if burst is not None else settings.RATE_LIMIT_BURST
+        self.min_rate = min_rate if min_rate is not None else settings.RATE_LIMIT_MIN_RPS
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        """Return the bucket key of *url* (its host, or the value itself if it has none)."""
+        try:
+            return httpx.URL(url).host or url
+        except Exception:
+            return url
+
+    def bucket(self, url: str) -> TokenBucket:
+        """Return the bucket for the host of *url*, creating it on first use."""
+        host = self.host_of(url)
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.setdefault(
+                    host, TokenBucket(self.rate, self.burst, self.min_rate)
+                )
+        return bucket
+
+    def acquire(self, url: str) -> float:
+        """
+        Block until a request to *url* may be sent.
+
+        Returns:
+            Seconds waited
+        """
+        bucket = self.bucket(url)
+        waited = 0.0
+        while True:
+            wait = bucket.try_acquire(waited)
+            if wait <= 0:
+                return waited
+            time.sleep(wait)
+            waited += wait
+
+    async def acquire_async(self, url: str) -> float:
+        """Wait without blocking the event loop until a request to *url* may be sent."""
+        bucket = self.bucket(url)
+        waited = 0.0
+        while True:
+            wait = bucket.try_acquire(waited)
+            if wait <= 0:
+                return waited
+            await asyncio.sleep(wait)
+            waited += wait
+
+    def record_response(
+        self, url: str, status_code: int, headers: Optional[Mapping[str, str]] = None
+    ) -> None:
+        """
+        Adapt the host's rate to a response.
+
+        Args:
+            url: Request URL
+            status_code: Response status code
+            headers: Response headers, read for Retry-After
+        """
+        bucket = self.bucket(url)
+        if status_code in THROTTLE_STATUS_CODES:
+            retry_after = parse_retry_after((headers or {}).get("retry-after"))
+            bucket.throttle(retry_after)
+            logger.warning(
+                f"{self.host_of(url)} returned {status_code}; slowing down to "
+                f"{bucket.rate:.2f} req/s"
+                + (f" and pausing {retry_after:.1f}s" if retry_after else "")
+            )
+        elif status_code < 400:
+            bucket.recover()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return the current rate and wait-time metrics per host."""
+        with self._lock:
+            buckets = dict(self._buckets)
+        return {host: bucket.stats() for host, bucket in sorted(buckets.items())}
+
+
+# Process-wide instance shared by DecisionAPIClient and AttachmentDownloader
+rate_limiter = RateLimiter()
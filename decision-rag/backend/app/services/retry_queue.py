@@ -0,0 +1,163 @@
+"""
+Delayed retry queue for failed document fetches.
+
+Failed IDs are scheduled with their own exponential backoff and retried by a
+few background workers while normal fetching continues, instead of the fetch
+loop sleeping through a backoff interval and retrying IDs one by one. Request
+pacing is left to the shared rate limiter.
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from typing import Any, Callable, List, Optional, Tuple
+
+from app.core import get_logger
+
+logger = get_logger(__name__)
+
+
+class DelayedRetryQueue:
+    """Retry failed fetches on background workers with per-ID exponential backoff."""
+
+    def __init__(
+        self,
+        fetch: Callable[[str], Any],
+        on_success: Callable[[str, Any, Any], None],
+        max_attempts: int,
+        min_wait: float,
+        max_wait: float,
+        multiplier: float,
+        workers: int = 1,
+        on_give_up: Optional[Callable[[str, Any], None]] = None,
+    ):
+        """
+        Initialize the queue and start its workers.
+
+        Args:
+            fetch: Called with an ID; a falsy result or an exception counts as a failure
+            on_success: Called with (id, result, context) when a retry succeeds
+            max_attempts: Retry attempts per ID before giving up
+            min_wait: Delay before an ID's first retry, in seconds
+            max_wait: Longest delay between attempts, in seconds
+            multiplier: Backoff multiplier between an ID's attempts
+            workers: Number of retries running at once
+            on_give_up: Called with (id, context) when an ID runs out of attempts
+        """
+        self.fetch = fetch
+        self.on_success = on_success
+        self.on_give_up = on_give_up
+        self.max_attempts = max_attempts
+        self.min_wait = min_wait
+        self.max_wait = max_wait
+        self.multiplier = multiplier
+
+        # Heap of (due, sequence, id, attempt, context)
+        self._heap: List[Tuple[float, int, str, int, Any]] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._in_flight = 0
+        self._closing = False
+        self._cancelled = False
+
+        self._workers = [
+            threading.Thread(target=self._work, name=f"fetch-retry-{i}", daemon=True)
+            for i in range(max(1, workers))
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def add(self, item_id: str, context: Any = None) -> None:
+        """Schedule the first retry of *item_id*, handing *context* back to the callbacks."""
+        if self.max_attempts <= 0:
+            self._give_up(item_id, context)
+            return
+        self._schedule(item_id, 1, context)
+
+    def pending(self) -> int:
+        """Return the number of IDs waiting for or running a retry."""
+        with self._condition:
+            return len(self._heap) + self._in_flight
+
+    def close(self, cancel: bool = False) -> None:
+        """
+        Stop the workers, by default after every scheduled retry has finished.
+
+        Args:
+            cancel: Drop scheduled retries and return without waiting
+        """
+        with self._condition:
+            self._closing = True
+            if cancel:
+                self._cancelled = True
+                self._heap.clear()
+            self._condition.notify_all()
+        if not cancel:
+            for worker in self._workers:
+                worker.join()
+
+    def _delay(self, attempt: int) -> float:
+        return min(self.min_wait * self.multiplier ** (attempt - 1), self.max_wait)
+
+    def _schedule(self, item_id: str, attempt: int, context: Any) -> None:
+        due = time.monotonic() + self._delay(attempt)
+        with self._condition:
+            if self._cancelled:
+                return
+            heapq.heappush(self._heap, (due, next(self._sequence), item_id, attempt, context))
+            self._condition.notify()
+
+    def _next_due(self) -> Optional[Tuple[float, int, str, int, Any]]:
+        """Wait for the earliest due retry; None once closed and drained."""
+        with self._condition:
+            while True:
+                if self._cancelled or (self._closing and not self._heap and not self._in_flight):
+                    self._condition.notify_all()
+                    return None
+                if not self._heap:
+                    self._condition.wait()
+                    continue
+                wait = self._heap[0][0] - time.monotonic()
+                if wait > 0:
+                    self._condition.wait(wait)
+                    continue
+                self._in_flight += 1
+                return heapq.heappop(self._heap)
+
+    def _work(self) -> None:
+        while True:
+            entry = self._next_due()
+            if entry is None:
+                return
+            _, _, item_id, attempt, context = entry
+            try:
+                self._attempt(item_id, attempt, context)
+            finally:
+                with self._condition:
+                    self._in_flight -= 1
+                    self._condition.notify_all()
+
+    def _attempt(self, item_id: str, attempt: int, context: Any) -> None:
+        try:
+            result = self.fetch(item_id)
+        except Exception as e:
+            logger.error(f"Error fetching {item_id} on retry attempt {attempt}: {e}")
+            result = None
+
+        if result:
+            logger.info(f"Successfully recovered {item_id} on retry attempt {attempt}")
+            self.on_success(item_id, result, context)
+        elif attempt >= self.max_attempts:
+            self._give_up(item_id, context)
+        else:
+            logger.warning(
+                f"Retry attempt {attempt}/{self.max_attempts} failed for {item_id}; "
+                f"next attempt in {self._delay(attempt + 1):.1f}s"
+            )
+            self._schedule(item_id, attempt + 1, context)
+
+    def _give_up(self, item_id: str, context: Any) -> None:
+        logger.warning(f"{item_id} permanently failed after {self.max_attempts} retry attempts")
+        if self.on_give_up is not None:
+            self.on_give_up(item_id, context)
@@ -12,6 +12,7 @@ from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 
 from app.core import get_logger, settings
+from app.repositories import DecisionWriteBehind
 from app.services.data_fetcher import DecisionDataFetcher
 from app.services.ingestion_pipeline import IngestionPipeline
 from app.services.job_manager import JobManager
@@ -311,6 +312,7 @@ class SchedulerService:
         # Create job
         job_id = self.job_manager.create_job("scheduled_full_pipeline")
         self._running_job_id = job_id
+        write_behind = None
 
         try:
             logger.info(f"Starting scheduled pipeline execution (job: {job_id})")
@@ -349,18 +351,19 @@ class SchedulerService:
                 "total_chunks": 0,
                 "total_attachments": 0,
                 "total_attachment_chunks": 0,
-                "total_deleted": 0,
                 "batches_processed": 0,
             }
 
-            # Batch accumulator
+            # Batch accumulator; documents go to ingestion in memory and are
+            # only written to disk, behind the pipeline, when files are kept
             batch_buffer = []
-            batch_native_ids = []
+            if settings.SCHEDULER_KEEP_FILES:
+                write_behind = DecisionWriteBehind(self.pipeline.repository)
 
             self.job_manager.update_progress(job_id, 5, "Fetching documents...")
 
             # Stream documents from fetcher (same as API endpoint)
-            for document in self.fetcher.fetch_all_decisions(
+            for document, _, _ in self.fetcher.fetch_all_decisions(
                 api_key=settings.API_KEY,
                 start_date=start,
                 end_date=end,
@@ -375,10 +378,9 @@ class SchedulerService:
                     logger.debug(f"Skipping existing document: {document.NativeId}")
                     continue
 
-                # Save document temporarily
-                if self.pipeline.repository.save_decision(document):
-                    batch_buffer.append(document)
-                    batch_native_ids.append(document.NativeId)
+                batch_buffer.append(document)
+                if write_behind is not None:
+                    write_behind.submit(document)
 
                 # Process batch when size reached (same as API endpoint)
                 if len(batch_buffer) >= settings.SCHEDULER_BATCH_SIZE:
@@ -395,8 +397,8 @@ class SchedulerService:
                     )
 
                     # Process the batch
-                    batch_stats = self.pipeline.process_batch(
-                        batch_native_ids, reindex=not settings.SCHEDULER_SKIP_EXISTING
+                    batch_stats = self.pipeline.process_decisions(
+                        batch_buffer, reindex=not settings.SCHEDULER_SKIP_EXISTING
                     )
 
                     stats["total_processed"] += batch_stats["processed"]
@@ -410,18 +412,8 @@ class SchedulerService:
                     )
                     stats["batches_processed"] += 1
 
-                    # Delete processed files if not keeping them (same as API endpoint)
-                    if not settings.SCHEDULER_KEEP_FILES:
-                        for native_id in batch_native_ids:
-                            try:
-                                if self.pipeline.repository.delete_decision(native_id):
-                                    stats["total_deleted"] += 1
-                            except Exception as e:
-                                logger.warning(f"Failed to delete file {native_id}: {e}")
-
                     # Clear batch
                     batch_buffer = []
-                    batch_native_ids = []
 
                     # Save checkpoint periodically
                     if checkpoint_mgr.should_save(
@@ -445,7 +437,6 @@ class SchedulerService:
                             stats["total_chunks"],
                             stats["total_attachments"],
                             stats["total_attachment_chunks"],
-                            stats["total_deleted"],
                             stats["batches_processed"],
                         )
                         checkpoint_mgr.save()
@@ -455,8 +446,8 @@ class SchedulerService:
                 logger.info(f"Processing final batch of {len(batch_buffer)} documents")
                 self.job_manager.update_progress(job_id, 95, "Processing final batch...")
 
-                batch_stats = self.pipeline.process_batch(
-                    batch_native_ids, reindex=not settings.SCHEDULER_SKIP_EXISTING
+                batch_stats = self.pipeline.process_decisions(
+                    batch_buffer, reindex=not settings.SCHEDULER_SKIP_EXISTING
                 )
 
                 stats["total_processed"] += batch_stats["processed"]
@@ -468,15 +459,6 @@ class SchedulerService:
                 stats["total_attachment_chunks"] += batch_stats.get("total_attachment_chunks", 0)
                 stats["batches_processed"] += 1
 
-                # Delete processed files
-                if not settings.SCHEDULER_KEEP_FILES:
-                    for native_id in batch_native_ids:
-                        try:
-                            if self.pipeline.repository.delete_decision(native_id):
-                                stats["total_deleted"] += 1
-                        except Exception as e:
-                            logger.warning(f"Failed to delete file {native_id}: {e}")
-
             # Mark checkpoint as completed
             fetcher_stats = self.fetcher.stats
             checkpoint_mgr.mark_completed(
@@ -495,7 +477,6 @@ class SchedulerService:
                 total_chunks=stats["total_chunks"],
                 total_attachments=stats["total_attachments"],
                 total_attachment_chunks=stats["total_attachment_chunks"],
-                files_deleted=stats["total_deleted"],
                 batches_processed=stats["batches_processed"],
             )
 
@@ -517,7 +498,6 @@ class SchedulerService:
                 "total_chunks": stats["total_chunks"],
                 "attachments_processed": stats["total_attachments"],
                 "attachment_chunks": stats["total_attachment_chunks"],
-                "files_deleted": stats["total_deleted"],
                 "batches_processed": stats["batches_processed"],
                 "duration_seconds": duration,
             }
@@ -570,6 +550,8 @@ class SchedulerService:
             )
 
         finally:
+            if write_behind is not None:
+                write_behind.close()
             self._running_job_id = None
 
             # Update next execution time
@@ -0,0 +1,239 @@
+"""
+Caches for repeated /search queries.
+
+Query embeddings are cached by normalised query text, which saves the Azure
+OpenAI round trip for repeated questions. Search results can additionally be
+cached by a hash of the query embedding, the filters and the result options.
+Result keys include the index epoch: a counter persisted in a small file that
+IngestionPipeline bumps whenever it changes the index, so every API worker stops
+serving results computed before the change.
+"""
+
+import hashlib
+import json
+import os
+import struct
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from app.core import get_logger, settings
+
+logger = get_logger(__name__)
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries also expire after ttl_seconds."""
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of entries; 0 disables the cache
+            ttl_seconds: Entry lifetime; 0 keeps entries until evicted
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for *key*, or *default* if absent or expired."""
+        if not self.enabled:
+            return default
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is not _MISSING:
+                stored_at, value = entry
+                if not self.ttl_seconds or time.monotonic() - stored_at < self.ttl_seconds:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return default
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store *value*, evicting the least recently used entry when full."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return size, hits, misses and hit rate."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+            }
+
+
+class IndexEpoch:
+    """
+    Counter of index changes, shared between processes through a file.
+
+    Reads stat() the file and re-read it only when it was replaced; bump() writes
+    a new file and renames it over the old one, so the inode changes every time.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initialize the epoch.
+
+        Args:
+            path: Epoch file (falls back to INDEX_EPOCH_FILE setting)
+        """
+        self.path = Path(path or getattr(settings, "INDEX_EPOCH_FILE", "data/index_epoch.json"))
+        self._lock = threading.Lock()
+        self._file_id: Optional[Tuple[int, int]] = None
+        self._value = 0
+
+    @property
+    def value(self) -> int:
+        """Return the current epoch (0 before the first bump)."""
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return self._value
+        file_id = (stat.st_ino, stat.st_mtime_ns)
+        with self._lock:
+            if file_id != self._file_id:
+                self._value = self._read()
+                self._file_id = file_id
+            return self._value
+
+    def bump(self) -> int:
+        """Increment and persist the epoch; returns the new value."""
+        with self._lock:
+            value = max(self._read(), self._value) + 1
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps({"epoch": value, "updated_at": time.time()}))
+            os.replace(tmp_path, self.path)
+            self._value = value
+            self._file_id = None
+            return value
+
+    def _read(self) -> int:
+        try:
+            return int(json.loads(self.path.read_text())["epoch"])
+        except FileNotFoundError:
+            return 0
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable index epoch file {self.path}: {e}")
+            return self._value
+
+
+def normalize_query(text: str) -> str:
+    """Normalise query text for cache lookups: Unicode NFC, collapsed whitespace, casefold."""
+    return " ".join(unicodedata.normalize("NFC", text).split()).casefold()
+
+
+class SearchCache:
+    """Query embedding cache, optional result cache and the index epoch they depend on."""
+
+    def __init__(
+        self,
+        embedding_cache: Optional[TTLCache] = None,
+        result_cache: Optional[TTLCache] = None,
+        epoch: Optional[IndexEpoch] = None,
+    ):
+        """
+        Initialize the caches (defaults come from the QUERY_EMBEDDING_CACHE_* and
+        SEARCH_RESULT_CACHE_* settings).
+
+        Args:
+            embedding_cache: Cache of query embeddings
+            result_cache: Cache of search results
+            epoch: Index epoch included in result cache keys
+        """
+        self.embeddings = embedding_cache or TTLCache(
+            getattr(settings, "QUERY_EMBEDDING_CACHE_SIZE", 1024),
+            getattr(settings, "QUERY_EMBEDDING_CACHE_TTL_SECONDS", 86400),
+        )
+        self.results = result_cache or TTLCache(
+            getattr(settings, "SEARCH_RESULT_CACHE_SIZE", 0),
+            getattr(settings, "SEARCH_RESULT_CACHE_TTL_SECONDS", 300),
+        )
+        self.epoch = epoch or IndexEpoch()
+
+    def get_embedding(self, query: str) -> Optional[List[float]]:
+        return self.embeddings.get(normalize_query(query))
+
+    def put_embedding(self, query: str, embedding: List[float]) -> None:
+        if embedding:
+            self.embeddings.put(normalize_query(query), embedding)
+
+    def result_key(self, embedding: Sequence[float], **options: Any) -> Optional[str]:
+        """
+        Return the result cache key for a query, or None when result caching is off.
+
+        Args:
+            embedding: Query embedding
+            **options: Everything else that changes the results (filters, top_k,
+                hybrid/collapse/neighbours flags); must be JSON-serialisable
+
+        Returns:
+            Hex digest over the embedding, the options and the current index epoch
+        """
+        if not self.results.enabled:
+            return None
+        digest = hashlib.sha256()
+        digest.update(struct.pack(f"{len(embedding)}d", *embedding))
+        digest.update(json.dumps(options, sort_keys=True, default=str).encode())
+        digest.update(str(self.epoch.value).encode())
+        return digest.hexdigest()
+
+    def get_results(
+        self, key: Optional[str]
+    ) -> Optional[Tuple[List[Dict[str, Any]], Dict[str, float]]]:
+        return self.results.get(key) if key else None
+
+    def put_results(
+        self, key: Optional[str], hits: List[Dict[str, Any]], timings: Dict[str, float]
+    ) -> None:
+        # Vector stores return no hits when a search fails, so empty results are
+        # not cached; the next request searches again
+        if key and hits:
+            self.results.put(key, (hits, dict(timings)))
+
+    def invalidate(self) -> int:
+        """Bump the index epoch after an index change; returns the new epoch."""
+        return self.epoch.bump()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit rates of both caches and the current index epoch."""
+        return {
+            "embeddings": self.embeddings.stats(),
+            "results": self.results.stats(),
+            "index_epoch": self.epoch.value,
+        }
+
+
+# Process-wide instance used by the API and by IngestionPipeline
+search_cache = SearchCache()
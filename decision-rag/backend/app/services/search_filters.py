@@ -0,0 +1,177 @@
+"""
+Typed search-time filters and their per-backend compilation.
+
+A SearchFilter is reduced to a flat list of FilterConditions on chunk metadata keys,
+which each vector store compiles natively: Elasticsearch kNN pre-filters
+(term/terms/range on the keyword mapping), SQL predicates on the indexed
+``vmetadata->>'key'`` expressions in pgvector, and column masks in LocalVectorStore.
+"""
+
+from datetime import date, timedelta
+from typing import AbstractSet, Any, Dict, List, NamedTuple, Optional, Tuple
+
+from pydantic import BaseModel, Field, field_validator
+
+# Metadata keys a SearchFilter can constrain
+FILTER_FIELDS = ("organization_name", "date_decision", "classification_code", "is_attachment")
+
+# Virtual key matching a decision and its attachments: native_id or decision_native_id
+DECISION_FIELD = "decision"
+
+
+class FilterCondition(NamedTuple):
+    """One predicate on a chunk metadata key.
+
+    ``op`` is one of ``eq``, ``in`` (value is a list), ``gte`` and ``lt``
+    (ISO strings compared lexicographically). The ``decision`` field is always
+    ``in`` and matches chunks whose native_id or decision_native_id is listed.
+    """
+
+    field: str
+    op: str
+    value: Any
+
+
+class SearchFilter(BaseModel):
+    """Typed metadata filter for vector search."""
+
+    organizations: Optional[List[str]] = Field(
+        None, description="Match any of these organization names"
+    )
+    date_from: Optional[date] = Field(None, description="Decision date on or after")
+    date_to: Optional[date] = Field(None, description="Decision date on or before")
+    classification_codes: Optional[List[str]] = Field(
+        None, description="Match any of these classification codes"
+    )
+    is_attachment: Optional[bool] = Field(
+        None, description="Only attachment chunks (true) or only decision chunks (false)"
+    )
+    native_ids: Optional[List[str]] = Field(
+        None, description="Only chunks of these decisions, including their attachments"
+    )
+
+    @field_validator("organizations", "classification_codes", "native_ids", mode="before")
+    @classmethod
+    def _single_value_as_list(cls, value: Any) -> Any:
+        if isinstance(value, str):
+            return [value]
+        return value
+
+    @field_validator("date_to")
+    @classmethod
+    def _date_range_order(cls, value: Optional[date], info) -> Optional[date]:
+        date_from = info.data.get("date_from")
+        if value and date_from and value < date_from:
+            raise ValueError("date_to must be on or after date_from")
+        return value
+
+    def is_empty(self) -> bool:
+        """Return True when the filter does not constrain anything."""
+        return not self.conditions()
+
+    def conditions(self) -> List[FilterCondition]:
+        """
+        Flatten the filter into metadata conditions, all of which must hold.
+
+        date_decision is stored as an ISO string (date or datetime), so the inclusive
+        date_to becomes ``< date_to + 1 day`` to keep same-day timestamps.
+        """
+        conditions: List[FilterCondition] = []
+        for field, values in (
+            ("organization_name", self.organizations),
+            ("classification_code", self.classification_codes),
+        ):
+            if values:
+                if len(values) == 1:
+                    conditions.append(FilterCondition(field, "eq", values[0]))
+                else:
+                    conditions.append(FilterCondition(field, "in", list(values)))
+        if self.date_from:
+            conditions.append(
+                FilterCondition("date_decision", "gte", self.date_from.isoformat())
+            )
+        if self.date_to:
+            conditions.append(
+                FilterCondition(
+                    "date_decision", "lt", (self.date_to + timedelta(days=1)).isoformat()
+                )
+            )
+        if self.is_attachment is not None:
+            conditions.append(FilterCondition("is_attachment", "eq", self.is_attachment))
+        if self.native_ids is not None:
+            conditions.append(FilterCondition(DECISION_FIELD, "in", list(self.native_ids)))
+        return conditions
+
+    def to_elasticsearch(self) -> Optional[Dict[str, Any]]:
+        """Compile to a bool filter usable as a kNN pre-filter, or None when empty."""
+        clauses: List[Dict[str, Any]] = []
+        ranges: Dict[str, Dict[str, Any]] = {}
+        for condition in self.conditions():
+            field = f"metadata.{condition.field}"
+            if condition.field == DECISION_FIELD:
+                clauses.append(
+                    {
+                        "bool": {
+                            "should": [
+                                {"terms": {"metadata.native_id": condition.value}},
+                                {"terms": {"metadata.decision_native_id": condition.value}},
+                            ],
+                            "minimum_should_match": 1,
+                        }
+                    }
+                )
+            elif condition.op == "eq":
+                clauses.append({"term": {field: condition.value}})
+            elif condition.op == "in":
+                clauses.append({"terms": {field: condition.value}})
+            else:
+                ranges.setdefault(field, {})[condition.op] = condition.value
+        clauses.extend({"range": {field: bounds}} for field, bounds in ranges.items())
+        if not clauses:
+            return None
+        return {"bool": {"filter": clauses}}
+
+    def to_pgvector(self, columns: AbstractSet[str] = frozenset()) -> Tuple[str, List[Any]]:
+        """
+        Compile to a SQL predicate over ``vmetadata`` and its parameters.
+
+        Each condition uses the same expression as the index created by
+        PgvectorVectorStore.create_filter_indexes(), so the planner can use it.
+
+        Args:
+            columns: Metadata keys stored as typed table columns, which are
+                referenced directly instead of through ``vmetadata``
+
+        Returns:
+            Tuple of (predicate without WHERE, or "" when empty; parameters)
+        """
+        clauses: List[str] = []
+        params: List[Any] = []
+        for condition in self.conditions():
+            if condition.field == DECISION_FIELD:
+                native_id = pgvector_filter_expression("native_id", columns)
+                decision_native_id = pgvector_filter_expression("decision_native_id", columns)
+                clauses.append(f"({native_id} = ANY(%s) OR {decision_native_id} = ANY(%s))")
+                params.extend([condition.value, condition.value])
+                continue
+            expression = pgvector_filter_expression(condition.field, columns)
+            if condition.op == "eq":
+                clauses.append(f"{expression} = %s")
+            elif condition.op == "in":
+                clauses.append(f"{expression} = ANY(%s)")
+            elif condition.op == "gte":
+                clauses.append(f"{expression} >= %s")
+            else:
+                clauses.append(f"{expression} < %s")
+            params.append(condition.value)
+        return " AND ".join(clauses), params
+
+
+def pgvector_filter_expression(field: str, columns: AbstractSet[str] = frozenset()) -> str:
+    """Return the SQL expression for a filterable metadata key in pgvector."""
+    if field in columns:
+        return field
+    if field == "is_attachment":
+        return "((vmetadata->>'is_attachment')::boolean)"
+    return f"(vmetadata->>'{field}')"
+
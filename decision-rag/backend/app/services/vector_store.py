@@ -4,10 +4,15 @@ Vector store abstractions: base class, exception, and composite store.
 The concrete implementations live in elasticsearch_store.py and pgvector_store.py.
 """
 
+import inspect
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
+from typing import Any, Callable, Dict, List, Optional, Union
 
 from app.core import get_logger
+from app.services.search_filters import SearchFilter
 
 logger = get_logger(__name__)
 
@@ -18,6 +23,66 @@ class MaxRetriesExceededError(Exception):
     pass
 
 
+def reciprocal_rank_fusion(
+    ranked_lists: List[List[Dict[str, Any]]],
+    top_k: int,
+    rrf_k: int = 60,
+    leg_names: Optional[List[str]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Merge ranked result lists by reciprocal rank fusion on chunk_id.
+
+    Each result's ``score`` becomes the fused score. Without leg_names the score of
+    the first list that contained a result is kept as ``vector_score``; with them,
+    each result records ``<leg>_rank`` and ``<leg>_score`` for every list it was in.
+    """
+    fused: Dict[str, Dict[str, Any]] = {}
+    for leg, results in enumerate(ranked_lists):
+        name = leg_names[leg] if leg_names else None
+        for rank, result in enumerate(results, start=1):
+            key = result.get("chunk_id")
+            entry = fused.get(key)
+            if entry is None:
+                entry = fused[key] = {**result, "score": 0.0}
+                if name is None:
+                    entry["vector_score"] = result.get("score")
+            if name is not None:
+                entry[f"{name}_rank"] = rank
+                entry[f"{name}_score"] = result.get("score")
+            entry["score"] += 1.0 / (rrf_k + rank)
+
+    merged = sorted(fused.values(), key=lambda r: r["score"], reverse=True)
+    return merged[:top_k]
+
+
+def collapse_by_native_id(results: List[Dict[str, Any]], top_k: int) -> List[Dict[str, Any]]:
+    """Keep the best-ranked result of each native_id, preserving order, up to top_k."""
+    seen = set()
+    collapsed = []
+    for result in results:
+        native_id = result.get("native_id")
+        if native_id in seen:
+            continue
+        seen.add(native_id)
+        collapsed.append(result)
+        if len(collapsed) == top_k:
+            break
+    return collapsed
+
+
+def join_context(chunks: List[Dict[str, Any]]) -> str:
+    """Join context window chunks, already in chunk_index order, into one text."""
+    return "\n\n".join(chunk.get("text") or "" for chunk in chunks)
+
+
+def supported_options(method: Callable[..., Any], options: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the entries of *options* that *method* takes as keyword arguments."""
+    parameters = inspect.signature(method).parameters
+    if any(p.kind is inspect.Parameter.VAR_KEYWORD for p in parameters.values()):
+        return dict(options)
+    return {name: value for name, value in options.items() if name in parameters}
+
+
 class BaseVectorStore(ABC):
     """
     Abstract base class for all vector store backends.
@@ -31,6 +96,10 @@ class BaseVectorStore(ABC):
 
         self._retry_count: int = 0
         self._max_total_retries: int = getattr(settings, "MAX_TOTAL_RETRIES", 10)
+        # Milliseconds per stage of the most recent search (e.g. lexical_ms, vector_ms)
+        self.last_search_timings: Dict[str, float] = {}
+        # Per-query timings of the most recent search_batch()
+        self.last_batch_timings: List[Dict[str, float]] = []
 
     def _increment_retry_count(self) -> None:
         """
@@ -92,11 +161,62 @@ class BaseVectorStore(ABC):
         self,
         query_vector: List[float],
         top_k: int = 10,
-        filter_conditions: Optional[Dict[str, Any]] = None,
+        filter_conditions: Optional[Union[SearchFilter, Dict[str, Any]]] = None,
+        query_text: Optional[str] = None,
+        collapse: bool = False,
+        neighbours: int = 0,
     ) -> List[Dict[str, Any]]:
-        """Return top-k results for the given query vector."""
+        """Return top-k results for the given query vector.
+
+        filter_conditions is a SearchFilter, which every backend compiles natively,
+        or a backend-specific dict kept for existing callers. With query_text the
+        search is hybrid: a full-text leg and the vector leg fused by reciprocal rank
+        fusion, with per-leg timings in last_search_timings.
+
+        collapse keeps only the best chunk of each native_id. With neighbours > 0
+        each result gets ``context_chunks``: the chunks of the same native_id within
+        ±neighbours of its chunk_index (including itself) in chunk order, each with
+        chunk_id, chunk_index and text, and their joined text as ``context``.
+        """
         raise NotImplementedError("search must be implemented by subclasses")
 
+    def search_batch(self, queries: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """
+        Run several searches, returning one result list per query in input order.
+
+        Each query is a dict of search() keyword arguments (query_vector, top_k,
+        filter_conditions, query_text, collapse, neighbours). This default runs
+        them one after another; backends override it to send the batch in fewer
+        round trips. Per-query timings are kept in last_batch_timings and the
+        whole batch's total_ms in last_search_timings.
+        """
+        started = time.perf_counter()
+        results, timings = [], []
+        for query in queries:
+            results.append(self.search(**query))
+            timings.append(dict(self.last_search_timings))
+        self.last_batch_timings = timings
+        self.last_search_timings = {"total_ms": (time.perf_counter() - started) * 1000}
+        return results
+
+    @property
+    def bulk_load_active(self) -> bool:
+        """Whether bulk-load mode is active; always False for backends without one."""
+        return False
+
+    def begin_bulk_load(self, **options: Any) -> Optional[str]:
+        """
+        Enter bulk-load mode for a backfill.
+
+        Backends with a bulk-load mode override this with their own options. This
+        default keeps writing to the live index and returns None.
+        """
+        return None
+
+    def end_bulk_load(self, promote: bool = True, **options: Any) -> Dict[str, Any]:
+        """Leave bulk-load mode and return its report; empty for backends without one."""
+        return {}
+
     @abstractmethod
     def get_statistics(self) -> Dict[str, Any]:
         """Return statistics about the store."""
@@ -112,48 +232,231 @@ class CompositeVectorStore(BaseVectorStore):
     """
     Fan-out vector store that delegates to multiple backends.
 
-    Write operations are dispatched to **all** backends sequentially.
-    Read operations are delegated to the **first** backend in the list.
-    Exceptions are propagated rather than suppressed.
+    Write operations are dispatched to **all** backends concurrently. A failing
+    backend does not stop the others from completing the write; once all have
+    finished, the first error (in backend order) is re-raised. Per-backend write
+    latency, failures and lag are tracked and reported by get_statistics().
+
+    Reads depend on *read_mode*:
+
+    - ``"primary"``: delegate to the first backend (default)
+    - ``"rrf"``: query all backends in parallel and merge by reciprocal rank fusion
+    - ``"first"``: query all backends in parallel and return the first non-empty answer
     """
 
-    def __init__(self, backends: List[BaseVectorStore]) -> None:
+    READ_MODES = ("primary", "rrf", "first")
+
+    def __init__(
+        self,
+        backends: List[BaseVectorStore],
+        read_mode: str = "primary",
+        rrf_k: int = 60,
+    ) -> None:
         if not backends:
             raise ValueError("CompositeVectorStore requires at least one backend.")
+        if read_mode not in self.READ_MODES:
+            raise ValueError(
+                f"Unknown read_mode '{read_mode}', expected one of {self.READ_MODES}"
+            )
         # Do NOT call super().__init__() – the concrete backends manage their own
         # retry state independently.
         self.backends = backends
+        self.read_mode = read_mode
+        self.rrf_k = rrf_k
         self._retry_count = 0
         self._max_total_retries = 0
 
+        self._executor = ThreadPoolExecutor(
+            max_workers=len(backends) * 4, thread_name_prefix="vector-store-fanout"
+        )
+        self._health_lock = threading.Lock()
+        self._health: List[Dict[str, Any]] = [
+            {
+                "backend": type(backend).__name__,
+                "writes": 0,
+                "failed_writes": 0,
+                "consecutive_failures": 0,
+                "last_success_at": None,
+                "last_error": None,
+                "last_write_seconds": None,
+                "total_write_seconds": 0.0,
+            }
+            for backend in backends
+        ]
+
+    # ------------------------------------------------------------------
+    # Fan-out helpers
+    # ------------------------------------------------------------------
+
+    def _fan_out_write(self, operation: str, *args: Any) -> List[Any]:
+        """
+        Run *operation* on every backend concurrently and record per-backend health.
+
+        Returns:
+            Per-backend results in backend order
+
+        Raises:
+            The first backend exception (in backend order), after all backends finished
+        """
+
+        def run(index: int, backend: BaseVectorStore) -> Any:
+            started = time.perf_counter()
+            try:
+                result = getattr(backend, operation)(*args)
+            except Exception as e:
+                self._record_write(index, time.perf_counter() - started, error=e)
+                raise
+            self._record_write(index, time.perf_counter() - started)
+            return result
+
+        if len(self.backends) == 1:
+            return [run(0, self.backends[0])]
+
+        futures = [
+            self._executor.submit(run, index, backend)
+            for index, backend in enumerate(self.backends)
+        ]
+        wait(futures)
+
+        errors = [f.exception() for f in futures if f.exception() is not None]
+        for error in errors[1:]:
+            logger.error(f"Additional vector store error during {operation}: {error}")
+        if errors:
+            raise errors[0]
+        return [f.result() for f in futures]
+
+    def _record_write(
+        self, index: int, seconds: float, error: Optional[Exception] = None
+    ) -> None:
+        """Update write health for the backend at *index*."""
+        with self._health_lock:
+            health = self._health[index]
+            health["writes"] += 1
+            health["last_write_seconds"] = round(seconds, 3)
+            health["total_write_seconds"] += seconds
+            if error is None:
+                health["consecutive_failures"] = 0
+                health["last_success_at"] = time.time()
+            else:
+                health["failed_writes"] += 1
+                health["consecutive_failures"] += 1
+                health["last_error"] = str(error)
+                logger.error(
+                    f"Vector store backend {health['backend']} write failed "
+                    f"({health['consecutive_failures']} in a row): {error}"
+                )
+
+    def get_backend_health(self) -> List[Dict[str, Any]]:
+        """
+        Return write health per backend.
+
+        ``lag_seconds`` is how far the backend's last successful write trails the
+        most recent successful write of any backend (None if it has never succeeded);
+        ``consecutive_failures`` counts write operations it has missed since then.
+        """
+        with self._health_lock:
+            snapshot = [dict(h) for h in self._health]
+
+        successes = [h["last_success_at"] for h in snapshot if h["last_success_at"]]
+        newest = max(successes) if successes else None
+        for h in snapshot:
+            if newest is None or h["last_success_at"] is None:
+                h["lag_seconds"] = None
+            else:
+                h["lag_seconds"] = round(newest - h["last_success_at"], 3)
+            h["avg_write_seconds"] = (
+                round(h["total_write_seconds"] / h["writes"], 3) if h["writes"] else None
+            )
+            h["total_write_seconds"] = round(h["total_write_seconds"], 3)
+        return snapshot
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
     def bulk_index_chunks(
         self, chunks_with_embeddings: List[Dict[str, Any]], batch_size: int = 100
     ) -> Dict[str, Any]:
         result: Dict[str, Any] = {"success": 0, "failed": 0, "errors": []}
-        for backend in self.backends:
-            r = backend.bulk_index_chunks(chunks_with_embeddings, batch_size)
+        for r in self._fan_out_write("bulk_index_chunks", chunks_with_embeddings, batch_size):
             result["success"] = max(result["success"], r.get("success", 0))
             result["failed"] += r.get("failed", 0)
             result["errors"].extend(r.get("errors", []))
         return result
 
     def index_chunk(self, chunk_data: Dict[str, Any]) -> bool:
-        ok = True
-        for backend in self.backends:
-            ok = backend.index_chunk(chunk_data) and ok
-        return ok
+        return all(self._fan_out_write("index_chunk", chunk_data))
 
     def delete_document(self, native_id: str) -> int:
-        total = 0
-        for backend in self.backends:
-            total += backend.delete_document(native_id)
-        return total
+        return sum(self._fan_out_write("delete_document", native_id))
 
     def delete_attachments(self, decision_native_id: str) -> int:
-        total = 0
+        return sum(self._fan_out_write("delete_attachments", decision_native_id))
+
+    # ------------------------------------------------------------------
+    # Bulk load
+    # ------------------------------------------------------------------
+
+    @property
+    def bulk_load_active(self) -> bool:
+        return any(backend.bulk_load_active for backend in self.backends)
+
+    def begin_bulk_load(self, **options: Any) -> Optional[str]:
+        """
+        Put every backend with a bulk-load mode into it.
+
+        Each backend gets the options its begin_bulk_load() accepts (e.g. new_index
+        for Elasticsearch, resume for pgvector). If a backend fails, the backends
+        already switched leave bulk-load mode again without promoting anything.
+
+        Returns:
+            Comma-separated write targets of the backends, or None if none has one
+        """
+        targets = []
+        try:
+            for backend in self.backends:
+                target = backend.begin_bulk_load(
+                    **supported_options(backend.begin_bulk_load, options)
+                )
+                if target:
+                    targets.append(target)
+        except Exception:
+            for backend in self.backends:
+                if backend.bulk_load_active:
+                    backend.end_bulk_load(promote=False)
+            raise
+        return ", ".join(targets) or None
+
+    def end_bulk_load(self, promote: bool = True, **options: Any) -> Dict[str, Any]:
+        """
+        Take every backend out of bulk-load mode.
+
+        All backends are ended even if one fails; the first error is re-raised
+        afterwards.
+
+        Returns:
+            ``{"backends": {backend class name: its bulk-load report}}``
+        """
+        reports: Dict[str, Any] = {}
+        errors = []
         for backend in self.backends:
-            total += backend.delete_attachments(decision_native_id)
-        return total
+            if not backend.bulk_load_active:
+                continue
+            name = type(backend).__name__
+            try:
+                reports[name] = backend.end_bulk_load(
+                    **supported_options(backend.end_bulk_load, {"promote": promote, **options})
+                )
+            except Exception as e:
+                logger.error(f"Leaving bulk-load mode failed on {name}: {e}")
+                errors.append(e)
+        if errors:
+            raise errors[0]
+        return {"backends": reports}
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
 
     def document_exists(self, native_id: str) -> bool:
         return self.backends[0].document_exists(native_id)
@@ -162,13 +465,90 @@ class CompositeVectorStore(BaseVectorStore):
         self,
         query_vector: List[float],
         top_k: int = 10,
-        filter_conditions: Optional[Dict[str, Any]] = None,
+        filter_conditions: Optional[Union[SearchFilter, Dict[str, Any]]] = None,
+        query_text: Optional[str] = None,
+        collapse: bool = False,
+        neighbours: int = 0,
     ) -> List[Dict[str, Any]]:
-        return self.backends[0].search(query_vector, top_k, filter_conditions)
+        if self.read_mode == "primary" or len(self.backends) == 1:
+            results = self.backends[0].search(
+                query_vector, top_k, filter_conditions, query_text, collapse, neighbours
+            )
+            self.last_search_timings = dict(self.backends[0].last_search_timings)
+            return results
+
+        started = time.perf_counter()
+        futures = {
+            self._executor.submit(
+                backend.search,
+                query_vector,
+                top_k,
+                filter_conditions,
+                query_text,
+                collapse,
+                neighbours,
+            ): index
+            for index, backend in enumerate(self.backends)
+        }
+
+        if self.read_mode == "first":
+            results = self._first_answer(futures)
+            self.last_search_timings = {"total_ms": (time.perf_counter() - started) * 1000}
+            return results
+
+        ranked_lists: List[List[Dict[str, Any]]] = []
+        for future in futures:
+            try:
+                ranked_lists.append(future.result())
+            except Exception as e:
+                logger.error(
+                    f"Search failed on {type(self.backends[futures[future]]).__name__}: {e}"
+                )
+        if not ranked_lists:
+            # Every backend failed: surface the primary backend's error
+            return next(iter(futures)).result()
+        self.last_search_timings = {"total_ms": (time.perf_counter() - started) * 1000}
+        if collapse:
+            # Backends may have kept different chunks of the same decision
+            fused = reciprocal_rank_fusion(ranked_lists, len(ranked_lists) * top_k, self.rrf_k)
+            return collapse_by_native_id(fused, top_k)
+        return reciprocal_rank_fusion(ranked_lists, top_k, self.rrf_k)
+
+    def search_batch(self, queries: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        if self.read_mode == "primary" or len(self.backends) == 1:
+            results = self.backends[0].search_batch(queries)
+            self.last_batch_timings = list(self.backends[0].last_batch_timings)
+            self.last_search_timings = dict(self.backends[0].last_search_timings)
+            return results
+        # Fan-out modes fuse per query, which search() already does concurrently
+        return super().search_batch(queries)
+
+    def _first_answer(self, futures: Dict[Future, int]) -> List[Dict[str, Any]]:
+        """Return the first non-empty search result; empty if every backend is empty."""
+        first_error: Optional[Exception] = None
+        answered = False
+        for future in as_completed(futures):
+            backend_name = type(self.backends[futures[future]]).__name__
+            try:
+                results = future.result()
+            except Exception as e:
+                logger.error(f"Search failed on {backend_name}: {e}")
+                first_error = first_error or e
+                continue
+            answered = True
+            if results:
+                logger.debug(f"First search answer from {backend_name}")
+                return results
+        if not answered and first_error is not None:
+            raise first_error
+        return []
 
     def get_statistics(self) -> Dict[str, Any]:
-        return self.backends[0].get_statistics()
+        stats = dict(self.backends[0].get_statistics())
+        stats["backends"] = self.get_backend_health()
+        return stats
 
     def close(self) -> None:
         for backend in self.backends:
             backend.close()
+        self._executor.shutdown(wait=False)
@@ -7,6 +7,7 @@ from .checkpoint_manager import (
     IngestCheckpoint,
 )
 from .date_utils import (
+    AdaptiveDateWindows,
     format_date_for_api,
     generate_date_range,
     parse_date,
@@ -28,6 +29,7 @@ __all__ = [
     "parse_date",
     "format_date_for_api",
     "generate_date_range",
+    "AdaptiveDateWindows",
     "weeks_between",
     "validate_native_id",
     "validate_decision_document",
@@ -314,7 +314,6 @@ class FullPipelineCheckpoint(CheckpointManager):
             total_chunks=0,
             total_attachments=0,
             total_attachment_chunks=0,
-            total_deleted=0,
             batches_processed=0,
         )
 
@@ -337,7 +336,6 @@ class FullPipelineCheckpoint(CheckpointManager):
         total_chunks: int,
         total_attachments: int,
         total_attachment_chunks: int,
-        total_deleted: int,
         batches_processed: int,
     ) -> None:
         """
@@ -359,7 +357,6 @@ class FullPipelineCheckpoint(CheckpointManager):
             total_chunks: Total chunks created
             total_attachments: Total attachments processed
             total_attachment_chunks: Total attachment chunks created
-            total_deleted: Total files deleted
             batches_processed: Total batches processed
         """
         self.update_fields(
@@ -378,6 +375,5 @@ class FullPipelineCheckpoint(CheckpointManager):
             total_chunks=total_chunks,
             total_attachments=total_attachments,
             total_attachment_chunks=total_attachment_chunks,
-            total_deleted=total_deleted,
             batches_processed=batches_processed,
         )
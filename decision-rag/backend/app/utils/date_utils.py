@@ -1,11 +1,12 @@
 """
 Date utility functions for the pipeline.
 
-Includes parsing, formatting, and generating date ranges.
+Includes parsing, formatting, and generating fixed or adaptive date ranges.
 """
 
+import math
 from datetime import datetime, timedelta
-from typing import List, Tuple
+from typing import Iterator, List, Tuple
 
 from dateutil import parser as date_parser
 
@@ -85,3 +86,80 @@ def weeks_between(start_date: datetime, end_date: datetime, backwards: bool = Fa
     else:
         delta = end_date - start_date
     return (delta.days + 6) // 7  # Round up
+
+
+class AdaptiveDateWindows:
+    """
+    Date windows sized by how many decision IDs the previous window held.
+
+    Iterating yields consecutive (start, end) windows like generate_date_range().
+    After each window, record() is called with its ID count: a window that came
+    close to the API page size halves the next one, a sparse window doubles it,
+    so busy periods stay near one page per window and quiet ones need few calls.
+    """
+
+    # Window ID count, as a share of the page size, that halves the next window
+    SPLIT_RATIO = 0.8
+    # Window ID count, as a share of the page size, below which the next window doubles
+    MERGE_RATIO = 0.25
+
+    def __init__(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        initial: timedelta,
+        minimum: timedelta,
+        maximum: timedelta,
+        page_size: int,
+    ):
+        """
+        Initialize the windows.
+
+        Args:
+            start_date: Start date (after end_date to walk backwards)
+            end_date: End date
+            initial: Size of the first window
+            minimum: Smallest window size
+            maximum: Largest window size
+            page_size: Decision IDs per API page
+        """
+        self.backwards = start_date > end_date
+        self.current = start_date
+        self.end_date = end_date
+        self.minimum = minimum
+        self.maximum = max(maximum, minimum)
+        self.window = min(max(initial, self.minimum), self.maximum)
+        self.page_size = page_size
+
+    def __iter__(self) -> Iterator[Tuple[datetime, datetime]]:
+        while self.current > self.end_date if self.backwards else self.current < self.end_date:
+            if self.backwards:
+                batch_start = max(self.current - self.window, self.end_date)
+                window = (batch_start, self.current)
+                self.current = batch_start
+            else:
+                batch_end = min(self.current + self.window, self.end_date)
+                window = (self.current, batch_end)
+                self.current = batch_end
+            yield window
+
+    def record(self, id_count: int) -> timedelta:
+        """
+        Size the next window from the ID count of the last one.
+
+        Args:
+            id_count: Decision IDs listed for the last window
+
+        Returns:
+            Size of the next window
+        """
+        if id_count >= self.page_size * self.SPLIT_RATIO:
+            self.window = max(self.window / 2, self.minimum)
+        elif id_count < self.page_size * self.MERGE_RATIO:
+            self.window = min(self.window * 2, self.maximum)
+        return self.window
+
+    def remaining(self) -> int:
+        """Estimate the number of windows left at the current window size."""
+        span = abs(self.end_date - self.current)
+        return math.ceil(span / self.window) if span else 0
@@ -12,16 +12,23 @@ from rich.console import Console
 from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
 
 from app import __version__
+from app.api.deps import _build_decision_index, _build_vector_store
 from app.core import get_logger, settings, setup_logging
-from app.repositories import DecisionRepository
+from app.repositories import DecisionRepository, DecisionWriteBehind
+from app.schemas.decision import DecisionDocument
 from app.services import (
     AttachmentDownloader,
     AzureEmbedder,
     DecisionAPIClient,
     DecisionDataFetcher,
+    DecisionSummaryIndex,
     ElasticsearchVectorStore,
     IngestionPipeline,
+    LocalVectorStore,
     ParagraphChunker,
+    PgvectorVectorStore,
+    search_cache,
+    supported_options,
 )
 from app.utils.date_utils import parse_date
 from app.utils.validators import validate_decision_document
@@ -160,7 +167,7 @@ def fetch(
         documents_saved = 0
         documents_skipped = 0
 
-        for document in fetcher.fetch_all_decisions(api_key, start_dt, end_dt):
+        for document, _, _ in fetcher.fetch_all_decisions(api_key, start_dt, end_dt):
             # Check if already exists
             if skip_existing and repository.decision_exists(document.NativeId):
                 documents_skipped += 1
@@ -338,6 +345,8 @@ def ingest(
             embedder=embedder,
             vector_store=vector_store,
             attachment_downloader=attachment_downloader,
+            decision_index=_decision_index(),
+            search_cache=search_cache,
         )
 
         console.print("[green]✓ Pipeline initialized[/green]\n")
@@ -481,7 +490,25 @@ def full_pipeline(
     keep_files: bool = typer.Option(
         False,
         "--keep-files",
-        help="Keep decision files after processing (default: delete)",
+        help="Also save fetched decisions as JSON files, written in the background (default: off)",
+    ),
+    backfill: bool = typer.Option(
+        False,
+        "--backfill",
+        help=(
+            "Bulk-load mode: Elasticsearch disables refresh and replicas, pgvector loads "
+            "an unindexed staging table that is indexed and swapped in at the end"
+        ),
+    ),
+    force_merge: bool = typer.Option(
+        False,
+        "--force-merge",
+        help="With --backfill, force-merge the index to one segment before restoring replicas",
+    ),
+    backfill_new_index: bool = typer.Option(
+        False,
+        "--backfill-new-index",
+        help="With --backfill, build a new index behind the ELASTICSEARCH_INDEX alias, seeded from the current one, and swap it in at the end",
     ),
     log_level: Optional[str] = typer.Option(
         "INFO",
@@ -515,8 +542,13 @@ def full_pipeline(
 
         # Debug mode with file preservation
         python pipeline.py full-pipeline --log-level DEBUG --keep-files --batch-size 10
+
+        # Historical backfill with refresh/replicas disabled and a final force merge
+        python pipeline.py full-pipeline --backfill --force-merge
     """
     logger = get_logger(__name__)
+    vector_store = None
+    write_behind = None
 
     try:
         # Setup logging
@@ -571,10 +603,11 @@ def full_pipeline(
             sys.exit(1)
 
         try:
-            vector_store = ElasticsearchVectorStore()
-            console.print("[green]✓ Connected to Elasticsearch[/green]")
+            vector_store = _build_vector_store()
+            backends = ", ".join(settings.VECTOR_STORE_BACKENDS)
+            console.print(f"[green]✓ Connected to vector store ({backends})[/green]")
         except Exception as e:
-            console.print(f"[bold red]Error: Failed to connect to Elasticsearch: {e}[/bold red]")
+            console.print(f"[bold red]Error: Failed to connect to vector store: {e}[/bold red]")
             sys.exit(1)
 
         # Initialize attachment downloader if needed
@@ -594,6 +627,8 @@ def full_pipeline(
             embedder=embedder,
             vector_store=vector_store,
             attachment_downloader=attachment_downloader,
+            decision_index=_decision_index(),
+            search_cache=search_cache,
         )
 
         console.print("[green]✓ Pipeline initialized[/green]\n")
@@ -620,8 +655,22 @@ def full_pipeline(
         console.print(f"Skip existing: {skip_existing}")
         console.print(f"Process attachments: {not skip_attachments and attachment_downloader is not None}")
         console.print(f"Keep files: {keep_files}")
+        console.print(f"Backfill mode: {backfill}")
         console.print(f"Logging level: {log_level}\n")
 
+        if backfill:
+            # With --resume, pgvector keeps loading into the staging table of the failed run
+            write_target = vector_store.begin_bulk_load(
+                **supported_options(
+                    vector_store.begin_bulk_load,
+                    {"new_index": backfill_new_index, "resume": resume},
+                )
+            )
+            if write_target:
+                console.print(f"[yellow]Bulk-load mode enabled: writes go to {write_target}[/yellow]\n")
+            else:
+                console.print("[yellow]Vector store has no bulk-load mode[/yellow]\n")
+
         # Initialize statistics
         stats = {
             "total_fetched": 0,
@@ -632,13 +681,15 @@ def full_pipeline(
             "total_chunks": 0,
             "total_attachments": 0,
             "total_attachment_chunks": 0,
-            "total_deleted": 0,
+            "total_saved": 0,
             "batches_processed": 0,
         }
 
-        # Batch accumulator
+        # Batch accumulator; documents go to ingestion in memory and are only
+        # written to disk, behind the pipeline, with --keep-files
         batch_buffer = []
-        batch_native_ids = []
+        if keep_files:
+            write_behind = DecisionWriteBehind(repository)
 
         # Create progress display
         with Progress(
@@ -652,7 +703,7 @@ def full_pipeline(
             process_task = progress.add_task("Processing documents...", total=0)
 
             # Stream documents from fetcher
-            for document in fetcher.fetch_all_decisions(
+            for document, _, _ in fetcher.fetch_all_decisions(
                 settings.API_KEY, start_dt, end_dt
             ):
                 stats["total_fetched"] += 1
@@ -663,23 +714,22 @@ def full_pipeline(
                     logger.debug(f"Skipping already indexed document: {document.NativeId}")
                     continue
 
-                # Save document temporarily
-                if repository.save_decision(document):
-                    batch_buffer.append(document)
-                    batch_native_ids.append(document.NativeId)
-                    progress.update(fetch_task, description=f"Fetching documents... ({stats['total_fetched']} fetched)")
+                batch_buffer.append(document)
+                if write_behind is not None:
+                    write_behind.submit(document)
+                progress.update(fetch_task, description=f"Fetching documents... ({stats['total_fetched']} fetched)")
 
                 # Process batch when size reached
                 if len(batch_buffer) >= batch_size:
                     logger.info(f"Processing batch of {len(batch_buffer)} documents")
 
                     # Update progress task total
-                    progress.update(process_task, total=len(batch_native_ids))
+                    progress.update(process_task, total=len(batch_buffer))
 
                     # Process each document in batch
                     batch_stats = _process_batch(
                         pipeline,
-                        batch_native_ids,
+                        batch_buffer,
                         skip_existing,
                         progress,
                         process_task,
@@ -695,12 +745,6 @@ def full_pipeline(
                     stats["total_attachment_chunks"] += batch_stats.get("total_attachment_chunks", 0)
                     stats["batches_processed"] += 1
 
-                    # Delete processed files
-                    if not keep_files:
-                        delete_stats = repository.delete_decisions(batch_native_ids)
-                        stats["total_deleted"] += delete_stats["deleted"]
-                        logger.info(f"Deleted {delete_stats['deleted']} processed files")
-
                     # Save checkpoint
                     last_doc = batch_buffer[-1] if batch_buffer else None
                     fetcher_stats = fetcher.stats  # Get current fetcher stats
@@ -723,17 +767,16 @@ def full_pipeline(
 
                     # Clear batch buffer
                     batch_buffer = []
-                    batch_native_ids = []
                     progress.reset(process_task)
 
             # Process remaining documents in final batch
             if batch_buffer:
                 logger.info(f"Processing final batch of {len(batch_buffer)} documents")
-                progress.update(process_task, total=len(batch_native_ids))
+                progress.update(process_task, total=len(batch_buffer))
 
                 batch_stats = _process_batch(
                     pipeline,
-                    batch_native_ids,
+                    batch_buffer,
                     skip_existing,
                     progress,
                     process_task,
@@ -748,11 +791,8 @@ def full_pipeline(
                 stats["total_attachment_chunks"] += batch_stats.get("total_attachment_chunks", 0)
                 stats["batches_processed"] += 1
 
-                # Delete processed files
-                if not keep_files:
-                    delete_stats = repository.delete_decisions(batch_native_ids)
-                    stats["total_deleted"] += delete_stats["deleted"]
-                    logger.info(f"Deleted {delete_stats['deleted']} processed files")
+        if write_behind is not None:
+            stats["total_saved"] = write_behind.close()["saved"]
 
         # Save final checkpoint
         # Include fetcher statistics
@@ -777,6 +817,13 @@ def full_pipeline(
         }
         repository.save_checkpoint(checkpoint_data)
 
+        if backfill:
+            console.print("[bold blue]Leaving bulk-load mode...[/bold blue]")
+            indexing_report = vector_store.end_bulk_load(
+                **supported_options(vector_store.end_bulk_load, {"force_merge": force_merge})
+            )
+            _print_indexing_report(indexing_report)
+
         # Final summary
         console.print("\n[bold green]✓ Full pipeline completed successfully![/bold green]")
         console.print(f"Native IDs fetched: {fetcher_stats.get('ids_fetched', 0)}")
@@ -794,8 +841,8 @@ def full_pipeline(
         if not skip_attachments:
             console.print(f"Attachments processed: {stats['total_attachments']}")
             console.print(f"Attachment chunks indexed: {stats['total_attachment_chunks']}")
-        if not keep_files:
-            console.print(f"Files deleted: {stats['total_deleted']}")
+        if keep_files:
+            console.print(f"Files saved: {stats['total_saved']}")
         console.print(f"Batches processed: {stats['batches_processed']}")
 
         # Show vector store statistics
@@ -813,21 +860,101 @@ def full_pipeline(
         console.print(f"\n[bold red]Error: {e}[/bold red]")
         logger.exception("Fatal error during full pipeline")
         sys.exit(1)
+    finally:
+        if write_behind is not None:
+            write_behind.close()
+        # Never leave the index with refresh and replicas disabled or writes on staging
+        if vector_store is not None and vector_store.bulk_load_active:
+            console.print("[yellow]Leaving bulk-load mode after interrupted backfill[/yellow]")
+            vector_store.end_bulk_load(promote=False)
+
+
+def _decision_index() -> Optional[DecisionSummaryIndex]:
+    """Return the decision summary index on the configured backends, if enabled."""
+    return _build_decision_index()
+
+
+def _print_recall_report(report: Dict[str, Any], top_k: int) -> None:
+    """Print recall and latency per search variant from a benchmark report."""
+    if not report:
+        console.print("[yellow]No vectors found to benchmark[/yellow]")
+        return
+
+    console.print(f"\n[bold blue]Recall@{top_k} over {report['queries']} queries[/bold blue]")
+    for variant, values in report.items():
+        if isinstance(values, dict):
+            console.print(
+                f"{variant:>14}: recall {values['recall']:.3f}, "
+                f"p50 {values['p50_ms']:.1f} ms, p95 {values['p95_ms']:.1f} ms"
+            )
+
+
+def _print_tuning_report(report: Dict[str, Any], parameter: str) -> None:
+    """Print recall and latency per candidate count and the value chosen for each top_k."""
+    if not report.get("chosen"):
+        console.print("[yellow]No vectors found to benchmark[/yellow]")
+        return
+
+    console.print(
+        f"\n[bold blue]{parameter} over {report['queries']} queries, "
+        f"target recall {report['target_recall']}[/bold blue]"
+    )
+    for top_k, chosen in report["chosen"].items():
+        console.print(f"\n[bold]top_k {top_k}[/bold]")
+        for values in report[f"top_k_{top_k}"].values():
+            marker = "  <- chosen" if values["candidates"] == chosen else ""
+            console.print(
+                f"{values['candidates']:>6}: recall {values['recall']:.3f}, "
+                f"p50 {values['p50_ms']:.1f} ms, p95 {values['p95_ms']:.1f} ms{marker}"
+            )
+
+
+def _print_indexing_report(report: Dict[str, Any]) -> None:
+    """Print the bulk-load report of each backend: throughput, index builds and swap."""
+    for backend, backend_report in report.get("backends", {}).items():
+        console.print(f"\n[bold blue]{backend}[/bold blue]")
+        _print_indexing_report(backend_report)
+    if "rows_loaded" in report:
+        console.print("\n[bold blue]Staging Table Load[/bold blue]")
+        console.print(
+            f"{report['rows_loaded']} rows in {report['load_seconds']:.1f}s "
+            f"({report['rows_per_second']} rows/s)"
+        )
+        for build in report.get("index_builds", []):
+            console.print(f"Index {build['index']} built in {build['seconds']:.1f}s")
+        if report.get("swap_seconds") is not None:
+            console.print(f"Swap: {report['swap_seconds']:.3f}s")
+        return
+    if not any(report.get(mode) for mode in ("normal", "bulk_load")):
+        return
+    console.print("\n[bold blue]Indexing Throughput[/bold blue]")
+    for mode in ("normal", "bulk_load"):
+        values = report.get(mode)
+        if not values or not values.get("chunks"):
+            continue
+        console.print(
+            f"{mode}: {values['chunks']} chunks in {values['seconds']:.1f}s "
+            f"({values['chunks_per_second']} chunks/s)"
+        )
+    if report.get("speedup"):
+        console.print(f"Bulk-load speedup: {report['speedup']}x")
 
 
 def _process_batch(
     pipeline: IngestionPipeline,
-    native_ids: List[str],
+    decisions: List[DecisionDocument],
     skip_existing: bool,
     progress: Progress,
     task_id,
 ) -> Dict[str, Any]:
     """
-    Process a batch of documents through the ingestion pipeline.
+    Process a batch of fetched documents through the ingestion pipeline.
+
+    The documents are handed to the pipeline in memory, not through the repository.
 
     Args:
         pipeline: IngestionPipeline instance
-        native_ids: List of NativeIds to process
+        decisions: Decision documents to process
         skip_existing: Skip documents already in vector store
         progress: Rich Progress instance
         task_id: Progress task ID
@@ -847,31 +974,55 @@ def _process_batch(
         "total_attachment_chunks": 0,
     }
 
-    for native_id in native_ids:
-        try:
-            doc_stats = pipeline.process_document(native_id, reindex=not skip_existing)
-
-            batch_stats["processed"] += 1
-
-            if doc_stats.get("skipped"):
-                batch_stats["skipped"] += 1
-            elif doc_stats.get("success"):
-                batch_stats["successful"] += 1
-                batch_stats["total_chunks"] += doc_stats.get("chunks_indexed", 0)
-                batch_stats["total_attachments"] += doc_stats.get("attachments_processed", 0)
-                batch_stats["total_attachment_chunks"] += doc_stats.get(
-                    "attachment_chunks_indexed", 0
+    # Attachments of the whole batch share one scheduler and finish in the background
+    attachment_scheduler = pipeline.create_attachment_scheduler()
+    try:
+        for decision in decisions:
+            native_id = decision.NativeId
+            is_valid, error = validate_decision_document(decision)
+            if not is_valid:
+                logger.error(f"Invalid decision document: {error}")
+                progress.advance(task_id)
+                continue
+            try:
+                doc_stats = pipeline.process_document(
+                    native_id,
+                    reindex=not skip_existing,
+                    attachment_scheduler=attachment_scheduler,
+                    decision=decision,
                 )
-            else:
-                batch_stats["failed"] += 1
 
-            progress.advance(task_id)
+                batch_stats["processed"] += 1
 
-        except Exception as e:
-            logger.error(f"Error processing document {native_id}: {e}")
-            batch_stats["processed"] += 1
-            batch_stats["failed"] += 1
-            progress.advance(task_id)
+                if doc_stats.get("skipped"):
+                    batch_stats["skipped"] += 1
+                elif doc_stats.get("success"):
+                    batch_stats["successful"] += 1
+                    batch_stats["total_chunks"] += doc_stats.get("chunks_indexed", 0)
+                    batch_stats["total_attachments"] += doc_stats.get("attachments_processed", 0)
+                    batch_stats["total_attachment_chunks"] += doc_stats.get(
+                        "attachment_chunks_indexed", 0
+                    )
+                else:
+                    batch_stats["failed"] += 1
+
+                progress.advance(task_id)
+
+            except Exception as e:
+                logger.error(f"Error processing document {native_id}: {e}")
+                batch_stats["processed"] += 1
+                batch_stats["failed"] += 1
+                progress.advance(task_id)
+
+        if attachment_scheduler is not None:
+            for attachment_stats in attachment_scheduler.join().values():
+                batch_stats["total_attachments"] += attachment_stats["attachments_processed"]
+                batch_stats["total_attachment_chunks"] += attachment_stats["chunks_indexed"]
+            if pipeline.attachment_registry is not None:
+                logger.info(f"Attachment registry: {pipeline.attachment_registry.stats()}")
+    finally:
+        if attachment_scheduler is not None:
+            attachment_scheduler.close()
 
     return batch_stats
 
@@ -920,6 +1071,355 @@ def vector_store_stats():
         sys.exit(1)
 
 
+@app.command()
+def load_local_vector_store(
+    paths: List[Path] = typer.Argument(
+        ...,
+        help="Parquet embedding export files or directories to load",
+    ),
+):
+    """
+    Load Parquet embedding exports into the local memory-mapped vector store.
+
+    Examples:
+        python pipeline.py load-local-vector-store data/embeddings/
+    """
+    try:
+        vector_store = LocalVectorStore()
+        loaded = vector_store.load_parquet(paths)
+        stats = vector_store.get_statistics()
+
+        console.print(f"[green]Loaded {loaded} embeddings[/green]")
+        console.print(f"Store: {stats.get('index_name')}")
+        console.print(f"Total chunks: {stats.get('total_chunks', 0)}")
+        console.print(f"Size: {stats.get('size_mb', 0):.2f} MB\n")
+
+    except Exception as e:
+        console.print(f"[bold red]Error: {e}[/bold red]")
+        sys.exit(1)
+
+
+@app.command()
+def pgvector_create_bq_index():
+    """Create the binary-quantized Hamming-distance index used by PGVECTOR_BINARY_QUANTIZATION."""
+    try:
+        vector_store = PgvectorVectorStore()
+        seconds = vector_store.create_binary_quantized_index()
+        console.print(f"[green]Binary-quantized index ready ({seconds:.1f}s)[/green]")
+        vector_store.close()
+
+    except Exception as e:
+        console.print(f"[bold red]Error: {e}[/bold red]")
+        sys.exit(1)
+
+
+@app.command()
+def pgvector_create_filter_indexes():
+    """Create the metadata expression indexes used by search filters in pgvector."""
+    try:
+        vector_store = PgvectorVectorStore()
+        names = vector_store.create_filter_indexes()
+        console.print(f"[green]Filter indexes ready: {', '.join(names)}[/green]")
+        vector_store.close()
+
+    except Exception as e:
+        console.print(f"[bold red]Error: {e}[/bold red]")
+        sys.exit(1)
+
+
+@app.command()
+def pgvector_migrate_schema():
+    """Add and backfill the typed metadata columns, then index them."""
+    try:
+        vector_store = PgvectorVectorStore()
+        report = vector_store.migrate_schema()
+        console.print(
+            f"[green]Promoted columns ready: {report['rows_backfilled']:,} rows backfilled "
+            f"in {report['seconds']:.1f}s[/green]"
+        )
+        console.print("Set PGVECTOR_PROMOTED_COLUMNS=true so new writes fill the columns.")
+        vector_store.close()
+
+    except Exception as e:
+        console.print(f"[bold red]Error: {e}[/bold red]")
+        sys.exit(1)
+
+
+@app.command()
+def pgvector_drop_partitions(
+    before: str = typer.Option(
+        ...,
+        "--before",
+        help="Drop decision-year partitions ending on or before this date (YYYY-MM-DD)",
+    ),
+    dry_run: bool = typer.Option(
+        False,
+        "--dry-run",
+        help="Only list the partitions that would be dropped",
+    ),
+):
+    """Apply retention to a date-partitioned pgvector table by dropping old partitions."""
+    try:
+        vector_store = PgvectorVectorStore()
+        dropped = vector_store.drop_partitions_before(parse_date(before).date(), dry_run=dry_run)
+        verb = "Would drop" if dry_run else "Dropped"
+        console.print(f"[green]{verb} {len(dropped)} partitions[/green]")
+        for name in dropped:
+            console.print(f"  {name}")
+        vector_store.close()
+
+    except Exception as e:
+        console.print(f"[bold red]Error: {e}[/bold red]")
+        sys.exit(1)
+
+
+@app.command()
+def pgvector_drop_staging():
+    """Drop the staging table and mirror trigger left by a failed pgvector backfill."""
+    try:
+        vector_store = PgvectorVectorStore()
+        if vector_store.drop_bulk_load_staging():
+            console.print(f"[green]Dropped '{vector_store.staging_table}' and its trigger[/green]")
+        else:
+            console.print("[yellow]No leftover staging table found[/yellow]")
+        vector_store.close()
+
+    except Exception as e:
+        console.print(f"[bold red]Error: {e}[/bold red]")
+        sys.exit(1)
+
+
+@app.command()
+def pgvector_create_text_index():
+    """Create the Finnish full-text GIN index used by hybrid search in pgvector."""
+    try:
+        vector_store = PgvectorVectorStore()
+        seconds = vector_store.create_text_search_index()
+        console.print(f"[green]Full-text index ready ({seconds:.1f}s)[/green]")
+        vector_store.close()
+
+    except Exception as e:
+        console.print(f"[bold red]Error: {e}[/bold red]")
+        sys.exit(1)
+
+
+@app.command()
+def pgvector_bq_benchmark(
+    sample_size: int = typer.Option(
+        50,
+        "--sample-size",
+        "-n",
+        help="Number of query vectors sampled from the table",
+    ),
+    top_k: int = typer.Option(
+        10,
+        "--top-k",
+        "-k",
+        help="Results per query",
+    ),
+    oversampling: str = typer.Option(
+        "1,2,4,8",
+        "--oversampling",
+        help="Comma-separated oversampling factors to compare",
+    ),
+):
+    """Compare recall and latency of plain HNSW and binary-quantized pgvector search."""
+    try:
+        vector_store = PgvectorVectorStore()
+        report = vector_store.benchmark_binary_quantization(
+            sample_size=sample_size,
+            top_k=top_k,
+            oversampling_factors=[int(f) for f in oversampling.split(",") if f.strip()],
+        )
+        vector_store.close()
+        _print_recall_report(report, top_k)
+
+    except Exception as e:
+        console.print(f"[bold red]Error: {e}[/bold red]")
+        sys.exit(1)
+
+
+@app.command()
+def es_shortlist_backfill():
+    """Compute the shortlist vector for chunks indexed before ELASTICSEARCH_SHORTLIST_DIMS was set."""
+    try:
+        vector_store = ElasticsearchVectorStore()
+        updated = vector_store.backfill_shortlist_vectors()
+        console.print(f"[green]Shortlist vectors added to {updated} chunks[/green]")
+
+    except Exception as e:
+        console.print(f"[bold red]Error: {e}[/bold red]")
+        sys.exit(1)
+
+
+@app.command()
+def es_shortlist_benchmark(
+    sample_size: int = typer.Option(
+        50,
+        "--sample-size",
+        "-n",
+        help="Number of query vectors sampled from the index",
+    ),
+    top_k: int = typer.Option(
+        10,
+        "--top-k",
+        "-k",
+        help="Results per query",
+    ),
+    oversampling: str = typer.Option(
+        "2,5,10",
+        "--oversampling",
+        help="Comma-separated shortlist oversampling factors to compare",
+    ),
+):
+    """Compare recall and latency of full-vector kNN and shortlist + rescore search."""
+    try:
+        vector_store = ElasticsearchVectorStore()
+        report = vector_store.benchmark_shortlist(
+            sample_size=sample_size,
+            top_k=top_k,
+            oversampling_factors=[int(f) for f in oversampling.split(",") if f.strip()],
+        )
+        _print_recall_report(report, top_k)
+
+    except Exception as e:
+        console.print(f"[bold red]Error: {e}[/bold red]")
+        sys.exit(1)
+
+
+@app.command()
+def knn_tune(
+    backend: str = typer.Option(
+        "elasticsearch",
+        "--backend",
+        "-b",
+        help="Vector store to tune: elasticsearch (num_candidates) or pgvector (hnsw.ef_search)",
+    ),
+    sample_size: int = typer.Option(
+        50,
+        "--sample-size",
+        "-n",
+        help="Number of query vectors sampled from the index",
+    ),
+    top_k: str = typer.Option(
+        "5,10,20,50",
+        "--top-k",
+        "-k",
+        help="Comma-separated result sizes to tune",
+    ),
+    factors: Optional[str] = typer.Option(
+        None,
+        "--factors",
+        help="Comma-separated candidate counts to try, as multiples of top_k",
+    ),
+    target_recall: Optional[float] = typer.Option(
+        None,
+        "--target-recall",
+        help="Recall@k to reach (default: KNN_TARGET_RECALL)",
+    ),
+    dry_run: bool = typer.Option(
+        False,
+        "--dry-run",
+        help="Report only; do not save the chosen values",
+    ),
+):
+    """Benchmark recall against exact search and save the cheapest kNN candidate counts."""
+    try:
+        kwargs = {
+            "sample_size": sample_size,
+            "top_k_values": [int(k) for k in top_k.split(",") if k.strip()],
+            "factors": [int(f) for f in factors.split(",") if f.strip()] if factors else None,
+            "target_recall": target_recall,
+            "persist": not dry_run,
+        }
+        if backend == "elasticsearch":
+            vector_store = ElasticsearchVectorStore()
+            report = vector_store.benchmark_num_candidates(**kwargs)
+            parameter = "num_candidates"
+        elif backend == "pgvector":
+            vector_store = PgvectorVectorStore()
+            report = vector_store.benchmark_ef_search(**kwargs)
+            parameter = "hnsw.ef_search"
+        else:
+            console.print(f"[bold red]Error: unknown backend '{backend}'[/bold red]")
+            sys.exit(1)
+        vector_store.close()
+        _print_tuning_report(report, parameter)
+        if report.get("chosen") and not dry_run:
+            console.print(f"[green]Saved to {vector_store.knn_tuning.path}[/green]")
+
+    except Exception as e:
+        console.print(f"[bold red]Error: {e}[/bold red]")
+        sys.exit(1)
+
+
+@app.command()
+def decision_index_benchmark(
+    sample_size: int = typer.Option(
+        50,
+        "--sample-size",
+        "-n",
+        help="Number of decisions whose titles are used as queries",
+    ),
+    top_k: int = typer.Option(
+        10,
+        "--top-k",
+        "-k",
+        help="Results per query",
+    ),
+    shortlist: str = typer.Option(
+        "10,50,200",
+        "--shortlist",
+        help="Comma-separated decision shortlist sizes to compare",
+    ),
+):
+    """Compare recall and latency of single-stage and two-stage (decision shortlist) search."""
+    try:
+        decision_index = _decision_index()
+        if decision_index is None:
+            console.print("[bold red]Error: DECISION_INDEX_ENABLED is not set[/bold red]")
+            sys.exit(1)
+
+        embedder = AzureEmbedder()
+        titles = decision_index.sample_titles(sample_size, embedder.dimension)
+        query_vectors = [vector for vector in map(embedder.create_embedding, titles) if vector]
+        if not query_vectors:
+            decision_index.close()
+            console.print("[bold red]Error: no indexed decisions to sample queries from[/bold red]")
+            sys.exit(1)
+
+        vector_store = _build_vector_store()
+        report = decision_index.benchmark(
+            vector_store,
+            query_vectors,
+            top_k=top_k,
+            shortlist_sizes=[int(s) for s in shortlist.split(",") if s.strip()],
+        )
+        decision_index.close()
+        vector_store.close()
+        _print_recall_report(report, top_k)
+
+    except Exception as e:
+        console.print(f"[bold red]Error: {e}[/bold red]")
+        sys.exit(1)
+
+
+@app.command()
+def restore_index_settings():
+    """Restore Elasticsearch index settings left behind by an interrupted backfill."""
+    try:
+        vector_store = ElasticsearchVectorStore()
+        if vector_store.restore_bulk_load_settings():
+            console.print("[green]Index settings restored[/green]")
+        else:
+            console.print("[yellow]No interrupted backfill found[/yellow]")
+        _print_indexing_report(vector_store.get_indexing_report())
+
+    except Exception as e:
+        console.print(f"[bold red]Error: {e}[/bold red]")
+        sys.exit(1)
+
+
 @app.command()
 def validate(
     sample_size: int = typer.Option(
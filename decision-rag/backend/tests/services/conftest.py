@@ -0,0 +1,69 @@
+"""
+Shared fixtures for the service tests.
+
+PostgreSQL is mocked for the pgvector tests; no live database is required.
+"""
+
+from typing import Callable, List, Optional, Tuple
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.services.pgvector_store import PgvectorVectorStore
+
+
+@pytest.fixture()
+def mock_conn():
+    """
+    Return a mock psycopg2 connection and the cursor it hands out.
+
+    Plain cursor() and cursor(cursor_factory=...) calls yield the same cursor.
+    fetchall() returns no rows; tests set fetchall/fetchone for their own queries.
+    """
+    conn = MagicMock()
+    cursor = MagicMock()
+    conn.cursor.return_value.__enter__ = MagicMock(return_value=cursor)
+    conn.cursor.return_value.__exit__ = MagicMock(return_value=False)
+    cursor.fetchall.return_value = []
+    return conn, cursor
+
+
+@pytest.fixture()
+def pg_store(mock_conn) -> Callable[..., PgvectorVectorStore]:
+    """
+    Return a factory of PgvectorVectorStores on the mock connection.
+
+    Calls made while constructing the store are cleared, so tests only see their own.
+    """
+    conn, cursor = mock_conn
+
+    def create(**kwargs) -> PgvectorVectorStore:
+        options = {"table": "document_chunk", "vector_dims": 3, **kwargs}
+        with patch("app.services.pgvector_store.psycopg2.connect", return_value=conn):
+            store = PgvectorVectorStore(**options)
+        cursor.execute.reset_mock()
+        conn.commit.reset_mock()
+        conn.rollback.reset_mock()
+        return store
+
+    return create
+
+
+@pytest.fixture()
+def executed(mock_conn) -> Callable[[], List[Tuple[str, Optional[tuple]]]]:
+    """Return a function listing (whitespace-normalised SQL, params) of every execute() call."""
+    _, cursor = mock_conn
+
+    def calls() -> List[Tuple[str, Optional[tuple]]]:
+        return [
+            (" ".join(c.args[0].split()), c.args[1] if len(c.args) > 1 else None)
+            for c in cursor.execute.call_args_list
+        ]
+
+    return calls
+
+
+@pytest.fixture()
+def executed_sql(executed) -> Callable[[], List[str]]:
+    """Return a function listing the whitespace-normalised SQL of every execute() call."""
+    return lambda: [sql for sql, _ in executed()]
@@ -0,0 +1,83 @@
+"""
+Unit tests for the AttachmentRegistry used to reuse attachments across decisions.
+"""
+
+import pytest
+
+from app.services.attachment_registry import AttachmentRegistry
+from app.services.chunker import METADATA_HEADER_END, METADATA_HEADER_START
+
+HEADER = f'{METADATA_HEADER_START}\nPäätös: "First" (ID: DEC-1)\n{METADATA_HEADER_END}\n\n'
+
+
+def _chunks(count: int, header: str = HEADER):
+    return [
+        {
+            "chunk_index": i,
+            "text": f"{header}Body {i}",
+            "token_count": 20,
+            "embedding": [0.5, float(i)],
+        }
+        for i in range(count)
+    ]
+
+
+def _register(registry, count=1, **keys):
+    return registry.register("DEC-1", "ATT-1", "model", _chunks(count), **keys)
+
+
+class TestAttachmentRegistry:
+    def test_lookup_by_any_key(self):
+        registry = AttachmentRegistry(max_chunks=10)
+        _register(registry, native_id="ATT-1", file_uri="https://a.test/1.pdf", sha256="abc")
+
+        assert registry.lookup(native_id="ATT-1") is not None
+        assert registry.lookup(file_uri="https://a.test/1.pdf") is not None
+        assert registry.lookup(native_id="ATT-9", sha256="abc") is not None
+        assert registry.lookup(native_id="ATT-9", file_uri="https://a.test/9.pdf") is None
+        assert registry.stats()["hits"] == 3
+        assert registry.stats()["misses"] == 1
+
+    def test_chunks_kept_without_header(self):
+        registry = AttachmentRegistry(max_chunks=10)
+        processed = _register(registry, count=2, sha256="abc")
+
+        assert [chunk.body for chunk in processed.chunks] == ["Body 0", "Body 1"]
+        assert processed.chunks[1].embedding_list == pytest.approx([0.5, 1.0])
+        assert processed.decision_native_id == "DEC-1"
+
+    def test_chunks_without_header_kept_as_is(self):
+        registry = AttachmentRegistry(max_chunks=10)
+        processed = registry.register("DEC-1", "ATT-1", "model", _chunks(1, header=""), sha256="a")
+
+        assert processed.chunks[0].body == "Body 0"
+
+    def test_added_keys_reach_entry(self):
+        registry = AttachmentRegistry(max_chunks=10)
+        processed = _register(registry, sha256="abc")
+
+        registry.add_keys(processed, native_id="ATT-2", file_uri="https://b.test/2.pdf")
+
+        assert registry.lookup(file_uri="https://b.test/2.pdf") is processed
+
+    def test_evicts_least_recently_used_by_chunk_count(self):
+        registry = AttachmentRegistry(max_chunks=4)
+        _register(registry, count=2, native_id="old")
+        _register(registry, count=2, native_id="used")
+        registry.lookup(native_id="old")
+
+        _register(registry, count=2, native_id="new")
+
+        assert registry.lookup(native_id="used") is None
+        assert registry.lookup(native_id="old") is not None
+        assert registry.stats()["chunks"] == 4
+        assert registry.stats()["evictions"] == 1
+
+    def test_disabled_or_oversized_not_registered(self):
+        assert _register(AttachmentRegistry(max_chunks=0), native_id="ATT-1") is None
+        assert AttachmentRegistry(max_chunks=0).lookup(native_id="ATT-1") is None
+
+        registry = AttachmentRegistry(max_chunks=2)
+        assert _register(registry, count=3, native_id="ATT-1") is None
+        assert _register(registry, count=1) is None  # No key to find it by
+        assert registry.stats()["entries"] == 0
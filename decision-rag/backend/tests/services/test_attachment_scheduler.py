@@ -0,0 +1,220 @@
+"""
+Unit tests for the batch-wide AttachmentScheduler.
+"""
+
+import hashlib
+import threading
+import time
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from app.core.config import settings
+from app.schemas.decision import Attachment, DecisionDocument
+from app.services.attachment_scheduler import AttachmentScheduler
+
+
+def _decision(native_id: str, *uris: str) -> DecisionDocument:
+    return DecisionDocument(
+        NativeId=native_id,
+        Attachments=[
+            Attachment(NativeId=f"{native_id}-att{i}", Title=f"Attachment {i}", FileURI=uri)
+            for i, uri in enumerate(uris, start=1)
+        ],
+    )
+
+
+def _downloader(contents=None, on_download=None):
+    """Mock downloader writing each file's content (its URI by default) to the target path."""
+    downloader = Mock()
+    downloader.should_fetch_attachment.return_value = True
+    downloader.attachment_path.side_effect = lambda temp_dir, decision_id, attachment: (
+        temp_dir / f"{decision_id}_{attachment.NativeId}.pdf"
+    )
+
+    def download(file_uri, target_path, title=""):
+        if on_download:
+            on_download(file_uri)
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+        target_path.write_bytes((contents or {}).get(file_uri, file_uri.encode()))
+        return target_path
+
+    downloader.download_attachment.side_effect = download
+    downloader.file_digest.side_effect = lambda path: hashlib.sha256(path.read_bytes()).hexdigest()
+    return downloader
+
+
+@pytest.fixture(autouse=True)
+def download_dir(tmp_path):
+    with patch.object(settings, "ATTACHMENT_DOWNLOAD_DIR", str(tmp_path / "downloads")):
+        yield tmp_path / "downloads"
+
+
+def _processed(decision, attachment, file_path: Path, sha256=None):
+    return {"success": True, "chunks_created": 2, "chunks_indexed": 2}
+
+
+class TestAttachmentScheduler:
+    def test_stats_per_decision_and_temp_dirs_removed(self, download_dir):
+        processed = []
+
+        def process(decision, attachment, file_path, sha256):
+            assert file_path.exists()
+            processed.append(attachment.NativeId)
+            return _processed(decision, attachment, file_path, sha256)
+
+        with AttachmentScheduler(_downloader(), process) as scheduler:
+            scheduler.submit(_decision("D1", "https://a.test/1.pdf", "https://a.test/2.pdf"))
+            scheduler.submit(_decision("D2"))
+            results = scheduler.join()
+
+        assert sorted(processed) == ["D1-att1", "D1-att2"]
+        assert results["D1"] == {
+            "attachments_processed": 2,
+            "chunks_created": 4,
+            "chunks_indexed": 4,
+            "failed": 0,
+        }
+        assert results["D2"]["attachments_processed"] == 0
+        assert not (download_dir / "D1").exists()
+
+    def test_later_decisions_download_while_earlier_ones_process(self):
+        second_downloaded = threading.Event()
+
+        def on_download(file_uri):
+            if file_uri.endswith("/2.pdf"):
+                second_downloaded.set()
+
+        def process(decision, attachment, file_path, sha256):
+            if decision.NativeId == "D1":
+                # D1 only finishes converting once D2's download has happened
+                assert second_downloaded.wait(timeout=5)
+            return _processed(decision, attachment, file_path, sha256)
+
+        with AttachmentScheduler(
+            _downloader(on_download=on_download), process, processing_workers=1
+        ) as scheduler:
+            scheduler.submit(_decision("D1", "https://a.test/1.pdf"))
+            scheduler.submit(_decision("D2", "https://a.test/2.pdf"))
+            results = scheduler.join()
+
+        assert results["D1"]["attachments_processed"] == 1
+        assert results["D2"]["attachments_processed"] == 1
+
+    def test_downloads_limited_per_host(self):
+        active = {"a.test": 0, "b.test": 0}
+        peak = {"a.test": 0, "b.test": 0}
+        lock = threading.Lock()
+
+        def on_download(file_uri):
+            host = file_uri.split("/")[2]
+            with lock:
+                active[host] += 1
+                peak[host] = max(peak[host], active[host])
+            time.sleep(0.05)
+            with lock:
+                active[host] -= 1
+
+        uris = [f"https://{host}/{i}.pdf" for host in ("a.test", "b.test") for i in range(4)]
+        with AttachmentScheduler(
+            _downloader(on_download=on_download), _processed, download_workers=8, per_host=2
+        ) as scheduler:
+            scheduler.submit(_decision("D1", *uris))
+            scheduler.join()
+
+        assert peak == {"a.test": 2, "b.test": 2}
+
+    def test_identical_files_processed_once(self):
+        process = Mock(side_effect=_processed)
+        downloader = _downloader(
+            contents={"https://a.test/1.pdf": b"same", "https://a.test/2.pdf": b"same"}
+        )
+
+        with AttachmentScheduler(downloader, process) as scheduler:
+            scheduler.submit(_decision("D1", "https://a.test/1.pdf", "https://a.test/2.pdf"))
+            results = scheduler.join()
+
+        assert process.call_count == 1
+        assert results["D1"]["attachments_processed"] == 1
+
+    def test_failed_download_and_processing_complete_decision(self):
+        downloader = _downloader()
+        downloader.download_attachment.side_effect = [None, RuntimeError("boom")]
+
+        with AttachmentScheduler(downloader, _processed, download_workers=1) as scheduler:
+            scheduler.submit(_decision("D1", "https://a.test/1.pdf", "https://a.test/2.pdf"))
+            results = scheduler.join()
+
+        assert results["D1"]["attachments_processed"] == 0
+
+    def test_download_digest_passed_to_process(self):
+        process = Mock(side_effect=_processed)
+        downloader = _downloader(contents={"https://a.test/1.pdf": b"body"})
+
+        with AttachmentScheduler(downloader, process) as scheduler:
+            scheduler.submit(_decision("D1", "https://a.test/1.pdf"))
+            scheduler.join()
+
+        assert process.call_args.args[3] == hashlib.sha256(b"body").hexdigest()
+        assert downloader.file_digest.call_count == 1
+
+    def test_in_flight_attachment_shared_by_decisions_processed_once(self):
+        registry = {}
+        started = threading.Event()
+        release = threading.Event()
+
+        def process(decision, attachment, file_path, sha256):
+            started.set()
+            # Hold the attachment in flight until the second decision has asked for it
+            assert release.wait(timeout=5)
+            registry[attachment.FileURI] = decision.NativeId
+            return _processed(decision, attachment, file_path, sha256)
+
+        def reuse(decision, attachment):
+            if attachment.FileURI not in registry:
+                return None
+            return {"success": True, "chunks_created": 0, "chunks_indexed": 2}
+
+        reuse_calls = Mock(side_effect=reuse)
+        downloader = _downloader()
+        with AttachmentScheduler(downloader, process, reuse=reuse_calls) as scheduler:
+            scheduler.submit(_decision("D1", "https://a.test/1.pdf"))
+            assert started.wait(timeout=5)
+            scheduler.submit(_decision("D2", "https://a.test/1.pdf"))
+            while reuse_calls.call_count < 2:
+                time.sleep(0.01)
+            release.set()
+            results = scheduler.join()
+
+        assert downloader.download_attachment.call_count == 1
+        assert registry == {"https://a.test/1.pdf": "D1"}
+        assert results["D2"]["attachments_processed"] == 1
+        assert results["D2"]["chunks_indexed"] == 2
+
+    def test_same_content_in_flight_waited_for(self):
+        contents = {"https://a.test/1.pdf": b"same", "https://b.test/2.pdf": b"same"}
+        release = threading.Event()
+        order = []
+
+        def process(decision, attachment, file_path, sha256):
+            if decision.NativeId == "D1":
+                assert release.wait(timeout=5)
+            order.append(decision.NativeId)
+            return _processed(decision, attachment, file_path, sha256)
+
+        def on_download(file_uri):
+            if file_uri.startswith("https://b.test"):
+                release.set()
+
+        with AttachmentScheduler(
+            _downloader(contents, on_download),
+            process,
+            reuse=lambda decision, attachment: None,
+            download_workers=1,
+        ) as scheduler:
+            scheduler.submit(_decision("D1", "https://a.test/1.pdf"))
+            scheduler.submit(_decision("D2", "https://b.test/2.pdf"))
+            scheduler.join()
+
+        assert order == ["D1", "D2"]
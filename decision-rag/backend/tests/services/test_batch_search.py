@@ -0,0 +1,215 @@
+"""
+Unit tests for batched multi-query search.
+
+Backend and Azure OpenAI clients are mocked; no live service is required.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.services.elasticsearch_store import ElasticsearchVectorStore
+from app.services.embedder import AzureEmbedder
+from app.services.local_vector_store import LocalVectorStore
+from app.services.search_filters import SearchFilter
+from app.services.vector_store import CompositeVectorStore
+
+
+def _hit(chunk_id: str, native_id: str, chunk_index: int = 0, score: float = 1.0) -> dict:
+    return {
+        "_score": score,
+        "_source": {
+            "id": chunk_id,
+            "text": chunk_id,
+            "metadata": {"native_id": native_id, "chunk_index": chunk_index},
+        },
+    }
+
+
+class TestElasticsearchBatch:
+    @pytest.fixture()
+    def client(self):
+        client = MagicMock()
+        client.ping.return_value = True
+        client.indices.exists.return_value = True
+        return client
+
+    @pytest.fixture()
+    def store(self, client):
+        with (
+            patch("app.services.elasticsearch_store.Elasticsearch", return_value=client),
+            patch("app.services.elasticsearch_store.settings.ELASTICSEARCH_SHORTLIST_DIMS", 0),
+        ):
+            return ElasticsearchVectorStore(index_name="decision_documents", vector_dims=2)
+
+    def test_vector_and_hybrid_queries_share_one_msearch(self, client, store):
+        client.msearch.return_value = {
+            "responses": [
+                {"took": 3, "hits": {"hits": [_hit("a_chunk_0", "a")]}},
+                {"took": 4, "hits": {"hits": [_hit("b_chunk_0", "b")]}},
+                {"took": 5, "hits": {"hits": [_hit("b_chunk_0", "b"), _hit("c_chunk_0", "c")]}},
+            ]
+        }
+
+        results = store.search_batch(
+            [
+                {"query_vector": [0.1, 0.2], "top_k": 3},
+                {"query_vector": [0.3, 0.4], "top_k": 2, "query_text": "Diaarinumero"},
+            ]
+        )
+
+        client.msearch.assert_called_once()
+        searches = client.msearch.call_args.kwargs["searches"]
+        assert len(searches) == 6
+        assert searches[1]["size"] == 3 and searches[1]["knn"]["k"] == 3
+        assert searches[3]["query"]["match"]["text"]["query"] == "Diaarinumero"
+        assert [r["chunk_id"] for r in results[0]] == ["a_chunk_0"]
+        assert [r["chunk_id"] for r in results[1]] == ["b_chunk_0", "c_chunk_0"]
+        assert store.last_batch_timings[0] == {"vector_ms": 3}
+        assert store.last_batch_timings[1]["lexical_ms"] == 4
+        assert store.last_batch_timings[1]["vector_ms"] == 5
+
+    def test_neighbours_fetched_in_second_msearch(self, client, store):
+        client.msearch.side_effect = [
+            {
+                "responses": [
+                    {"took": 1, "hits": {"hits": [_hit("a_chunk_1", "a", 1)]}},
+                    {"took": 1, "hits": {"hits": [_hit("b_chunk_0", "b", 0)]}},
+                ]
+            },
+            {
+                "responses": [
+                    {
+                        "hits": {
+                            "hits": [
+                                _hit("a_chunk_0", "a", 0),
+                                _hit("a_chunk_1", "a", 1),
+                                _hit("a_chunk_2", "a", 2),
+                            ]
+                        }
+                    }
+                ]
+            },
+        ]
+
+        results = store.search_batch(
+            [
+                {"query_vector": [0.1, 0.2], "top_k": 1, "neighbours": 1},
+                {"query_vector": [0.3, 0.4], "top_k": 1},
+            ]
+        )
+
+        assert client.msearch.call_count == 2
+        assert len(client.msearch.call_args.kwargs["searches"]) == 2
+        assert results[0][0]["context"] == "a_chunk_0\n\na_chunk_1\n\na_chunk_2"
+        assert "context" not in results[1][0]
+        assert "neighbours_ms" in store.last_batch_timings[0]
+        assert "neighbours_ms" not in store.last_batch_timings[1]
+
+    def test_failed_response_returns_empty_lists(self, client, store):
+        client.msearch.return_value = {"responses": [{"error": {"type": "boom"}}]}
+        assert store.search_batch([{"query_vector": [0.1, 0.2]}]) == [[]]
+
+
+class TestPgvectorBatch:
+    @pytest.fixture()
+    def store(self, pg_store):
+        return pg_store(vector_dims=2, iterative_scan="off")
+
+    @staticmethod
+    def _row(ord: int, chunk_id: str, native_id: str) -> dict:
+        return {
+            "ord": ord,
+            "id": chunk_id,
+            "collection_name": "decisions",
+            "text": chunk_id,
+            "vmetadata": {"native_id": native_id},
+            "score": 0.9,
+        }
+
+    def test_plain_queries_run_as_one_lateral_statement(self, store, mock_conn):
+        _, cursor = mock_conn
+        cursor.fetchall.return_value = [
+            self._row(1, "a_chunk_0", "a"),
+            self._row(2, "b_chunk_0", "b"),
+            self._row(2, "c_chunk_0", "c"),
+        ]
+        search_filter = SearchFilter(is_attachment=False)
+
+        results = store.search_batch(
+            [
+                {"query_vector": [0.1, 0.2], "top_k": 1, "filter_conditions": search_filter},
+                {"query_vector": [0.3, 0.4], "top_k": 2, "filter_conditions": search_filter},
+            ]
+        )
+
+        assert cursor.execute.call_count == 1
+        sql, params = cursor.execute.call_args.args
+        assert "CROSS JOIN LATERAL" in sql and "LIMIT q.k" in sql
+        assert params[:2] == [["[0.1,0.2]", "[0.3,0.4]"], [1, 2]]
+        assert [r["chunk_id"] for r in results[0]] == ["a_chunk_0"]
+        assert [r["chunk_id"] for r in results[1]] == ["b_chunk_0", "c_chunk_0"]
+        assert len(store.last_batch_timings) == 2
+
+    def test_mixed_filters_fall_back_to_one_search_per_query(self, store):
+        with patch.object(store, "search", return_value=[]) as search:
+            store.search_batch(
+                [
+                    {
+                        "query_vector": [0.1, 0.2],
+                        "filter_conditions": SearchFilter(is_attachment=True),
+                    },
+                    {"query_vector": [0.3, 0.4]},
+                ]
+            )
+        assert search.call_count == 2
+
+
+def test_default_batch_runs_searches_in_order(tmp_path):
+    LocalVectorStore._indexes.clear()
+    store = LocalVectorStore(directory=tmp_path / "store", vector_dims=2, dtype="float32")
+    store.bulk_index_chunks(
+        [
+            {
+                "chunk_id": f"{native_id}_chunk_0",
+                "native_id": native_id,
+                "chunk_index": 0,
+                "text": native_id,
+                "embedding": embedding,
+                "metadata": {},
+            }
+            for native_id, embedding in (("a", [1.0, 0.0]), ("b", [0.0, 1.0]))
+        ]
+    )
+
+    results = store.search_batch(
+        [{"query_vector": [0.0, 1.0], "top_k": 1}, {"query_vector": [1.0, 0.0], "top_k": 1}]
+    )
+
+    assert [r[0]["native_id"] for r in results] == ["b", "a"]
+    assert len(store.last_batch_timings) == 2
+    LocalVectorStore._indexes.clear()
+
+
+def test_composite_primary_delegates_batch():
+    primary, secondary = MagicMock(), MagicMock()
+    primary.search_batch.return_value = [[{"chunk_id": "a"}]]
+    primary.last_batch_timings = [{"vector_ms": 1.0}]
+    primary.last_search_timings = {"total_ms": 2.0}
+    composite = CompositeVectorStore([primary, secondary], read_mode="primary")
+
+    assert composite.search_batch([{"query_vector": [0.1]}]) == [[{"chunk_id": "a"}]]
+    assert composite.last_batch_timings == [{"vector_ms": 1.0}]
+    secondary.search_batch.assert_not_called()
+
+
+def test_query_embeddings_in_one_request():
+    with patch("app.services.embedder.AzureOpenAI"):
+        embedder = AzureEmbedder(
+            api_key="key", endpoint="https://example.test", batch_size=100
+        )
+    with patch.object(embedder, "_create_embeddings_batch", return_value=[[0.1], [0.2]]) as batch:
+        embeddings = embedder.create_query_embeddings(["first", " ", "second"])
+
+    batch.assert_called_once_with(["first", "second"])
+    assert embeddings == [[0.1], [], [0.2]]
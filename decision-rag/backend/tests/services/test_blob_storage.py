@@ -49,6 +49,11 @@ class TestBlobName:
         name = saver._build_blob_name(datetime(2024, 3, 1), datetime(2024, 3, 31))
         assert name == "archive/decisions/2024-03-01_2024-03-31.ndjson.gz"
 
+    def test_blob_name_with_label(self):
+        saver = _make_saver()
+        name = saver._build_blob_name(BATCH_START, BATCH_END, "retries")
+        assert name == "raw_responses/2025-01-01_2025-01-07_retries.ndjson.gz"
+
 
 class TestStartBatch:
     def test_start_batch_sets_dates(self):
@@ -68,6 +73,16 @@ class TestStartBatch:
         saver.start_batch(datetime(2025, 1, 8), datetime(2025, 1, 14))
         assert saver._buffer == []
 
+    def test_entries_buffered_after_flush_carry_over(self):
+        saver = _make_saver()
+        saver.start_batch(BATCH_START, BATCH_END)
+        saver.flush_batch()  # Empty batch, nothing uploaded
+
+        # E.g. a retry of the previous batch finishing between batches
+        saver.buffer("late", {"a": 1})
+        saver.start_batch(datetime(2025, 1, 8), datetime(2025, 1, 14))
+        assert [e["native_id"] for e in saver._buffer] == ["late"]
+
 
 class TestBuffer:
     def test_buffer_accumulates_entries(self):
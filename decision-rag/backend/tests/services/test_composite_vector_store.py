@@ -129,6 +129,15 @@ class TestReadOperations:
         assert results[0]["chunk_id"] == "from-primary"
         b2.search.assert_not_called()
 
+    def test_hybrid_search_passes_query_text_and_timings(self, store_pair):
+        composite, b1, _ = store_pair
+        b1.last_search_timings = {"lexical_ms": 3, "vector_ms": 5}
+
+        composite.search([0.1, 0.2], top_k=4, query_text="Diaarinumero")
+
+        b1.search.assert_called_once_with([0.1, 0.2], 4, None, "Diaarinumero", False, 0)
+        assert composite.last_search_timings == {"lexical_ms": 3, "vector_ms": 5}
+
     def test_get_statistics_delegates_to_first_backend(self, store_pair):
         composite, b1, b2 = store_pair
         stats = composite.get_statistics()
@@ -151,8 +160,8 @@ class TestErrorPropagation:
         with pytest.raises(RuntimeError, match="b1 failed"):
             composite.bulk_index_chunks(CHUNKS)
 
-        # b2 should NOT have been called after b1 raised
-        b2.bulk_index_chunks.assert_not_called()
+        # b2 still receives the write; one failing backend does not block the others
+        b2.bulk_index_chunks.assert_called_once_with(CHUNKS, 100)
 
     def test_exception_in_second_backend_propagates(self):
         b1 = _mock_backend("b1")
@@ -169,3 +178,137 @@ class TestErrorPropagation:
         composite.close()
         b1.close.assert_called_once()
         b2.close.assert_called_once()
+
+
+# ---------------------------------------------------------------------------
+# Backend health / lag tracking
+# ---------------------------------------------------------------------------
+
+
+class TestBackendHealth:
+    def test_failed_backend_is_tracked_and_lags(self):
+        b1, b2 = _mock_backend("b1"), _mock_backend("b2")
+        composite = CompositeVectorStore([b1, b2])
+        composite.bulk_index_chunks(CHUNKS)
+
+        b2.bulk_index_chunks.side_effect = ConnectionError("b2 gone")
+        with pytest.raises(ConnectionError):
+            composite.bulk_index_chunks(CHUNKS)
+
+        h1, h2 = composite.get_backend_health()
+        assert (h1["writes"], h1["failed_writes"], h1["lag_seconds"]) == (2, 0, 0.0)
+        assert (h2["writes"], h2["failed_writes"], h2["consecutive_failures"]) == (2, 1, 1)
+        assert h2["last_error"] == "b2 gone"
+        assert h2["lag_seconds"] >= 0
+
+    def test_statistics_include_backend_health(self):
+        composite = CompositeVectorStore([_mock_backend("b1"), _mock_backend("b2")])
+        stats = composite.get_statistics()
+        assert stats["total_chunks"] == 10
+        assert len(stats["backends"]) == 2
+
+
+# ---------------------------------------------------------------------------
+# Parallel read modes
+# ---------------------------------------------------------------------------
+
+
+class TestParallelReads:
+    def test_rejects_unknown_read_mode(self):
+        with pytest.raises(ValueError):
+            CompositeVectorStore([_mock_backend()], read_mode="fastest")
+
+    def test_rrf_merges_results_from_all_backends(self):
+        b1, b2 = _mock_backend("b1"), _mock_backend("b2")
+        b1.search.return_value = [
+            {"chunk_id": "a", "score": 0.9},
+            {"chunk_id": "b", "score": 0.8},
+        ]
+        b2.search.return_value = [
+            {"chunk_id": "b", "score": 0.7},
+            {"chunk_id": "c", "score": 0.6},
+        ]
+        composite = CompositeVectorStore([b1, b2], read_mode="rrf", rrf_k=60)
+
+        results = composite.search([0.1], top_k=3)
+
+        assert [r["chunk_id"] for r in results] == ["b", "a", "c"]
+        assert results[0]["score"] == pytest.approx(1 / 62 + 1 / 61)
+        assert results[0]["vector_score"] == 0.8
+
+    def test_rrf_skips_failing_backend(self):
+        b1, b2 = _mock_backend("b1"), _mock_backend("b2")
+        b1.search.side_effect = ConnectionError("b1 gone")
+        b2.search.return_value = [{"chunk_id": "c", "score": 0.6}]
+        composite = CompositeVectorStore([b1, b2], read_mode="rrf")
+
+        assert [r["chunk_id"] for r in composite.search([0.1])] == ["c"]
+
+    def test_rrf_raises_when_all_backends_fail(self):
+        b1, b2 = _mock_backend("b1"), _mock_backend("b2")
+        b1.search.side_effect = ConnectionError("b1 gone")
+        b2.search.side_effect = ConnectionError("b2 gone")
+        composite = CompositeVectorStore([b1, b2], read_mode="rrf")
+
+        with pytest.raises(ConnectionError, match="b1 gone"):
+            composite.search([0.1])
+
+    def test_first_mode_skips_empty_and_failed_answers(self):
+        b1, b2 = _mock_backend("b1"), _mock_backend("b2")
+        b1.search.return_value = []
+        b2.search.return_value = [{"chunk_id": "from-b2"}]
+        composite = CompositeVectorStore([b1, b2], read_mode="first")
+
+        assert composite.search([0.1]) == [{"chunk_id": "from-b2"}]
+
+
+class _BulkLoadBackend:
+    """Backend with a bulk-load mode taking only the options in its signature."""
+
+    def __init__(self, target, fail=False):
+        self.target = target
+        self.fail = fail
+        self.bulk_load_active = False
+        self.calls = []
+
+    def begin_bulk_load(self, resume=False):
+        if self.fail:
+            raise RuntimeError(f"{self.target} busy")
+        self.calls.append(("begin", resume))
+        self.bulk_load_active = True
+        return self.target
+
+    def end_bulk_load(self, promote=True):
+        self.calls.append(("end", promote))
+        self.bulk_load_active = False
+        return {"rows_loaded": 1}
+
+
+class TestBulkLoad:
+    def test_forwards_supported_options_to_each_backend(self):
+        es, pg = _mock_backend("es"), _BulkLoadBackend("t_staging")
+        es.begin_bulk_load.return_value = "idx-v2"
+        es.bulk_load_active = True
+        composite = CompositeVectorStore([es, pg])
+
+        assert composite.begin_bulk_load(new_index=True, resume=True) == "idx-v2, t_staging"
+        assert composite.bulk_load_active
+        es.begin_bulk_load.assert_called_once_with(new_index=True, resume=True)
+        assert pg.calls == [("begin", True)]
+
+        es.end_bulk_load.return_value = {"speedup": 2.0}
+        report = composite.end_bulk_load(force_merge=True)
+
+        es.end_bulk_load.assert_called_once_with(promote=True, force_merge=True)
+        assert pg.calls[-1] == ("end", True)
+        assert report["backends"]["_BulkLoadBackend"] == {"rows_loaded": 1}
+
+    def test_failed_begin_ends_started_backends_without_promoting(self):
+        first, second = _BulkLoadBackend("a"), _BulkLoadBackend("b", fail=True)
+        composite = CompositeVectorStore([first, second])
+
+        with pytest.raises(RuntimeError, match="b busy"):
+            composite.begin_bulk_load()
+
+        assert first.calls == [("begin", False), ("end", False)]
+        assert not composite.bulk_load_active
@@ -0,0 +1,111 @@
+"""
+Unit tests for token-budgeted context assembly.
+
+Tokens are counted as whitespace-separated words, so no tiktoken download is needed.
+"""
+
+from app.services.context_builder import ContextBuilder, merge_overlapping, split_header
+
+HEADER = "--- Dokumentin konteksti ---\nPäätös: \"Kaava\" (ID: dec-1)\n---"
+
+
+def _words(text: str) -> int:
+    return len(text.split())
+
+
+def _hit(native_id: str, chunk_index: int, body: str, score: float, header: str = HEADER) -> dict:
+    return {
+        "chunk_id": f"{native_id}_chunk_{chunk_index}",
+        "native_id": native_id,
+        "text": f"{header}\n\n{body}" if header else body,
+        "score": score,
+        "metadata": {"chunk_index": chunk_index, "title": "Kaava"},
+    }
+
+
+def test_split_header():
+    assert split_header(f"{HEADER}\n\nBody text") == (HEADER, "Body text")
+    assert split_header("No header here") == ("", "No header here")
+
+
+def test_merge_overlapping_drops_repeated_start():
+    assert merge_overlapping("one two three", "two three four", 5) == "one two three four"
+    assert merge_overlapping("one", "two") == "one\n\ntwo"
+
+
+def test_merge_overlapping_ignores_short_repeats():
+    first = "The board approved the plan."
+    assert merge_overlapping(first, "plan. Next item") == f"{first}\n\nplan. Next item"
+    assert merge_overlapping(first, "plan. Next item", 5) == f"{first} Next item"
+
+
+def test_header_repeated_once_and_adjacent_chunks_merged():
+    hits = [
+        _hit("dec-1", 1, "gamma delta epsilon", 0.9),
+        _hit("dec-1", 0, "alpha beta gamma", 0.8),
+        _hit("dec-1", 3, "omega", 0.7),
+    ]
+
+    result = ContextBuilder(_words, min_overlap=5).build(hits, max_tokens=1000)
+
+    assert result["context"].count("Dokumentin konteksti") == 1
+    assert result["context"] == f"{HEADER}\n\nalpha beta gamma delta epsilon\n\n[...]\n\nomega"
+    (document,) = result["documents"]
+    assert [document.chunk_ids[i] for i in sorted(document.chunk_ids)] == [
+        "dec-1_chunk_0",
+        "dec-1_chunk_1",
+        "dec-1_chunk_3",
+    ]
+
+
+def test_documents_ordered_by_best_score():
+    hits = [
+        _hit("dec-2", 0, "second", 0.5, header="--- Dokumentin konteksti ---\nB\n---"),
+        _hit("dec-1", 0, "first", 0.9),
+    ]
+    result = ContextBuilder(_words).build(hits, max_tokens=1000)
+    assert [d.native_id for d in result["documents"]] == ["dec-1", "dec-2"]
+
+
+def test_budget_skips_hits_that_do_not_fit():
+    hits = [
+        _hit("dec-1", 0, "short", 0.9, header=""),
+        _hit("dec-2", 0, " ".join(["long"] * 50), 0.8, header=""),
+        _hit("dec-3", 0, "tiny", 0.7, header=""),
+    ]
+
+    result = ContextBuilder(_words).build(hits, max_tokens=10)
+
+    assert result["context"] == "short\n\ntiny"
+    assert result["token_count"] == 2
+    assert result["skipped"] == 1
+
+
+def test_token_count_kept_per_document():
+    counted = []
+
+    def counter(text: str) -> int:
+        counted.append(text)
+        return _words(text)
+
+    hits = [
+        _hit("dec-1", 0, "one two", 0.9, header=""),
+        _hit("dec-2", 0, "three", 0.8, header=""),
+        _hit("dec-1", 2, "four five", 0.7, header=""),
+    ]
+
+    result = ContextBuilder(counter).build(hits, max_tokens=1000)
+
+    assert result["token_count"] == _words(result["context"]) == 6
+    # Only the document a hit adds to is counted again
+    assert counted[1:] == ["one two", "three", "one two\n\n[...]\n\nfour five"]
+
+
+def test_neighbour_context_chunks_are_used():
+    hit = _hit("dec-1", 1, "middle", 0.9)
+    hit["context_chunks"] = [
+        {"chunk_id": "dec-1_chunk_0", "chunk_index": 0, "text": f"{HEADER}\n\nbefore"},
+        {"chunk_id": "dec-1_chunk_1", "chunk_index": 1, "text": f"{HEADER}\n\nmiddle"},
+    ]
+    result = ContextBuilder(_words).build([hit], max_tokens=1000)
+    assert result["context"] == f"{HEADER}\n\nbefore\n\nmiddle"
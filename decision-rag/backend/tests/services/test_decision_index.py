@@ -0,0 +1,215 @@
+"""
+Unit tests for the decision-level summary index and two-stage search.
+
+Vector stores are mocked or local; no live service is required.
+"""
+
+from unittest.mock import MagicMock, Mock, patch
+
+import numpy as np
+import pytest
+
+from app.services.decision_index import DecisionSummaryIndex
+from app.services.ingestion_pipeline import IngestionPipeline
+from app.services.local_vector_store import LocalVectorStore
+from app.services.search_filters import FilterCondition, SearchFilter
+
+METADATA = {
+    "native_id": "dec-1",
+    "title": "Asemakaavan muutos",
+    "organization_name": "Kaupunkiympäristölautakunta",
+    "classification_title": "Maankäyttö",
+    "date_decision": "2024-03-05T10:00:00",
+    "source": "Asemakaavan muutos.md",
+}
+
+
+class TestSearchFilterNativeIds:
+    native_filter = SearchFilter(native_ids=["dec-1", "dec-2"])
+
+    def test_condition_matches_decision_and_attachments(self):
+        assert self.native_filter.conditions() == [
+            FilterCondition("decision", "in", ["dec-1", "dec-2"])
+        ]
+
+    def test_elasticsearch_matches_native_or_decision_native_id(self):
+        (clause,) = self.native_filter.to_elasticsearch()["bool"]["filter"]
+        assert clause["bool"]["should"] == [
+            {"terms": {"metadata.native_id": ["dec-1", "dec-2"]}},
+            {"terms": {"metadata.decision_native_id": ["dec-1", "dec-2"]}},
+        ]
+
+    def test_pgvector_uses_promoted_columns(self):
+        sql, params = self.native_filter.to_pgvector({"native_id", "decision_native_id"})
+        assert sql == "(native_id = ANY(%s) OR decision_native_id = ANY(%s))"
+        assert params == [["dec-1", "dec-2"], ["dec-1", "dec-2"]]
+
+    def test_local_store_includes_attachment_chunks(self, tmp_path):
+        LocalVectorStore._indexes.clear()
+        store = LocalVectorStore(directory=tmp_path / "store", vector_dims=2, dtype="float32")
+        store.bulk_index_chunks(
+            [
+                {
+                    "chunk_id": chunk_id,
+                    "native_id": native_id,
+                    "chunk_index": 0,
+                    "text": chunk_id,
+                    "embedding": [1.0, 0.0],
+                    "metadata": metadata,
+                }
+                for chunk_id, native_id, metadata in (
+                    ("dec-1_chunk_0", "dec-1", {}),
+                    ("att_chunk_0", "dec-1_att_a", {"decision_native_id": "dec-1"}),
+                    ("dec-2_chunk_0", "dec-2", {}),
+                )
+            ]
+        )
+
+        results = store.search([1.0, 0.0], filter_conditions=SearchFilter(native_ids="dec-1"))
+
+        assert {r["chunk_id"] for r in results} == {"dec-1_chunk_0", "att_chunk_0"}
+        LocalVectorStore._indexes.clear()
+
+
+class TestDecisionSummaryIndex:
+    @pytest.fixture()
+    def store(self):
+        store = MagicMock()
+        store.index_chunk.return_value = True
+        store.search.return_value = [{"native_id": "dec-1"}, {"native_id": "dec-2"}]
+        return store
+
+    def test_summary_vector_blends_title_and_mean_chunk(self, store):
+        index = DecisionSummaryIndex(store, title_weight=0.5)
+
+        vector = index.summary_vector([1.0, 0.0], [[0.0, 1.0], [0.0, 1.0]])
+
+        assert np.allclose(vector, [2**-0.5, 2**-0.5])
+
+    def test_summary_vector_without_title_embedding(self, store):
+        index = DecisionSummaryIndex(store)
+        assert np.allclose(index.summary_vector([], [[0.0, 2.0]]), [0.0, 1.0])
+
+    def test_index_decision_writes_one_entry(self, store):
+        DecisionSummaryIndex(store).index_decision("dec-1", METADATA, [1.0, 0.0], [[0.0, 1.0]])
+
+        (entry,), _ = store.index_chunk.call_args
+        assert entry["chunk_id"] == "dec-1_decision"
+        assert entry["native_id"] == "dec-1"
+        assert entry["text"] == (
+            "Asemakaavan muutos\nKaupunkiympäristölautakunta\nMaankäyttö\n2024-03-05"
+        )
+        assert entry["metadata"]["is_attachment"] is False
+        assert entry["metadata"]["chunk_count"] == 1
+        assert "source" not in entry["metadata"]
+
+    def test_two_stage_search_restricts_chunks_to_shortlist(self, store):
+        chunk_store = MagicMock()
+        chunk_store.search.return_value = [{"chunk_id": "c1"}]
+        chunk_store.last_search_timings = {"vector_ms": 2.0, "total_ms": 2.0}
+        index = DecisionSummaryIndex(store)
+
+        results = index.two_stage_search(
+            chunk_store,
+            [0.1, 0.2],
+            top_k=5,
+            search_filter=SearchFilter(organizations=["A"], is_attachment=True),
+            shortlist_size=20,
+            collapse=True,
+        )
+
+        assert results == [{"chunk_id": "c1"}]
+        _, size, decision_filter = store.search.call_args.args
+        assert size == 20
+        assert decision_filter.is_attachment is None
+        assert decision_filter.organizations == ["A"]
+        _, top_k, chunk_filter = chunk_store.search.call_args.args
+        assert top_k == 5
+        assert chunk_filter.native_ids == ["dec-1", "dec-2"]
+        assert chunk_filter.is_attachment is True
+        assert chunk_store.search.call_args.kwargs == {"collapse": True}
+        assert set(index.last_search_timings) == {
+            "decision_ms",
+            "chunk_ms",
+            "vector_ms",
+            "total_ms",
+        }
+
+    def test_empty_shortlist_skips_chunk_search(self, store):
+        store.search.return_value = []
+        chunk_store = MagicMock()
+
+        assert DecisionSummaryIndex(store).two_stage_search(chunk_store, [0.1, 0.2]) == []
+        chunk_store.search.assert_not_called()
+
+    def test_sample_titles_from_summary_entries(self, store):
+        store.search.return_value = [
+            {"native_id": "dec-1", "metadata": {"title": "Asemakaavan muutos"}},
+            {"native_id": "dec-2", "metadata": {}},
+        ]
+
+        titles = DecisionSummaryIndex(store).sample_titles(2, dimension=4)
+
+        assert titles == ["Asemakaavan muutos"]
+        probe, size = store.search.call_args.args
+        assert size == 2
+        assert len(probe) == 4
+        assert np.isclose(np.linalg.norm(probe), 1.0)
+
+    def test_benchmark_recall_against_single_stage(self, store):
+        chunk_store = MagicMock()
+        chunk_store.last_search_timings = {}
+
+        def search(vector, top_k, search_filter=None, **kwargs):
+            if search_filter is None:
+                return [{"chunk_id": "a"}, {"chunk_id": "b"}]
+            return [{"chunk_id": "a"}]
+
+        chunk_store.search.side_effect = search
+
+        report = DecisionSummaryIndex(store).benchmark(
+            chunk_store, [[0.1, 0.2]], top_k=2, shortlist_sizes=[10]
+        )
+
+        assert report["single_stage"]["recall"] == 1.0
+        assert report["two_stage_10"]["recall"] == 0.5
+
+
+def test_ingestion_maintains_summary_index():
+    chunk = Mock(chunk_id="dec-1_chunk_0", native_id="dec-1", chunk_index=0, text="t")
+    chunk.token_count = 1
+    chunk.metadata = dict(METADATA)
+    chunker = Mock()
+    chunker.chunk_text.return_value = [chunk]
+    embedder = Mock()
+    embedder.create_embeddings.return_value = [
+        Mock(chunk_id="dec-1_chunk_0", embedding=[0.0, 1.0])
+    ]
+    embedder.create_embedding.return_value = [1.0, 0.0]
+    vector_store = Mock()
+    vector_store.document_exists.return_value = False
+    vector_store.bulk_index_chunks.return_value = {"success": 1, "failed": 0, "errors": []}
+    decision_index = Mock()
+    decision_index.summary_text.return_value = "Asemakaavan muutos"
+    decision_index.index_decision.return_value = True
+    repository = Mock()
+    repository.get_decision.return_value = Mock(
+        Content="<p>x</p>", Title="Asemakaavan muutos", DateDecision=None, Attachments=[]
+    )
+    pipeline = IngestionPipeline(
+        repository=repository,
+        chunker=chunker,
+        embedder=embedder,
+        vector_store=vector_store,
+        decision_index=decision_index,
+    )
+
+    with patch("app.services.ingestion_pipeline.convert_decision_content", return_value="x"):
+        stats = pipeline.process_document("dec-1")
+
+    assert stats["decision_summary_indexed"] is True
+    embedder.create_embedding.assert_called_once_with("Asemakaavan muutos")
+    native_id, _, title_embedding, chunk_embeddings = decision_index.index_decision.call_args.args
+    assert native_id == "dec-1"
+    assert title_embedding == [1.0, 0.0]
+    assert chunk_embeddings == [[0.0, 1.0]]
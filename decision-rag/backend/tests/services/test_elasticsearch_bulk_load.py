@@ -0,0 +1,349 @@
+"""
+Unit tests for ElasticsearchVectorStore bulk-load (backfill) mode.
+
+The Elasticsearch client is mocked; no live cluster is required.
+"""
+
+import json
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.services.elasticsearch_store import ElasticsearchVectorStore
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture()
+def state_files(tmp_path):
+    """Point bulk-load state and indexing stats files into tmp_path."""
+    state_file = tmp_path / "es_bulk_load_state.json"
+    stats_file = tmp_path / "es_indexing_stats.json"
+    with (
+        patch(
+            "app.services.elasticsearch_store.settings.ELASTICSEARCH_BULK_LOAD_STATE_FILE",
+            str(state_file),
+        ),
+        patch(
+            "app.services.elasticsearch_store.settings.ELASTICSEARCH_INDEXING_STATS_FILE",
+            str(stats_file),
+        ),
+    ):
+        yield state_file, stats_file
+
+
+@pytest.fixture()
+def es_client():
+    """Return a mock Elasticsearch client for an existing concrete index."""
+    client = MagicMock()
+    client.ping.return_value = True
+    client.indices.exists.return_value = True
+    client.indices.exists_alias.return_value = False
+    client.indices.get_settings.return_value = {
+        "decision_documents": {
+            "settings": {
+                "index.refresh_interval": "1s",
+                "index.number_of_replicas": "1",
+            }
+        }
+    }
+    return client
+
+
+@pytest.fixture()
+def store(state_files, es_client):
+    """Return an ElasticsearchVectorStore backed by the mock client."""
+    with patch("app.services.elasticsearch_store.Elasticsearch", return_value=es_client):
+        yield ElasticsearchVectorStore(index_name="decision_documents")
+
+
+def _put_settings_bodies(client) -> list:
+    return [c.kwargs["body"]["index"] for c in client.indices.put_settings.call_args_list]
+
+
+# ---------------------------------------------------------------------------
+# begin / end
+# ---------------------------------------------------------------------------
+
+
+class TestBulkLoadMode:
+    def test_begin_disables_refresh_and_replicas(self, store, es_client, state_files):
+        state_file, _ = state_files
+
+        target = store.begin_bulk_load()
+
+        assert target == "decision_documents"
+        assert store.bulk_load_active
+        assert _put_settings_bodies(es_client) == [
+            {"refresh_interval": "-1", "number_of_replicas": 0}
+        ]
+        state = json.loads(state_file.read_text())
+        assert state["original_settings"]["decision_documents"] == {
+            "index.refresh_interval": "1s",
+            "index.number_of_replicas": "1",
+        }
+
+    def test_begin_twice_raises(self, store):
+        store.begin_bulk_load()
+        with pytest.raises(RuntimeError):
+            store.begin_bulk_load()
+
+    def test_begin_refuses_live_load_of_another_process(self, store, es_client, state_files):
+        state_file, _ = state_files
+        state_file.write_text(
+            json.dumps(
+                {
+                    "index_name": "decision_documents",
+                    "target_index": "decision_documents",
+                    "original_settings": {},
+                    "heartbeat": time.time(),
+                    "pid": 1,
+                }
+            )
+        )
+
+        with pytest.raises(RuntimeError, match="another process"):
+            store.begin_bulk_load()
+
+        es_client.indices.put_settings.assert_not_called()
+        assert json.loads(state_file.read_text())["pid"] == 1
+
+    def test_heartbeat_refreshed_without_bulk_requests(self, store, state_files):
+        state_file, _ = state_files
+        with patch(
+            "app.services.elasticsearch_store.settings.ELASTICSEARCH_BULK_LOAD_STALE_SECONDS", 3
+        ):
+            store.begin_bulk_load()
+        first = json.loads(state_file.read_text())["heartbeat"]
+
+        time.sleep(1.3)
+
+        assert json.loads(state_file.read_text())["heartbeat"] > first
+        store.end_bulk_load()
+        assert not state_file.exists()
+
+    def test_concurrent_state_writes_do_not_collide(self, store, state_files):
+        store.begin_bulk_load()
+        errors = []
+
+        def write():
+            for _ in range(50):
+                try:
+                    store._write_bulk_load_state()
+                except Exception as e:
+                    errors.append(e)
+
+        threads = [threading.Thread(target=write) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert json.loads(state_files[0].read_text())["index_name"] == "decision_documents"
+        assert [p.name for p in state_files[0].parent.iterdir() if p.name.startswith(".")] == []
+
+    def test_end_restores_settings_and_clears_state(self, store, es_client, state_files):
+        state_file, _ = state_files
+        store.begin_bulk_load()
+
+        store.end_bulk_load()
+
+        assert not store.bulk_load_active
+        assert not state_file.exists()
+        es_client.indices.refresh.assert_called_once_with(index="decision_documents")
+        es_client.indices.forcemerge.assert_not_called()
+        assert _put_settings_bodies(es_client)[-1] == {
+            "refresh_interval": "1s",
+            "number_of_replicas": "1",
+        }
+
+    def test_force_merge_runs_before_replicas_are_restored(self, store, es_client):
+        store.begin_bulk_load()
+
+        store.end_bulk_load(force_merge=True)
+
+        call_names = [c[0] for c in es_client.indices.method_calls]
+        assert call_names.index("forcemerge") < len(call_names) - 1 - call_names[::-1].index(
+            "put_settings"
+        )
+        assert es_client.indices.forcemerge.call_args.kwargs["max_num_segments"] == 1
+
+    def test_context_manager_restores_settings_on_error(self, store, es_client):
+        with pytest.raises(ValueError):
+            with store.bulk_load_mode(force_merge=True):
+                raise ValueError("boom")
+
+        assert not store.bulk_load_active
+        es_client.indices.forcemerge.assert_not_called()
+        assert _put_settings_bodies(es_client)[-1]["refresh_interval"] == "1s"
+
+    def test_writes_go_to_write_index(self, store):
+        store.begin_bulk_load()
+        with patch("app.services.elasticsearch_store.helpers.bulk", return_value=(1, [])) as bulk:
+            store.bulk_index_chunks(
+                [
+                    {
+                        "chunk_id": "n1_chunk_0",
+                        "native_id": "n1",
+                        "chunk_index": 0,
+                        "text": "t",
+                        "embedding": [0.1],
+                        "metadata": {},
+                    }
+                ]
+            )
+
+        actions = list(bulk.call_args.args[1])
+        assert actions[0]["_index"] == "decision_documents"
+
+
+# ---------------------------------------------------------------------------
+# Alias swap
+# ---------------------------------------------------------------------------
+
+
+class TestBulkLoadNewIndex:
+    @pytest.fixture()
+    def alias_client(self, es_client):
+        es_client.indices.exists_alias.return_value = True
+        es_client.indices.get_alias.return_value = {"decision_documents_v1": {}}
+        es_client.indices.get_settings.side_effect = lambda index, **_: {
+            index: {"settings": {"index.refresh_interval": None, "index.number_of_replicas": "1"}}
+        }
+        es_client.reindex.return_value = {"created": 3, "failures": []}
+        return es_client
+
+    def test_new_index_is_built_and_alias_swapped(self, store, alias_client):
+        target = store.begin_bulk_load(new_index=True)
+
+        assert target.startswith("decision_documents_")
+        assert store.write_index == target
+        alias_client.indices.create.assert_called_once()
+
+        store.end_bulk_load()
+
+        actions = alias_client.indices.update_aliases.call_args.kwargs["body"]["actions"]
+        assert {"remove": {"index": "decision_documents_v1", "alias": "decision_documents"}} in actions
+        assert {"add": {"index": target, "alias": "decision_documents"}} in actions
+        assert store.write_index == "decision_documents"
+
+    def test_new_index_seeded_from_current_index(self, store, alias_client):
+        target = store.begin_bulk_load(new_index=True)
+
+        body = alias_client.reindex.call_args.kwargs["body"]
+        assert body == {"source": {"index": "decision_documents_v1"}, "dest": {"index": target}}
+        settings_call = alias_client.indices.put_settings.call_args_list[0]
+        assert settings_call.kwargs["body"]["index"]["refresh_interval"] == "-1"
+
+    def test_new_index_left_empty_without_copy(self, store, alias_client):
+        store.begin_bulk_load(new_index=True, copy_existing=False)
+
+        alias_client.reindex.assert_not_called()
+
+    def test_failed_copy_leaves_bulk_load_and_alias(self, store, alias_client):
+        alias_client.reindex.return_value = {"created": 0, "failures": [{"cause": "x"}]}
+
+        with pytest.raises(RuntimeError):
+            store.begin_bulk_load(new_index=True)
+
+        assert not store.bulk_load_active
+        assert store.write_index == "decision_documents"
+        alias_client.indices.update_aliases.assert_not_called()
+
+    def test_failed_load_does_not_swap_alias(self, store, alias_client):
+        with pytest.raises(ValueError):
+            with store.bulk_load_mode(new_index=True):
+                raise ValueError("boom")
+
+        alias_client.indices.update_aliases.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# Crash recovery
+# ---------------------------------------------------------------------------
+
+
+class TestBulkLoadRecovery:
+    def _write_state(self, state_file, heartbeat):
+        state_file.write_text(
+            json.dumps(
+                {
+                    "index_name": "decision_documents",
+                    "target_index": "decision_documents",
+                    "previous_indices": [],
+                    "original_settings": {
+                        "decision_documents": {
+                            "index.refresh_interval": "5s",
+                            "index.number_of_replicas": "2",
+                        }
+                    },
+                    "started_at": "2025-01-01T00:00:00+00:00",
+                    "heartbeat": heartbeat,
+                }
+            )
+        )
+
+    def test_stale_state_is_restored_on_init(self, state_files, es_client):
+        state_file, _ = state_files
+        self._write_state(state_file, heartbeat=time.time() - 10_000)
+
+        with patch("app.services.elasticsearch_store.Elasticsearch", return_value=es_client):
+            ElasticsearchVectorStore(index_name="decision_documents")
+
+        assert _put_settings_bodies(es_client) == [
+            {"refresh_interval": "5s", "number_of_replicas": "2"}
+        ]
+        assert not state_file.exists()
+
+    def test_live_state_is_left_alone_on_init(self, state_files, es_client):
+        state_file, _ = state_files
+        self._write_state(state_file, heartbeat=time.time())
+
+        with patch("app.services.elasticsearch_store.Elasticsearch", return_value=es_client):
+            ElasticsearchVectorStore(index_name="decision_documents")
+
+        es_client.indices.put_settings.assert_not_called()
+        assert state_file.exists()
+
+    def test_restore_bulk_load_settings_forces_recovery(self, store, es_client, state_files):
+        state_file, _ = state_files
+        self._write_state(state_file, heartbeat=time.time())
+
+        assert store.restore_bulk_load_settings() is True
+        assert not state_file.exists()
+
+
+# ---------------------------------------------------------------------------
+# Throughput report
+# ---------------------------------------------------------------------------
+
+
+class TestIndexingReport:
+    def test_report_splits_modes_and_computes_speedup(self, store):
+        store._record_indexing_throughput(100, 10.0)
+        store.begin_bulk_load()
+        store._record_indexing_throughput(100, 2.0)
+
+        report = store.end_bulk_load()
+
+        assert report["normal"]["chunks_per_second"] == 10.0
+        assert report["bulk_load"]["chunks_per_second"] == 50.0
+        assert report["speedup"] == 5.0
+
+    def test_totals_persist_across_instances(self, store, es_client, state_files):
+        _, stats_file = state_files
+        store._record_indexing_throughput(40, 4.0)
+        store.close()
+
+        assert json.loads(stats_file.read_text())["normal"]["chunks"] == 40
+
+        with patch("app.services.elasticsearch_store.Elasticsearch", return_value=es_client):
+            other = ElasticsearchVectorStore(index_name="decision_documents")
+        other._record_indexing_throughput(10, 1.0)
+
+        assert other.get_indexing_report()["normal"]["chunks"] == 50
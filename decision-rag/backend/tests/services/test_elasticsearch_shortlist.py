@@ -0,0 +1,144 @@
+"""
+Unit tests for the Matryoshka shortlist field in ElasticsearchVectorStore.
+
+The Elasticsearch client is mocked; no live cluster is required.
+"""
+
+import math
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.services.elasticsearch_store import ElasticsearchVectorStore
+
+
+@pytest.fixture()
+def es_client():
+    client = MagicMock()
+    client.ping.return_value = True
+    client.indices.exists.return_value = True
+    client.indices.get_mapping.return_value = {
+        "decision_documents": {"mappings": {"properties": {"vector_short": {}}}}
+    }
+    client.search.return_value = {"hits": {"hits": []}}
+    return client
+
+
+def _store(es_client, shortlist_dims=2, index_full_vector=True) -> ElasticsearchVectorStore:
+    with (
+        patch("app.services.elasticsearch_store.Elasticsearch", return_value=es_client),
+        patch("app.services.elasticsearch_store.settings.ELASTICSEARCH_SHORTLIST_DIMS", shortlist_dims),
+        patch(
+            "app.services.elasticsearch_store.settings.ELASTICSEARCH_INDEX_FULL_VECTOR",
+            index_full_vector,
+        ),
+    ):
+        return ElasticsearchVectorStore(index_name="decision_documents", vector_dims=4)
+
+
+CHUNK = {
+    "chunk_id": "n1_chunk_0",
+    "native_id": "n1",
+    "chunk_index": 0,
+    "text": "t",
+    "embedding": [3.0, 4.0, 1.0, 1.0],
+    "metadata": {},
+}
+
+
+class TestShortlistMapping:
+    def test_disabled_by_default(self, es_client):
+        store = _store(es_client, shortlist_dims=0)
+        assert "vector_short" not in store._build_index_body()["mappings"]["properties"]
+
+    def test_mapping_adds_shortlist_field(self, es_client):
+        store = _store(es_client)
+        properties = store._build_index_body()["mappings"]["properties"]
+        assert properties["vector_short"]["dims"] == 2
+        assert properties["vector_short"]["similarity"] == "dot_product"
+        assert properties["vector"]["index"] is True
+
+    def test_full_vector_can_skip_hnsw(self, es_client):
+        store = _store(es_client, index_full_vector=False)
+        vector = store._build_index_body()["mappings"]["properties"]["vector"]
+        assert vector == {"type": "dense_vector", "dims": 4, "index": False}
+
+    def test_missing_field_is_added_to_existing_index(self, es_client):
+        es_client.indices.get_mapping.return_value = {
+            "decision_documents": {"mappings": {"properties": {"vector": {}}}}
+        }
+        _store(es_client)
+        body = es_client.indices.put_mapping.call_args.kwargs["body"]
+        assert body["properties"]["vector_short"]["dims"] == 2
+
+    def test_shortlist_must_be_smaller_than_embedding(self, es_client):
+        with pytest.raises(ValueError):
+            _store(es_client, shortlist_dims=4)
+
+
+class TestShortlistWrites:
+    def test_shortlist_vector_is_truncated_and_renormalised(self, es_client):
+        store = _store(es_client)
+        assert store._shortlist_vector([3.0, 4.0, 1.0, 1.0]) == [0.6, 0.8]
+
+    def test_bulk_index_writes_shortlist_vector(self, es_client):
+        store = _store(es_client)
+        with patch("app.services.elasticsearch_store.helpers.bulk", return_value=(1, [])) as bulk:
+            store.bulk_index_chunks([dict(CHUNK, metadata={})])
+
+        source = list(bulk.call_args.args[1])[0]["_source"]
+        assert source["vector_short"] == [0.6, 0.8]
+        assert source["vector"] == [3.0, 4.0, 1.0, 1.0]
+
+    def test_index_chunk_writes_shortlist_vector(self, es_client):
+        store = _store(es_client)
+        store.index_chunk(dict(CHUNK, metadata={}))
+        assert es_client.index.call_args.kwargs["document"]["vector_short"] == [0.6, 0.8]
+
+
+class TestShortlistSearch:
+    def test_plain_knn_without_shortlist(self, es_client):
+        store = _store(es_client, shortlist_dims=0)
+        store.search([0.1, 0.2, 0.3, 0.4], top_k=5)
+        body = es_client.search.call_args.kwargs["body"]
+        assert body["knn"]["field"] == "vector"
+        assert "rescore" not in body
+
+    def test_shortlist_knn_is_rescored_on_full_vector(self, es_client):
+        store = _store(es_client)
+        query = [3.0, 4.0, 1.0, 1.0]
+
+        store.search(query, top_k=4, filter_conditions={"term": {"metadata.section": "1"}})
+
+        body = es_client.search.call_args.kwargs["body"]
+        assert body["knn"]["field"] == "vector_short"
+        assert body["knn"]["k"] == 20
+        assert body["knn"]["query_vector"] == [0.6, 0.8]
+        assert body["knn"]["filter"] == {"term": {"metadata.section": "1"}}
+        rescore = body["rescore"]
+        assert rescore["window_size"] == 20
+        script = rescore["query"]["rescore_query"]["script_score"]["script"]
+        assert "'vector'" in script["source"]
+        assert script["params"]["query_vector"] == query
+        assert rescore["query"]["query_weight"] == 0.0
+
+
+def hits(*ids) -> dict:
+    return {"hits": {"hits": [{"_id": i} for i in ids]}}
+
+
+class TestShortlistBenchmark:
+    def test_recall_against_exact_scan(self, es_client):
+        store = _store(es_client)
+        es_client.search.side_effect = [
+            {"hits": {"hits": [{"_source": {"vector": [1.0, 0.0, 0.0, 0.0]}}]}},
+            hits("a", "b"),  # exact
+            hits("a", "b"),  # full kNN
+            hits("a", "c"),  # shortlist x2
+        ]
+
+        report = store.benchmark_shortlist(sample_size=1, top_k=2, oversampling_factors=[2])
+
+        assert report["exact"]["recall"] == 1.0
+        assert report["full_knn"]["recall"] == 1.0
+        assert math.isclose(report["shortlist_x2"]["recall"], 0.5)
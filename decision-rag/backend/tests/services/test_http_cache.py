@@ -0,0 +1,144 @@
+"""
+Unit tests for the on-disk HTTPCache and its use by the API client and attachment downloader.
+"""
+
+import json
+from unittest.mock import Mock
+
+import httpx
+import pytest
+
+from app.core.config import settings
+from app.services.api_client import DecisionAPIClient
+from app.services.attachment_downloader import AttachmentDownloader
+from app.services.http_cache import HTTPCache
+from app.services.rate_limiter import RateLimiter
+
+URL = "https://example.com/file.pdf"
+
+
+@pytest.fixture()
+def cache(tmp_path):
+    return HTTPCache(directory=str(tmp_path / "cache"), max_size_mb=1)
+
+
+def _response(status_code=200, content=b"", headers=None):
+    response = Mock()
+    response.status_code = status_code
+    response.content = content
+    response.headers = httpx.Headers(headers or {})
+    response.json = Mock(side_effect=lambda: json.loads(content))
+    response.raise_for_status = Mock()
+    return response
+
+
+class TestHTTPCache:
+    def test_store_and_conditional_headers(self, cache):
+        cache.store(URL, b"body", httpx.Headers({"ETag": '"v1"', "Last-Modified": "Mon"}))
+
+        entry = cache.lookup(URL)
+
+        assert cache.read(entry) == b"body"
+        assert HTTPCache.conditional_headers(entry) == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Mon",
+        }
+        assert HTTPCache.conditional_headers(None) == {}
+
+    def test_identical_bodies_stored_once(self, cache):
+        cache.store("https://a.test/1.pdf", b"same", {})
+        cache.store("https://b.test/2.pdf", b"same", {})
+
+        stats = cache.stats()
+        assert stats["entries"] == 2
+        assert stats["objects"] == 1
+
+    def test_entries_survive_restart(self, cache):
+        cache.store(URL, b"body", {"etag": '"v1"'})
+
+        reopened = HTTPCache(directory=str(cache.directory), max_size_mb=1)
+
+        assert reopened.lookup(URL).etag == '"v1"'
+
+    def test_size_cap_evicts_least_recently_used(self, cache):
+        cache.max_bytes = 10
+        cache.store("https://a.test/old", b"x" * 6, {})
+        cache.store("https://a.test/new", b"y" * 6, {})
+
+        assert cache.lookup("https://a.test/old") is None
+        assert cache.lookup("https://a.test/new") is not None
+        assert cache.stats()["evictions"] == 1
+        assert len([p for p in (cache.directory / "objects").rglob("*") if p.is_file()]) == 1
+
+    def test_changed_body_replaces_old_object(self, cache):
+        cache.store(URL, b"v1", {})
+        old = cache.lookup(URL)
+        cache.store(URL, b"v2", {})
+
+        assert not cache.object_path(old.sha256).exists()
+        assert cache.read(cache.lookup(URL)) == b"v2"
+
+    def test_shared_body_kept_until_last_entry_goes(self, cache):
+        cache.store("https://a.test/1.pdf", b"same", {})
+        cache.store("https://b.test/2.pdf", b"same", {})
+        shared = cache.lookup("https://a.test/1.pdf").sha256
+
+        cache.store("https://a.test/1.pdf", b"other", {})
+        assert cache.object_path(shared).exists()
+        assert cache.stats()["size_mb"] == round(9 / (1024 * 1024), 2)
+
+        cache.store("https://b.test/2.pdf", b"other", {})
+        assert not cache.object_path(shared).exists()
+        assert cache.stats()["objects"] == 1
+        assert cache._total_bytes == 5
+
+    def test_running_total_restored_on_restart(self, cache):
+        cache.store("https://a.test/1.pdf", b"same", {})
+        cache.store("https://b.test/2.pdf", b"same", {})
+        cache.store("https://c.test/3.pdf", b"different", {})
+
+        reopened = HTTPCache(directory=str(cache.directory), max_size_mb=1)
+
+        assert reopened._total_bytes == cache._total_bytes == 13
+        assert reopened.stats()["objects"] == 2
+
+
+class TestCachedRequests:
+    def test_api_client_revalidates_cached_document(self, cache, monkeypatch):
+        monkeypatch.setattr(settings, "API_BASE_URL", "https://api.test")
+        monkeypatch.setattr(settings, "DECISION_DOCUMENT_ENDPOINT", "/decisions/{native_id}")
+        client = DecisionAPIClient(limiter=RateLimiter(rate=1000.0, burst=100), http_cache=cache)
+        client.client = Mock()
+        client.client.get.side_effect = [
+            _response(content=b'{"NativeId": "a", "Title": "T"}', headers={"ETag": '"v1"'}),
+            _response(status_code=304),
+        ]
+
+        first = client.fetch_decision_document("a", "key")
+        second = client.fetch_decision_document("a", "key")
+
+        assert first.Title == second.Title == "T"
+        assert client.client.get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+        assert cache.stats()["revalidated"] == 1
+
+    def test_downloader_copies_unchanged_attachment_from_cache(self, cache, tmp_path):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if "if-modified-since" in request.headers:
+                return httpx.Response(304)
+            return httpx.Response(200, content=b"PDF", headers={"Last-Modified": "Mon"})
+
+        downloader = AttachmentDownloader(
+            limiter=RateLimiter(rate=1000.0, burst=100), http_cache=cache
+        )
+        downloader.client = httpx.Client(transport=httpx.MockTransport(handler))
+
+        downloader.download_attachment(URL, tmp_path / "first.pdf")
+        result = downloader.download_attachment(URL, tmp_path / "second.pdf")
+
+        assert result.read_bytes() == b"PDF"
+        assert requests[1].headers["if-modified-since"] == "Mon"
+        assert cache.stats()["revalidated"] == 1
+        assert cache.lookup(URL).sha256 == downloader._file_digests[tmp_path / "first.pdf"]
@@ -0,0 +1,154 @@
+"""
+Unit tests for hybrid (full-text + vector) search.
+
+Elasticsearch and PostgreSQL clients are mocked; no live service is required.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.services.elasticsearch_store import ElasticsearchVectorStore
+from app.services.search_filters import SearchFilter
+from app.services.vector_store import reciprocal_rank_fusion
+
+
+def _hit(chunk_id: str, score: float) -> dict:
+    return {
+        "_score": score,
+        "_source": {"id": chunk_id, "text": chunk_id, "metadata": {"native_id": "n"}},
+    }
+
+
+class TestReciprocalRankFusion:
+    def test_leg_ranks_and_scores_are_recorded(self):
+        lexical = [{"chunk_id": "a", "score": 12.0}, {"chunk_id": "b", "score": 8.0}]
+        vector = [{"chunk_id": "b", "score": 0.9}, {"chunk_id": "c", "score": 0.8}]
+
+        fused = reciprocal_rank_fusion(
+            [lexical, vector], top_k=3, rrf_k=60, leg_names=["lexical", "vector"]
+        )
+
+        assert [r["chunk_id"] for r in fused] == ["b", "a", "c"]
+        assert fused[0]["score"] == pytest.approx(1 / 62 + 1 / 61)
+        assert fused[0]["lexical_rank"] == 2 and fused[0]["vector_rank"] == 1
+        assert fused[0]["vector_score"] == 0.9
+        assert "vector_rank" not in fused[1]
+
+
+class TestElasticsearchHybrid:
+    @pytest.fixture()
+    def client(self):
+        client = MagicMock()
+        client.ping.return_value = True
+        client.indices.exists.return_value = True
+        client.msearch.return_value = {
+            "responses": [
+                {"took": 4, "hits": {"hits": [_hit("a", 11.0), _hit("b", 7.0)]}},
+                {"took": 9, "hits": {"hits": [_hit("b", 0.9)]}},
+            ]
+        }
+        return client
+
+    @pytest.fixture()
+    def store(self, client):
+        with (
+            patch("app.services.elasticsearch_store.Elasticsearch", return_value=client),
+            patch("app.services.elasticsearch_store.settings.ELASTICSEARCH_SHORTLIST_DIMS", 0),
+            patch("app.services.elasticsearch_store.settings.HYBRID_SEARCH_WINDOW", 20),
+        ):
+            yield ElasticsearchVectorStore(index_name="decision_documents", vector_dims=3)
+
+    def test_both_legs_in_one_msearch(self, store, client):
+        search_filter = SearchFilter(is_attachment=False)
+
+        results = store.search(
+            [0.1, 0.2, 0.3], top_k=2, filter_conditions=search_filter, query_text="HEL 2024-000123"
+        )
+
+        client.search.assert_not_called()
+        header, lexical, _, vector = client.msearch.call_args.kwargs["searches"]
+        assert header == {}
+        assert lexical["query"]["bool"]["must"] == [
+            {"match": {"text": {"query": "HEL 2024-000123"}}}
+        ]
+        assert lexical["query"]["bool"]["filter"] == [search_filter.to_elasticsearch()]
+        assert lexical["size"] == 20
+        assert vector["knn"]["k"] == 20
+        assert vector["knn"]["filter"] == search_filter.to_elasticsearch()
+        assert vector["_source"] == {"excludes": ["vector", "vector_short"]}
+        assert [r["chunk_id"] for r in results] == ["b", "a"]
+
+    def test_per_leg_timings(self, store):
+        store.search([0.1, 0.2, 0.3], top_k=2, query_text="kaavoitus")
+
+        timings = store.last_search_timings
+        assert timings["lexical_ms"] == 4
+        assert timings["vector_ms"] == 9
+        assert timings["fusion_ms"] >= 0
+        assert timings["total_ms"] >= 0
+
+    def test_failed_leg_returns_no_results(self, store, client):
+        client.msearch.return_value = {
+            "responses": [{"error": {"type": "query_shard_exception"}}, {"hits": {"hits": []}}]
+        }
+        assert store.search([0.1, 0.2, 0.3], query_text="x") == []
+
+    def test_text_field_uses_finnish_analyzer(self, store):
+        mapping = store._build_index_body()["mappings"]["properties"]["text"]
+        assert mapping == {"type": "text", "analyzer": "finnish"}
+
+
+class TestPgvectorHybrid:
+    @pytest.fixture(autouse=True)
+    def fused_rows(self, mock_conn):
+        _, cursor = mock_conn
+        cursor.fetchall.return_value = [
+            {
+                "id": "c1",
+                "collection_name": "decisions",
+                "text": "t",
+                "vmetadata": {"native_id": "n1"},
+                "score": 0.032,
+                "lexical_rank": 1,
+                "vector_rank": None,
+            }
+        ]
+
+    def test_single_statement_fuses_both_legs(self, mock_conn, pg_store):
+        _, cursor = mock_conn
+        store = pg_store()
+        with patch("app.services.pgvector_store.settings.HYBRID_SEARCH_WINDOW", 30):
+            results = store.search(
+                [0.1, 0.2, 0.3],
+                top_k=5,
+                filter_conditions=SearchFilter(is_attachment=True),
+                query_text="Diaarinumero HEL 2024-000123",
+            )
+
+        assert cursor.execute.call_count == 1
+        sql, params = cursor.execute.call_args.args
+        sql = " ".join(sql.split())
+        assert "websearch_to_tsquery('finnish', %s) query" in sql
+        assert (
+            "WHERE to_tsvector('finnish', coalesce(text, '')) @@ query AND "
+            "((vmetadata->>'is_attachment')::boolean) = %s"
+        ) in sql
+        assert "FULL OUTER JOIN lexical_leg" in sql
+        query = "[0.1,0.2,0.3]"
+        assert params == [
+            query, True, query, 30, "Diaarinumero HEL 2024-000123", True, 30, 60, 60, 5
+        ]
+        assert results[0]["lexical_rank"] == 1
+        assert results[0]["vector_rank"] is None
+        assert store.last_search_timings["total_ms"] >= 0
+
+    def test_create_text_search_index_matches_query_expression(self, mock_conn, pg_store):
+        _, cursor = mock_conn
+
+        pg_store().create_text_search_index()
+
+        assert cursor.execute.call_args.args[0] == (
+            "CREATE INDEX IF NOT EXISTS document_chunk_text_tsv_idx ON document_chunk "
+            "USING gin ((to_tsvector('finnish', coalesce(text, ''))));"
+        )
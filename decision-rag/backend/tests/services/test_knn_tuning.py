@@ -0,0 +1,138 @@
+"""
+Unit tests for recall-driven kNN candidate tuning.
+
+Backend clients are mocked; no live service is required.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.services.elasticsearch_store import ElasticsearchVectorStore
+from app.services.knn_tuning import KnnTuning, summarize_runs, tune_candidates
+
+
+class TestKnnTuning:
+    def test_untuned_key_returns_none(self, tmp_path):
+        assert KnnTuning(str(tmp_path / "knn_tuning.json")).candidates("es:idx", 10) is None
+
+    def test_lookup_uses_next_larger_top_k_and_scales_beyond(self, tmp_path):
+        path = str(tmp_path / "knn_tuning.json")
+        KnnTuning(path).save("es:idx", {10: 40, 50: 150}, target_recall=0.95)
+        tuning = KnnTuning(path)
+
+        assert tuning.candidates("es:idx", 10) == 40
+        assert tuning.candidates("es:idx", 5) == 40
+        assert tuning.candidates("es:idx", 20) == 150
+        assert tuning.candidates("es:idx", 100) == 300
+        assert tuning.candidates("pg:table", 10) is None
+
+    def test_save_keeps_other_keys_and_is_seen_by_readers(self, tmp_path):
+        path = str(tmp_path / "knn_tuning.json")
+        reader = KnnTuning(path)
+        KnnTuning(path).save("es:idx", {10: 40}, target_recall=0.9)
+        KnnTuning(path).save("pg:table", {10: 20}, target_recall=0.9)
+
+        assert reader.candidates("es:idx", 10) == 40
+        assert reader.candidates("pg:table", 10) == 20
+
+
+def test_tune_candidates_picks_smallest_reaching_target():
+    truth = ["a", "b", "c", "d"]
+
+    def approximate(query, k, candidates):
+        # Recall grows with the candidate count
+        return truth[: min(k, candidates // 5)]
+
+    report = tune_candidates(
+        queries=[None, None],
+        exact=lambda query, k: truth[:k],
+        approximate=approximate,
+        top_k_values=[2, 4],
+        factors=[1, 5, 10],
+        target_recall=1.0,
+        max_candidates=30,
+    )
+
+    assert report["chosen"] == {2: 10, 4: 20}
+    assert report["top_k_2"]["x1"]["recall"] == 0.0
+    assert report["top_k_4"]["x10"]["candidates"] == 30
+
+
+def test_tune_candidates_falls_back_to_largest():
+    report = tune_candidates(
+        [None],
+        exact=lambda query, k: ["a"],
+        approximate=lambda query, k, candidates: [],
+        top_k_values=[1],
+        factors=[1, 2],
+        target_recall=0.9,
+        max_candidates=100,
+    )
+    assert report["chosen"] == {1: 2}
+
+
+def test_summarize_runs_reports_mean_recall_and_percentiles():
+    latencies = [float(ms) for ms in range(20, 0, -1)]
+
+    summary = summarize_runs(latencies, [1.0, 0.5] * 10)
+
+    assert summary == {"recall": 0.75, "p50_ms": 11.0, "p95_ms": 20.0}
+    assert latencies[0] == 20.0
+
+
+class TestElasticsearchNumCandidates:
+    @pytest.fixture()
+    def store(self, tmp_path):
+        client = MagicMock()
+        client.ping.return_value = True
+        client.indices.exists.return_value = True
+        with (
+            patch("app.services.elasticsearch_store.Elasticsearch", return_value=client),
+            patch("app.services.elasticsearch_store.settings.ELASTICSEARCH_SHORTLIST_DIMS", 0),
+        ):
+            store = ElasticsearchVectorStore(index_name="decision_documents", vector_dims=2)
+        store.knn_tuning = KnnTuning(str(tmp_path / "knn_tuning.json"))
+        return store
+
+    def test_default_is_ten_per_result(self, store):
+        assert store._build_search_body([0.1, 0.2], 5)["knn"]["num_candidates"] == 50
+
+    def test_tuned_value_applied_per_top_k(self, store):
+        store.knn_tuning.save("elasticsearch:decision_documents", {10: 30}, 0.95)
+        assert store._build_search_body([0.1, 0.2], 10)["knn"]["num_candidates"] == 30
+        assert store._build_search_body([0.1, 0.2], 20)["knn"]["num_candidates"] == 60
+
+    def test_benchmark_persists_choice(self, store):
+        store.client.search.side_effect = lambda index, body, size: (
+            {"hits": {"hits": [{"_source": {"vector": [0.1, 0.2]}}]}}
+            if "function_score" in body.get("query", {})
+            else {"hits": {"hits": [{"_id": "a"}, {"_id": "b"}][:size]}}
+        )
+
+        report = store.benchmark_num_candidates(top_k_values=[2], factors=[1, 4])
+
+        assert report["chosen"] == {2: 2}
+        assert store.knn_tuning.candidates("elasticsearch:decision_documents", 2) == 2
+
+
+class TestPgvectorEfSearch:
+    @pytest.fixture()
+    def store(self, tmp_path, pg_store):
+        store = pg_store(vector_dims=2)
+        store.knn_tuning = KnnTuning(str(tmp_path / "knn_tuning.json"))
+        return store
+
+    def test_untuned_search_leaves_ef_search_alone(self, store, mock_conn):
+        _, cursor = mock_conn
+        store.search([0.1, 0.2], top_k=10)
+        assert not any("ef_search" in c.args[0] for c in cursor.execute.call_args_list)
+
+    def test_tuned_search_sets_ef_search(self, store, mock_conn):
+        _, cursor = mock_conn
+        store.knn_tuning.save("pgvector:document_chunk", {10: 80}, 0.95)
+
+        store.search([0.1, 0.2], top_k=10)
+
+        assert cursor.execute.call_args_list[0].args == ("SET LOCAL hnsw.ef_search = %s;", (80,))
+        store.conn.commit.assert_called()
@@ -0,0 +1,313 @@
+"""
+Unit tests for LocalVectorStore.
+
+Stores are created in tmp_path; no external service is required.
+"""
+
+import json
+from datetime import datetime, timezone
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from app.services.local_vector_store import LocalVectorStore
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(autouse=True)
+def clear_shared_indexes():
+    """Isolate tests from the per-process index cache."""
+    LocalVectorStore._indexes.clear()
+    yield
+    LocalVectorStore._indexes.clear()
+
+
+@pytest.fixture()
+def store(tmp_path):
+    return LocalVectorStore(directory=tmp_path / "store", vector_dims=3, dtype="float32")
+
+
+def _make_chunk(
+    chunk_id: str,
+    embedding,
+    native_id: str = "native-1",
+    **metadata,
+) -> dict:
+    return {
+        "chunk_id": chunk_id,
+        "native_id": native_id,
+        "chunk_index": 0,
+        "text": f"text of {chunk_id}",
+        "embedding": embedding,
+        "metadata": metadata,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Indexing and search
+# ---------------------------------------------------------------------------
+
+
+class TestSearch:
+    def test_returns_nearest_chunks_in_score_order(self, store):
+        store.bulk_index_chunks(
+            [
+                _make_chunk("a", [1.0, 0.0, 0.0]),
+                _make_chunk("b", [0.0, 1.0, 0.0]),
+                _make_chunk("c", [0.7, 0.7, 0.0]),
+            ]
+        )
+
+        results = store.search([1.0, 0.1, 0.0], top_k=2)
+
+        assert [r["chunk_id"] for r in results] == ["a", "c"]
+        assert results[0]["score"] == pytest.approx(0.995, abs=1e-3)
+        assert results[0]["text"] == "text of a"
+        assert results[0]["metadata"]["native_id"] == "native-1"
+
+    def test_filter_conditions_are_applied_before_ranking(self, store):
+        store.bulk_index_chunks(
+            [
+                _make_chunk("a", [1.0, 0.0, 0.0], organization_name="Kaupunginhallitus"),
+                _make_chunk("b", [0.0, 1.0, 0.0], organization_name="Kasvatuslautakunta"),
+                _make_chunk("c", [0.5, 0.5, 0.0], is_attachment=True),
+            ]
+        )
+
+        results = store.search(
+            [1.0, 0.0, 0.0], top_k=5, filter_conditions={"organization_name": "Kasvatuslautakunta"}
+        )
+        assert [r["chunk_id"] for r in results] == ["b"]
+
+        results = store.search([1.0, 0.0, 0.0], filter_conditions={"is_attachment": True})
+        assert [r["chunk_id"] for r in results] == ["c"]
+
+    def test_list_filter_matches_any_value(self, store):
+        store.bulk_index_chunks(
+            [
+                _make_chunk("a", [1.0, 0.0, 0.0], section="1"),
+                _make_chunk("b", [0.0, 1.0, 0.0], section="2"),
+                _make_chunk("c", [0.0, 0.0, 1.0], section="3"),
+            ]
+        )
+
+        results = store.search([1.0, 1.0, 1.0], filter_conditions={"section": ["1", "3"]})
+
+        assert sorted(r["chunk_id"] for r in results) == ["a", "c"]
+
+    def test_float16_scored_in_float32_blocks(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("app.services.local_vector_store._SCORE_BLOCK_ROWS", 2)
+        half = LocalVectorStore(directory=tmp_path / "half", vector_dims=3, dtype="float16")
+        half.bulk_index_chunks(
+            [
+                _make_chunk("a", [1.0, 0.0, 0.0]),
+                _make_chunk("b", [0.0, 1.0, 0.0]),
+                _make_chunk("c", [0.6, 0.8, 0.0]),
+                _make_chunk("d", [0.0, 0.0, 1.0], native_id="native-2"),
+                _make_chunk("e", [0.8, 0.6, 0.0]),
+            ]
+        )
+
+        results = half.search([1.0, 0.0, 0.0], top_k=3)
+        filtered = half.search(
+            [1.0, 0.0, 0.0], top_k=5, filter_conditions={"native_id": "native-1"}
+        )
+
+        assert [r["chunk_id"] for r in results] == ["a", "e", "c"]
+        assert results[1]["score"] == pytest.approx(0.8, abs=1e-3)
+        assert [r["chunk_id"] for r in filtered] == ["a", "e", "c", "b"]
+
+    def test_empty_store_returns_no_results(self, store):
+        assert store.search([1.0, 0.0, 0.0]) == []
+
+    def test_upsert_replaces_existing_chunk(self, store):
+        store.index_chunk(_make_chunk("a", [1.0, 0.0, 0.0]))
+        store.index_chunk(_make_chunk("a", [0.0, 1.0, 0.0]))
+
+        results = store.search([0.0, 1.0, 0.0])
+
+        assert len(results) == 1
+        assert results[0]["score"] == pytest.approx(1.0)
+
+    def test_wrong_dimension_is_rejected(self, store):
+        assert store.index_chunk(_make_chunk("a", [1.0, 0.0])) is False
+
+
+# ---------------------------------------------------------------------------
+# Deletes and existence
+# ---------------------------------------------------------------------------
+
+
+class TestDeletes:
+    def test_delete_document_removes_decision_and_attachments(self, store):
+        store.bulk_index_chunks(
+            [
+                _make_chunk("d1", [1.0, 0.0, 0.0], native_id="dec-1"),
+                _make_chunk(
+                    "att1",
+                    [0.0, 1.0, 0.0],
+                    native_id="dec-1_att_1",
+                    is_attachment=True,
+                    decision_native_id="dec-1",
+                ),
+                _make_chunk("d2", [0.0, 0.0, 1.0], native_id="dec-2"),
+            ]
+        )
+        assert store.document_exists("dec-1")
+
+        assert store.delete_document("dec-1") == 2
+
+        assert not store.document_exists("dec-1")
+        assert [r["chunk_id"] for r in store.search([1.0, 1.0, 1.0])] == ["d2"]
+
+    def test_delete_attachments_keeps_decision_chunks(self, store):
+        store.bulk_index_chunks(
+            [
+                _make_chunk("d1", [1.0, 0.0, 0.0], native_id="dec-1"),
+                _make_chunk(
+                    "att1",
+                    [0.0, 1.0, 0.0],
+                    native_id="dec-1_att_1",
+                    is_attachment=True,
+                    decision_native_id="dec-1",
+                ),
+            ]
+        )
+
+        assert store.delete_attachments("dec-1") == 1
+
+        assert [r["chunk_id"] for r in store.search([1.0, 1.0, 0.0])] == ["d1"]
+
+
+# ---------------------------------------------------------------------------
+# Persistence
+# ---------------------------------------------------------------------------
+
+
+class TestPersistence:
+    def test_close_persists_and_reopen_memory_maps(self, tmp_path):
+        directory = tmp_path / "store"
+        store = LocalVectorStore(directory=directory, vector_dims=3, dtype="float16")
+        store.bulk_index_chunks(
+            [_make_chunk("a", [1.0, 0.0, 0.0]), _make_chunk("b", [0.0, 1.0, 0.0])]
+        )
+        store.delete_document("missing")
+        store.index_chunk(_make_chunk("c", [0.0, 0.0, 1.0], native_id="native-2"))
+        store.delete_document("native-2")
+        store.close()
+
+        LocalVectorStore._indexes.clear()
+        reopened = LocalVectorStore(directory=directory, vector_dims=3)
+
+        assert isinstance(reopened._index.vectors, np.memmap)
+        assert reopened._index.vectors.dtype == np.float16
+        assert reopened.get_statistics()["total_chunks"] == 2
+        assert reopened.search([0.0, 1.0, 0.0], top_k=1)[0]["chunk_id"] == "b"
+
+    def test_dimension_mismatch_on_reopen_raises(self, tmp_path):
+        directory = tmp_path / "store"
+        store = LocalVectorStore(directory=directory, vector_dims=3)
+        store.index_chunk(_make_chunk("a", [1.0, 0.0, 0.0]))
+        store.close()
+
+        LocalVectorStore._indexes.clear()
+        with pytest.raises(ValueError):
+            LocalVectorStore(directory=directory, vector_dims=4)
+
+    def test_save_switches_generation_and_removes_previous_files(self, tmp_path):
+        directory = tmp_path / "store"
+        store = LocalVectorStore(directory=directory, vector_dims=3)
+        store.index_chunk(_make_chunk("a", [1.0, 0.0, 0.0]))
+        store.save()
+        store.index_chunk(_make_chunk("b", [0.0, 1.0, 0.0]))
+        store.save()
+
+        manifest = json.loads((directory / "manifest.json").read_text(encoding="utf-8"))
+        assert manifest["generation"] == 2
+        assert sorted(p.name for p in directory.iterdir()) == [
+            "chunks.2.parquet",
+            "manifest.json",
+            "vectors.2.npy",
+        ]
+
+    def test_crash_before_manifest_replace_keeps_previous_generation(
+        self, tmp_path, monkeypatch
+    ):
+        directory = tmp_path / "store"
+        store = LocalVectorStore(directory=directory, vector_dims=3)
+        store.index_chunk(_make_chunk("a", [1.0, 0.0, 0.0]))
+        store.save()
+        store.index_chunk(_make_chunk("b", [0.0, 1.0, 0.0]))
+
+        def crash(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr("app.services.local_vector_store.os.replace", crash)
+        with pytest.raises(OSError):
+            store.save()
+        monkeypatch.undo()
+
+        LocalVectorStore._indexes.clear()
+        reopened = LocalVectorStore(directory=directory, vector_dims=3)
+        assert reopened.get_statistics()["total_chunks"] == 1
+        assert reopened.search([1.0, 0.0, 0.0], top_k=5)[0]["chunk_id"] == "a"
+
+    def test_unsuffixed_files_from_older_saves_still_load(self, tmp_path):
+        directory = tmp_path / "store"
+        directory.mkdir()
+        np.save(directory / "vectors.npy", np.array([[1.0, 0.0, 0.0]], dtype=np.float32))
+        pq.write_table(
+            pa.Table.from_pydict(
+                {"chunk_id": ["a"], "native_id": ["native-1"], "text": ["t"], "metadata": ["{}"]}
+            ),
+            directory / "chunks.parquet",
+        )
+        (directory / "manifest.json").write_text(
+            json.dumps({"count": 1, "vector_dims": 3, "dtype": "float32"}), encoding="utf-8"
+        )
+
+        store = LocalVectorStore(directory=directory, vector_dims=3)
+
+        assert store.search([1.0, 0.0, 0.0], top_k=1)[0]["chunk_id"] == "a"
+
+    def test_row_count_mismatch_with_manifest_raises(self, tmp_path):
+        directory = tmp_path / "store"
+        store = LocalVectorStore(directory=directory, vector_dims=3)
+        store.bulk_index_chunks(
+            [_make_chunk("a", [1.0, 0.0, 0.0]), _make_chunk("b", [0.0, 1.0, 0.0])]
+        )
+        store.close()
+        np.save(directory / "vectors.1.npy", np.array([[1.0, 0.0, 0.0]], dtype=np.float32))
+
+        LocalVectorStore._indexes.clear()
+        with pytest.raises(ValueError, match="inconsistent"):
+            LocalVectorStore(directory=directory, vector_dims=3)
+
+    def test_load_parquet_export(self, tmp_path, store):
+        export = tmp_path / "exports" / "embeddings_2024.parquet"
+        export.parent.mkdir()
+        pq.write_table(
+            pa.Table.from_pydict(
+                {
+                    "chunk_id": ["dec-1_chunk_0", "dec-1_chunk_1"],
+                    "native_id": ["dec-1", "dec-1"],
+                    "embedding": [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]],
+                    "embedding_model": ["m", "m"],
+                    "embedding_dimensions": [3, 3],
+                    "created_at": [datetime.now(timezone.utc)] * 2,
+                }
+            ),
+            export,
+        )
+
+        assert store.load_parquet([export.parent]) == 2
+
+        result = store.search([0.0, 1.0, 0.0], top_k=1)[0]
+        assert result["chunk_id"] == "dec-1_chunk_1"
+        assert result["metadata"]["chunk_index"] == 1
+        assert store.document_exists("dec-1")
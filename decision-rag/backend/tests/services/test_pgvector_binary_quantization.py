@@ -0,0 +1,94 @@
+"""
+Unit tests for binary-quantized search in PgvectorVectorStore.
+
+All PostgreSQL interactions are mocked; no live database is required.
+"""
+
+
+class TestBinaryQuantizedSearch:
+    def test_plain_hnsw_query_by_default(self, pg_store, executed):
+        store = pg_store(binary_quantization=False)
+
+        store.search([0.1, 0.2, 0.3], top_k=5)
+
+        (sql, _), = executed()
+        assert "binary_quantize" not in sql
+
+    def test_hamming_candidates_reranked_on_halfvec(self, mock_conn, pg_store, executed):
+        conn, _ = mock_conn
+        store = pg_store(binary_quantization=True, bq_oversampling=8)
+
+        store.search([0.1, 0.2, 0.3], top_k=5, filter_conditions={"section": "1"})
+
+        (set_sql, set_params), (sql, params) = executed()
+        assert set_sql == "SET LOCAL hnsw.ef_search = %s;"
+        assert set_params == (40,)
+        assert "ORDER BY binary_quantize(vector)::bit(3) <~> binary_quantize(%s::halfvec)" in sql
+        assert sql.endswith(") candidates ORDER BY vector <=> %s::halfvec LIMIT %s;")
+        query = "[0.1,0.2,0.3]"
+        assert params == [query, "section", "1", query, 40, query, 5]
+        conn.commit.assert_called()
+
+    def test_ef_search_follows_candidate_count(self, pg_store, executed):
+        store = pg_store(binary_quantization=True, bq_oversampling=4)
+
+        store.search([0.1, 0.2, 0.3], top_k=50)
+
+        (_, set_params), (_, params) = executed()
+        assert set_params == (200,)
+        assert params[-3:-1] == [200, "[0.1,0.2,0.3]"]
+
+    def test_ef_search_clamped_to_pgvector_maximum(self, pg_store, executed):
+        store = pg_store(binary_quantization=True, bq_oversampling=20)
+
+        store.search([0.1, 0.2, 0.3], top_k=100)
+
+        (_, set_params), (_, params) = executed()
+        assert set_params == (1000,)
+        assert params[-3] == 2000
+
+    def test_failed_search_rolls_back(self, mock_conn, pg_store):
+        conn, cursor = mock_conn
+        cursor.execute.side_effect = [None, Exception("statement timeout")]
+        store = pg_store(binary_quantization=True)
+
+        assert store.search([0.1, 0.2, 0.3], top_k=5) == []
+        conn.rollback.assert_called_once()
+
+    def test_create_index_uses_bit_hamming_expression(self, pg_store, executed):
+        store = pg_store()
+
+        store.create_binary_quantized_index()
+
+        statements = [sql for sql, _ in executed()]
+        assert (
+            "CREATE INDEX IF NOT EXISTS document_chunk_vector_bq_idx ON document_chunk "
+            "USING hnsw ((binary_quantize(vector)::bit(3)) bit_hamming_ops);"
+        ) in statements
+
+
+class TestBenchmark:
+    def test_reports_recall_against_exact_scan(self, mock_conn, pg_store, executed):
+        _, cursor = mock_conn
+        store = pg_store()
+        cursor.fetchall.side_effect = [
+            [("[1,0,0]",)],  # sampled query vectors
+            [{"id": "a"}, {"id": "b"}],  # exact
+            [{"id": "a"}, {"id": "b"}],  # hnsw
+            [{"id": "a"}, {"id": "c"}],  # bq x1
+            [{"id": "a"}, {"id": "b"}],  # bq x4
+        ]
+
+        report = store.benchmark_binary_quantization(
+            sample_size=1, top_k=2, oversampling_factors=[1, 4]
+        )
+
+        assert report["exact"]["recall"] == 1.0
+        assert report["hnsw"]["recall"] == 1.0
+        assert report["bq_x1"]["recall"] == 0.5
+        assert report["bq_x4"]["recall"] == 1.0
+        assert "SET LOCAL enable_indexscan = off;" in [sql for sql, _ in executed()]
+
+    def test_empty_table_returns_empty_report(self, pg_store):
+        store = pg_store()
+        assert store.benchmark_binary_quantization() == {}
@@ -0,0 +1,251 @@
+"""
+Unit tests for PgvectorVectorStore bulk-load (backfill) mode.
+
+All PostgreSQL interactions are mocked; no live database is required.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from app.services.pgvector_store import PgvectorVectorStore
+
+HNSW_DEF = (
+    "CREATE INDEX document_chunk_vector_idx ON public.document_chunk "
+    "USING hnsw (vector halfvec_cosine_ops) WITH (m='16', ef_construction='64')"
+)
+BTREE_DEF = (
+    "CREATE INDEX document_chunk_native_id_idx ON public.document_chunk "
+    "USING btree (((vmetadata ->> 'native_id'::text)))"
+)
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture()
+def store(mock_conn, pg_store):
+    """Return a PgvectorVectorStore whose live table has an HNSW and a btree index."""
+    _, cursor = mock_conn
+    cursor.fetchone.return_value = (False,)
+    cursor.fetchall.return_value = [
+        ("document_chunk_vector_idx", HNSW_DEF),
+        ("document_chunk_native_id_idx", BTREE_DEF),
+    ]
+    with patch("app.services.pgvector_store.settings.PGVECTOR_INDEX_BUILD_PROGRESS_SECONDS", 0):
+        yield pg_store()
+
+
+def _make_chunk(chunk_id: str = "chunk-1") -> dict:
+    return {
+        "chunk_id": chunk_id,
+        "native_id": "native-1",
+        "chunk_index": 0,
+        "text": "Hello world",
+        "embedding": [0.1, 0.2, 0.3],
+        "metadata": {},
+    }
+
+
+# ---------------------------------------------------------------------------
+# begin_bulk_load
+# ---------------------------------------------------------------------------
+
+
+class TestBeginBulkLoad:
+    def test_creates_unindexed_staging_table(self, store, executed_sql):
+        staging = store.begin_bulk_load()
+
+        assert staging == "document_chunk_staging"
+        assert store.write_table == "document_chunk_staging"
+        sql = executed_sql()
+        assert "CREATE TABLE document_chunk_staging (LIKE document_chunk INCLUDING DEFAULTS);" in sql
+        assert "ALTER TABLE document_chunk_staging ADD PRIMARY KEY (id);" in sql
+        assert "INSERT INTO document_chunk_staging SELECT * FROM document_chunk;" in sql
+        assert not any("CREATE INDEX" in q for q in sql)
+
+    def test_resume_reuses_existing_staging_table(self, store, mock_conn, executed_sql):
+        _, cursor = mock_conn
+        cursor.fetchone.return_value = (True,)
+
+        store.begin_bulk_load(resume=True)
+
+        sql = executed_sql()
+        assert not any(q.startswith("CREATE TABLE") for q in sql)
+        assert any(q.startswith("CREATE TRIGGER document_chunk_mirror_to_staging") for q in sql)
+
+    def test_live_writes_mirrored_from_before_the_copy(self, store, mock_conn, executed_sql):
+        _, cursor = mock_conn
+        cursor.fetchall.return_value = [("id",), ("text",), ("vector",)]
+
+        store.begin_bulk_load()
+
+        sql = executed_sql()
+        function = next(q for q in sql if "FUNCTION document_chunk_mirror_to_staging()" in q)
+        assert "DELETE FROM document_chunk_staging WHERE id = OLD.id;" in function
+        assert (
+            "INSERT INTO document_chunk_staging SELECT NEW.* ON CONFLICT (id) DO UPDATE SET "
+            "text = EXCLUDED.text, vector = EXCLUDED.vector;"
+        ) in function
+        trigger = next(
+            i for i, q in enumerate(sql) if q.startswith("CREATE TRIGGER document_chunk_mirror")
+        )
+        assert "AFTER INSERT OR UPDATE OR DELETE ON document_chunk" in sql[trigger]
+        copy = sql.index("INSERT INTO document_chunk_staging SELECT * FROM document_chunk;")
+        assert trigger < copy
+
+    def test_writes_go_to_staging_table(self, store, mock_conn, executed_sql):
+        _, cursor = mock_conn
+        store.begin_bulk_load()
+        cursor.execute.reset_mock()
+
+        store.bulk_index_chunks([_make_chunk()])
+
+        assert "INSERT INTO document_chunk_staging" in executed_sql()[0]
+
+    def test_search_keeps_using_live_table(self, store, mock_conn, executed_sql):
+        _, cursor = mock_conn
+        store.begin_bulk_load()
+        cursor.execute.reset_mock()
+        cursor.fetchall.return_value = []
+
+        store.search([0.1, 0.2, 0.3])
+
+        assert "FROM document_chunk ORDER BY" in executed_sql()[0]
+
+    def test_begin_twice_raises(self, store):
+        store.begin_bulk_load()
+        with pytest.raises(RuntimeError):
+            store.begin_bulk_load()
+
+
+# ---------------------------------------------------------------------------
+# end_bulk_load
+# ---------------------------------------------------------------------------
+
+
+class TestEndBulkLoad:
+    def test_builds_indexes_with_tuned_settings_then_swaps(self, store, mock_conn, executed_sql):
+        _, cursor = mock_conn
+        store.begin_bulk_load()
+        cursor.execute.reset_mock()
+
+        report = store.end_bulk_load()
+
+        sql = executed_sql()
+        mem = sql.index("SET maintenance_work_mem = %s;")
+        btree = next(i for i, q in enumerate(sql) if "native_id_idx_staging ON" in q)
+        hnsw = next(i for i, q in enumerate(sql) if "vector_idx_staging ON" in q)
+        drop = sql.index("DROP TABLE document_chunk;")
+        assert mem < btree < hnsw < drop
+        assert sql[hnsw].startswith(
+            "CREATE INDEX document_chunk_vector_idx_staging ON document_chunk_staging USING hnsw"
+        )
+        assert "ALTER TABLE document_chunk_staging RENAME TO document_chunk;" in sql
+        assert "DROP FUNCTION IF EXISTS document_chunk_mirror_to_staging();" in sql
+        assert "ALTER INDEX document_chunk_vector_idx_staging RENAME TO document_chunk_vector_idx;" in sql
+        assert [b["index"] for b in report["index_builds"]] == [
+            "document_chunk_native_id_idx",
+            "document_chunk_vector_idx",
+        ]
+        assert report["swap_seconds"] is not None
+        assert store.write_table == "document_chunk"
+        assert not store.bulk_load_active
+
+    def test_default_hnsw_index_when_live_table_has_none(self, store, mock_conn, executed_sql):
+        _, cursor = mock_conn
+        cursor.fetchall.return_value = []
+        store.begin_bulk_load()
+        cursor.execute.reset_mock()
+
+        store.end_bulk_load()
+
+        assert any(
+            q.startswith("CREATE INDEX document_chunk_vector_idx_staging ON document_chunk_staging")
+            and "halfvec_cosine_ops" in q
+            for q in executed_sql()
+        )
+
+    def test_report_contains_load_progress(self, store):
+        store.begin_bulk_load()
+        store.bulk_index_chunks([_make_chunk("c1"), _make_chunk("c2")])
+
+        report = store.end_bulk_load()
+
+        assert report["rows_loaded"] == 2
+        assert report["load_seconds"] >= 0
+
+    def test_context_manager_keeps_staging_table_on_error(self, store, mock_conn, executed_sql):
+        _, cursor = mock_conn
+
+        with pytest.raises(ValueError):
+            with store.bulk_load_mode():
+                cursor.execute.reset_mock()
+                raise ValueError("boom")
+
+        sql = executed_sql()
+        assert not any("CREATE INDEX" in q or "DROP TABLE" in q for q in sql)
+        assert store.write_table == "document_chunk"
+
+
+# ---------------------------------------------------------------------------
+# Leftover staging mirror
+# ---------------------------------------------------------------------------
+
+
+class TestLeftoverStagingMirror:
+    def test_warns_at_startup_when_mirror_trigger_is_left(self, mock_conn, pg_store):
+        _, cursor = mock_conn
+        cursor.fetchone.return_value = (True,)
+
+        with patch("app.services.pgvector_store.logger") as logger:
+            pg_store()
+
+        message = logger.warning.call_args[0][0]
+        assert "document_chunk_mirror_to_staging" in message
+        assert "pgvector-drop-staging" in message
+
+    def test_no_warning_without_mirror_trigger(self, mock_conn, pg_store):
+        _, cursor = mock_conn
+        cursor.fetchone.return_value = (False,)
+
+        with patch("app.services.pgvector_store.logger") as logger:
+            pg_store()
+
+        logger.warning.assert_not_called()
+
+    def test_drop_removes_trigger_function_and_staging_table(self, store, mock_conn, executed_sql):
+        conn, cursor = mock_conn
+        cursor.fetchone.return_value = (True, True)
+
+        assert store.drop_bulk_load_staging() is True
+
+        sql = executed_sql()
+        assert "DROP TRIGGER IF EXISTS document_chunk_mirror_to_staging ON document_chunk;" in sql
+        assert "DROP FUNCTION IF EXISTS document_chunk_mirror_to_staging();" in sql
+        assert "DROP TABLE IF EXISTS document_chunk_staging;" in sql
+        conn.commit.assert_called_once()
+
+    def test_drop_reports_nothing_left(self, store, mock_conn):
+        _, cursor = mock_conn
+        cursor.fetchone.return_value = (False, False)
+
+        assert store.drop_bulk_load_staging() is False
+
+    def test_drop_refused_during_active_bulk_load(self, store):
+        store.begin_bulk_load()
+
+        with pytest.raises(RuntimeError):
+            store.drop_bulk_load_staging()
+
+
+class TestRetargetIndexDefinition:
+    def test_rewrites_name_and_table(self):
+        statement = PgvectorVectorStore._retarget_index_definition(
+            HNSW_DEF, "document_chunk_vector_idx", "document_chunk_vector_idx_staging", "t_staging"
+        )
+        assert statement == (
+            "CREATE INDEX document_chunk_vector_idx_staging ON t_staging "
+            "USING hnsw (vector halfvec_cosine_ops) WITH (m='16', ef_construction='64')"
+        )
@@ -0,0 +1,186 @@
+"""
+Unit tests for promoted metadata columns, date partitioning and iterative scans
+in PgvectorVectorStore.
+
+All PostgreSQL interactions are mocked; no live database is required.
+"""
+
+from datetime import date
+
+import pytest
+
+from app.services.search_filters import SearchFilter
+
+
+def _make_chunk(chunk_id: str = "c1", date_decision: str = "2024-03-05T10:00:00") -> dict:
+    return {
+        "chunk_id": chunk_id,
+        "native_id": "dec-1",
+        "chunk_index": 0,
+        "text": "t",
+        "embedding": [0.1, 0.2, 0.3],
+        "metadata": {
+            "date_decision": date_decision,
+            "organization_name": "Kaupunginhallitus",
+            "is_attachment": True,
+            "decision_native_id": "dec-0",
+        },
+    }
+
+
+class TestPromotedColumns:
+    def test_legacy_insert_by_default(self, pg_store, executed):
+        pg_store().bulk_index_chunks([_make_chunk()])
+
+        (sql, params), = executed()
+        assert "(id, collection_name, text, vector, vmetadata)" in sql
+        assert "ON CONFLICT (id)" in sql
+        assert len(params) == 5
+
+    def test_insert_fills_typed_columns(self, pg_store, executed):
+        pg_store(promoted_columns=True).index_chunk(_make_chunk())
+
+        (sql, params), = executed()
+        assert (
+            "(id, collection_name, text, vector, vmetadata, native_id, decision_native_id, "
+            "date_decision, organization_name, is_attachment)"
+        ) in sql
+        assert "date_decision = EXCLUDED.date_decision" in sql
+        assert params[5:] == ["dec-1", "dec-0", date(2024, 3, 5), "Kaupunginhallitus", True]
+
+    def test_filters_and_deletes_use_columns(self, pg_store, executed):
+        store = pg_store(promoted_columns=True)
+
+        store.search(
+            [0.1, 0.2, 0.3],
+            filter_conditions=SearchFilter(date_from=date(2024, 1, 1), is_attachment=False),
+        )
+        store.delete_document("dec-1")
+
+        (search_sql, _), (delete_sql, _) = executed()
+        assert "WHERE date_decision >= %s AND is_attachment = %s" in search_sql
+        assert "WHERE native_id = %s OR decision_native_id = %s" in delete_sql
+
+    def test_migrate_schema_adds_backfills_and_indexes(self, mock_conn, pg_store, executed):
+        _, cursor = mock_conn
+        cursor.rowcount = 7
+        store = pg_store()
+
+        report = store.migrate_schema()
+
+        statements = [sql for sql, _ in executed()]
+        assert "ALTER TABLE document_chunk ADD COLUMN IF NOT EXISTS date_decision date;" in statements
+        update = next(sql for sql in statements if sql.startswith("UPDATE"))
+        assert "left(vmetadata->>'date_decision', 10)::date" in update
+        assert (
+            "CREATE INDEX IF NOT EXISTS document_chunk_organization_name_idx "
+            "ON document_chunk (organization_name);"
+        ) in statements
+        assert report["rows_backfilled"] == 7
+        assert store.promoted_columns
+
+
+class TestPartitioning:
+    def test_create_table_is_partitioned_by_decision_date(self, pg_store, executed):
+        store = pg_store(partition_by_date=True)
+
+        store._create_table_if_not_exists()
+
+        statements = [sql for sql, _ in executed()]
+        create = statements[0]
+        assert create.endswith("PARTITION BY RANGE (date_decision);")
+        assert "UNIQUE NULLS NOT DISTINCT (id, date_decision)" in create
+        assert (
+            "CREATE TABLE IF NOT EXISTS document_chunk_undated PARTITION OF document_chunk DEFAULT;"
+        ) in statements
+        assert any("USING hnsw (vector halfvec_cosine_ops)" in sql for sql in statements)
+
+    def test_writes_create_missing_year_partitions_once(self, pg_store, executed):
+        store = pg_store(partition_by_date=True)
+
+        store.bulk_index_chunks(
+            [_make_chunk("c1"), _make_chunk("c2", "2023-12-01"), _make_chunk("c3", None)]
+        )
+        store.index_chunk(_make_chunk("c4"))
+
+        statements = [sql for sql, _ in executed()]
+        partitions = [sql for sql in statements if "PARTITION OF" in sql]
+        assert partitions == [
+            "CREATE TABLE IF NOT EXISTS document_chunk_y2023 PARTITION OF document_chunk "
+            "FOR VALUES FROM ('2023-01-01') TO ('2024-01-01');",
+            "CREATE TABLE IF NOT EXISTS document_chunk_y2024 PARTITION OF document_chunk "
+            "FOR VALUES FROM ('2024-01-01') TO ('2025-01-01');",
+        ]
+        assert "ON CONFLICT (id, date_decision)" in statements[-1]
+
+    def test_partition_created_again_after_rolled_back_write(self, mock_conn, pg_store, executed):
+        conn, cursor = mock_conn
+        store = pg_store(partition_by_date=True)
+        failures = [RuntimeError("upsert failed")]
+
+        def execute(sql, params=None):
+            if sql.lstrip().startswith("INSERT") and failures:
+                raise failures.pop()
+
+        cursor.execute.side_effect = execute
+
+        assert store.index_chunk(_make_chunk("c1")) is False
+        conn.rollback.assert_called_once()
+        assert store.index_chunk(_make_chunk("c1")) is True
+
+        partitions = [sql for sql, _ in executed() if "PARTITION OF" in sql]
+        assert len(partitions) == 2
+        assert all("document_chunk_y2024" in sql for sql in partitions)
+
+    def test_drop_partitions_before_cutoff(self, mock_conn, pg_store, executed):
+        _, cursor = mock_conn
+        cursor.fetchall.return_value = [
+            ("document_chunk_undated", "DEFAULT"),
+            ("document_chunk_y2019", "FOR VALUES ..."),
+            ("document_chunk_y2020", "FOR VALUES ..."),
+            ("document_chunk_y2021", "FOR VALUES ..."),
+        ]
+        store = pg_store(partition_by_date=True)
+
+        dropped = store.drop_partitions_before(date(2021, 1, 1))
+
+        assert dropped == ["document_chunk_y2019", "document_chunk_y2020"]
+        statements = [sql for sql, _ in executed()]
+        assert "DROP TABLE document_chunk_y2020;" in statements
+        assert "DROP TABLE document_chunk_y2021;" not in statements
+
+    def test_drop_partitions_requires_partitioned_table(self, pg_store):
+        with pytest.raises(RuntimeError):
+            pg_store().drop_partitions_before(date(2021, 1, 1))
+
+    def test_bulk_load_staging_is_refused(self, pg_store):
+        with pytest.raises(RuntimeError):
+            pg_store(partition_by_date=True).begin_bulk_load()
+
+
+class TestIterativeScan:
+    def test_filtered_query_enables_iterative_scan(self, mock_conn, pg_store, executed):
+        conn, cursor = mock_conn
+        cursor.fetchall.return_value = [{"score": 0.5}, {"score": 0.9}]
+        store = pg_store(iterative_scan="relaxed_order")
+
+        rows = store._query_nearest(cursor, "[0,0,1]", 5, "WHERE is_attachment = %s", [True])
+
+        statements = executed()
+        assert statements[0] == ("SET LOCAL hnsw.iterative_scan = relaxed_order;", None)
+        assert statements[1][0] == "SET LOCAL hnsw.max_scan_tuples = %s;"
+        # relaxed_order may return rows slightly out of order
+        assert [r["score"] for r in rows] == [0.9, 0.5]
+        conn.commit.assert_called()
+
+    def test_unfiltered_query_skips_iterative_scan(self, mock_conn, pg_store, executed):
+        _, cursor = mock_conn
+        store = pg_store(iterative_scan="strict_order")
+
+        store._query_nearest(cursor, "[0,0,1]", 5)
+
+        assert not any("iterative_scan" in sql for sql, _ in executed())
+
+    def test_unknown_mode_is_rejected(self, pg_store):
+        with pytest.raises(ValueError):
+            pg_store(iterative_scan="sometimes")
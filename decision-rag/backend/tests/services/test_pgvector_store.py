@@ -15,17 +15,6 @@ from app.services.pgvector_store import PgvectorVectorStore
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture()
-def mock_conn():
-    """Return a mock psycopg2 connection with a mock cursor via context manager."""
-    conn = MagicMock()
-    cursor = MagicMock()
-    # Support both plain cursor() and cursor(cursor_factory=...) calls
-    conn.cursor.return_value.__enter__ = MagicMock(return_value=cursor)
-    conn.cursor.return_value.__exit__ = MagicMock(return_value=False)
-    return conn, cursor
-
-
 @pytest.fixture()
 def store(mock_conn):
     """Return a PgvectorVectorStore with all DB calls mocked out during init."""
@@ -34,6 +23,7 @@ def store(mock_conn):
         patch("app.services.pgvector_store.psycopg2.connect", return_value=conn),
         patch.object(PgvectorVectorStore, "_enable_pgvector"),
         patch.object(PgvectorVectorStore, "_create_table_if_not_exists"),
+        patch.object(PgvectorVectorStore, "_warn_leftover_staging_mirror"),
     ):
         s = PgvectorVectorStore(
             host="localhost",
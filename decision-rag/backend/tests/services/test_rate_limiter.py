@@ -0,0 +1,145 @@
+"""
+Unit tests for the per-host token-bucket rate limiter.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+from app.services.rate_limiter import RateLimiter, TokenBucket, parse_retry_after
+
+
+def _at(seconds: float):
+    return patch("app.services.rate_limiter.time.monotonic", return_value=seconds)
+
+
+class _Clock:
+    """Fake monotonic clock that sleeping advances."""
+
+    def __init__(self, now: float = 100.0):
+        self.now = now
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestTokenBucket:
+    def test_burst_then_wait_for_next_token(self):
+        with _at(100.0):
+            bucket = TokenBucket(rate=2.0, burst=2, min_rate=0.1)
+            waits = [bucket.try_acquire() for _ in range(4)]
+        with _at(100.5):
+            assert bucket.try_acquire(waited=0.5) == 0.0
+
+        # Without a token nothing is taken, so the wait does not grow
+        assert waits == [0.0, 0.0, 0.5, 0.5]
+        assert bucket.stats()["requests"] == 3
+        assert bucket.stats()["waits"] == 1
+
+    def test_tokens_refill_up_to_capacity(self):
+        with _at(100.0):
+            bucket = TokenBucket(rate=1.0, burst=2, min_rate=0.1)
+            bucket.try_acquire()
+            bucket.try_acquire()
+        with _at(110.0):
+            assert [bucket.try_acquire() for _ in range(3)] == [0.0, 0.0, 1.0]
+
+    def test_throttle_halves_rate_and_honours_retry_after(self):
+        with _at(100.0):
+            bucket = TokenBucket(rate=4.0, burst=4, min_rate=1.0)
+            bucket.throttle(retry_after=5.0)
+            assert bucket.rate == 2.0
+            assert bucket.try_acquire() == 5.0
+            bucket.throttle()
+            bucket.throttle()
+            assert bucket.rate == 1.0
+
+    def test_recovers_towards_configured_rate(self):
+        with _at(100.0):
+            bucket = TokenBucket(rate=10.0, burst=1, min_rate=0.1)
+            bucket.throttle()
+            for _ in range(3):
+                bucket.recover()
+            assert bucket.rate == 6.5
+            for _ in range(20):
+                bucket.recover()
+            assert bucket.rate == 10.0
+
+
+class TestRateLimiter:
+    def test_buckets_are_per_host(self):
+        limiter = RateLimiter(rate=1.0, burst=1, min_rate=0.1)
+        clock = _Clock()
+        with patch("app.services.rate_limiter.time.monotonic", new=clock), patch(
+            "app.services.rate_limiter.time.sleep", new=clock.sleep
+        ):
+            limiter.acquire("https://paatokset.hel.fi/api/a")
+            limiter.acquire("https://liitteet.hel.fi/b.pdf")
+            assert limiter.acquire("https://paatokset.hel.fi/api/c") == 1.0
+
+        assert clock.sleeps == [1.0]
+        assert set(limiter.stats()) == {"paatokset.hel.fi", "liitteet.hel.fi"}
+
+    def test_waiter_honours_throttle_received_while_sleeping(self):
+        limiter = RateLimiter(rate=1.0, burst=1, min_rate=0.1)
+        clock = _Clock()
+
+        def sleep(seconds: float) -> None:
+            if not clock.sleeps:
+                limiter.record_response("https://api.test/x", 429, {"retry-after": "5"})
+            clock.sleep(seconds)
+
+        with patch("app.services.rate_limiter.time.monotonic", new=clock), patch(
+            "app.services.rate_limiter.time.sleep", new=sleep
+        ):
+            limiter.acquire("https://api.test/a")
+            waited = limiter.acquire("https://api.test/b")
+
+        # The first sleep ends inside the Retry-After pause, which is waited out
+        assert clock.sleeps == [1.0, 4.0]
+        assert waited == 5.0
+
+    def test_record_response_adapts_rate(self):
+        limiter = RateLimiter(rate=4.0, burst=1, min_rate=0.1)
+        limiter.record_response("https://api.test/x", 503, {"retry-after": "2"})
+        stats = limiter.stats()["api.test"]
+        assert stats["rate"] == 2.0
+        assert stats["throttled"] == 1
+        assert 0 < stats["paused_for_s"] <= 2.0
+
+        limiter.record_response("https://api.test/x", 200, {})
+        assert limiter.stats()["api.test"]["rate"] == 2.2
+
+    def test_async_acquire_does_not_block_other_tasks(self):
+        limiter = RateLimiter(rate=2.0, burst=1, min_rate=0.1)
+        clock = _Clock()
+        yield_to_loop = asyncio.sleep
+
+        async def fake_sleep(seconds: float) -> None:
+            clock.sleep(seconds)
+            await yield_to_loop(0)
+
+        async def run():
+            with patch("app.services.rate_limiter.time.monotonic", new=clock), patch(
+                "app.services.rate_limiter.asyncio.sleep", new=AsyncMock(side_effect=fake_sleep)
+            ):
+                return await asyncio.gather(
+                    *(limiter.acquire_async("https://api.test") for _ in range(3))
+                )
+
+        waited = asyncio.run(run())
+        # Three requests at 2 req/s with a burst of 1 need one second in total
+        assert sorted(waited) == [0.0, 0.0, 1.0]
+        assert clock.now == 101.0
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("100000") == 300.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
@@ -0,0 +1,80 @@
+"""
+Unit tests for DelayedRetryQueue.
+"""
+
+import threading
+import time
+
+from app.services.retry_queue import DelayedRetryQueue
+
+
+def _queue(fetch, max_attempts=3, min_wait=0.0, multiplier=2.0, **kwargs):
+    recovered, given_up = [], []
+    retry_queue = DelayedRetryQueue(
+        fetch=fetch,
+        on_success=lambda item_id, result, context: recovered.append((item_id, result, context)),
+        on_give_up=lambda item_id, context: given_up.append((item_id, context)),
+        max_attempts=max_attempts,
+        min_wait=min_wait,
+        max_wait=10.0,
+        multiplier=multiplier,
+        **kwargs,
+    )
+    return retry_queue, recovered, given_up
+
+
+class TestDelayedRetryQueue:
+    def test_recovers_item_and_passes_context(self):
+        retry_queue, recovered, given_up = _queue(lambda item_id: f"doc-{item_id}")
+
+        retry_queue.add("a", ("start", "end"))
+        retry_queue.close()
+
+        assert recovered == [("a", "doc-a", ("start", "end"))]
+        assert given_up == []
+
+    def test_gives_up_after_max_attempts(self):
+        calls = []
+
+        def fetch(item_id):
+            calls.append(item_id)
+            raise ConnectionError("down")
+
+        retry_queue, recovered, given_up = _queue(fetch, max_attempts=3)
+
+        retry_queue.add("a", "ctx")
+        retry_queue.close()
+
+        assert calls == ["a", "a", "a"]
+        assert recovered == []
+        assert given_up == [("a", "ctx")]
+
+    def test_backoff_grows_per_item(self):
+        times = []
+
+        def fetch(item_id):
+            times.append(time.monotonic())
+            return None
+
+        retry_queue, _, given_up = _queue(fetch, max_attempts=3, min_wait=0.05, multiplier=3.0)
+        added = time.monotonic()
+
+        retry_queue.add("a")
+        retry_queue.close()
+
+        assert len(times) == 3 and given_up == [("a", None)]
+        assert times[0] - added >= 0.05
+        assert times[1] - times[0] >= 0.15
+        assert times[2] - times[1] >= 0.45
+
+    def test_cancel_drops_scheduled_retries(self):
+        fetched = threading.Event()
+        retry_queue, recovered, _ = _queue(lambda item_id: fetched.set() or item_id, min_wait=60.0)
+
+        retry_queue.add("a")
+        assert retry_queue.pending() == 1
+        retry_queue.close(cancel=True)
+
+        assert retry_queue.pending() == 0
+        assert not fetched.wait(0.1)
+        assert recovered == []
@@ -0,0 +1,145 @@
+"""
+Unit tests for the /search query embedding and result caches.
+"""
+
+from unittest.mock import Mock, patch
+
+from app.services.ingestion_pipeline import IngestionPipeline
+from app.services.search_cache import IndexEpoch, SearchCache, TTLCache, normalize_query
+
+
+class TestTTLCache:
+    def test_evicts_least_recently_used(self):
+        cache = TTLCache(max_size=2, ttl_seconds=0)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_entries_expire(self):
+        cache = TTLCache(max_size=10, ttl_seconds=60)
+        with patch("app.services.search_cache.time.monotonic", return_value=1000.0):
+            cache.put("a", 1)
+        with patch("app.services.search_cache.time.monotonic", return_value=1059.0):
+            assert cache.get("a") == 1
+        with patch("app.services.search_cache.time.monotonic", return_value=1061.0):
+            assert cache.get("a") is None
+        assert cache.stats()["size"] == 0
+
+    def test_hit_rate(self):
+        cache = TTLCache(max_size=10, ttl_seconds=0)
+        assert cache.stats()["hit_rate"] is None
+        cache.put("a", 1)
+        cache.get("a")
+        cache.get("a")
+        cache.get("b")
+
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"]) == (2, 1)
+        assert stats["hit_rate"] == 0.6667
+
+    def test_zero_size_disables(self):
+        cache = TTLCache(max_size=0, ttl_seconds=0)
+        cache.put("a", 1)
+        assert cache.get("a") is None
+        assert cache.stats()["misses"] == 0
+
+
+class TestIndexEpoch:
+    def test_bump_is_seen_by_other_instances(self, tmp_path):
+        path = str(tmp_path / "index_epoch.json")
+        reader, writer = IndexEpoch(path), IndexEpoch(path)
+        assert reader.value == 0
+
+        writer.bump()
+        assert reader.value == 1
+        writer.bump()
+        assert reader.value == 2
+
+    def test_bump_continues_from_file(self, tmp_path):
+        path = str(tmp_path / "index_epoch.json")
+        IndexEpoch(path).bump()
+        assert IndexEpoch(path).bump() == 2
+
+
+class TestSearchCache:
+    def _cache(self, tmp_path, result_size: int = 10) -> SearchCache:
+        return SearchCache(
+            embedding_cache=TTLCache(10, 0),
+            result_cache=TTLCache(result_size, 0),
+            epoch=IndexEpoch(str(tmp_path / "index_epoch.json")),
+        )
+
+    def test_normalize_query(self):
+        assert normalize_query("  Helsingin   KAUPUNKI\n") == "helsingin kaupunki"
+
+    def test_embeddings_keyed_by_normalized_text(self, tmp_path):
+        cache = self._cache(tmp_path)
+        cache.put_embedding("Mitä päätettiin?", [0.1, 0.2])
+        assert cache.get_embedding("  mitä PÄÄTETTIIN? ") == [0.1, 0.2]
+
+    def test_failed_embedding_is_not_cached(self, tmp_path):
+        cache = self._cache(tmp_path)
+        cache.put_embedding("q", [])
+        assert cache.get_embedding("q") is None
+
+    def test_result_key_depends_on_options_and_epoch(self, tmp_path):
+        cache = self._cache(tmp_path)
+        key = cache.result_key([0.1, 0.2], top_k=10, filters={"is_attachment": None})
+        cache.put_results(key, [{"chunk_id": "r"}], {"total_ms": 1.0})
+
+        assert cache.result_key([0.1, 0.2], filters={"is_attachment": None}, top_k=10) == key
+        assert cache.result_key([0.1, 0.2], top_k=5, filters={"is_attachment": None}) != key
+        assert cache.get_results(key) == ([{"chunk_id": "r"}], {"total_ms": 1.0})
+
+        cache.invalidate()
+        new_key = cache.result_key([0.1, 0.2], top_k=10, filters={"is_attachment": None})
+        assert new_key != key
+        assert cache.get_results(new_key) is None
+
+    def test_empty_results_are_not_cached(self, tmp_path):
+        cache = self._cache(tmp_path)
+        key = cache.result_key([0.1, 0.2], top_k=10)
+        cache.put_results(key, [], {"total_ms": 1.0})
+        assert cache.get_results(key) is None
+
+    def test_result_cache_disabled_by_default_size(self, tmp_path):
+        cache = self._cache(tmp_path, result_size=0)
+        assert cache.result_key([0.1], top_k=10) is None
+        assert cache.stats()["results"]["enabled"] is False
+
+
+def test_ingestion_bumps_index_epoch():
+    chunk = Mock(chunk_id="dec-1_chunk_0", native_id="dec-1", chunk_index=0, text="t")
+    chunk.token_count = 1
+    chunk.metadata = {}
+    chunker = Mock()
+    chunker.chunk_text.return_value = [chunk]
+    embedder = Mock()
+    embedder.create_embeddings.return_value = [Mock(chunk_id="dec-1_chunk_0", embedding=[0.1])]
+    vector_store = Mock()
+    vector_store.document_exists.return_value = False
+    vector_store.delete_document.return_value = 1
+    vector_store.bulk_index_chunks.return_value = {"success": 1, "failed": 0, "errors": []}
+    repository = Mock()
+    repository.get_decision.return_value = Mock(
+        Content="<p>x</p>", Title="t", DateDecision=None, Attachments=[]
+    )
+    search_cache = Mock()
+    pipeline = IngestionPipeline(
+        repository=repository,
+        chunker=chunker,
+        embedder=embedder,
+        vector_store=vector_store,
+        search_cache=search_cache,
+    )
+
+    with patch("app.services.ingestion_pipeline.convert_decision_content", return_value="x"):
+        pipeline.process_document("dec-1", reindex=True)
+
+    # Once for the deleted chunks, once for the new ones
+    assert search_cache.invalidate.call_count == 2
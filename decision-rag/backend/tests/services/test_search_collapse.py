@@ -0,0 +1,219 @@
+"""
+Unit tests for decision-level result collapsing and neighbour-chunk expansion.
+
+Backend clients are mocked; no live service is required.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.services.elasticsearch_store import ElasticsearchVectorStore
+from app.services.local_vector_store import LocalVectorStore
+from app.services.vector_store import CompositeVectorStore, collapse_by_native_id
+
+
+def _hit(chunk_id: str, native_id: str, chunk_index: int, score: float = 1.0) -> dict:
+    return {
+        "_score": score,
+        "_source": {
+            "id": chunk_id,
+            "text": chunk_id,
+            "metadata": {"native_id": native_id, "chunk_index": chunk_index},
+        },
+    }
+
+
+def test_collapse_by_native_id_keeps_first_of_each():
+    results = [
+        {"chunk_id": "a1", "native_id": "a"},
+        {"chunk_id": "a2", "native_id": "a"},
+        {"chunk_id": "b1", "native_id": "b"},
+        {"chunk_id": "c1", "native_id": "c"},
+    ]
+    assert [r["chunk_id"] for r in collapse_by_native_id(results, 2)] == ["a1", "b1"]
+
+
+class TestElasticsearchCollapse:
+    @pytest.fixture()
+    def client(self):
+        client = MagicMock()
+        client.ping.return_value = True
+        client.indices.exists.return_value = True
+        client.search.return_value = {
+            "hits": {"hits": [_hit("a_chunk_3", "a", 3), _hit("b_chunk_0", "b", 0)]}
+        }
+        return client
+
+    def _store(self, client, shortlist_dims: int = 0) -> ElasticsearchVectorStore:
+        with (
+            patch("app.services.elasticsearch_store.Elasticsearch", return_value=client),
+            patch(
+                "app.services.elasticsearch_store.settings.ELASTICSEARCH_SHORTLIST_DIMS",
+                shortlist_dims,
+            ),
+        ):
+            return ElasticsearchVectorStore(index_name="decision_documents", vector_dims=4)
+
+    def test_field_collapse_on_oversampled_candidates(self, client):
+        store = self._store(client)
+        with patch("app.services.elasticsearch_store.settings.SEARCH_COLLAPSE_OVERSAMPLING", 4):
+            store.search([0.1, 0.2, 0.3, 0.4], top_k=5, collapse=True)
+
+        body = client.search.call_args.kwargs["body"]
+        assert body["collapse"] == {"field": "metadata.native_id"}
+        assert body["knn"]["k"] == 20
+
+    def test_shortlist_collapses_rescored_hits_client_side(self, client):
+        client.search.return_value = {
+            "hits": {
+                "hits": [
+                    _hit("a_chunk_3", "a", 3, 0.9),
+                    _hit("a_chunk_4", "a", 4, 0.8),
+                    _hit("b_chunk_0", "b", 0, 0.7),
+                ]
+            }
+        }
+        store = self._store(client, shortlist_dims=2)
+
+        results = store.search([0.1, 0.2, 0.3, 0.4], top_k=2, collapse=True)
+
+        assert "collapse" not in client.search.call_args.kwargs["body"]
+        assert [r["chunk_id"] for r in results] == ["a_chunk_3", "b_chunk_0"]
+
+    def test_neighbours_fetched_in_one_request(self, client):
+        store = self._store(client)
+        client.search.side_effect = [
+            client.search.return_value,
+            {
+                "hits": {
+                    "hits": [
+                        _hit("b_chunk_0", "b", 0),
+                        _hit("a_chunk_2", "a", 2),
+                        _hit("b_chunk_1", "b", 1),
+                        _hit("a_chunk_3", "a", 3),
+                        _hit("a_chunk_4", "a", 4),
+                    ]
+                }
+            },
+        ]
+
+        results = store.search([0.1, 0.2, 0.3, 0.4], top_k=2, neighbours=1)
+
+        assert client.search.call_count == 2
+        windows = client.search.call_args.kwargs["body"]["query"]["bool"]["should"]
+        assert windows[0]["bool"]["filter"][1] == {
+            "range": {"metadata.chunk_index": {"gte": 2, "lte": 4}}
+        }
+        assert [c["chunk_id"] for c in results[0]["context_chunks"]] == [
+            "a_chunk_2",
+            "a_chunk_3",
+            "a_chunk_4",
+        ]
+        assert results[1]["context"] == "b_chunk_0\n\nb_chunk_1"
+        assert store.last_search_timings["neighbours_ms"] >= 0
+
+
+class TestPgvectorCollapse:
+    @pytest.fixture(autouse=True)
+    def collapsed_rows(self, mock_conn):
+        _, cursor = mock_conn
+        cursor.fetchall.return_value = [
+            {
+                "id": "a_chunk_3",
+                "collection_name": "decisions",
+                "text": "three",
+                "vmetadata": {"native_id": "a", "chunk_index": 3},
+                "score": 0.9,
+                "context_chunks": [
+                    {"chunk_id": "a_chunk_2", "chunk_index": 2, "text": "two"},
+                    {"chunk_id": "a_chunk_3", "chunk_index": 3, "text": "three"},
+                ],
+            }
+        ]
+
+    def test_collapse_wraps_query_with_window_function(self, mock_conn, pg_store):
+        _, cursor = mock_conn
+        with patch("app.services.pgvector_store.settings.SEARCH_COLLAPSE_OVERSAMPLING", 4):
+            pg_store().search([0.1, 0.2, 0.3], top_k=5, collapse=True)
+
+        sql, params = cursor.execute.call_args.args
+        sql = " ".join(sql.split())
+        assert "PARTITION BY hits.vmetadata->>'native_id' ORDER BY hits.score DESC" in sql
+        assert sql.endswith("WHERE native_rank = 1 ORDER BY score DESC LIMIT %s;")
+        assert params == ["[0.1,0.2,0.3]", "[0.1,0.2,0.3]", 20, 5]
+
+    def test_neighbours_aggregated_in_same_statement(self, mock_conn, pg_store):
+        _, cursor = mock_conn
+        store = pg_store(promoted_columns=True)
+
+        results = store.search([0.1, 0.2, 0.3], top_k=5, neighbours=2)
+
+        assert cursor.execute.call_count == 1
+        sql, params = cursor.execute.call_args.args
+        sql = " ".join(sql.split())
+        assert "FROM document_chunk n WHERE n.native_id = hits.vmetadata->>'native_id'" in sql
+        assert params[:2] == [2, 2]
+        assert results[0]["context"] == "two\n\nthree"
+        assert len(results[0]["context_chunks"]) == 2
+
+    def test_plain_query_is_unchanged(self, mock_conn, pg_store):
+        _, cursor = mock_conn
+        pg_store().search([0.1, 0.2, 0.3], top_k=5)
+
+        sql, params = cursor.execute.call_args.args
+        assert "native_rank" not in sql and "context_chunks" not in sql
+        assert params == ["[0.1,0.2,0.3]", "[0.1,0.2,0.3]", 5]
+
+
+class TestLocalCollapse:
+    @pytest.fixture()
+    def store(self, tmp_path):
+        LocalVectorStore._indexes.clear()
+        store = LocalVectorStore(directory=tmp_path / "store", vector_dims=2, dtype="float32")
+        store.bulk_index_chunks(
+            [
+                {
+                    "chunk_id": f"{native_id}_chunk_{i}",
+                    "native_id": native_id,
+                    "chunk_index": i,
+                    "text": f"{native_id}{i}",
+                    "embedding": embedding,
+                    "metadata": {},
+                }
+                for native_id, embeddings in (
+                    ("a", [[1.0, 0.0], [0.99, 0.1], [0.98, 0.2]]),
+                    ("b", [[0.9, 0.4], [0.0, 1.0]]),
+                )
+                for i, embedding in enumerate(embeddings)
+            ]
+        )
+        yield store
+        LocalVectorStore._indexes.clear()
+
+    def test_collapse_returns_one_chunk_per_document(self, store):
+        results = store.search([1.0, 0.0], top_k=2, collapse=True)
+        assert [r["chunk_id"] for r in results] == ["a_chunk_0", "b_chunk_0"]
+
+    def test_neighbours_attach_context_in_chunk_order(self, store):
+        (result,) = store.search([0.99, 0.1], top_k=1, neighbours=1)
+        assert result["chunk_id"] == "a_chunk_1"
+        assert result["context"] == "a0\n\na1\n\na2"
+
+
+def test_composite_rrf_collapses_fused_results():
+    b1, b2 = MagicMock(), MagicMock()
+    b1.search.return_value = [
+        {"chunk_id": "a1", "native_id": "a"},
+        {"chunk_id": "b1", "native_id": "b"},
+    ]
+    b2.search.return_value = [
+        {"chunk_id": "a2", "native_id": "a"},
+        {"chunk_id": "c1", "native_id": "c"},
+    ]
+    composite = CompositeVectorStore([b1, b2], read_mode="rrf")
+
+    results = composite.search([0.1], top_k=2, collapse=True, neighbours=1)
+
+    b1.search.assert_called_once_with([0.1], 2, None, None, True, 1)
+    assert [r["native_id"] for r in results] == ["a", "b"]
@@ -0,0 +1,171 @@
+"""
+Unit tests for SearchFilter and its compilation in each vector store backend.
+
+Backend clients are mocked; no live service is required.
+"""
+
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pydantic import ValidationError
+
+from app.api.v1.models.requests import SearchRequest
+from app.services.elasticsearch_store import ElasticsearchVectorStore
+from app.services.local_vector_store import LocalVectorStore
+from app.services.search_filters import FilterCondition, SearchFilter
+
+FILTER = SearchFilter(
+    organizations=["Kaupunginhallitus", "Kaupunginvaltuusto"],
+    date_from=date(2024, 1, 1),
+    date_to=date(2024, 6, 30),
+    classification_codes="00 01 00",
+    is_attachment=False,
+)
+
+
+class TestSearchFilter:
+    def test_conditions(self):
+        assert FILTER.conditions() == [
+            FilterCondition("organization_name", "in", ["Kaupunginhallitus", "Kaupunginvaltuusto"]),
+            FilterCondition("classification_code", "eq", "00 01 00"),
+            FilterCondition("date_decision", "gte", "2024-01-01"),
+            FilterCondition("date_decision", "lt", "2024-07-01"),
+            FilterCondition("is_attachment", "eq", False),
+        ]
+
+    def test_empty_filter(self):
+        assert SearchFilter().is_empty()
+        assert SearchFilter().to_elasticsearch() is None
+        assert SearchFilter().to_pgvector() == ("", [])
+
+    def test_reversed_date_range_is_rejected(self):
+        with pytest.raises(ValidationError):
+            SearchFilter(date_from=date(2024, 2, 1), date_to=date(2024, 1, 1))
+
+    def test_elasticsearch_bool_filter(self):
+        assert FILTER.to_elasticsearch() == {
+            "bool": {
+                "filter": [
+                    {
+                        "terms": {
+                            "metadata.organization_name": [
+                                "Kaupunginhallitus",
+                                "Kaupunginvaltuusto",
+                            ]
+                        }
+                    },
+                    {"term": {"metadata.classification_code": "00 01 00"}},
+                    {"term": {"metadata.is_attachment": False}},
+                    {"range": {"metadata.date_decision": {"gte": "2024-01-01", "lt": "2024-07-01"}}},
+                ]
+            }
+        }
+
+    def test_pgvector_predicate(self):
+        sql, params = FILTER.to_pgvector()
+        assert sql == (
+            "(vmetadata->>'organization_name') = ANY(%s) AND "
+            "(vmetadata->>'classification_code') = %s AND "
+            "(vmetadata->>'date_decision') >= %s AND "
+            "(vmetadata->>'date_decision') < %s AND "
+            "((vmetadata->>'is_attachment')::boolean) = %s"
+        )
+        assert params == [
+            ["Kaupunginhallitus", "Kaupunginvaltuusto"],
+            "00 01 00",
+            "2024-01-01",
+            "2024-07-01",
+            False,
+        ]
+
+    def test_search_request_merges_flat_fields(self):
+        request = SearchRequest(
+            query="q",
+            start_date="2024-01-01",
+            organization="Kaupunginhallitus",
+            filters={"is_attachment": True},
+        )
+        merged = request.to_search_filter()
+        assert merged.date_from == date(2024, 1, 1)
+        assert merged.organizations == ["Kaupunginhallitus"]
+        assert merged.is_attachment is True
+
+
+class TestBackendCompilation:
+    def test_elasticsearch_uses_knn_prefilter_and_drops_vectors(self):
+        client = MagicMock()
+        client.ping.return_value = True
+        client.indices.exists.return_value = True
+        client.search.return_value = {"hits": {"hits": []}}
+        with (
+            patch("app.services.elasticsearch_store.Elasticsearch", return_value=client),
+            patch("app.services.elasticsearch_store.settings.ELASTICSEARCH_SHORTLIST_DIMS", 0),
+        ):
+            store = ElasticsearchVectorStore(index_name="decision_documents", vector_dims=3)
+
+        store.search([0.1, 0.2, 0.3], top_k=5, filter_conditions=FILTER)
+
+        body = client.search.call_args.kwargs["body"]
+        assert body["knn"]["filter"] == FILTER.to_elasticsearch()
+        assert "filter" not in body
+        assert body["_source"] == {"excludes": ["vector", "vector_short"]}
+
+    def test_pgvector_where_clause(self, mock_conn, pg_store):
+        _, cursor = mock_conn
+
+        pg_store().search(
+            [0.1, 0.2, 0.3], top_k=5, filter_conditions=SearchFilter(is_attachment=True)
+        )
+
+        sql, params = cursor.execute.call_args.args
+        assert "WHERE ((vmetadata->>'is_attachment')::boolean) = %s" in " ".join(sql.split())
+        assert params == ["[0.1,0.2,0.3]", True, "[0.1,0.2,0.3]", 5]
+
+    def test_pgvector_filter_indexes_match_predicates(self, mock_conn, pg_store):
+        _, cursor = mock_conn
+
+        pg_store().create_filter_indexes()
+
+        statements = [c.args[0] for c in cursor.execute.call_args_list]
+        assert (
+            "CREATE INDEX IF NOT EXISTS document_chunk_date_decision_idx ON document_chunk "
+            "((vmetadata->>'date_decision'));"
+        ) in statements
+        assert (
+            "CREATE INDEX IF NOT EXISTS document_chunk_is_attachment_idx ON document_chunk "
+            "(((vmetadata->>'is_attachment')::boolean));"
+        ) in statements
+
+    def test_local_store_ranges_and_sets(self, tmp_path):
+        LocalVectorStore._indexes.clear()
+        store = LocalVectorStore(directory=tmp_path / "store", vector_dims=3, dtype="float32")
+
+        def chunk(chunk_id, **metadata):
+            return {
+                "chunk_id": chunk_id,
+                "native_id": chunk_id,
+                "chunk_index": 0,
+                "text": chunk_id,
+                "embedding": [1.0, 0.0, 0.0],
+                "metadata": metadata,
+            }
+
+        store.bulk_index_chunks(
+            [
+                chunk("early", date_decision="2023-12-31T00:00:00", organization_name="A"),
+                chunk("in", date_decision="2024-06-30T14:00:00", organization_name="B"),
+                chunk("other_org", date_decision="2024-03-01T00:00:00", organization_name="C"),
+                chunk("undated", organization_name="A"),
+            ]
+        )
+
+        results = store.search(
+            [1.0, 0.0, 0.0],
+            filter_conditions=SearchFilter(
+                organizations=["A", "B"], date_from=date(2024, 1, 1), date_to=date(2024, 6, 30)
+            ),
+        )
+
+        assert [r["chunk_id"] for r in results] == ["in"]
+        LocalVectorStore._indexes.clear()
@@ -0,0 +1,146 @@
+"""
+Tests for the asyncio document fetch mode of DecisionAPIClient.
+
+Requests are served by httpx.MockTransport; no live API is required.
+"""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+from tenacity import RetryError, wait_none
+
+from app.core.config import settings
+from app.schemas.decision import DecisionDocument
+from app.services.api_client import DecisionAPIClient
+from app.services.data_fetcher import DecisionDataFetcher
+from app.services.rate_limiter import RateLimiter
+
+
+@pytest.fixture()
+def api_settings():
+    with (
+        patch.object(settings, "API_BASE_URL", "https://api.test"),
+        patch.object(settings, "DECISION_DOCUMENT_ENDPOINT", "/decisions/{native_id}"),
+        patch.object(DecisionAPIClient._make_request_async.retry, "wait", wait_none()),
+    ):
+        yield
+
+
+def _client(handler) -> DecisionAPIClient:
+    client = DecisionAPIClient(limiter=RateLimiter(rate=1000.0, burst=100))
+    client._async_client = lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+class TestAsyncFetch:
+    def test_documents_parsed_and_missing_ones_none(self, api_settings):
+        def handler(request: httpx.Request) -> httpx.Response:
+            native_id = request.url.path.rsplit("/", 1)[-1]
+            assert request.url.params["api-key"] == "key"
+            if native_id == "missing":
+                return httpx.Response(404, text="Not Found")
+            if native_id == "v2":
+                return httpx.Response(200, json=[{"NativeId": "v2", "Title": "List"}])
+            return httpx.Response(200, json={"NativeId": native_id, "Title": "Dict"})
+
+        saved = []
+        client = _client(handler)
+        client.raw_response_saver = lambda native_id, data: saved.append(native_id)
+
+        results = client.fetch_decision_documents(["a", "missing", "v2"], "key")
+
+        assert results["a"].Title == "Dict"
+        assert results["missing"] is None
+        assert results["v2"].NativeId == "v2"
+        assert sorted(saved) == ["a", "v2"]
+
+    def test_network_errors_retried(self, api_settings):
+        attempts = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            attempts.append(request)
+            if len(attempts) < settings.MAX_RETRY_ATTEMPTS:
+                raise httpx.ConnectError("refused", request=request)
+            return httpx.Response(200, json={"NativeId": "a"})
+
+        results = _client(handler).fetch_decision_documents(["a"], "key")
+
+        assert results["a"].NativeId == "a"
+        assert len(attempts) == settings.MAX_RETRY_ATTEMPTS
+
+    def test_failure_after_retries_returned_as_exception(self, api_settings):
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ReadTimeout("slow", request=request)
+
+        results = _client(handler).fetch_decision_documents(["a"], "key")
+
+        assert isinstance(results["a"], RetryError)
+
+    def test_throttle_response_slows_host_and_is_retried(self, api_settings):
+        responses = [
+            httpx.Response(429, headers={"Retry-After": "0"}),
+            httpx.Response(200, json={"NativeId": "a"}),
+        ]
+        client = _client(lambda request: responses.pop(0))
+
+        results = client.fetch_decision_documents(["a"], "key")
+
+        assert results["a"].NativeId == "a"
+        stats = client.rate_limiter.stats()["api.test"]
+        assert stats["throttled"] == 1
+        assert stats["requests"] == 2
+        assert stats["rate"] < 1000.0
+
+
+def test_fetcher_uses_async_mode_when_enabled():
+    api_client = MagicMock()
+    api_client.fetch_decision_documents.return_value = {
+        "a": DecisionDocument(NativeId="a"),
+        "b": None,
+        "c": httpx.ConnectError("refused"),
+    }
+    fetcher = DecisionDataFetcher(api_client=api_client)
+
+    with patch.object(settings, "API_ASYNC_FETCH", True):
+        documents, failed_ids = fetcher._fetch_documents_for_ids(["a", "b", "c"], "key")
+
+    api_client.fetch_decision_document.assert_not_called()
+    assert [d.NativeId for d in documents] == ["a"]
+    assert failed_ids == ["b", "c"]
+    assert fetcher.stats["errors"] == 2
+
+
+def test_blocking_handoff_does_not_stall_other_fetches(api_settings):
+    released = threading.Event()
+    handed_over = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        native_id = request.url.path.rsplit("/", 1)[-1]
+        return httpx.Response(200, json={"NativeId": native_id})
+
+    def on_document(document: DecisionDocument) -> None:
+        # The first handoff blocks, like a full buffer, until every fetch is done
+        if not handed_over:
+            assert released.wait(5)
+        handed_over.append((document.NativeId, threading.current_thread().name))
+
+    client = _client(handler)
+    original = client._fetch_decision_document_async
+    fetched = []
+
+    async def fetch_and_count(http_client, native_id, api_key):
+        document = await original(http_client, native_id, api_key)
+        fetched.append(native_id)
+        if len(fetched) == 3:
+            released.set()
+        return document
+
+    client._fetch_decision_document_async = fetch_and_count
+
+    results = client.fetch_decision_documents(["a", "b", "c"], "key", on_document=on_document)
+
+    assert sorted(results) == ["a", "b", "c"]
+    assert sorted(native_id for native_id, _ in handed_over) == ["a", "b", "c"]
+    assert all(name.startswith("document-handoff") for _, name in handed_over)
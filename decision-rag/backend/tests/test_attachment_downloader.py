@@ -2,7 +2,7 @@
 Unit tests for attachment downloader service.
 """
 
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import httpx
 import pytest
@@ -11,6 +11,14 @@ from app.schemas.decision import Attachment
 from app.services.attachment_downloader import AttachmentDownloader
 
 
+def _streamed(response, chunks=(b"PDF content",)):
+    """Wrap a mock response as the context manager returned by httpx.Client.stream."""
+    response.iter_bytes = Mock(side_effect=lambda chunk_size=None: iter(chunks))
+    stream = MagicMock()
+    stream.__enter__.return_value = response
+    return stream
+
+
 @pytest.fixture
 def downloader():
     """Create attachment downloader instance."""
@@ -88,16 +96,15 @@ def test_should_fetch_attachment_no_uri(downloader):
     assert downloader.should_fetch_attachment(attachment) is False
 
 
-@patch("app.services.attachment_downloader.httpx.Client.get")
-def test_download_attachment_success(mock_get, downloader, tmp_path):
+@patch("app.services.attachment_downloader.httpx.Client.stream")
+def test_download_attachment_success(mock_stream, downloader, tmp_path):
     """Test successful attachment download."""
     # Mock successful response
     mock_response = Mock()
     mock_response.status_code = 200
-    mock_response.content = b"PDF content"
     mock_response.headers = {"content-length": "11"}
     mock_response.raise_for_status = Mock()
-    mock_get.return_value = mock_response
+    mock_stream.return_value = _streamed(mock_response, [b"PDF ", b"content"])
 
     target_path = tmp_path / "test.pdf"
     result = downloader.download_attachment(
@@ -109,8 +116,8 @@ def test_download_attachment_success(mock_get, downloader, tmp_path):
     assert target_path.read_bytes() == b"PDF content"
 
 
-@patch("app.services.attachment_downloader.httpx.Client.get")
-def test_download_attachment_http_error(mock_get, downloader, tmp_path):
+@patch("app.services.attachment_downloader.httpx.Client.stream")
+def test_download_attachment_http_error(mock_stream, downloader, tmp_path):
     """Test attachment download with HTTP error."""
     # Mock HTTP error
     mock_response = Mock()
@@ -119,7 +126,7 @@ def test_download_attachment_http_error(mock_get, downloader, tmp_path):
     mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
         "404 Not Found", request=Mock(), response=mock_response
     )
-    mock_get.return_value = mock_response
+    mock_stream.return_value = _streamed(mock_response)
 
     target_path = tmp_path / "test.pdf"
     result = downloader.download_attachment(
@@ -130,16 +137,15 @@ def test_download_attachment_http_error(mock_get, downloader, tmp_path):
     assert not target_path.exists()
 
 
-@patch("app.services.attachment_downloader.httpx.Client.get")
-def test_download_attachment_too_large(mock_get, downloader, tmp_path):
+@patch("app.services.attachment_downloader.httpx.Client.stream")
+def test_download_attachment_too_large(mock_stream, downloader, tmp_path):
     """Test that large attachments are rejected."""
     # Mock response with large file
     mock_response = Mock()
     mock_response.status_code = 200
-    mock_response.content = b"Large content"
     mock_response.headers = {"content-length": str(100 * 1024 * 1024)}  # 100MB
     mock_response.raise_for_status = Mock()
-    mock_get.return_value = mock_response
+    mock_stream.return_value = _streamed(mock_response)
 
     target_path = tmp_path / "large.pdf"
     result = downloader.download_attachment(
@@ -148,18 +154,45 @@ def test_download_attachment_too_large(mock_get, downloader, tmp_path):
 
     assert result is None
     assert not target_path.exists()
+    mock_response.iter_bytes.assert_not_called()
+
 
+@patch("app.services.attachment_downloader.httpx.Client.stream")
+def test_download_attachment_too_large_without_content_length(mock_stream, downloader, tmp_path):
+    """Downloads without Content-Length stop once the byte count passes the limit."""
+    chunks_read = []
 
-@patch("app.services.attachment_downloader.httpx.Client.get")
-def test_download_attachments(mock_get, downloader, tmp_path, sample_attachment, private_attachment):
+    def chunks():
+        for i in range(100):
+            chunks_read.append(i)
+            yield b"x" * 512 * 1024
+
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.headers = {}
+    mock_response.raise_for_status = Mock()
+    mock_stream.return_value = _streamed(mock_response, chunks())
+
+    target_path = tmp_path / "large.pdf"
+    with patch("app.services.attachment_downloader.settings.MAX_ATTACHMENT_SIZE_MB", 1):
+        result = downloader.download_attachment(
+            "https://example.com/large.pdf", target_path, "Large Attachment"
+        )
+
+    assert result is None
+    assert len(chunks_read) == 3
+    assert list(tmp_path.iterdir()) == []  # No partial file left behind
+
+
+@patch("app.services.attachment_downloader.httpx.Client.stream")
+def test_download_attachments(mock_stream, downloader, tmp_path, sample_attachment, private_attachment):
     """Test batch download of attachments with filtering."""
     # Mock successful response
     mock_response = Mock()
     mock_response.status_code = 200
-    mock_response.content = b"PDF content"
     mock_response.headers = {"content-length": "11"}
     mock_response.raise_for_status = Mock()
-    mock_get.return_value = mock_response
+    mock_stream.return_value = _streamed(mock_response)
 
     attachments = [sample_attachment, private_attachment]
     result = downloader.download_attachments(attachments, tmp_path, "DEC-001")
@@ -170,6 +203,20 @@ def test_download_attachments(mock_get, downloader, tmp_path, sample_attachment,
     assert result["ATT-001"].exists()
 
 
+def test_download_attachments_processes_identical_files_once(downloader, tmp_path):
+    """Attachments with identical content are returned once."""
+    files = {"ATT-1": b"same", "ATT-2": b"same", "ATT-3": b"other"}
+    downloaded = {}
+    for native_id, content in files.items():
+        path = tmp_path / f"{native_id}.pdf"
+        path.write_bytes(content)
+        downloaded[native_id] = path
+
+    result = downloader._drop_duplicate_files(downloaded, "DEC-001")
+
+    assert sorted(result) == ["ATT-1", "ATT-3"]
+
+
 def test_get_extension_from_uri(downloader):
     """Test file extension extraction from URI."""
     assert downloader._get_extension_from_uri("https://example.com/file.pdf") == ".pdf"
@@ -195,11 +242,11 @@ def test_rate_limiting(downloader):
 
     start_time = time.time()
 
-    # Make two sequential rate-limited calls
-    downloader._rate_limit()
-    downloader._rate_limit()
+    # Use up the burst, then one more call has to wait for a token
+    for _ in range(downloader.rate_limiter.burst + 1):
+        downloader.rate_limiter.acquire("https://example.com/test.pdf")
 
     elapsed = time.time() - start_time
 
-    # Should take at least one rate_limit_delay interval
-    assert elapsed >= downloader.rate_limit_delay * 0.9  # Allow small timing variance
+    # Should take at least one interval at the configured rate
+    assert elapsed >= 1.0 / downloader.rate_limiter.rate * 0.9  # Allow small timing variance
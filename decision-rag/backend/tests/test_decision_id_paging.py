@@ -0,0 +1,135 @@
+"""
+Tests for paged decision ID listing and adaptive batch windows.
+"""
+
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+from app.core.config import settings
+from app.schemas.decision import DecisionId, DecisionIdResponse
+from app.services.api_client import DecisionAPIClient
+from app.services.data_fetcher import DecisionDataFetcher
+from app.services.rate_limiter import RateLimiter
+
+
+def _page(native_ids, count=None, page=None, size=2, next_count=None):
+    response = MagicMock()
+    response.status_code = 200
+    response.json.return_value = {
+        "decisions": [{"NativeId": native_id} for native_id in native_ids],
+        "count": count,
+        "page": page,
+        "size": size,
+        "nextCount": next_count,
+    }
+    return response
+
+
+def _client() -> DecisionAPIClient:
+    return DecisionAPIClient(limiter=RateLimiter(rate=1000.0, burst=100))
+
+
+class TestDecisionIdPaging:
+    @patch("app.services.api_client.httpx.Client")
+    def test_follows_all_pages_by_count(self, mock_client_class):
+        pages = {
+            None: _page(["A", "B"], count=5, page=0),
+            1: _page(["C", "D"], count=5, page=1),
+            2: _page(["D", "E"], count=5, page=2),
+        }
+        mock_client = mock_client_class.return_value
+        mock_client.get.side_effect = lambda url, params: pages[params.get("page")]
+
+        result = _client().fetch_decision_ids("key", "2024-01-01", "2024-01-02", size=2)
+
+        assert [d.NativeId for d in result.decisions] == ["A", "B", "C", "D", "E"]
+        assert result.count == 5
+        assert mock_client.get.call_count == 3
+
+    @patch("app.services.api_client.httpx.Client")
+    def test_short_pages_followed_until_count_reached(self, mock_client_class):
+        pages = {
+            None: _page(["A"], count=3, page=0, size=None),
+            1: _page(["B"], count=3, page=1, size=None),
+            2: _page(["C"], count=3, page=2, size=None),
+        }
+        mock_client = mock_client_class.return_value
+        mock_client.get.side_effect = lambda url, params: pages[params.get("page")]
+
+        result = _client().fetch_decision_ids("key", "2024-01-01", "2024-01-02", size=2)
+
+        assert [d.NativeId for d in result.decisions] == ["A", "B", "C"]
+        assert mock_client.get.call_count == 3
+
+    @patch("app.services.api_client.httpx.Client")
+    def test_stops_at_empty_page_before_count(self, mock_client_class):
+        pages = {
+            None: _page(["A", "B"], count=6, page=0),
+            1: _page(["C", "D"], count=6, page=1),
+            2: _page([], count=6, page=2),
+        }
+        mock_client = mock_client_class.return_value
+        mock_client.get.side_effect = lambda url, params: pages[params.get("page")]
+
+        result = _client().fetch_decision_ids("key", "2024-01-01", "2024-01-02", size=2)
+
+        assert [d.NativeId for d in result.decisions] == ["A", "B", "C", "D"]
+        assert mock_client.get.call_count == 3
+
+    @patch("app.services.api_client.httpx.Client")
+    def test_follows_next_count_without_total(self, mock_client_class):
+        mock_client = mock_client_class.return_value
+        mock_client.get.side_effect = [
+            _page(["A", "B"], next_count=1),
+            _page(["C"], next_count=0),
+        ]
+
+        result = _client().fetch_decision_ids("key", "2024-01-01", "2024-01-02", size=2)
+
+        assert [d.NativeId for d in result.decisions] == ["A", "B", "C"]
+        assert mock_client.get.call_args.kwargs["params"]["page"] == 1
+
+    @patch("app.services.api_client.httpx.Client")
+    def test_single_page_makes_one_request(self, mock_client_class):
+        mock_client = mock_client_class.return_value
+        mock_client.get.return_value = _page(["A"], count=1)
+
+        result = _client().fetch_decision_ids("key", "2024-01-01", "2024-01-02", size=2)
+
+        assert [d.NativeId for d in result.decisions] == ["A"]
+        assert "page" not in mock_client.get.call_args.kwargs["params"]
+
+
+def test_adaptive_windows_follow_id_counts():
+    api_client = MagicMock()
+    listed = {
+        datetime(2024, 1, 1): 100,  # Busy: next window halves
+        datetime(2024, 1, 3): 0,  # Sparse: next window doubles
+    }
+    api_client.fetch_decision_ids.side_effect = lambda key, start, end: DecisionIdResponse(
+        decisions=[
+            DecisionId(NativeId=f"{start}-{i}")
+            for i in range(listed.get(datetime.fromisoformat(start), 0))
+        ]
+    )
+    fetcher = DecisionDataFetcher(api_client=api_client)
+    fetcher._fetch_documents_for_ids = MagicMock(return_value=([], []))
+
+    with (
+        patch.object(settings, "ADAPTIVE_BATCH_WINDOWS", True),
+        patch.object(settings, "BATCH_SIZE_DAYS", 2),
+        patch.object(settings, "BATCH_MIN_HOURS", 24),
+        patch.object(settings, "BATCH_MAX_DAYS", 4),
+        patch.object(settings, "API_PAGE_SIZE", 100),
+    ):
+        list(fetcher.fetch_all_decisions("key", datetime(2024, 1, 1), datetime(2024, 1, 9)))
+
+    windows = [c.args[1:] for c in api_client.fetch_decision_ids.call_args_list]
+    assert windows == [
+        ("2024-01-01T00:00:00", "2024-01-03T00:00:00"),
+        ("2024-01-03T00:00:00", "2024-01-04T00:00:00"),
+        ("2024-01-04T00:00:00", "2024-01-06T00:00:00"),
+        ("2024-01-06T00:00:00", "2024-01-09T00:00:00"),
+    ]
+    assert fetcher.stats["total_batches"] == 4
+    assert fetcher.stats["batches_completed"] == 4
@@ -0,0 +1,129 @@
+"""
+Tests for yield-as-fetched streaming and window prefetch in DecisionDataFetcher.
+"""
+
+import threading
+import time
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.core.config import settings
+from app.schemas.decision import DecisionDocument, DecisionId, DecisionIdResponse
+from app.services.data_fetcher import DecisionDataFetcher
+
+
+def _listing(*native_ids: str) -> DecisionIdResponse:
+    return DecisionIdResponse(
+        count=len(native_ids), decisions=[DecisionId(NativeId=n) for n in native_ids]
+    )
+
+
+@pytest.fixture()
+def fetch_settings():
+    with (
+        patch.object(settings, "BATCH_SIZE_DAYS", 1),
+        patch.object(settings, "MAX_CONCURRENT_REQUESTS", 2),
+        patch.object(settings, "FETCH_PREFETCH_DOCUMENTS", 10),
+    ):
+        yield
+
+
+def test_documents_yielded_before_window_completes(fetch_settings):
+    first_consumed = threading.Event()
+    api_client = MagicMock()
+    api_client.fetch_decision_ids.return_value = _listing("A", "B")
+
+    def fetch_document(native_id, api_key):
+        if native_id == "B":
+            # Only completes once the consumer has received A
+            assert first_consumed.wait(timeout=5)
+        return DecisionDocument(NativeId=native_id)
+
+    api_client.fetch_decision_document.side_effect = fetch_document
+    fetcher = DecisionDataFetcher(api_client=api_client)
+
+    received = []
+    for document, _, _ in fetcher.fetch_all_decisions(
+        "key", datetime(2024, 1, 1), datetime(2024, 1, 2)
+    ):
+        received.append(document.NativeId)
+        first_consumed.set()
+
+    assert received == ["A", "B"]
+    assert fetcher.stats["documents_fetched"] == 2
+    assert fetcher.stats["batches_completed"] == 1
+
+
+def test_next_window_prefetched_while_consumer_works(fetch_settings):
+    api_client = MagicMock()
+    api_client.fetch_decision_ids.side_effect = [_listing("A"), _listing("B")]
+    api_client.fetch_decision_document.side_effect = lambda native_id, api_key: (
+        DecisionDocument(NativeId=native_id)
+    )
+    fetcher = DecisionDataFetcher(api_client=api_client)
+
+    documents = fetcher.fetch_all_decisions("key", datetime(2024, 1, 1), datetime(2024, 1, 3))
+    first, batch_start, _ = next(documents)
+
+    # The second window is listed and fetched without the consumer asking for it
+    deadline = time.monotonic() + 5
+    while api_client.fetch_decision_document.call_count < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert first.NativeId == "A" and batch_start == datetime(2024, 1, 1)
+    assert api_client.fetch_decision_document.call_count == 2
+    assert [d.NativeId for d, _, _ in documents] == ["B"]
+
+
+def test_closing_generator_stops_prefetch(fetch_settings):
+    api_client = MagicMock()
+    api_client.fetch_decision_ids.side_effect = lambda key, start, end: _listing(start)
+    api_client.fetch_decision_document.side_effect = lambda native_id, api_key: (
+        DecisionDocument(NativeId=native_id)
+    )
+    fetcher = DecisionDataFetcher(api_client=api_client)
+
+    with patch.object(settings, "FETCH_PREFETCH_DOCUMENTS", 1):
+        documents = fetcher.fetch_all_decisions("key", datetime(2024, 1, 1), datetime(2024, 3, 1))
+        next(documents)
+        documents.close()
+        time.sleep(0.3)
+
+    listed = api_client.fetch_decision_ids.call_count
+    time.sleep(0.3)
+    assert api_client.fetch_decision_ids.call_count == listed < 10
+
+
+def test_failed_document_retried_while_later_windows_continue(fetch_settings):
+    api_client = MagicMock()
+    api_client.fetch_decision_ids.side_effect = [_listing("A"), _listing("B")]
+    attempts = {"A": 0}
+
+    def fetch_document(native_id, api_key):
+        if native_id == "A":
+            attempts["A"] += 1
+            if attempts["A"] == 1:
+                return None
+        return DecisionDocument(NativeId=native_id)
+
+    api_client.fetch_decision_document.side_effect = fetch_document
+    fetcher = DecisionDataFetcher(api_client=api_client)
+
+    with (
+        patch.object(settings, "DOCUMENT_FETCH_RETRY_MIN_WAIT", 0.2),
+        patch.object(settings, "DOCUMENT_FETCH_RETRY_STAGGER_DELAY", 60.0),
+    ):
+        received = [
+            (document.NativeId, batch_start)
+            for document, batch_start, _ in fetcher.fetch_all_decisions(
+                "key", datetime(2024, 1, 1), datetime(2024, 1, 3)
+            )
+        ]
+
+    # B's window is not held up by A's backoff; A keeps its own window
+    assert received == [("B", datetime(2024, 1, 2)), ("A", datetime(2024, 1, 1))]
+    assert fetcher.stats["retry_attempts"] == 1
+    assert fetcher.stats["documents_recovered"] == 1
+    assert fetcher.stats["permanently_failed"] == 0
@@ -2,11 +2,13 @@
 Tests for ingestion pipeline.
 """
 
+import hashlib
 from unittest.mock import Mock, patch
 
 import pytest
 
-from app.schemas.decision import Attachment
+from app.schemas.decision import Attachment, DecisionDocument
+from app.services.chunker import DocumentChunk
 from app.services.ingestion_pipeline import IngestionPipeline
 
 
@@ -112,6 +114,22 @@ class TestIngestionPipeline:
         assert result["processed"] == 3
         assert result["failed"] == 3
 
+    def test_process_decisions_uses_documents_in_memory(
+        self, pipeline, mock_repository, mock_chunker
+    ):
+        """Documents handed over in memory are not loaded from the repository."""
+        decisions = [
+            DecisionDocument(NativeId="id1", Title="First", Content="<p>First text</p>"),
+            DecisionDocument(NativeId="", Title="Invalid", Content="<p>No ID</p>"),
+        ]
+
+        result = pipeline.process_decisions(decisions)
+
+        mock_repository.get_decision.assert_not_called()
+        assert result["total"] == 1
+        assert mock_chunker.chunk_text.call_args.kwargs["native_id"] == "id1"
+        assert "First text" in mock_chunker.chunk_text.call_args.kwargs["text"]
+
 
 class TestAttachmentProcessing:
     """Tests for attachment processing in ingestion pipeline."""
@@ -308,6 +326,137 @@ class TestAttachmentProcessing:
         assert result["attachments_processed"] == 0
         assert result["chunks_indexed"] == 0
 
+    @patch("app.services.ingestion_pipeline.convert_attachment_content")
+    def test_process_batch_schedules_attachments_batch_wide(
+        self, mock_convert, pipeline_with_attachments, mock_repository, tmp_path
+    ):
+        """Attachments of a batch go through one scheduler and are counted in the batch stats."""
+        mock_convert.return_value = "# Attachment\n\nText."
+        downloader = Mock()
+        downloader.should_fetch_attachment.return_value = True
+        downloader.attachment_path.side_effect = lambda temp_dir, decision_id, attachment: (
+            temp_dir / f"{attachment.NativeId}.pdf"
+        )
+
+        def download(file_uri, target_path, title=""):
+            target_path.parent.mkdir(parents=True, exist_ok=True)
+            target_path.write_bytes(file_uri.encode())
+            return target_path
+
+        downloader.download_attachment.side_effect = download
+        downloader.file_digest.side_effect = lambda path: path.read_bytes().decode()
+        pipeline_with_attachments.attachment_downloader = downloader
+
+        def decision(native_id):
+            return DecisionDocument(
+                NativeId=native_id,
+                Title="Decision",
+                Content="<p>Decision text</p>",
+                Attachments=[
+                    Attachment(
+                        NativeId=f"{native_id}-ATT",
+                        Title="Attachment",
+                        FileURI=f"https://example.com/{native_id}.pdf",
+                    )
+                ],
+            )
+
+        mock_repository.get_decision.side_effect = decision
+
+        download_dir = tmp_path / "downloads"
+        with patch(
+            "app.services.ingestion_pipeline.settings.ATTACHMENT_DOWNLOAD_DIR", str(download_dir)
+        ):
+            result = pipeline_with_attachments.process_batch(["DEC-1", "DEC-2"])
+
+        downloader.download_attachments.assert_not_called()
+        assert downloader.download_attachment.call_count == 2
+        assert result["total_attachments"] == 2
+        assert result["total_attachment_chunks"] == 2
+        assert not any(download_dir.iterdir())  # Per-decision directories removed
+
+    @patch("app.services.ingestion_pipeline.convert_attachment_content")
+    def test_shared_attachment_reused_across_decisions(
+        self,
+        mock_convert,
+        pipeline_with_attachments,
+        mock_chunker,
+        mock_embedder,
+        mock_vector_store,
+        tmp_path,
+    ):
+        """An attachment seen before is indexed for the new decision without reprocessing."""
+        mock_convert.return_value = "# Attachment\n\nText."
+        mock_embedder.create_embeddings.return_value[0].model = "text-embedding-3-large"
+        mock_chunker.rebuild_chunk.side_effect = (
+            lambda body, native_id, chunk_index, token_count, metadata: DocumentChunk(
+                chunk_id=f"{native_id}_chunk_{chunk_index}",
+                native_id=native_id,
+                chunk_index=chunk_index,
+                text=body,
+                token_count=token_count,
+                metadata=metadata,
+            )
+        )
+        downloader = Mock()
+        downloader.should_fetch_attachment.return_value = True
+        downloader.file_digest.side_effect = lambda path: hashlib.sha256(
+            path.read_bytes()
+        ).hexdigest()
+        pipeline_with_attachments.attachment_downloader = downloader
+
+        def decision(native_id, attachment_id, file_uri):
+            attachment = Attachment(NativeId=attachment_id, Title="Liite", FileURI=file_uri)
+            return DecisionDocument(NativeId=native_id, Title=native_id, Attachments=[attachment])
+
+        first, second, third = (tmp_path / f"{name}.pdf" for name in ("first", "second", "third"))
+        for path in (first, second):
+            path.write_bytes(b"same bytes")
+
+        # First decision processes the attachment
+        dec_1 = decision("DEC-1", "ATT-1", "https://example.com/a.pdf")
+        assert pipeline_with_attachments._process_single_attachment(
+            dec_1, dec_1.Attachments[0], first
+        )["success"]
+
+        # Identical bytes under another NativeId and URI reuse it
+        dec_2 = decision("DEC-2", "ATT-2", "https://example.com/b.pdf")
+        stats = pipeline_with_attachments._process_single_attachment(
+            dec_2, dec_2.Attachments[0], second
+        )
+
+        assert stats == {"success": True, "chunks_created": 1, "chunks_indexed": 1}
+        assert mock_convert.call_count == 1
+        assert mock_embedder.create_embeddings.call_count == 1
+        reused = mock_vector_store.bulk_index_chunks.call_args.args[0][0]
+        assert reused["chunk_id"] == "DEC-2_att_ATT-2_chunk_0"
+        assert reused["metadata"]["decision_native_id"] == "DEC-2"
+        assert reused["metadata"]["attachment_native_id"] == "ATT-2"
+        assert reused["embedding"] == pytest.approx([0.1] * 3072)
+
+        # A known NativeId is not even downloaded
+        dec_3 = decision("DEC-3", "ATT-1", "https://example.com/c.pdf")
+        with patch(
+            "app.services.ingestion_pipeline.settings.ATTACHMENT_DOWNLOAD_DIR", str(third.parent)
+        ):
+            with pipeline_with_attachments.create_attachment_scheduler() as scheduler:
+                scheduler.submit(dec_3)
+                results = scheduler.join()
+
+        downloader.download_attachment.assert_not_called()
+        assert results["DEC-3"]["attachments_processed"] == 1
+        assert mock_convert.call_count == 1
+
+    def test_generated_attachment_ids_are_not_registry_keys(self, pipeline_with_attachments):
+        """Locally generated NativeIds repeat across decisions and must not match."""
+        attachment = Attachment(NativeId="att_1", FileURI="https://example.com/a.pdf")
+
+        assert pipeline_with_attachments._attachment_keys(attachment, "abc") == {
+            "native_id": None,
+            "file_uri": "https://example.com/a.pdf",
+            "sha256": "abc",
+        }
+
 
 class TestMetadataHeaderIntegration:
     """Integration tests for metadata header embedding in chunks."""
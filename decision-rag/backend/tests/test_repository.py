@@ -2,7 +2,9 @@
 Tests for the DecisionRepository.
 """
 
-from app.repositories import DecisionRepository
+import threading
+
+from app.repositories import DecisionRepository, DecisionWriteBehind
 from app.schemas import DecisionDocument
 
 
@@ -81,3 +83,46 @@ def test_get_statistics(temp_data_dir, sample_decision_data):
     assert stats["total_documents"] == 3
     assert stats["storage_size_mb"] > 0
     assert "storage_path" in stats
+
+
+def test_write_behind_saves_in_background(temp_data_dir, sample_decision_data):
+    """Test that submitted decisions are saved by the time the writer is closed."""
+    repo = DecisionRepository(temp_data_dir)
+    decisions = [
+        DecisionDocument(**{**sample_decision_data, "NativeId": f"TEST-2024-00{i}"})
+        for i in range(3)
+    ]
+
+    with DecisionWriteBehind(repo, max_pending=1) as write_behind:
+        for decision in decisions:
+            write_behind.submit(decision)
+
+    assert write_behind.stats == {"saved": 3, "failed": 0}
+    assert all(repo.decision_exists(decision.NativeId) for decision in decisions)
+
+
+def test_write_behind_counts_rejected_decisions(temp_data_dir, sample_decision_data):
+    """Test that decisions failing validation are counted as failed."""
+    repo = DecisionRepository(temp_data_dir)
+    write_behind = DecisionWriteBehind(repo)
+
+    write_behind.submit(DecisionDocument(**{**sample_decision_data, "NativeId": ""}))
+
+    assert write_behind.close() == {"saved": 0, "failed": 1}
+
+
+def test_write_behind_saves_decision_as_submitted(temp_data_dir, sample_decision_data):
+    """Test that changes made after submit() do not reach the saved file."""
+    repo = DecisionRepository(temp_data_dir)
+    decision = DecisionDocument(**sample_decision_data)
+    changed = threading.Event()
+    save_decision = repo.save_decision
+    # Only save once the document has been changed
+    repo.save_decision = lambda d: changed.wait(timeout=5) and save_decision(d)
+
+    with DecisionWriteBehind(repo) as write_behind:
+        write_behind.submit(decision)
+        decision.Title = "Changed during ingestion"
+        changed.set()
+
+    assert repo.get_decision(decision.NativeId).Title == sample_decision_data["Title"]
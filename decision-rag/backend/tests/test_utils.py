@@ -2,9 +2,10 @@
 Tests for utility functions.
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from app.utils import (
+    AdaptiveDateWindows,
     format_date_for_api,
     generate_date_range,
     parse_date,
@@ -40,6 +41,45 @@ def test_generate_date_range():
     assert ranges[0][0] == start
 
 
+def test_adaptive_date_windows():
+    """Test that windows shrink near the page size and grow when sparse."""
+    windows = AdaptiveDateWindows(
+        datetime(2024, 1, 1),
+        datetime(2024, 1, 10),
+        initial=timedelta(days=2),
+        minimum=timedelta(days=1),
+        maximum=timedelta(days=4),
+        page_size=100,
+    )
+
+    ranges = []
+    for window_start, window_end in windows:
+        ranges.append((window_start.day, window_end.day))
+        windows.record({1: 90, 3: 90, 4: 10}.get(window_start.day, 50))
+
+    assert ranges == [(1, 3), (3, 4), (4, 5), (5, 7), (7, 9), (9, 10)]
+    assert windows.remaining() == 0
+
+
+def test_adaptive_date_windows_backwards():
+    """Test adaptive windows walking backwards."""
+    windows = AdaptiveDateWindows(
+        datetime(2024, 1, 10),
+        datetime(2024, 1, 1),
+        initial=timedelta(days=3),
+        minimum=timedelta(days=1),
+        maximum=timedelta(days=30),
+        page_size=100,
+    )
+    assert windows.remaining() == 3
+
+    first = next(iter(windows))
+    windows.record(0)
+
+    assert first == (datetime(2024, 1, 7), datetime(2024, 1, 10))
+    assert [w for w in windows] == [(datetime(2024, 1, 1), datetime(2024, 1, 7))]
+
+
 def test_weeks_between():
     """Test weeks calculation."""
     start = datetime(2024, 1, 1)